@@ -0,0 +1,36 @@
+"""add claim payout constraints
+
+Revision ID: 3f6b1c2d9a40
+Revises: 89a8ca66c82b
+Create Date: 2026-10-19 10:12:31.418203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6b1c2d9a40'
+down_revision = '89a8ca66c82b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Индекс для выборки страховых случаев по статусу (в том числе утвержденных без выплаты)
+    op.create_index('ix_claims_status', 'claims', ['status'], unique=False)
+    # Не более одной страховой выплаты на страховой случай.
+    # Перед применением дубликаты выплат по одному случаю должны быть устранены вручную.
+    op.create_index(
+        'uq_payments_claim_payout',
+        'payments',
+        ['claim_id'],
+        unique=True,
+        postgresql_where=sa.text("payment_type = 'CLAIM_PAYOUT'"),
+        sqlite_where=sa.text("payment_type = 'CLAIM_PAYOUT'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_payments_claim_payout', table_name='payments')
+    op.drop_index('ix_claims_status', table_name='claims')
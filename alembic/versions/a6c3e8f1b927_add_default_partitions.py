@@ -0,0 +1,41 @@
+"""add default partitions
+
+Revision ID: a6c3e8f1b927
+Revises: d2f6b8a3c470
+Create Date: 2026-10-20 10:41:05.118274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c3e8f1b927'
+down_revision = 'd2f6b8a3c470'
+branch_labels = None
+depends_on = None
+
+TABLES = ('payments', 'claims')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Без секции по умолчанию вставка строки с ключом вне созданных секций (дата заявления в прошлом,
+    # загрузка исторических данных, остановленное обслуживание секций) завершается ошибкой
+    for table in TABLES:
+        op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in TABLES:
+        rows = op.get_bind().execute(sa.text(f"SELECT count(*) FROM {table}_default")).scalar()
+        if rows:
+            raise RuntimeError(
+                f"В секции {table}_default есть строки ({rows}): перед откатом создайте для них помесячные секции"
+            )
+        op.drop_table(f'{table}_default')
@@ -0,0 +1,45 @@
+"""add claim payouts table
+
+Revision ID: b3d7f2a9c614
+Revises: a6c3e8f1b927
+Create Date: 2026-10-21 09:18:42.604391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d7f2a9c614'
+down_revision = 'a6c3e8f1b927'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Единственность выплаты по случаю: после секционирования payments уникальный индекс
+    # uq_payments_claim_payout невозможен, его заменяет несекционированная таблица
+    op.create_table('claim_payouts',
+    sa.Column('claim_id', sa.Uuid(), nullable=False),
+    sa.Column('payment_id', sa.Uuid(), nullable=False),
+    sa.PrimaryKeyConstraint('claim_id')
+    )
+    op.create_index(op.f('ix_claim_payouts_payment_id'), 'claim_payouts', ['payment_id'], unique=False)
+
+    # Перед применением дубликаты выплат по одному случаю должны быть устранены вручную
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT count(*) FROM (SELECT claim_id FROM payments "
+        "WHERE payment_type = 'CLAIM_PAYOUT' AND claim_id IS NOT NULL "
+        "GROUP BY claim_id HAVING count(*) > 1) duplicated"
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(f"По {duplicates} страховым случаям создано несколько выплат: устраните дубликаты")
+    op.execute(
+        "INSERT INTO claim_payouts (claim_id, payment_id) SELECT claim_id, id FROM payments "
+        "WHERE payment_type = 'CLAIM_PAYOUT' AND claim_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_claim_payouts_payment_id'), table_name='claim_payouts')
+    op.drop_table('claim_payouts')
@@ -0,0 +1,27 @@
+"""add policy renewal
+
+Revision ID: b7d2e94c1f05
+Revises: f3c81d6a9e24
+Create Date: 2026-10-19 19:12:31.408215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e94c1f05'
+down_revision = 'f3c81d6a9e24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('policies', sa.Column('auto_renew', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Выбор действующих полисов с истекшим сроком обработчиком продления
+    op.create_index('ix_policies_status_end_date', 'policies', ['status', 'end_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_policies_status_end_date', table_name='policies')
+    op.drop_column('policies', 'auto_renew')
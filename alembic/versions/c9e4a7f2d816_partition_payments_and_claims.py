@@ -0,0 +1,134 @@
+"""partition payments and claims
+
+Revision ID: c9e4a7f2d816
+Revises: b7d2e94c1f05
+Create Date: 2026-10-19 21:04:17.530912
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9e4a7f2d816'
+down_revision = 'b7d2e94c1f05'
+branch_labels = None
+depends_on = None
+
+# Таблица -> ключ секционирования, номер записи и индексы (кроме индекса номера), в порядке преобразования
+TABLES = {
+    'payments': ('created_at', 'payment_number', {
+        'ix_payments_claim_id': ['claim_id'],
+        'ix_payments_updated_at_id': ['updated_at', 'id'],
+    }),
+    'claims': ('report_date', 'claim_number', {
+        'ix_claims_status': ['status'],
+        'ix_claims_updated_at_id': ['updated_at', 'id'],
+    }),
+}
+# Индексы исходных таблиц: их имена общие для схемы, поэтому они удаляются до создания новых
+REPLACED_INDEXES = {
+    'payments': ['uq_payments_claim_payout', 'ix_payments_updated_at_id'],
+    'claims': ['ix_claims_status', 'ix_claims_updated_at_id'],
+}
+# Секции создаются на столько месяцев вперед; дальше их создает partition_maintenance
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_partitions(table: str, key: str, source: str) -> None:
+    """Создает помесячные секции от самой ранней записи source до MONTHS_AHEAD месяцев вперед"""
+    earliest = op.get_bind().execute(sa.text(f"SELECT min({key}) FROM {source}")).scalar() or date.today()
+    month = date(earliest.year, earliest.month, 1)
+    last = date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        following = _next_month(month)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        )
+        month = following
+
+
+def _foreign_keys(table: str) -> None:
+    op.create_foreign_key(f'{table}_client_id_fkey', table, 'clients', ['client_id'], ['id'])
+    op.create_foreign_key(f'{table}_policy_id_fkey', table, 'policies', ['policy_id'], ['id'])
+
+
+def upgrade() -> None:
+    # Секционирование поддерживается только PostgreSQL; в остальных СУБД схема не меняется
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Ключ секционирования платежей обязателен, а внешний ключ на секционированную таблицу claims
+    # невозможен: ее первичный ключ включает report_date
+    op.drop_constraint('payments_claim_id_fkey', 'payments', type_='foreignkey')
+    op.execute("UPDATE payments SET created_at = coalesce(updated_at, now()) WHERE created_at IS NULL")
+    op.alter_column('payments', 'created_at', nullable=False)
+
+    # Таблица переименовывается, создается секционированная таблица той же структуры, строки переносятся.
+    # Уникальные ограничения номеров не переносятся: уникальный индекс секционированной таблицы
+    # обязан включать ключ секционирования
+    for table, (key, number, indexes) in TABLES.items():
+        source = f'{table}_unpartitioned'
+        op.rename_table(table, source)
+        op.execute(f"ALTER TABLE {source} RENAME CONSTRAINT {table}_pkey TO {source}_pkey")
+        op.drop_constraint(f'{table}_{number}_key', source, type_='unique')
+        for index in REPLACED_INDEXES[table]:
+            op.drop_index(index, table_name=source)
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {source} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+        op.create_primary_key(f'{table}_pkey', table, ['id', key])
+        _foreign_keys(table)
+        op.create_index(f'ix_{table}_{number}', table, [number], unique=False)
+        for index, columns in indexes.items():
+            op.create_index(index, table, columns, unique=False)
+
+        _create_partitions(table, key, source)
+        op.execute(f"INSERT INTO {table} SELECT * FROM {source}")
+        op.drop_table(source)
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Строки отсоединенных в архив секций в таблицы не возвращаются
+    for table, (key, number, indexes) in reversed(list(TABLES.items())):
+        source = f'{table}_partitioned'
+        op.rename_table(table, source)
+        for index in (f'ix_{table}_{number}', *indexes):
+            op.drop_index(index, table_name=source)
+        op.execute(f"ALTER TABLE {source} RENAME CONSTRAINT {table}_pkey TO {source}_pkey")
+
+        op.execute(f"CREATE TABLE {table} (LIKE {source} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {source}")
+        op.drop_table(source)
+
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+        op.create_unique_constraint(f'{table}_{number}_key', table, [number])
+        _foreign_keys(table)
+        for index in REPLACED_INDEXES[table]:
+            if index in indexes:
+                op.create_index(index, table, indexes[index], unique=False)
+
+    op.create_index(
+        'uq_payments_claim_payout',
+        'payments',
+        ['claim_id'],
+        unique=True,
+        postgresql_where=sa.text("payment_type = 'CLAIM_PAYOUT'")
+    )
+    op.alter_column('payments', 'created_at', nullable=True)
+    op.create_foreign_key('payments_claim_id_fkey', 'payments', 'claims', ['claim_id'], ['id'])
@@ -0,0 +1,70 @@
+"""add number sequences
+
+Revision ID: d2f6b8a3c470
+Revises: c9e4a7f2d816
+Create Date: 2026-10-19 23:12:48.207315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6b8a3c470'
+down_revision = 'c9e4a7f2d816'
+branch_labels = None
+depends_on = None
+
+# Совпадает с NUMBER_BLOCK_SIZE генератора номеров
+BLOCK_SIZE = 100
+# Последовательность -> таблица, столбец номера, префикс и ключ секционирования (упорядочивает дубликаты)
+SEQUENCES = {
+    'claim': ('claims', 'claim_number', 'CLM', 'report_date'),
+    'payment': ('payments', 'payment_number', 'PAY', 'created_at'),
+}
+
+
+def _renumber_duplicates(sequence: str, table: str, column: str, prefix: str, key: str) -> None:
+    """
+    Первой записи с повторяющимся номером номер сохраняется, остальные получают номера
+    из первых блоков последовательности; последовательность переводится за эти блоки.
+    """
+    renumbered = op.get_bind().execute(sa.text(
+        f"WITH duplicates AS ("
+        f"SELECT id, {key}, row_number() OVER (ORDER BY {key}, id) AS n FROM ("
+        f"SELECT id, {key}, row_number() OVER (PARTITION BY {column} ORDER BY {key}, id) AS k FROM {table}"
+        f") numbered WHERE k > 1) "
+        f"UPDATE {table} SET {column} = '{prefix}-' || lpad(duplicates.n::text, 10, '0'), "
+        f"version = version + 1, updated_at = now() "
+        f"FROM duplicates WHERE {table}.id = duplicates.id AND {table}.{key} = duplicates.{key}"
+    )).rowcount
+    if renumbered:
+        op.execute(f"SELECT setval('{sequence}_number_seq', {-(-renumbered // BLOCK_SIZE)})")
+
+
+def upgrade() -> None:
+    op.create_table('number_sequences',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('last_block', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    # Последовательности есть только в PostgreSQL; в остальных СУБД блоки считаются в number_sequences
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for sequence in ('policy', 'claim', 'payment'):
+        op.execute(sa.schema.CreateSequence(sa.Sequence(f'{sequence}_number_seq')))
+
+    # После секционирования номера страховых случаев и платежей не проверяются уникальным индексом,
+    # и номера, производные от идентификатора, могли совпасть. Номера полисов уникальны
+    for sequence, (table, column, prefix, key) in SEQUENCES.items():
+        _renumber_duplicates(sequence, table, column, prefix, key)
+
+
+def downgrade() -> None:
+    # Перенумерованные дубликаты сохраняют новые номера
+    if op.get_bind().dialect.name == 'postgresql':
+        for sequence in ('policy', 'claim', 'payment'):
+            op.execute(sa.schema.DropSequence(sa.Sequence(f'{sequence}_number_seq')))
+    op.drop_table('number_sequences')
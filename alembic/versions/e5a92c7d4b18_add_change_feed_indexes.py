@@ -0,0 +1,31 @@
+"""add change feed indexes
+
+Revision ID: e5a92c7d4b18
+Revises: d8b3f05e2c17
+Create Date: 2026-10-19 16:41:07.553812
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a92c7d4b18'
+down_revision = 'd8b3f05e2c17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('payments', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE payments SET updated_at = created_at")
+    op.execute("UPDATE claims SET updated_at = created_at WHERE updated_at IS NULL")
+    # Ключи постраничного чтения ленты изменений
+    op.create_index('ix_claims_updated_at_id', 'claims', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_payments_updated_at_id', 'payments', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_payments_updated_at_id', table_name='payments')
+    op.drop_index('ix_claims_updated_at_id', table_name='claims')
+    op.drop_column('payments', 'updated_at')
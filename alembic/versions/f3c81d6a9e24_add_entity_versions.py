@@ -0,0 +1,31 @@
+"""add entity versions
+
+Revision ID: f3c81d6a9e24
+Revises: e5a92c7d4b18
+Create Date: 2026-10-19 18:02:44.216390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c81d6a9e24'
+down_revision = 'e5a92c7d4b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('clients', 'policies'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
+    for table in ('clients', 'policies', 'claims', 'payments'):
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    for table in ('payments', 'claims', 'policies', 'clients'):
+        op.drop_column(table, 'version')
+    for table in ('policies', 'clients'):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,4 @@
+"""
+Бенчмарки производительности приложения.
+Запускаются как модули, например: python -m benchmarks.bench_domain_memory
+"""
@@ -0,0 +1,166 @@
+"""
+Нагрузочный бенчмарк API.
+
+Заполняет базу данных генератором benchmarks.datagen, нагружает API смесью типичных запросов
+или запросами из журнала JSON Lines (--replay) и выводит по каждому сценарию пропускную способность,
+перцентили задержки и количество SQL-запросов на HTTP-запрос. По умолчанию приложение ASGI
+выполняется в том же процессе на временной базе SQLite; с --target нагружается запущенный сервер
+(SQL-запросы в этом режиме не подсчитываются).
+
+Сравнение с базовыми результатами завершается с кодом 1 при регрессии:
+    python -m benchmarks.bench_api --baseline benchmarks/baseline.json
+Обновление базовых результатов:
+    python -m benchmarks.bench_api --save-baseline benchmarks/baseline.json
+Нагрузка запущенного сервера, база которого заполняется бенчмарком:
+    python -m benchmarks.bench_api --target http://127.0.0.1:8000 --database-url postgresql://... --secret-key ...
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+import httpx
+import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.datagen import generate
+from benchmarks.load import (
+    QueryCountingMiddleware,
+    compare,
+    count_queries,
+    default_mix,
+    load_replay,
+    run_load,
+    summarize
+)
+from insurance_app.infrastructure.database.config import Base
+
+
+def access_tokens(secret_key: str, users: int) -> List[str]:
+    """Токены виртуальных пользователей; у каждого своя корзина ограничения частоты запросов"""
+    return [
+        jwt.encode(
+            {"sub": str(uuid.uuid4()), "roles": ["admin"], "exp": datetime.utcnow() + timedelta(hours=1)},
+            secret_key,
+            algorithm="HS256"
+        )
+        for _ in range(users)
+    ]
+
+
+def asgi_client(engine, queries: dict) -> httpx.AsyncClient:
+    """Клиент приложения ASGI в том же процессе, работающего с базой данных бенчмарка"""
+    # Замеряется приложение, а не ограничение частоты запросов; переменная читается при импорте main
+    os.environ.setdefault("RATE_LIMIT_PER_SECOND", "0")
+    from insurance_app.presentation.api.dependencies import get_db
+    from insurance_app.presentation.main import app
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    async def bench_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = bench_get_db
+    count_queries(engine)
+    app.add_middleware(QueryCountingMiddleware, results=queries)
+    # Исключения приложения учитываются как ответы 500, а не прерывают нагрузку
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60.0)
+
+
+def print_summary(summary: dict) -> None:
+    print(f"{'Сценарий':<20}{'запросов':>10}{'запр/с':>10}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}"
+          f"{'ошибок':>8}{'SQL/запр':>10}")
+    for name, row in summary.items():
+        queries = f"{row['queries']:.1f}" if row["queries"] is not None else "-"
+        print(f"{name:<20}{row['requests']:>10}{row['rps']:>10.1f}{row['p50']:>10.1f}{row['p95']:>10.1f}"
+              f"{row['p99']:>10.1f}{row['errors']:>8}{queries:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный бенчмарк API")
+    parser.add_argument("--clients", type=int, default=200, help="Количество клиентов в тестовых данных")
+    parser.add_argument("--concurrency", type=int, default=16, help="Количество виртуальных пользователей")
+    parser.add_argument("--duration", type=float, default=20.0, help="Длительность замера, с")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Длительность прогрева, с")
+    parser.add_argument("--replay", default=None, help="Журнал запросов JSON Lines вместо стандартной смеси")
+    parser.add_argument("--seed", type=int, default=42, help="Начальное значение генераторов случайных чисел")
+    parser.add_argument("--target", default=None, help="URL запущенного сервера вместо приложения в процессе")
+    parser.add_argument("--database-url", default=None,
+                        help="URL базы данных для заполнения (по умолчанию временный файл SQLite)")
+    parser.add_argument("--secret-key", default=None, help="Ключ подписи токенов сервера (по умолчанию ключ приложения)")
+    parser.add_argument("--baseline", default=None, help="Файл базовых результатов для поиска регрессий")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Допустимое ухудшение задержки и пропускной способности")
+    parser.add_argument("--save-baseline", default=None, help="Сохранить результаты как базовые в файл")
+    parser.add_argument("--output", default=None, help="Сохранить результаты в файл JSON")
+    args = parser.parse_args()
+
+    if args.target and not args.database_url:
+        parser.error("--target требует --database-url базы данных сервера")
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_api.db')}"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        data = generate(session, clients=args.clients, seed=args.seed)
+    scenarios = load_replay(args.replay, data) if args.replay else default_mix(data)
+
+    queries = {}
+    if args.target:
+        secret_key = args.secret_key or os.environ.get("SECRET_KEY", "your-secret-key")
+        client = httpx.AsyncClient(base_url=args.target, timeout=60.0,
+                                   limits=httpx.Limits(max_connections=args.concurrency))
+    else:
+        client = asgi_client(engine, queries)
+        from insurance_app.presentation.main import secret_key
+    tokens = access_tokens(args.secret_key or secret_key, args.concurrency)
+
+    async def measure():
+        async with client:
+            if args.warmup > 0:
+                await run_load(client, scenarios, tokens, args.concurrency, args.warmup, args.seed)
+            queries.clear()
+            return await run_load(client, scenarios, tokens, args.concurrency, args.duration, args.seed)
+
+    stats, elapsed = asyncio.run(measure())
+    summary = summarize(stats, elapsed, queries if not args.target else None)
+    total = sum(row["rps"] for row in summary.values())
+    print(f"Клиентов: {len(data.client_ids)}, полисов: {len(data.policy_ids)}, "
+          f"пользователей: {args.concurrency}, замер: {elapsed:.1f} с, всего {total:.1f} запр/с")
+    print_summary(summary)
+
+    results = {
+        "config": {"clients": args.clients, "concurrency": args.concurrency, "duration": args.duration,
+                   "replay": args.replay, "target": args.target},
+        "results": summary,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(summary, baseline, args.tolerance)
+        if regressions:
+            print("Регрессии относительно базовых результатов:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("Регрессий относительно базовых результатов нет")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Микробенчмарк накладных расходов JWTAuthMiddleware.
+
+Вызывает middleware приложения напрямую с пустым ASGI-приложением вместо маршрутизатора,
+поэтому замер включает только поиск правила доступа, разбор заголовка и проверку токена.
+
+Запуск:
+    python -m benchmarks.bench_auth_middleware --requests 20000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import jwt
+
+from insurance_app.infrastructure.auth.middleware import JWTAuthMiddleware
+from insurance_app.presentation.main import app, excluded_paths
+
+SECRET_KEY = "bench-secret-key"
+
+CASES = [
+    ("открытый путь", "GET", "/api/health-check", False),
+    ("без токена", "GET", "/api/policies", False),
+    ("аутентификация", "GET", f"/api/policies/{uuid.uuid4()}", True),
+    ("роль admin", "GET", f"/api/users/{uuid.uuid4()}", True),
+    ("неизвестный путь", "GET", "/api/unknown/path", True),
+]
+
+
+async def downstream(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def scope_for(method: str, path: str, token: str = None) -> dict:
+    headers = [(b"host", b"testserver"), (b"accept", b"application/json")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return {"type": "http", "method": method, "path": path, "root_path": "", "query_string": b"", "headers": headers}
+
+
+async def measure(middleware, scope: dict, requests: int) -> float:
+    """Среднее время вызова, мкс"""
+    started = time.perf_counter()
+    for _ in range(requests):
+        await middleware(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Накладные расходы JWT middleware")
+    parser.add_argument("--requests", type=int, default=20000, help="Количество вызовов на сценарий")
+    args = parser.parse_args()
+
+    token = jwt.encode(
+        {"sub": str(uuid.uuid4()), "roles": ["admin"], "exp": datetime.utcnow() + timedelta(hours=1)},
+        SECRET_KEY,
+        algorithm="HS256"
+    )
+    started = time.perf_counter()
+    middleware = JWTAuthMiddleware(downstream, SECRET_KEY, excluded_paths=excluded_paths, routes=app.routes)
+    print(f"Маршрутов: {len(app.routes)}, компиляция политики: {(time.perf_counter() - started) * 1000:.2f} мс")
+
+    print(f"{'Сценарий':<20}{'мкс/запрос':>12}")
+    for name, method, path, with_token in CASES:
+        scope = scope_for(method, path, token if with_token else None)
+        asyncio.run(measure(middleware, scope, 100))
+        print(f"{name:<20}{asyncio.run(measure(middleware, scope, args.requests)):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Бенчмарк памяти доменных моделей.
+
+Сравнивает количество байт на загруженную строку платежа для доменной модели
+со __slots__ и для эквивалентного dataclass с __dict__ (прежнее представление).
+
+Запуск:
+    python -m benchmarks.bench_domain_memory --rows 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+import uuid
+from dataclasses import fields, make_dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+
+from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType
+
+
+# Доменная модель платежа в прежнем виде: тот же набор полей, но без __slots__
+DictPayment = make_dataclass(
+    "DictPayment",
+    [(f.name, f.type, field(default=f.default)) for f in fields(Payment)],
+)
+
+
+def generate_rows(count: int) -> list:
+    """Генерирует кортежи значений, имитирующие строки таблицы payments"""
+    client_id = uuid.uuid4()
+    policy_id = uuid.uuid4()
+    today = date.today()
+    now = datetime.utcnow()
+    return [
+        (
+            uuid.uuid4(), f"PAY-{i:08d}", client_id, policy_id, None,
+            Decimal("1500.00"), today, today, PaymentStatus.COMPLETED,
+            PaymentType.PREMIUM, "card", "", now, True
+        )
+        for i in range(count)
+    ]
+
+
+def measure(model_cls, rows: list) -> float:
+    """Возвращает количество байт, выделенных на один объект модели"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [model_cls(*row) for row in rows]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Список объектов тоже попадает в замер, вычитаем его размер
+    list_size = 8 * len(objects)
+    del objects
+    return (after - before - list_size) / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Память доменной модели Payment на строку")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Количество строк")
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows)
+    dict_bytes = measure(DictPayment, rows)
+    slots_bytes = measure(Payment, rows)
+
+    print(f"Строк: {args.rows}")
+    print(f"{'Представление':<24}{'байт/строку':>14}{'всего, МБ':>12}")
+    for name, per_row in (("dataclass (__dict__)", dict_bytes), ("dataclass (__slots__)", slots_bytes)):
+        print(f"{name:<24}{per_row:>14.1f}{per_row * args.rows / 2 ** 20:>12.1f}")
+    print(f"Экономия: {(1 - slots_bytes / dict_bytes) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
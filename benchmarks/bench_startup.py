@@ -0,0 +1,57 @@
+"""
+Бенчмарк времени запуска: импорт приложения в новом процессе, как при старте обработчика или тестов.
+
+Выводит среднее время импорта за несколько запусков и самые долгие модули по профилю -X importtime.
+
+Запуск:
+    python -m benchmarks.bench_startup --runs 5 --top 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+MODULE = "insurance_app.presentation.main"
+
+
+def profile_once(module: str) -> dict:
+    """Совокупное время импорта каждого модуля за один запуск, мкс"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Время импорта приложения")
+    parser.add_argument("--module", default=MODULE, help="Импортируемый модуль")
+    parser.add_argument("--runs", type=int, default=5, help="Количество запусков")
+    parser.add_argument("--top", type=int, default=20, help="Количество самых долгих модулей в отчете")
+    args = parser.parse_args()
+
+    totals = []
+    samples = defaultdict(list)
+    for _ in range(args.runs):
+        profile = profile_once(args.module)
+        totals.append(profile[args.module] / 1000)
+        for name, cumulative in profile.items():
+            samples[name].append(cumulative / 1000)
+
+    print(f"Импорт {args.module}: среднее {statistics.mean(totals):.0f} мс, "
+          f"минимум {min(totals):.0f} мс за {args.runs} запусков")
+    print(f"{'Модуль':<60}{'мс':>10}")
+    ranked = sorted(samples.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, values in ranked[:args.top]:
+        print(f"{name:<60}{statistics.median(values):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
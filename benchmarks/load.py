@@ -0,0 +1,241 @@
+"""
+Асинхронный генератор нагрузки для API.
+
+Виртуальные пользователи выполняют запросы из взвешенной смеси сценариев или из записанного
+журнала запросов (JSON Lines) через httpx: к приложению ASGI в том же процессе или к запущенному серверу.
+Для каждого сценария собираются задержки, ошибки и количество SQL-запросов на HTTP-запрос.
+"""
+import asyncio
+import json
+import random
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.datagen import SeedData
+
+# Счетчик SQL-запросов текущего HTTP-запроса. Контекст копируется в пул потоков,
+# в котором выполняются обработчики, поэтому счетчик — изменяемый список из одного элемента
+_query_counter: ContextVar[Optional[List[int]]] = ContextVar("query_counter", default=None)
+
+# Подстановки в путях и телах запросов журнала: {policy_id}, {client_id}, {claim_id}, {payment_id}, {policy_number}
+_PLACEHOLDER = re.compile(r"\{(policy_id|client_id|claim_id|payment_id|policy_number)\}")
+
+
+def count_queries(engine) -> None:
+    """Подсчитывает SQL-запросы движка в счетчике текущего HTTP-запроса"""
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+
+class QueryCountingMiddleware:
+    """ASGI middleware бенчмарка: создает счетчик SQL-запросов на время HTTP-запроса"""
+
+    def __init__(self, app, results: Dict[str, List[int]]):
+        self.app = app
+        # Запрос сообщает имя сценария в заголовке x-bench-scenario
+        self.results = results
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        counter = [0]
+        token = _query_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_counter.reset(token)
+            scenario = dict(scope["headers"]).get(b"x-bench-scenario", b"").decode()
+            self.results.setdefault(scenario, []).append(counter[0])
+
+
+@dataclass
+class RequestSpec:
+    method: str
+    path: str
+    body: Any = None
+
+
+@dataclass
+class Scenario:
+    """Сценарий смеси нагрузки: имя для отчета, вес и построитель запроса"""
+    name: str
+    weight: float
+    build: Callable[[random.Random], RequestSpec]
+
+
+@dataclass
+class ScenarioStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+
+def default_mix(data: SeedData) -> List[Scenario]:
+    """Типичная смесь запросов: преобладают чтения карточек и списков, небольшая доля записей"""
+    def new_claim(rng: random.Random) -> RequestSpec:
+        index = rng.randrange(len(data.policy_ids))
+        return RequestSpec("POST", "/api/claims", {
+            "policy_id": str(data.policy_ids[index]),
+            "client_id": str(data.policy_client_ids[index]),
+            "incident_date": (date.today() - timedelta(days=1)).isoformat(),
+            "description": "Нагрузочный тест",
+            "claim_amount": "1500.00",
+        })
+
+    return [
+        Scenario("policy_list", 20, lambda rng: RequestSpec("GET", "/api/policies?limit=20")),
+        Scenario("policy_get", 20, lambda rng: RequestSpec("GET", f"/api/policies/{rng.choice(data.policy_ids)}")),
+        Scenario("client_policies", 10, lambda rng: RequestSpec(
+            "GET", f"/api/policies?client_id={rng.choice(data.client_ids)}")),
+        Scenario("client_get", 10, lambda rng: RequestSpec("GET", f"/api/clients/{rng.choice(data.client_ids)}")),
+        Scenario("claim_list", 10, lambda rng: RequestSpec(
+            "GET", f"/api/claims?policy_id={rng.choice(data.policy_ids)}")),
+        Scenario("claim_get", 10, lambda rng: RequestSpec("GET", f"/api/claims/{rng.choice(data.claim_ids)}")),
+        Scenario("payment_list", 10, lambda rng: RequestSpec(
+            "GET", f"/api/payments?policy_id={rng.choice(data.policy_ids)}")),
+        Scenario("claim_create", 5, new_claim),
+        Scenario("policy_by_number", 5, lambda rng: RequestSpec(
+            "GET", f"/api/policies/number/{rng.choice(data.policy_numbers)}")),
+    ]
+
+
+def load_replay(path: str, data: SeedData) -> List[Scenario]:
+    """
+    Сценарии из журнала запросов JSON Lines. Строка журнала:
+    {"method": "GET", "path": "/api/policies/{policy_id}", "body": null, "name": "policy_get", "weight": 1}
+    Подстановки заменяются случайными идентификаторами созданных данных, name и weight необязательны.
+    """
+    values = {
+        "policy_id": data.policy_ids,
+        "client_id": data.client_ids,
+        "claim_id": data.claim_ids,
+        "payment_id": data.payment_ids,
+        "policy_number": data.policy_numbers,
+    }
+
+    def substitute(text: str, rng: random.Random) -> str:
+        return _PLACEHOLDER.sub(lambda match: str(rng.choice(values[match.group(1)])), text)
+
+    def builder(method: str, template: str, body: Any) -> Callable[[random.Random], RequestSpec]:
+        body_template = json.dumps(body, ensure_ascii=False) if body is not None else None
+        return lambda rng: RequestSpec(
+            method,
+            substitute(template, rng),
+            json.loads(substitute(body_template, rng)) if body_template is not None else None
+        )
+
+    scenarios = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            method = record.get("method", "GET").upper()
+            name = record.get("name") or f"{method} {record['path'].split('?')[0]}"
+            scenarios.append(Scenario(name, float(record.get("weight", 1)), builder(method, record["path"], record.get("body"))))
+    if not scenarios:
+        raise ValueError(f"Журнал запросов {path} пуст")
+    return scenarios
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: List[Scenario],
+    tokens: List[str],
+    concurrency: int,
+    duration: float,
+    seed: int = 42
+) -> Tuple[Dict[str, ScenarioStats], float]:
+    """
+    Выполняет нагрузку виртуальными пользователями в течение duration секунд.
+    Каждый пользователь отправляет запросы со своим токеном. Возвращает статистику по сценариям и длительность.
+    """
+    stats = {scenario.name: ScenarioStats() for scenario in scenarios}
+    weights = [scenario.weight for scenario in scenarios]
+    deadline = time.monotonic() + duration
+
+    async def user(index: int):
+        rng = random.Random(seed + index)
+        headers = {"Authorization": f"Bearer {tokens[index % len(tokens)]}"}
+        while time.monotonic() < deadline:
+            scenario = rng.choices(scenarios, weights)[0]
+            spec = scenario.build(rng)
+            result = stats[scenario.name]
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    spec.method, spec.path, json=spec.body,
+                    headers={**headers, "x-bench-scenario": scenario.name}
+                )
+                status_code = response.status_code
+            except httpx.HTTPError:
+                status_code = 0
+            result.statuses[status_code] = result.statuses.get(status_code, 0) + 1
+            if 200 <= status_code < 400:
+                result.latencies.append(time.perf_counter() - started)
+            else:
+                result.errors += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(user(index) for index in range(concurrency)))
+    return stats, time.monotonic() - started
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def summarize(
+    stats: Dict[str, ScenarioStats],
+    elapsed: float,
+    queries: Optional[Dict[str, List[int]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Сводка по сценариям: запросов в секунду, перцентили задержки в мс, ошибки и SQL-запросов на HTTP-запрос"""
+    summary = {}
+    for name, result in stats.items():
+        requests = len(result.latencies) + result.errors
+        if not requests:
+            continue
+        counts = (queries or {}).get(name)
+        summary[name] = {
+            "requests": requests,
+            "rps": round(len(result.latencies) / elapsed, 1),
+            "p50": round(percentile(result.latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(result.latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(result.latencies, 0.99) * 1000, 2),
+            "errors": result.errors,
+            "queries": round(sum(counts) / len(counts), 2) if counts else None,
+        }
+    return summary
+
+
+def compare(summary: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    Регрессии относительно базовых результатов: p95 выше базового более чем на tolerance,
+    пропускная способность ниже на tolerance, больше SQL-запросов на HTTP-запрос или появились ошибки.
+    """
+    regressions = []
+    for name, base in baseline.items():
+        current = summary.get(name)
+        if current is None:
+            continue
+        if current["p95"] > base["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95']} мс, базовое {base['p95']} мс")
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['rps']} запр/с, базовое {base['rps']} запр/с")
+        if current["queries"] is not None and base.get("queries") is not None and current["queries"] > base["queries"] + 0.5:
+            regressions.append(f"{name}: {current['queries']} SQL-запросов на запрос, базовое {base['queries']}")
+        if current["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: {current['errors']} ошибок, базовое {base.get('errors', 0)}")
+    return regressions
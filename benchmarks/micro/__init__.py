@@ -0,0 +1,10 @@
+"""
+Микробенчмарки репозиториев, мапперов и сервисов (pytest-benchmark).
+Запускаются отдельно от тестов: python -m pytest benchmarks/micro
+"""
+import uuid
+
+
+def unique_number(prefix: str) -> str:
+    """Уникальный номер записи: номера фабрик из tests/factories.py повторяются на тысячах итераций"""
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
@@ -0,0 +1,43 @@
+"""
+Конфигурация микробенчмарков.
+
+Каждый бенчмарк выполняется на SQLite в памяти и, если задана переменная окружения
+BENCH_POSTGRES_URL, дополнительно на PostgreSQL.
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from insurance_app.infrastructure.database.config import Base
+
+def pytest_configure(config):
+    # Перехват предупреждений pytest искажает замер: в приложении DeprecationWarning по умолчанию не выводятся
+    config.addinivalue_line("filterwarnings", "ignore::DeprecationWarning")
+
+
+BACKENDS = ["sqlite"] + (["postgresql"] if os.getenv("BENCH_POSTGRES_URL") else [])
+
+
+@pytest.fixture(scope="session", params=BACKENDS)
+def engine(request):
+    """Движок базы данных бенчмарков с созданными таблицами"""
+    if request.param == "sqlite":
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(os.environ["BENCH_POSTGRES_URL"])
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Сессия бенчмарка; репозитории фиксируют транзакции, поэтому данные между бенчмарками не откатываются"""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
@@ -0,0 +1,82 @@
+"""
+Микробенчмарки мапперов DTO: одна запись и список из 10 000 записей
+"""
+import copy
+from datetime import datetime
+
+import pytest
+
+from insurance_app.application.dto.claim_dto import ClaimCreateDTO
+from insurance_app.application.dto.client_dto import ClientCreateDTO
+from insurance_app.application.dto.mappers import ClaimMapper, ClientMapper, PaymentMapper, PolicyMapper, UserMapper
+from insurance_app.application.dto.payment_dto import PaymentCreateDTO
+from insurance_app.application.dto.policy_dto import PolicyCreateDTO
+from insurance_app.application.dto.user_dto import UserCreateDTO
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory, UserFactory
+
+LIST_SIZE = 10_000
+
+# Дата создания в DTO ответа — дата без времени
+MIDNIGHT = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+MAPPERS = {
+    "client": (ClientMapper, ClientFactory, ClientCreateDTO),
+    "policy": (PolicyMapper, PolicyFactory, PolicyCreateDTO),
+    "claim": (ClaimMapper, ClaimFactory, ClaimCreateDTO),
+    "payment": (PaymentMapper, PaymentFactory, PaymentCreateDTO),
+    "user": (UserMapper, UserFactory, UserCreateDTO),
+}
+
+
+def entity(kind: str):
+    _, factory, _ = MAPPERS[kind]
+    return factory(created_at=MIDNIGHT) if kind != "user" else factory()
+
+
+def create_dto(kind: str):
+    """DTO создания с полями, совпадающими с полями записи"""
+    mapper, _, dto_class = MAPPERS[kind]
+    values = mapper.to_dto(entity(kind)).dict()
+    if kind == "user":
+        values["password"] = "benchmark-password"
+    return dto_class(**{name: value for name, value in values.items() if name in dto_class.model_fields})
+
+
+@pytest.mark.parametrize("kind", MAPPERS)
+def test_to_dto(benchmark, kind):
+    benchmark.group = "mapper.to_dto"
+    mapper, _, _ = MAPPERS[kind]
+    
+    benchmark(mapper.to_dto, entity(kind))
+
+
+@pytest.mark.parametrize("kind", MAPPERS)
+def test_to_dto_list(benchmark, kind):
+    benchmark.group = f"mapper.to_dto_list({LIST_SIZE})"
+    mapper, _, _ = MAPPERS[kind]
+    template = entity(kind)
+    entities = [copy.copy(template) for _ in range(LIST_SIZE)]
+    
+    result = benchmark.pedantic(mapper.to_dto_list, args=(entities,), rounds=5)
+    
+    assert len(result) == LIST_SIZE
+
+
+@pytest.mark.parametrize("kind", MAPPERS)
+def test_to_domain(benchmark, kind):
+    benchmark.group = "mapper.to_domain"
+    mapper, _, _ = MAPPERS[kind]
+    
+    benchmark(mapper.to_domain, create_dto(kind))
+
+
+@pytest.mark.parametrize("kind", MAPPERS)
+def test_to_domain_list(benchmark, kind):
+    benchmark.group = f"mapper.to_domain({LIST_SIZE})"
+    mapper, _, _ = MAPPERS[kind]
+    template = create_dto(kind)
+    dtos = [template.model_copy() for _ in range(LIST_SIZE)]
+    
+    result = benchmark.pedantic(lambda: [mapper.to_domain(dto) for dto in dtos], rounds=5)
+    
+    assert len(result) == LIST_SIZE
@@ -0,0 +1,124 @@
+"""
+Микробенчмарки репозиториев: CRUD-операции и преобразования модель <-> доменный объект
+"""
+import pytest
+
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from benchmarks.micro import unique_number
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory
+
+KINDS = ["client", "policy", "claim", "payment"]
+
+REPOSITORIES = {
+    "client": ClientRepositoryImpl,
+    "policy": PolicyRepositoryImpl,
+    "claim": ClaimRepositoryImpl,
+    "payment": PaymentRepositoryImpl,
+}
+
+
+@pytest.fixture
+def parents(session):
+    """Клиент, полис и страховой случай, на которые ссылаются создаваемые записи"""
+    client = ClientRepositoryImpl(session).create(ClientFactory(email=f"{unique_number('client')}@example.com"))
+    policy = PolicyRepositoryImpl(session).create(
+        PolicyFactory(client_id=client.id, policy_number=unique_number("POL"))
+    )
+    claim = ClaimRepositoryImpl(session).create(
+        ClaimFactory(policy_id=policy.id, client_id=client.id, claim_number=unique_number("CLM"))
+    )
+    return client, policy, claim
+
+
+def build(kind: str, parents):
+    """Новая запись с уникальным номером"""
+    client, policy, _ = parents
+    if kind == "client":
+        return ClientFactory(email=f"{unique_number('client')}@example.com")
+    if kind == "policy":
+        return PolicyFactory(client_id=client.id, policy_number=unique_number("POL"))
+    if kind == "claim":
+        return ClaimFactory(policy_id=policy.id, client_id=client.id, claim_number=unique_number("CLM"))
+    return PaymentFactory(policy_id=policy.id, client_id=client.id, payment_number=unique_number("PAY"))
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_create(benchmark, session, parents, kind):
+    benchmark.group = "repository.create"
+    repository = REPOSITORIES[kind](session)
+    
+    benchmark(lambda: repository.create(build(kind, parents)))
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_get_by_id(benchmark, session, parents, kind):
+    benchmark.group = "repository.get_by_id"
+    repository = REPOSITORIES[kind](session)
+    entity = repository.create(build(kind, parents))
+    
+    result = benchmark(repository.get_by_id, entity.id)
+    
+    assert result.id == entity.id
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_get_all(benchmark, session, parents, kind):
+    benchmark.group = "repository.get_all(100)"
+    repository = REPOSITORIES[kind](session)
+    for _ in range(100):
+        repository.create(build(kind, parents))
+    
+    result = benchmark(repository.get_all, 0, 100)
+    
+    assert len(result) == 100
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_update(benchmark, session, parents, kind):
+    benchmark.group = "repository.update"
+    repository = REPOSITORIES[kind](session)
+    state = {"entity": repository.create(build(kind, parents))}
+    
+    def update():
+        entity = state["entity"]
+        if kind == "client":
+            entity.phone = unique_number("+7")
+        else:
+            entity.description = unique_number("description")
+        state["entity"] = repository.update(entity)
+    
+    benchmark(update)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_delete(benchmark, session, parents, kind):
+    benchmark.group = "repository.delete"
+    repository = REPOSITORIES[kind](session)
+    
+    def setup():
+        return (repository.create(build(kind, parents)).id,), {}
+    
+    benchmark.pedantic(repository.delete, setup=setup, rounds=200)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_to_domain(benchmark, session, parents, kind):
+    benchmark.group = "repository._to_domain"
+    repository = REPOSITORIES[kind](session)
+    model = repository._to_model(build(kind, parents))
+    
+    benchmark(repository._to_domain, model)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_to_model(benchmark, session, parents, kind):
+    benchmark.group = "repository._to_model"
+    repository = REPOSITORIES[kind](session)
+    entity = build(kind, parents)
+    
+    benchmark(repository._to_model, entity)
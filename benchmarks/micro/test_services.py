@@ -0,0 +1,130 @@
+"""
+Микробенчмарки сервисных сценариев с репозиториями на реальной базе данных
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.payment import PaymentType
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PolicyRepositoryImpl,
+    ReferenceRepositoryImpl
+)
+from benchmarks.micro import unique_number
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory
+
+# Количество страховых случаев в одном проходе конвейера выплат
+PIPELINE_BATCH = 100
+
+
+@pytest.fixture
+def policy(session):
+    """Действующий полис клиента, по которому создаются страховые случаи"""
+    client = ClientRepositoryImpl(session).create(ClientFactory(email=f"{unique_number('client')}@example.com"))
+    return PolicyRepositoryImpl(session).create(PolicyFactory(
+        client_id=client.id,
+        policy_number=unique_number("POL"),
+        start_date=date.today() - timedelta(days=30),
+        coverage_amount=Decimal("1000000")
+    ))
+
+
+def create_claim(session, policy, **fields):
+    return ClaimRepositoryImpl(session).create(ClaimFactory(
+        policy_id=policy.id,
+        client_id=policy.client_id,
+        claim_number=unique_number("CLM"),
+        incident_date=date.today() - timedelta(days=1),
+        claim_amount=Decimal("5000"),
+        **fields
+    ))
+
+
+def test_create_claim(benchmark, session, policy):
+    benchmark.group = "service"
+    service = ServiceFactory.create_claim_service(session)
+    
+    def setup():
+        claim = ClaimFactory.build(
+            policy_id=policy.id, client_id=policy.client_id, claim_number=None,
+            incident_date=date.today() - timedelta(days=1), created_at=None
+        )
+        return (claim,), {}
+    
+    benchmark.pedantic(service.create, setup=setup, rounds=200)
+
+
+def test_create_payment(benchmark, session, policy):
+    benchmark.group = "service"
+    service = ServiceFactory.create_payment_service(session)
+    claim = create_claim(session, policy)
+    
+    def setup():
+        payment = PaymentFactory.build(
+            client_id=claim.client_id, policy_id=claim.policy_id, claim_id=claim.id, payment_number=None,
+            payment_type=PaymentType.REFUND, created_at=None
+        )
+        return (payment,), {}
+    
+    benchmark.pedantic(service.create, setup=setup, rounds=200)
+
+
+@pytest.mark.parametrize("strategy", ["get_by_id", "projections", "combined"])
+def test_payment_references(benchmark, session, policy, strategy):
+    """Проверка клиента, полиса и страхового случая платежа: загрузка записей целиком, запросы только
+    нужных столбцов к каждому репозиторию и один общий запрос"""
+    benchmark.group = "service.create.references"
+    claim = create_claim(session, policy)
+    clients, policies, claims = (
+        ClientRepositoryImpl(session), PolicyRepositoryImpl(session), ClaimRepositoryImpl(session)
+    )
+    references = ReferenceRepositoryImpl(session)
+    checks = {
+        "get_by_id": lambda: (
+            clients.get_by_id(claim.client_id), policies.get_by_id(claim.policy_id), claims.get_by_id(claim.id)
+        ),
+        "projections": lambda: (
+            clients.exists(claim.client_id), policies.get_ref(claim.policy_id), claims.get_ref(claim.id)
+        ),
+        "combined": lambda: references.get_refs(claim.client_id, claim.policy_id, claim.id),
+    }
+    
+    benchmark(checks[strategy])
+
+
+def test_approve_claim(benchmark, session, policy):
+    benchmark.group = "service"
+    service = ServiceFactory.create_claim_service(session)
+    
+    def setup():
+        return (create_claim(session, policy).id, 3000), {}
+    
+    benchmark.pedantic(service.approve_claim, setup=setup, rounds=200)
+
+
+def test_create_claim_payout(benchmark, session, policy):
+    benchmark.group = "service"
+    service = ServiceFactory.create_payment_service(session)
+    
+    def setup():
+        claim = create_claim(session, policy, status=ClaimStatus.APPROVED, approved_amount=Decimal("3000"))
+        return (claim.id,), {}
+    
+    benchmark.pedantic(service.create_claim_payout, setup=setup, rounds=200)
+
+
+def test_payout_pipeline(benchmark, session, policy):
+    benchmark.group = f"service.run_payout_pipeline({PIPELINE_BATCH})"
+    service = ServiceFactory.create_payment_service(session)
+    
+    def setup():
+        for _ in range(PIPELINE_BATCH):
+            create_claim(session, policy, status=ClaimStatus.APPROVED, approved_amount=Decimal("3000"))
+        return (PIPELINE_BATCH,), {}
+    
+    benchmark.pedantic(service.run_payout_pipeline, setup=setup, rounds=10)
@@ -269,5 +269,64 @@ const ApiService = {
         delete(paymentId) {
             return ApiService.request(`/payments/${paymentId}`, 'DELETE');
         }
+    },
+
+    // Лента изменений страховых случаев и платежей
+    changes: {
+        // Получение изменений после курсора
+        getSince(cursor = null, limit = 100) {
+            let url = `/changes?limit=${limit}`;
+            if (cursor) {
+                url += `&since=${encodeURIComponent(cursor)}`;
+            }
+            return ApiService.request(url);
+        },
+
+        // Чтение потока изменений (Server-Sent Events).
+        // EventSource не передает заголовок Authorization, поэтому поток читается через fetch.
+        // Возвращает курсор последнего полученного события после закрытия потока.
+        async stream(onChanges, cursor = null, signal = null) {
+            const headers = { 'Accept': 'text/event-stream' };
+            if (ApiService.token) {
+                headers['Authorization'] = `Bearer ${ApiService.token}`;
+            }
+            if (cursor) {
+                headers['Last-Event-ID'] = cursor;
+            }
+
+            const response = await fetch(`${API_URL}/changes/stream`, { headers, signal });
+            if (!response.ok) {
+                throw new Error(`Поток изменений недоступен: ${response.status}`);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) {
+                    return cursor;
+                }
+                buffer += decoder.decode(value, { stream: true });
+
+                // События разделяются пустой строкой
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    const block = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    let data = null;
+                    block.split('\n').forEach(line => {
+                        if (line.startsWith('id: ')) {
+                            cursor = line.slice(4);
+                        } else if (line.startsWith('data: ')) {
+                            data = line.slice(6);
+                        }
+                    });
+                    if (data) {
+                        onChanges(JSON.parse(data).changes);
+                    }
+                }
+            }
+        }
     }
 };
@@ -94,6 +94,25 @@ const ClaimsHandler = {
         }
     },
 
+    // Применение изменений из ленты изменений без повторной загрузки списка
+    applyChanges(changes) {
+        if (changes.length === 0) {
+            return;
+        }
+        changes.forEach(change => {
+            const index = this.currentClaims.findIndex(item => item.id === change.entity_id);
+            if (index === -1) {
+                this.currentClaims.unshift(change.data);
+            } else {
+                // Сохраняем вычисленные на клиенте поля (номера связанных записей)
+                this.currentClaims[index] = { ...this.currentClaims[index], ...change.data };
+            }
+        });
+        if (!this.elements.claimsSection.classList.contains('d-none')) {
+            this.renderClaimsTable();
+        }
+    },
+
     // Отображение таблицы страховых случаев
     renderClaimsTable() {
         const tbody = this.elements.claimsTableBody;
@@ -78,4 +78,46 @@ document.addEventListener('DOMContentLoaded', function() {
 
     // По умолчанию активируем ссылку на клиентов
     document.getElementById('nav-clients').classList.add('active');
+
+    // Подписка на изменения страховых случаев и платежей после входа в систему
+    window.addEventListener('load:clients', () => ChangeFeed.start());
+    window.addEventListener('auth:logout', () => ChangeFeed.stop());
 });
+
+// Поток изменений: таблицы обновляются по отдельным изменениям вместо повторной загрузки списков
+const ChangeFeed = {
+    controller: null,
+    cursor: null,
+
+    async start() {
+        if (this.controller) {
+            return;
+        }
+        this.controller = new AbortController();
+        const signal = this.controller.signal;
+
+        while (!signal.aborted && ApiService.token) {
+            try {
+                this.cursor = await ApiService.changes.stream(changes => {
+                    ClaimsHandler.applyChanges(changes.filter(change => change.entity_type === 'claim'));
+                    PaymentsHandler.applyChanges(changes.filter(change => change.entity_type === 'payment'));
+                }, this.cursor, signal);
+            } catch (error) {
+                if (signal.aborted) {
+                    break;
+                }
+                console.error('Change feed error:', error);
+            }
+            // Переподключение с последнего полученного курсора
+            await new Promise(resolve => setTimeout(resolve, 3000));
+        }
+        this.controller = null;
+    },
+
+    stop() {
+        if (this.controller) {
+            this.controller.abort();
+        }
+        this.cursor = null;
+    }
+};
@@ -105,6 +105,25 @@ const PaymentsHandler = {
         }
     },
 
+    // Применение изменений из ленты изменений без повторной загрузки списка
+    applyChanges(changes) {
+        if (changes.length === 0) {
+            return;
+        }
+        changes.forEach(change => {
+            const index = this.currentPayments.findIndex(item => item.id === change.entity_id);
+            if (index === -1) {
+                this.currentPayments.unshift(change.data);
+            } else {
+                // Сохраняем вычисленные на клиенте поля (номера связанных записей)
+                this.currentPayments[index] = { ...this.currentPayments[index], ...change.data };
+            }
+        });
+        if (!this.elements.paymentsSection.classList.contains('d-none')) {
+            this.renderPaymentsTable();
+        }
+    },
+
     // Отображение таблицы платежей
     renderPaymentsTable() {
         const tbody = this.elements.paymentsTableBody;
@@ -2,9 +2,11 @@
 from insurance_app.application.dto.common_dto import PaginationDTO, PaginatedResponseDTO, ErrorDTO
 from insurance_app.application.dto.client_dto import ClientBaseDTO, ClientCreateDTO, ClientUpdateDTO, ClientResponseDTO
 from insurance_app.application.dto.policy_dto import PolicyBaseDTO, PolicyCreateDTO, PolicyUpdateDTO, PolicyResponseDTO
-from insurance_app.application.dto.claim_dto import ClaimBaseDTO, ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO, ClaimApproveDTO
+from insurance_app.application.dto.claim_dto import ClaimBaseDTO, ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO, ClaimApproveDTO, ClaimStatusBatchDTO, ClaimStatusSkippedDTO, ClaimStatusBatchResultDTO, ClaimApprovalItemDTO, ClaimBulkApproveDTO, ClaimApprovalRejectedDTO, ClaimBulkApproveResultDTO
 from insurance_app.application.dto.payment_dto import PaymentBaseDTO, PaymentCreateDTO, PaymentUpdateDTO, PaymentResponseDTO, PaymentProcessDTO
 from insurance_app.application.dto.user_dto import UserBaseDTO, UserCreateDTO, UserUpdateDTO, UserResponseDTO, TokenDTO, LoginDTO
+from insurance_app.application.dto.job_dto import JobCreateDTO, JobResponseDTO
+from insurance_app.application.dto.change_dto import ChangeDTO, ChangeFeedDTO
 
 __all__ = [
     'PaginationDTO',
@@ -23,6 +25,13 @@ __all__ = [
     'ClaimUpdateDTO',
     'ClaimResponseDTO',
     'ClaimApproveDTO',
+    'ClaimStatusBatchDTO',
+    'ClaimStatusSkippedDTO',
+    'ClaimStatusBatchResultDTO',
+    'ClaimApprovalItemDTO',
+    'ClaimBulkApproveDTO',
+    'ClaimApprovalRejectedDTO',
+    'ClaimBulkApproveResultDTO',
     'PaymentBaseDTO',
     'PaymentCreateDTO',
     'PaymentUpdateDTO',
@@ -33,5 +42,9 @@ __all__ = [
     'UserUpdateDTO',
     'UserResponseDTO',
     'TokenDTO',
-    'LoginDTO'
+    'LoginDTO',
+    'JobCreateDTO',
+    'JobResponseDTO',
+    'ChangeDTO',
+    'ChangeFeedDTO'
 ]
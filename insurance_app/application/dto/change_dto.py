@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import List, Literal, Union
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from insurance_app.application.dto.claim_dto import ClaimResponseDTO
+from insurance_app.application.dto.payment_dto import PaymentResponseDTO
+
+
+class ChangeDTO(BaseModel):
+    """DTO изменения сущности в ленте изменений"""
+    entity_type: Literal["claim", "payment"] = Field(..., description="Тип сущности")
+    entity_id: UUID = Field(..., description="Идентификатор сущности")
+    updated_at: datetime = Field(..., description="Время изменения")
+    data: Union[ClaimResponseDTO, PaymentResponseDTO] = Field(..., description="Текущее состояние сущности")
+
+
+class ChangeFeedDTO(BaseModel):
+    """DTO страницы ленты изменений"""
+    changes: List[ChangeDTO] = Field(..., description="Изменения в порядке времени изменения")
+    cursor: str = Field(..., description="Курсор для запроса следующей страницы (параметр since)")
+    has_more: bool = Field(..., description="Есть изменения, не вошедшие в страницу")
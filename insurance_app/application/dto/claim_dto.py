@@ -1,6 +1,6 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -42,7 +42,7 @@ class ClaimResponseDTO(ClaimBaseDTO):
     report_date: date = Field(..., description="Дата подачи заявления")
     approved_amount: Optional[Decimal] = Field(None, description="Утвержденная сумма выплаты")
     created_at: date = Field(..., description="Дата создания страхового случая")
-    updated_at: date = Field(..., description="Дата обновления страхового случая")
+    updated_at: datetime = Field(..., description="Дата и время обновления страхового случая")
     is_active: bool = Field(..., description="Статус активности страхового случая")
 
     class Config:
@@ -52,3 +52,49 @@ class ClaimResponseDTO(ClaimBaseDTO):
 class ClaimApproveDTO(BaseModel):
     """DTO для утверждения страхового случая"""
     approved_amount: Decimal = Field(..., description="Утвержденная сумма выплаты", gt=0)
+
+
+class ClaimStatusBatchDTO(BaseModel):
+    """DTO для пакетного изменения статуса страховых случаев"""
+    claim_ids: List[UUID] = Field(..., description="Идентификаторы страховых случаев", min_length=1, max_length=1000)
+    status: ClaimStatus = Field(..., description="Новый статус страховых случаев")
+
+
+class ClaimStatusSkippedDTO(BaseModel):
+    """DTO для страхового случая, пропущенного при пакетном изменении статуса"""
+    id: UUID = Field(..., description="Идентификатор страхового случая")
+    status: Optional[ClaimStatus] = Field(None, description="Текущий статус страхового случая")
+    reason: str = Field(..., description="Причина пропуска: not_found или transition_not_allowed")
+
+
+class ClaimStatusBatchResultDTO(BaseModel):
+    """DTO для ответа на пакетное изменение статуса страховых случаев"""
+    status: ClaimStatus = Field(..., description="Новый статус страховых случаев")
+    updated: List[UUID] = Field(..., description="Идентификаторы обновленных страховых случаев")
+    skipped: List[ClaimStatusSkippedDTO] = Field(..., description="Пропущенные страховые случаи")
+
+
+class ClaimApprovalItemDTO(BaseModel):
+    """DTO для утверждения страхового случая в составе пакета"""
+    claim_id: UUID = Field(..., description="Идентификатор страхового случая")
+    approved_amount: Decimal = Field(..., description="Утвержденная сумма выплаты", gt=0)
+
+
+class ClaimBulkApproveDTO(BaseModel):
+    """DTO для пакетного утверждения страховых случаев"""
+    approvals: List[ClaimApprovalItemDTO] = Field(..., description="Утверждаемые страховые случаи", min_length=1, max_length=5000)
+    create_payouts: bool = Field(False, description="Создать платежи страховых выплат по утвержденным случаям")
+
+
+class ClaimApprovalRejectedDTO(BaseModel):
+    """DTO для страхового случая, не прошедшего пакетное утверждение"""
+    id: UUID = Field(..., description="Идентификатор страхового случая")
+    reason: str = Field(..., description="Причина отказа")
+
+
+class ClaimBulkApproveResultDTO(BaseModel):
+    """DTO для ответа на пакетное утверждение страховых случаев"""
+    approved: List[UUID] = Field(..., description="Идентификаторы утвержденных страховых случаев")
+    rejected: List[ClaimApprovalRejectedDTO] = Field(..., description="Страховые случаи, не прошедшие проверку")
+    payout_ids: List[UUID] = Field(default_factory=list, description="Идентификаторы созданных платежей страховых выплат")
+
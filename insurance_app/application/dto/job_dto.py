@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from insurance_app.domain.models.job import JobStatus
+
+
+class JobCreateDTO(BaseModel):
+    """DTO для постановки фоновой задачи в очередь"""
+    job_type: str = Field(..., description="Тип задачи, например payouts.run или claims.approve_batch")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Параметры задачи")
+    max_attempts: int = Field(3, description="Максимальное количество попыток выполнения", ge=1, le=20)
+
+
+class JobResponseDTO(BaseModel):
+    """DTO для ответа с состоянием фоновой задачи"""
+    id: UUID = Field(..., description="Идентификатор задачи")
+    job_type: str = Field(..., description="Тип задачи")
+    status: JobStatus = Field(..., description="Статус задачи")
+    attempts: int = Field(..., description="Количество выполненных попыток")
+    max_attempts: int = Field(..., description="Максимальное количество попыток")
+    progress_current: int = Field(..., description="Количество обработанных элементов")
+    progress_total: Optional[int] = Field(None, description="Общее количество элементов, если известно")
+    result: Optional[Dict[str, Any]] = Field(None, description="Результат выполнения задачи")
+    error: Optional[str] = Field(None, description="Ошибка последней попытки")
+    run_after: Optional[datetime] = Field(None, description="Время, раньше которого задача не будет выполнена")
+    created_at: Optional[datetime] = Field(None, description="Дата постановки задачи в очередь")
+    finished_at: Optional[datetime] = Field(None, description="Дата завершения задачи")
@@ -5,20 +5,38 @@ from pydantic import BaseModel
 
 from insurance_app.application.dto.client_dto import ClientCreateDTO, ClientUpdateDTO, ClientResponseDTO
 from insurance_app.application.dto.policy_dto import PolicyCreateDTO, PolicyUpdateDTO, PolicyResponseDTO
-from insurance_app.application.dto.claim_dto import ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO
+from insurance_app.application.dto.claim_dto import (
+    ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO, ClaimStatusBatchResultDTO, ClaimStatusSkippedDTO,
+    ClaimBulkApproveResultDTO, ClaimApprovalRejectedDTO
+)
 from insurance_app.application.dto.payment_dto import PaymentCreateDTO, PaymentUpdateDTO, PaymentResponseDTO
 from insurance_app.application.dto.user_dto import UserCreateDTO, UserUpdateDTO, UserResponseDTO
+from insurance_app.application.dto.job_dto import JobResponseDTO
+from insurance_app.application.dto.change_dto import ChangeDTO, ChangeFeedDTO
 from insurance_app.domain.models.client import Client
 from insurance_app.domain.models.policy import Policy, PolicyStatus
-from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.domain.models.claim import Claim, ClaimApprovalResult, ClaimStatus, ClaimStatusChangeResult
 from insurance_app.domain.models.payment import Payment, PaymentStatus
 from insurance_app.domain.models.user import User
+from insurance_app.domain.models.job import Job
+from insurance_app.domain.models.change import Change, ChangeBatch
 
 
 T = TypeVar('T')
 U = TypeVar('U')
 
 
+def _copy_fields(values: dict, entity) -> None:
+    """
+    Переносит значения полей в доменный объект.
+    Доменные модели объявлены со __slots__, поэтому поля, которых нет в модели, пропускаются.
+    """
+    slots = type(entity).__slots__
+    for field, value in values.items():
+        if field in slots:
+            setattr(entity, field, value)
+
+
 class Mapper(Generic[T, U]):
     """Базовый класс маппера для преобразования между доменными объектами и DTO"""
     
@@ -53,8 +71,7 @@ class ClientMapper:
             entity = Client()
         
         # Копируем все поля из DTO в доменный объект
-        for field, value in dto.dict(exclude_unset=True).items():
-            setattr(entity, field, value)
+        _copy_fields(dto.dict(exclude_unset=True), entity)
         
         return entity
     
@@ -90,8 +107,7 @@ class PolicyMapper:
             entity = Policy()
         
         # Копируем все поля из DTO в доменный объект
-        for field, value in dto.dict(exclude_unset=True).items():
-            setattr(entity, field, value)
+        _copy_fields(dto.dict(exclude_unset=True), entity)
         
         return entity
     
@@ -111,7 +127,8 @@ class PolicyMapper:
             payment_frequency=entity.payment_frequency,
             description=entity.description,
             created_at=entity.created_at,
-            is_active=entity.is_active
+            is_active=entity.is_active,
+            auto_renew=entity.auto_renew
         )
     
     @classmethod
@@ -130,8 +147,7 @@ class ClaimMapper:
             entity = Claim()
         
         # Копируем все поля из DTO в доменный объект
-        for field, value in dto.dict(exclude_unset=True).items():
-            setattr(entity, field, value)
+        _copy_fields(dto.dict(exclude_unset=True), entity)
         
         return entity
     
@@ -158,6 +174,34 @@ class ClaimMapper:
     def to_dto_list(cls, entities: List[Claim]) -> List[ClaimResponseDTO]:
         """Преобразует список доменных объектов в список DTO"""
         return [cls.to_dto(entity) for entity in entities]
+    
+    @staticmethod
+    def to_status_batch_dto(result: ClaimStatusChangeResult) -> ClaimStatusBatchResultDTO:
+        """Преобразует результат пакетного изменения статуса в DTO"""
+        return ClaimStatusBatchResultDTO(
+            status=result.status,
+            updated=result.updated_ids,
+            skipped=[
+                ClaimStatusSkippedDTO(
+                    id=claim_id,
+                    status=current_status,
+                    reason="not_found" if current_status is None else "transition_not_allowed"
+                )
+                for claim_id, current_status in result.skipped.items()
+            ]
+        )
+    
+    @staticmethod
+    def to_bulk_approve_dto(result: ClaimApprovalResult, payouts: List[Payment] = ()) -> ClaimBulkApproveResultDTO:
+        """Преобразует результат пакетного утверждения в DTO"""
+        return ClaimBulkApproveResultDTO(
+            approved=[claim.id for claim in result.approved],
+            rejected=[
+                ClaimApprovalRejectedDTO(id=claim_id, reason=reason)
+                for claim_id, reason in result.rejected.items()
+            ],
+            payout_ids=[payment.id for payment in payouts]
+        )
 
 
 class PaymentMapper:
@@ -170,8 +214,7 @@ class PaymentMapper:
             entity = Payment()
         
         # Копируем все поля из DTO в доменный объект
-        for field, value in dto.dict(exclude_unset=True).items():
-            setattr(entity, field, value)
+        _copy_fields(dto.dict(exclude_unset=True), entity)
         
         return entity
     
@@ -192,6 +235,7 @@ class PaymentMapper:
             payment_method=entity.payment_method,
             description=entity.description,
             created_at=entity.created_at,
+            updated_at=entity.updated_at,
             is_active=entity.is_active
         )
     
@@ -217,8 +261,7 @@ class UserMapper:
         if "password" in dto_dict:
             dto_dict.pop("password")
             
-        for field, value in dto_dict.items():
-            setattr(entity, field, value)
+        _copy_fields(dto_dict, entity)
         
         return entity
     
@@ -240,3 +283,52 @@ class UserMapper:
     def to_dto_list(cls, entities: List[User]) -> List[UserResponseDTO]:
         """Преобразует список доменных объектов в список DTO"""
         return [cls.to_dto(entity) for entity in entities]
+
+
+class JobMapper:
+    """Маппер для фоновых задач"""
+    
+    @staticmethod
+    def to_dto(entity: Job) -> JobResponseDTO:
+        """Преобразует доменный объект задачи в DTO"""
+        return JobResponseDTO(
+            id=entity.id,
+            job_type=entity.job_type,
+            status=entity.status,
+            attempts=entity.attempts,
+            max_attempts=entity.max_attempts,
+            progress_current=entity.progress_current,
+            progress_total=entity.progress_total,
+            result=entity.result,
+            error=entity.error,
+            run_after=entity.run_after,
+            created_at=entity.created_at,
+            finished_at=entity.finished_at
+        )
+
+
+class ChangeMapper:
+    """Маппер для ленты изменений"""
+    
+    @staticmethod
+    def to_dto(change: Change) -> ChangeDTO:
+        """Преобразует изменение сущности в DTO"""
+        if change.entity_type == "claim":
+            data = ClaimMapper.to_dto(change.entity)
+        else:
+            data = PaymentMapper.to_dto(change.entity)
+        return ChangeDTO(
+            entity_type=change.entity_type,
+            entity_id=change.entity.id,
+            updated_at=change.entity.updated_at,
+            data=data
+        )
+    
+    @classmethod
+    def to_feed_dto(cls, batch: ChangeBatch) -> ChangeFeedDTO:
+        """Преобразует страницу ленты изменений в DTO"""
+        return ChangeFeedDTO(
+            changes=[cls.to_dto(change) for change in batch.changes],
+            cursor=batch.cursor,
+            has_more=batch.has_more
+        )
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
@@ -48,6 +48,7 @@ class PaymentResponseDTO(PaymentBaseDTO):
     payment_date: Optional[date] = Field(None, description="Дата платежа")
     due_date: Optional[date] = Field(None, description="Срок оплаты")
     created_at: date = Field(..., description="Дата создания платежа")
+    updated_at: Optional[datetime] = Field(None, description="Дата и время последнего изменения платежа")
     is_active: bool = Field(..., description="Статус активности платежа")
 
     class Config:
@@ -17,6 +17,7 @@ class PolicyBaseDTO(BaseModel):
     coverage_amount: Decimal = Field(..., description="Страховая сумма", gt=0)
     payment_frequency: str = Field("monthly", description="Частота платежей")
     description: Optional[str] = Field(None, description="Описание полиса")
+    auto_renew: bool = Field(False, description="Продлевать полис при истечении срока действия")
 
 
 class PolicyCreateDTO(PolicyBaseDTO):
@@ -38,6 +39,7 @@ class PolicyUpdateDTO(BaseModel):
     payment_frequency: Optional[str] = Field(None, description="Частота платежей")
     description: Optional[str] = Field(None, description="Описание полиса")
     is_active: Optional[bool] = Field(None, description="Статус активности полиса")
+    auto_renew: Optional[bool] = Field(None, description="Продлевать полис при истечении срока действия")
 
 
 class PolicyResponseDTO(PolicyBaseDTO):
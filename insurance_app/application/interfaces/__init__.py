@@ -10,6 +10,21 @@ from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.application.interfaces.claim_service import ClaimService
 from insurance_app.application.interfaces.payment_service import PaymentService
 from insurance_app.application.interfaces.user_service import UserService
+from insurance_app.application.interfaces.idempotency_repository import IdempotencyRepository
+from insurance_app.application.interfaces.idempotency_service import IdempotencyService
+from insurance_app.application.interfaces.job_repository import JobRepository
+from insurance_app.application.interfaces.job_service import JobService
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.application.interfaces.event_sink import EventSink
+from insurance_app.application.interfaces.change_feed_service import ChangeFeedService
+from insurance_app.application.interfaces.import_repository import ImportRepository
+from insurance_app.application.interfaces.import_service import ImportService
+from insurance_app.application.interfaces.partition_repository import PartitionRepository
+from insurance_app.application.interfaces.partition_service import PartitionService
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
+from insurance_app.application.interfaces.number_sequence_repository import NumberSequenceRepository
+from insurance_app.application.interfaces.number_generator import NumberGenerator
+from insurance_app.application.interfaces.reference_repository import ReferenceRepository
 
 __all__ = [
     'BaseRepository',
@@ -22,5 +37,20 @@ __all__ = [
     'PolicyService',
     'ClaimService',
     'PaymentService',
-    'UserService'
+    'UserService',
+    'IdempotencyRepository',
+    'IdempotencyService',
+    'JobRepository',
+    'JobService',
+    'OutboxRepository',
+    'EventSink',
+    'ChangeFeedService',
+    'ImportRepository',
+    'ImportService',
+    'PartitionRepository',
+    'PartitionService',
+    'CacheInvalidator',
+    'NumberSequenceRepository',
+    'NumberGenerator',
+    'ReferenceRepository'
 ]
\ No newline at end of file
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional
+from typing import Collection, Generic, TypeVar, Iterator, List, Optional
 from uuid import UUID
 
+from insurance_app.domain.models.version import EntityVersion
+
 # Определяем обобщенный тип для сущности
 T = TypeVar('T')
 
@@ -19,11 +21,26 @@ class BaseRepository(Generic[T], ABC):
         """Получает сущность по идентификатору"""
         pass
     
+    @abstractmethod
+    def get_by_ids(self, entity_ids: Collection[UUID]) -> List[T]:
+        """Получает сущности по набору идентификаторов одним запросом"""
+        pass
+    
+    @abstractmethod
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        """Получает номер версии и время изменения сущности, не загружая ее целиком"""
+        pass
+    
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Получает список сущностей с пагинацией"""
         pass
     
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[T]:
+        """Потоково перебирает все сущности пачками (для выгрузок)"""
+        pass
+    
     @abstractmethod
     def update(self, entity: T) -> T:
         """Обновляет существующую сущность"""
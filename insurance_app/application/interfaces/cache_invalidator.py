@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+
+def entity_tags(kind: str, entity_ids: Iterable) -> List[str]:
+    """Теги кэша записей: kind — множественное имя сущности (clients, policies, claims, payments)"""
+    return [f"{kind}:{entity_id}" for entity_id in entity_ids]
+
+
+class CacheInvalidator(ABC):
+    """Интерфейс сброса кэшированных ответов, зависящих от изменяемых записей"""
+    
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Делает недействительными ответы, помеченные любым из тегов.
+        Тег записи — результат entity_tags, тег всех записей сущности — ее множественное имя.
+        Вызывается после фиксации изменения.
+        """
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from insurance_app.domain.models.change import ChangeBatch
+
+
+class ChangeFeedService(ABC):
+    """Интерфейс сервиса ленты изменений страховых случаев и платежей"""
+    
+    @abstractmethod
+    def get_changes(self, cursor: Optional[str] = None, limit: int = 100) -> ChangeBatch:
+        """
+        Получает изменения после курсора, не более limit записей.
+        Без курсора лента читается с начала.
+        """
+        pass
+    
+    @abstractmethod
+    def head_cursor(self) -> str:
+        """Возвращает курсор, указывающий на текущий конец ленты"""
+        pass
@@ -1,19 +1,36 @@
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Collection, Dict, Optional, List
 from uuid import UUID
 
 from insurance_app.application.interfaces.base_repository import BaseRepository
-from insurance_app.domain.models.claim import Claim
+from insurance_app.domain.models.change import ChangePosition
+from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.domain.models.reference import ClaimRef
+from insurance_app.domain.models.version import EntityVersion
 
 
 class ClaimRepository(BaseRepository[Claim]):
     """Интерфейс репозитория для работы с страховыми случаями"""
     
+    @abstractmethod
+    def get_by_ids(self, entity_ids: Collection[UUID], for_update: bool = False) -> List[Claim]:
+        """
+        Получает страховые случаи по набору идентификаторов одним запросом.
+        При for_update строки блокируются до конца транзакции.
+        """
+        pass
+    
     @abstractmethod
     def get_by_claim_number(self, claim_number: str) -> Optional[Claim]:
         """Получает страховой случай по номеру"""
         pass
     
+    @abstractmethod
+    def get_ref(self, entity_id: UUID) -> Optional[ClaimRef]:
+        """Получает клиента и полис страхового случая для проверки ссылки на него, не загружая запись целиком"""
+        pass
+    
     @abstractmethod
     def get_by_policy_id(self, policy_id: UUID, skip: int = 0, limit: int = 100) -> List[Claim]:
         """Получает список страховых случаев по полису"""
@@ -22,4 +39,89 @@ class ClaimRepository(BaseRepository[Claim]):
     @abstractmethod
     def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Claim]:
         """Получает список страховых случаев клиента"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_by_period(
+        self,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None
+    ) -> List[Claim]:
+        """
+        Получает страховые случаи, заявленные с reported_from по reported_to включительно, с фильтром по полису
+        или клиенту. Условие на дату заявления ограничивает просматриваемые секции таблицы
+        """
+        pass
+    
+    @abstractmethod
+    def update_status_bulk(
+        self,
+        claim_ids: Collection[UUID],
+        status: ClaimStatus,
+        from_statuses: Collection[ClaimStatus]
+    ) -> List[UUID]:
+        """
+        Переводит страховые случаи в новый статус одним запросом.
+        Обновляются только случаи, находящиеся в одном из статусов from_statuses.
+        Возвращает идентификаторы обновленных случаев.
+        """
+        pass
+    
+    @abstractmethod
+    def get_statuses(self, claim_ids: Collection[UUID]) -> Dict[UUID, ClaimStatus]:
+        """Получает текущие статусы страховых случаев по идентификаторам"""
+        pass
+    
+    @abstractmethod
+    def approve_bulk(self, claims: List[Claim]) -> None:
+        """Сохраняет статус и утвержденную сумму для набора страховых случаев в одной транзакции"""
+        pass
+    
+    @abstractmethod
+    def get_approved_without_payout(self, limit: int = 500) -> List[Claim]:
+        """
+        Получает утвержденные страховые случаи, по которым еще не создана страховая выплата.
+        Строки блокируются до конца транзакции, уже заблокированные другими обработчиками пропускаются.
+        """
+        pass
+    
+    @abstractmethod
+    def mark_paid_by_completed_payouts(self, limit: int = 500) -> List[UUID]:
+        """
+        Переводит в статус PAID утвержденные страховые случаи с проведенной страховой выплатой.
+        Возвращает идентификаторы обновленных случаев.
+        """
+        pass
+    
+    @abstractmethod
+    def get_changed_since(
+        self,
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int = 100
+    ) -> List[Claim]:
+        """
+        Получает записи, измененные после позиции after и не позднее until,
+        в порядке (updated_at, id). При after=None чтение начинается с начала таблицы.
+        """
+        pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка страховых случаев с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
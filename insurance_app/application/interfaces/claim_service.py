@@ -1,9 +1,12 @@
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Optional, List
 from uuid import UUID
 
 from insurance_app.application.interfaces.base_service import BaseService
-from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.domain.models.claim import Claim, ClaimApprovalResult, ClaimStatus, ClaimStatusChangeResult
+from insurance_app.domain.models.version import EntityVersion
 
 
 class ClaimService(BaseService[Claim]):
@@ -25,11 +28,53 @@ class ClaimService(BaseService[Claim]):
         pass
     
     @abstractmethod
-    def update_status(self, claim_id: UUID, status: ClaimStatus) -> Claim:
-        """Обновляет статус страхового случая"""
+    def get_by_period(
+        self,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None
+    ) -> List[Claim]:
+        """Получает список страховых случаев, заявленных за период, с фильтром по полису или клиенту"""
+        pass
+    
+    @abstractmethod
+    def update_status(self, claim_id: UUID, status: ClaimStatus, expected_version: Optional[int] = None) -> Claim:
+        """
+        Обновляет статус страхового случая.
+        Если передана ожидаемая версия, а случай уже изменен, выбрасывает ConcurrencyConflictException
+        """
+        pass
+    
+    @abstractmethod
+    def update_status_batch(self, claim_ids: List[UUID], status: ClaimStatus) -> ClaimStatusChangeResult:
+        """Переводит набор страховых случаев в новый статус с проверкой допустимых переходов"""
         pass
     
     @abstractmethod
     def approve_claim(self, claim_id: UUID, approved_amount: float) -> Claim:
         """Утверждает страховой случай с указанной суммой выплаты"""
         pass
+    
+    @abstractmethod
+    def approve_claims_bulk(self, approvals: Dict[UUID, Decimal]) -> ClaimApprovalResult:
+        """Утверждает набор страховых случаев с указанными суммами выплат в одной транзакции"""
+        pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка страховых случаев с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from insurance_app.application.interfaces.base_repository import BaseRepository
 from insurance_app.domain.models.client import Client
+from insurance_app.domain.models.version import EntityVersion
 
 
 class ClientRepository(BaseRepository[Client]):
@@ -17,4 +18,17 @@ class ClientRepository(BaseRepository[Client]):
     @abstractmethod
     def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
         """Поиск клиентов по имени или фамилии"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def exists(self, entity_id: UUID) -> bool:
+        """Проверяет существование клиента, не загружая запись"""
+        pass
+    
+    @abstractmethod
+    def get_versions(self, skip: int = 0, limit: int = 100, name: Optional[str] = None) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка клиентов с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
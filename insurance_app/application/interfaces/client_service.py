@@ -4,6 +4,7 @@ from uuid import UUID
 
 from insurance_app.application.interfaces.base_service import BaseService
 from insurance_app.domain.models.client import Client
+from insurance_app.domain.models.version import EntityVersion
 
 
 class ClientService(BaseService[Client]):
@@ -18,3 +19,11 @@ class ClientService(BaseService[Client]):
     def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
         """Поиск клиентов по имени или фамилии"""
         pass
+    
+    @abstractmethod
+    def get_versions(self, skip: int = 0, limit: int = 100, name: Optional[str] = None) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка клиентов с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
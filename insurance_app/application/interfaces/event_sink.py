@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from insurance_app.domain.models.outbox import OutboxEvent
+
+
+class EventSink(ABC):
+    """Интерфейс получателя публикуемых доменных событий"""
+    
+    @abstractmethod
+    def publish(self, events: List[OutboxEvent]) -> None:
+        """
+        Публикует пачку событий.
+        Выбрасывает исключение, если пачку не удалось доставить: события будут отправлены повторно.
+        """
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+
+
+class IdempotencyRepository(ABC):
+    """Интерфейс репозитория сохраненных ответов для ключей идемпотентности"""
+    
+    @abstractmethod
+    def get(self, user_id: str, key: str) -> Optional[IdempotencyRecord]:
+        """Получает запись по пользователю и ключу"""
+        pass
+    
+    @abstractmethod
+    def try_create(self, record: IdempotencyRecord) -> bool:
+        """
+        Создает запись о начале выполнения запроса.
+        Возвращает False, если запись с таким пользователем и ключом уже существует.
+        """
+        pass
+    
+    @abstractmethod
+    def complete(self, user_id: str, key: str, status_code: int, response_body: str) -> None:
+        """Сохраняет ответ выполненного запроса"""
+        pass
+    
+    @abstractmethod
+    def delete(self, user_id: str, key: str) -> None:
+        """Удаляет запись, например если запрос завершился ошибкой"""
+        pass
+    
+    @abstractmethod
+    def delete_expired(self, now: datetime) -> int:
+        """Удаляет записи с истекшим сроком хранения, возвращает количество удаленных"""
+        pass
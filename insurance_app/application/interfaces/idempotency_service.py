@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+
+
+class IdempotencyService(ABC):
+    """Интерфейс сервиса ключей идемпотентности"""
+    
+    @abstractmethod
+    def begin(self, user_id: str, key: str, request_hash: str) -> Optional[IdempotencyRecord]:
+        """
+        Начинает выполнение запроса с ключом идемпотентности.
+        Возвращает сохраненный ответ, если запрос уже выполнен, иначе None.
+        Выбрасывает IdempotencyConflictException, если запрос еще выполняется
+        или ключ использован для запроса с другим содержимым.
+        """
+        pass
+    
+    @abstractmethod
+    def complete(self, user_id: str, key: str, request_hash: str, status_code: int, response_body: str) -> None:
+        """Сохраняет ответ выполненного запроса"""
+        pass
+    
+    @abstractmethod
+    def release(self, user_id: str, key: str) -> None:
+        """Освобождает ключ запроса, завершившегося ошибкой, чтобы его можно было повторить"""
+        pass
+    
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Удаляет сохраненные ответы с истекшим сроком хранения"""
+        pass
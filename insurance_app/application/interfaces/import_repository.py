@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from insurance_app.domain.models.bulk_import import ImportEntity, ImportRejection
+
+
+class ImportRepository(ABC):
+    """
+    Интерфейс репозитория массовой загрузки данных.
+    Файл загружается в промежуточную таблицу, проверяется и переносится в основную таблицу
+    в одной транзакции, которую фиксирует merge или отменяет discard.
+    """
+
+    @abstractmethod
+    def stage(
+        self,
+        entity: ImportEntity,
+        stream: BinaryIO,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """
+        Загружает CSV с заголовком в промежуточную таблицу сущности и возвращает количество строк.
+        progress получает количество прочитанных байт; он вызывается внутри транзакции загрузки
+        и не должен фиксировать сессию.
+        """
+        pass
+
+    @abstractmethod
+    def validate(self, entity: ImportEntity) -> int:
+        """Проверяет все строки промежуточной таблицы и возвращает количество отклоненных"""
+        pass
+
+    @abstractmethod
+    def get_rejections(self, entity: ImportEntity, limit: int = 100) -> List[ImportRejection]:
+        """Получает первые отклоненные строки"""
+        pass
+
+    @abstractmethod
+    def merge(self, entity: ImportEntity) -> Tuple[int, int]:
+        """
+        Переносит прошедшие проверку строки в основную таблицу: новые записи вставляются,
+        существующие с тем же естественным ключом обновляются. Фиксирует транзакцию
+        и возвращает количество вставленных и обновленных записей.
+        """
+        pass
+
+    @abstractmethod
+    def discard(self, entity: ImportEntity) -> None:
+        """Отменяет загрузку: откатывает транзакцию вместе с промежуточной таблицей"""
+        pass
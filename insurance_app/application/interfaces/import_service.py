@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Callable, Optional
+
+from insurance_app.domain.models.bulk_import import ImportEntity, ImportResult
+
+
+class ImportService(ABC):
+    """Интерфейс сервиса массовой загрузки данных из CSV"""
+
+    @abstractmethod
+    def import_csv(
+        self,
+        entity: ImportEntity,
+        stream: BinaryIO,
+        progress: Optional[Callable[[int], None]] = None,
+        strict: bool = False,
+        max_rejections: int = 100
+    ) -> ImportResult:
+        """
+        Загружает файл сущности: строки, не прошедшие проверку, отклоняются, остальные переносятся
+        в основную таблицу. При strict загрузка отменяется целиком, если отклонена хотя бы одна строка.
+        progress получает количество прочитанных байт файла.
+        """
+        pass
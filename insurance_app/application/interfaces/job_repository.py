@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Collection, Dict, Optional
+from uuid import UUID
+
+from insurance_app.domain.models.job import Job
+
+
+class JobRepository(ABC):
+    """Интерфейс репозитория очереди фоновых задач"""
+    
+    @abstractmethod
+    def create(self, job: Job) -> Job:
+        """Помещает задачу в очередь"""
+        pass
+    
+    @abstractmethod
+    def get_by_id(self, job_id: UUID) -> Optional[Job]:
+        """Получает задачу по идентификатору"""
+        pass
+    
+    @abstractmethod
+    def claim_next(self, worker_id: str, now: datetime, job_types: Optional[Collection[str]] = None) -> Optional[Job]:
+        """
+        Атомарно выбирает следующую готовую к выполнению задачу и переводит ее в статус RUNNING.
+        Задачи, уже выбранные другими обработчиками, пропускаются.
+        """
+        pass
+    
+    @abstractmethod
+    def update_progress(self, job_id: UUID, worker_id: str, current: int, total: Optional[int] = None) -> bool:
+        """
+        Сохраняет прогресс выполнения задачи и продлевает ее блокировку обработчиком worker_id.
+        Здесь и далее изменяется только задача, которую еще выполняет worker_id; возвращает, изменена ли она.
+        """
+        pass
+    
+    @abstractmethod
+    def heartbeat(self, job_id: UUID, worker_id: str, now: datetime) -> bool:
+        """Продлевает блокировку задачи обработчиком worker_id"""
+        pass
+    
+    @abstractmethod
+    def mark_succeeded(self, job_id: UUID, worker_id: str, result: Optional[Dict[str, Any]], now: datetime) -> bool:
+        """Отмечает задачу как успешно выполненную"""
+        pass
+    
+    @abstractmethod
+    def mark_failed(
+        self,
+        job_id: UUID,
+        worker_id: str,
+        error: str,
+        now: datetime,
+        retry_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Отмечает неудачную попытку выполнения задачи.
+        Если указан retry_at, задача возвращается в очередь до этого времени, иначе завершается со статусом FAILED.
+        """
+        pass
+    
+    @abstractmethod
+    def requeue_stale(self, locked_before: datetime) -> int:
+        """
+        Возвращает в очередь задачи, блокировка которых не продлевалась с locked_before (обработчик перестал
+        отвечать); задачи с исчерпанными попытками завершаются со статусом FAILED. Возвращает число таких задач.
+        """
+        pass
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import Any, Collection, Dict, Optional
+from uuid import UUID
+
+from insurance_app.domain.models.job import Job
+
+
+class JobService(ABC):
+    """Интерфейс сервиса очереди фоновых задач"""
+    
+    @abstractmethod
+    def submit(self, job_type: str, payload: Dict[str, Any], max_attempts: int = 3) -> Job:
+        """Помещает задачу в очередь"""
+        pass
+    
+    @abstractmethod
+    def get_by_id(self, job_id: UUID) -> Optional[Job]:
+        """Получает задачу по идентификатору"""
+        pass
+    
+    @abstractmethod
+    def claim_next(self, worker_id: str, job_types: Optional[Collection[str]] = None) -> Optional[Job]:
+        """Выбирает следующую готовую к выполнению задачу для обработчика"""
+        pass
+    
+    @abstractmethod
+    def report_progress(self, job: Job, current: int, total: Optional[int] = None) -> None:
+        """Сохраняет прогресс выполнения задачи и продлевает ее блокировку"""
+        pass
+    
+    @abstractmethod
+    def heartbeat(self, job: Job) -> bool:
+        """Продлевает блокировку выполняемой задачи. Возвращает False, если задачу выполняет уже другой обработчик"""
+        pass
+    
+    @abstractmethod
+    def complete(self, job: Job, result: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Отмечает задачу как успешно выполненную.
+        Возвращает False, если задача была возвращена в очередь и результат не сохранен.
+        """
+        pass
+    
+    @abstractmethod
+    def fail(self, job: Job, error: str) -> Job:
+        """
+        Отмечает неудачную попытку выполнения задачи.
+        Если попытки не исчерпаны, задача возвращается в очередь с экспоненциальной задержкой.
+        """
+        pass
+    
+    @abstractmethod
+    def requeue_stale(self) -> int:
+        """
+        Возвращает в очередь задачи обработчиков, которые перестали отвечать;
+        задачи с исчерпанными попытками завершаются ошибкой
+        """
+        pass
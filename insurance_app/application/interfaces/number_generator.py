@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class NumberGenerator(ABC):
+    """Интерфейс генератора уникальных номеров полисов, страховых случаев и платежей"""
+    
+    @abstractmethod
+    def next_value(self, sequence: str) -> int:
+        """Следующее значение последовательности; значения уникальны, но могут идти с пропусками"""
+        pass
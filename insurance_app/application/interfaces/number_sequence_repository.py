@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class NumberSequenceRepository(ABC):
+    """Интерфейс репозитория последовательностей блоков номеров"""
+    
+    @abstractmethod
+    def next_block(self, sequence: str) -> int:
+        """
+        Выделяет следующий блок номеров последовательности sequence (policy, claim, payment)
+        и возвращает его номер, начиная с 1. Выделение не откатывается вместе с текущей транзакцией,
+        поэтому один блок никогда не выдается дважды.
+        """
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Collection, List
+
+from insurance_app.domain.models.outbox import OutboxEvent
+
+
+class OutboxRepository(ABC):
+    """Интерфейс репозитория исходящих доменных событий"""
+    
+    @abstractmethod
+    def add(self, event: OutboxEvent) -> None:
+        """
+        Добавляет событие в текущую транзакцию без ее фиксации.
+        Событие сохраняется вместе с изменением состояния, которое фиксирует следующий вызов репозитория.
+        """
+        pass
+    
+    @abstractmethod
+    def get_unpublished(self, limit: int = 100) -> List[OutboxEvent]:
+        """
+        Получает неопубликованные события в порядке их создания.
+        Строки блокируются до конца транзакции, заблокированные другими ретрансляторами пропускаются.
+        """
+        pass
+    
+    @abstractmethod
+    def mark_published(self, event_ids: Collection[int], now: datetime) -> None:
+        """Отмечает события как опубликованные"""
+        pass
+    
+    @abstractmethod
+    def mark_failed(self, event_ids: Collection[int], error: str) -> None:
+        """Учитывает неудачную попытку публикации событий"""
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+from insurance_app.domain.models.partition import TablePartition
+
+
+class PartitionRepository(ABC):
+    """
+    Интерфейс репозитория секций таблиц, секционированных по диапазонам дат.
+    Каждый вызов, изменяющий схему, фиксирует транзакцию, чтобы не удерживать блокировку родительской таблицы.
+    """
+
+    @abstractmethod
+    def get_partitioned_tables(self) -> List[str]:
+        """Получает секционированные таблицы; пустой список, если СУБД не поддерживает секционирование"""
+        pass
+
+    @abstractmethod
+    def get_partitions(self, table: str) -> List[TablePartition]:
+        """Получает секции таблицы в порядке диапазонов; секция по умолчанию не возвращается"""
+        pass
+
+    @abstractmethod
+    def create_partition(self, table: str, start: date, end: date) -> TablePartition:
+        """Создает секцию таблицы для строк с ключом секционирования в [start, end)"""
+        pass
+
+    @abstractmethod
+    def detach_partition(self, partition: TablePartition, archive_schema: str) -> None:
+        """
+        Отсоединяет секцию от таблицы и переносит ее в схему archive_schema.
+        Данные секции сохраняются, но запросы к таблице их больше не просматривают.
+        """
+        pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional
+
+from insurance_app.domain.models.partition import PartitionMaintenanceResult
+
+
+class PartitionService(ABC):
+    """Интерфейс сервиса обслуживания помесячных секций таблиц платежей и страховых случаев"""
+
+    @abstractmethod
+    def ensure_partitions(self, start: date, end: date) -> PartitionMaintenanceResult:
+        """Создает недостающие помесячные секции, покрывающие даты с start по end включительно"""
+        pass
+
+    @abstractmethod
+    def maintain(
+        self,
+        months_ahead: int = 3,
+        retain_months: Optional[int] = None,
+        archive_schema: str = "archive",
+        today: Optional[date] = None
+    ) -> PartitionMaintenanceResult:
+        """
+        Создает секции на текущий и months_ahead следующих месяцев. При заданном retain_months
+        отсоединяет в схему archive_schema секции, закончившиеся раньше, чем retain_months месяцев
+        до начала текущего месяца.
+        """
+        pass
@@ -1,9 +1,12 @@
 from abc import abstractmethod
+from datetime import date, datetime
 from typing import Optional, List
 from uuid import UUID
 
 from insurance_app.application.interfaces.base_repository import BaseRepository
+from insurance_app.domain.models.change import ChangePosition
 from insurance_app.domain.models.payment import Payment
+from insurance_app.domain.models.version import EntityVersion
 
 
 class PaymentRepository(BaseRepository[Payment]):
@@ -27,4 +30,65 @@ class PaymentRepository(BaseRepository[Payment]):
     @abstractmethod
     def get_by_claim_id(self, claim_id: UUID, skip: int = 0, limit: int = 100) -> List[Payment]:
         """Получает список платежей по страховому случаю"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_by_period(
+        self,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> List[Payment]:
+        """
+        Получает платежи, созданные с created_from по created_to включительно, с фильтром по страховому случаю,
+        полису или клиенту. Условие на дату создания ограничивает просматриваемые секции таблицы
+        """
+        pass
+    
+    @abstractmethod
+    def create_bulk(self, entities: List[Payment]) -> List[Payment]:
+        """Создает набор платежей одним пакетным запросом в одной транзакции"""
+        pass
+    
+    @abstractmethod
+    def create_payouts_bulk(self, entities: List[Payment]) -> List[Payment]:
+        """
+        Создает набор страховых выплат одним пакетным запросом.
+        Выплаты по страховым случаям, для которых выплата уже существует, пропускаются; строки случаев
+        блокируются до проверки. Возвращает фактически созданные платежи.
+        """
+        pass
+    
+    @abstractmethod
+    def get_changed_since(
+        self,
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int = 100
+    ) -> List[Payment]:
+        """
+        Получает записи, измененные после позиции after и не позднее until,
+        в порядке (updated_at, id). При after=None чтение начинается с начала таблицы.
+        """
+        pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка платежей с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
@@ -4,7 +4,9 @@ from uuid import UUID
 from datetime import date
 
 from insurance_app.application.interfaces.base_service import BaseService
-from insurance_app.domain.models.payment import Payment, PaymentStatus
+from insurance_app.domain.models.payment import Payment, PaymentStatus, PayoutRunResult
+from insurance_app.domain.models.version import EntityVersion
+from insurance_app.domain.models.claim import Claim
 
 
 class PaymentService(BaseService[Payment]):
@@ -30,6 +32,20 @@ class PaymentService(BaseService[Payment]):
         """Получает список платежей по страховому случаю"""
         pass
     
+    @abstractmethod
+    def get_by_period(
+        self,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> List[Payment]:
+        """Получает список платежей, созданных за период, с фильтром по страховому случаю, полису или клиенту"""
+        pass
+    
     @abstractmethod
     def process_payment(self, payment_id: UUID, payment_date: date = None) -> Payment:
         """Обрабатывает платеж, меняя его статус на COMPLETED"""
@@ -44,3 +60,33 @@ class PaymentService(BaseService[Payment]):
     def create_claim_payout(self, claim_id: UUID) -> Payment:
         """Создает платеж страховой выплаты по страховому случаю"""
         pass
+    
+    @abstractmethod
+    def create_claim_payouts(self, claims: List[Claim]) -> List[Payment]:
+        """Создает платежи страховых выплат по набору утвержденных страховых случаев"""
+        pass
+    
+    @abstractmethod
+    def run_payout_pipeline(self, batch_size: int = 500) -> PayoutRunResult:
+        """
+        Выполняет один проход конвейера страховых выплат: создает выплаты по утвержденным
+        страховым случаям без выплаты и переводит в статус PAID случаи с проведенной выплатой
+        """
+        pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка платежей с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
@@ -1,9 +1,12 @@
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import date
+from typing import Collection, Dict, Optional, List
 from uuid import UUID
 
 from insurance_app.application.interfaces.base_repository import BaseRepository
 from insurance_app.domain.models.policy import Policy
+from insurance_app.domain.models.reference import PolicyRef
+from insurance_app.domain.models.version import EntityVersion
 
 
 class PolicyRepository(BaseRepository[Policy]):
@@ -14,6 +17,11 @@ class PolicyRepository(BaseRepository[Policy]):
         """Получает полис по номеру"""
         pass
     
+    @abstractmethod
+    def get_ref(self, entity_id: UUID) -> Optional[PolicyRef]:
+        """Получает поля полиса для проверки ссылки на него, не загружая запись целиком"""
+        pass
+    
     @abstractmethod
     def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Policy]:
         """Получает список полисов клиента"""
@@ -21,5 +29,36 @@ class PolicyRepository(BaseRepository[Policy]):
     
     @abstractmethod
     def get_active_policies(self, skip: int = 0, limit: int = 100) -> List[Policy]:
-        """Получает список активных полисов"""
-        pass
\ No newline at end of file
+        """Получает список действующих полисов: статус ACTIVE и срок действия не истек"""
+        pass
+    
+    @abstractmethod
+    def get_expired_active(self, as_of: date, limit: int = 500) -> List[Policy]:
+        """
+        Получает полисы в статусе ACTIVE, срок действия которых закончился до as_of, в порядке даты окончания.
+        Строки блокируются до конца транзакции, полисы, заблокированные другим обработчиком, пропускаются.
+        """
+        pass
+    
+    @abstractmethod
+    def expire_and_renew(self, policy_ids: Collection[UUID], renewals: Dict[UUID, Policy]) -> List[UUID]:
+        """
+        В одной транзакции переводит полисы в статус EXPIRED и создает продления (ключ — идентификатор
+        истекающего полиса). Полисы, уже не находящиеся в статусе ACTIVE, и их продления пропускаются.
+        Возвращает идентификаторы истекших полисов.
+        """
+        pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        active_only: bool = False
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка полисов с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
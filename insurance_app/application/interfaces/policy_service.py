@@ -1,9 +1,11 @@
 from abc import abstractmethod
+from datetime import date
 from typing import Optional, List
 from uuid import UUID
 
 from insurance_app.application.interfaces.base_service import BaseService
-from insurance_app.domain.models.policy import Policy
+from insurance_app.domain.models.policy import Policy, PolicyExpiryResult
+from insurance_app.domain.models.version import EntityVersion
 
 
 class PolicyService(BaseService[Policy]):
@@ -21,10 +23,33 @@ class PolicyService(BaseService[Policy]):
     
     @abstractmethod
     def get_active_policies(self, skip: int = 0, limit: int = 100) -> List[Policy]:
-        """Получает список активных полисов"""
+        """Получает список действующих полисов"""
+        pass
+    
+    @abstractmethod
+    def process_expirations(self, batch_size: int = 500, as_of: Optional[date] = None) -> PolicyExpiryResult:
+        """
+        Выполняет один проход обработки полисов с истекшим сроком: переводит до batch_size действующих
+        полисов, срок которых закончился до as_of (по умолчанию сегодня), в статус EXPIRED
+        и создает продления для полисов с auto_renew
+        """
         pass
     
     @abstractmethod
     def calculate_premium(self, policy: Policy) -> Policy:
         """Рассчитывает страховую премию для полиса"""
         pass
+    
+    @abstractmethod
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        active_only: bool = False
+    ) -> List[EntityVersion]:
+        """
+        Получает версии страницы списка полисов с теми же фильтрами, что и получение списка,
+        не загружая записи целиком
+        """
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from insurance_app.domain.models.reference import EntityRefs
+
+
+class ReferenceRepository(ABC):
+    """Интерфейс репозитория для проверки ссылок создаваемой записи на клиента, полис и страховой случай"""
+    
+    @abstractmethod
+    def get_refs(
+        self,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> EntityRefs:
+        """
+        Одним запросом находит клиента, полис и страховой случай по указанным идентификаторам
+        и возвращает только поля, нужные для проверки ссылок
+        """
+        pass
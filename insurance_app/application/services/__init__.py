@@ -4,6 +4,13 @@ from insurance_app.application.services.policy_service import PolicyServiceImpl
 from insurance_app.application.services.claim_service import ClaimServiceImpl
 from insurance_app.application.services.payment_service import PaymentServiceImpl
 from insurance_app.application.services.user_service import UserServiceImpl
+from insurance_app.application.services.idempotency_service import IdempotencyServiceImpl
+from insurance_app.application.services.job_service import JobServiceImpl
+from insurance_app.application.services.outbox_relay import OutboxRelay
+from insurance_app.application.services.change_feed_service import ChangeFeedServiceImpl
+from insurance_app.application.services.import_service import ImportServiceImpl
+from insurance_app.application.services.partition_service import PartitionServiceImpl
+from insurance_app.application.services.number_generator import NumberGeneratorImpl
 from insurance_app.application.services.factory import ServiceFactory
 
 __all__ = [
@@ -12,5 +19,12 @@ __all__ = [
     'ClaimServiceImpl',
     'PaymentServiceImpl',
     'UserServiceImpl',
+    'IdempotencyServiceImpl',
+    'JobServiceImpl',
+    'OutboxRelay',
+    'ChangeFeedServiceImpl',
+    'ImportServiceImpl',
+    'PartitionServiceImpl',
+    'NumberGeneratorImpl',
     'ServiceFactory'
 ]
@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from uuid import UUID
+
+from insurance_app.application.interfaces.change_feed_service import ChangeFeedService
+from insurance_app.application.interfaces.claim_repository import ClaimRepository
+from insurance_app.application.interfaces.payment_repository import PaymentRepository
+from insurance_app.domain.models.change import Change, ChangeBatch, ChangePosition
+
+# Наибольший идентификатор: позиция с ним находится после всех записей с тем же updated_at
+_MAX_ID = UUID(int=(1 << 128) - 1)
+
+
+def encode_cursor(positions: Dict[str, ChangePosition]) -> str:
+    """Кодирует позиции чтения по типам сущностей в непрозрачную строку"""
+    data = {
+        entity_type: [position.updated_at.isoformat(), str(position.id)]
+        for entity_type, position in positions.items()
+    }
+    raw = json.dumps(data, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, ChangePosition]:
+    """Декодирует курсор. Для некорректного курсора выбрасывает ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return {
+            entity_type: ChangePosition(datetime.fromisoformat(updated_at), UUID(entity_id))
+            for entity_type, (updated_at, entity_id) in data.items()
+        }
+    except (binascii.Error, UnicodeDecodeError, AttributeError, TypeError, ValueError):
+        raise ValueError("Некорректный курсор ленты изменений")
+
+
+class ChangeFeedServiceImpl(ChangeFeedService):
+    """
+    Лента изменений по индексам (updated_at, id) таблиц страховых случаев и платежей.
+    Записи моложе settle_delay не выдаются: транзакция, получившая метку времени раньше,
+    но еще не зафиксированная, успевает завершиться до того, как курсор уйдет дальше ее записей.
+    Удаления в ленту не попадают.
+    """
+    
+    def __init__(
+        self,
+        claim_repository: ClaimRepository,
+        payment_repository: PaymentRepository,
+        settle_delay: timedelta = timedelta(seconds=2)
+    ):
+        self.sources = {
+            "claim": claim_repository,
+            "payment": payment_repository,
+        }
+        self.settle_delay = settle_delay
+    
+    def get_changes(self, cursor: Optional[str] = None, limit: int = 100) -> ChangeBatch:
+        """Получает изменения после курсора, не более limit записей"""
+        if limit < 1:
+            raise ValueError("Размер страницы должен быть не меньше 1")
+        positions = decode_cursor(cursor) if cursor else {}
+        until = datetime.utcnow() - self.settle_delay
+        
+        # Из каждой таблицы читается по limit + 1 записей, общая страница собирается слиянием по времени изменения
+        changes = [
+            Change(entity_type, entity)
+            for entity_type, repository in self.sources.items()
+            for entity in repository.get_changed_since(positions.get(entity_type), until, limit + 1)
+        ]
+        changes.sort(key=lambda change: (change.entity.updated_at, change.entity_type, change.entity.id))
+        page = changes[:limit]
+        
+        for change in page:
+            positions[change.entity_type] = change.position
+        return ChangeBatch(changes=page, cursor=encode_cursor(positions), has_more=len(changes) > limit)
+    
+    def head_cursor(self) -> str:
+        """Возвращает курсор, указывающий на текущий конец ленты"""
+        head = ChangePosition(datetime.utcnow() - self.settle_delay, _MAX_ID)
+        return encode_cursor({entity_type: head for entity_type in self.sources})
@@ -1,29 +1,47 @@
 import uuid
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
 from insurance_app.application.interfaces.claim_repository import ClaimRepository
 from insurance_app.application.interfaces.claim_service import ClaimService
 from insurance_app.application.interfaces.policy_repository import PolicyRepository
 from insurance_app.application.interfaces.client_repository import ClientRepository
-from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.application.interfaces.number_generator import NumberGenerator
+from insurance_app.application.interfaces.reference_repository import ReferenceRepository
+from insurance_app.application.services.mixins import CacheInvalidationMixin, EventRecorderMixin
+from insurance_app.domain.events import ClaimApproved
+from insurance_app.domain.models.claim import (
+    Claim, ClaimApprovalResult, ClaimStatus, ClaimStatusChangeResult, allowed_source_statuses
+)
 from insurance_app.domain.models.policy import PolicyStatus
+from insurance_app.domain.models.reference import EntityRefs
+from insurance_app.domain.models.version import EntityVersion
 
 
-class ClaimServiceImpl(ClaimService):
+class ClaimServiceImpl(EventRecorderMixin, CacheInvalidationMixin, ClaimService):
     """Реализация сервиса для работы с страховыми случаями"""
     
     def __init__(
         self,
         claim_repository: ClaimRepository,
         policy_repository: PolicyRepository,
-        client_repository: ClientRepository
+        client_repository: ClientRepository,
+        outbox_repository: Optional[OutboxRepository] = None,
+        cache_invalidator: Optional[CacheInvalidator] = None,
+        number_generator: Optional[NumberGenerator] = None,
+        reference_repository: Optional[ReferenceRepository] = None
     ):
         self.claim_repository = claim_repository
         self.policy_repository = policy_repository
         self.client_repository = client_repository
+        self.outbox_repository = outbox_repository
+        self.cache_invalidator = cache_invalidator
+        self.number_generator = number_generator
+        self.reference_repository = reference_repository
     
     def create(self, entity: Claim) -> Claim:
         """Создает новый страховой случай"""
@@ -31,9 +49,12 @@ class ClaimServiceImpl(ClaimService):
         if entity.id is None:
             entity.id = uuid.uuid4()
         
-        # Генерируем номер страхового случая если его нет
+        # Генерируем номер страхового случая если его нет. Указанный номер проверяется на занятость:
+        # секционированная таблица в PostgreSQL не имеет уникального индекса номера
         if not entity.claim_number:
-            entity.claim_number = f"CLM-{str(entity.id)[:8].upper()}"
+            entity.claim_number = self._claim_number(entity.id)
+        elif self.claim_repository.get_by_claim_number(entity.claim_number) is not None:
+            raise ValueError(f"Страховой случай с номером {entity.claim_number} уже существует")
         
         # Устанавливаем даты
         today = date.today()
@@ -41,14 +62,18 @@ class ClaimServiceImpl(ClaimService):
             entity.created_at = today
         
         if entity.updated_at is None:
-            entity.updated_at = today
+            entity.updated_at = datetime.utcnow()
         
         if entity.report_date is None:
             entity.report_date = today
         
+        # Указанные клиент и полис загружаются вместе, до проверок
+        client_id = entity.client_id
+        refs = self._load_refs(client_id, entity.policy_id)
+        
         # Проверяем существование полиса
         if entity.policy_id:
-            policy = self.policy_repository.get_by_id(entity.policy_id)
+            policy = refs.policy
             if not policy:
                 raise ValueError(f"Полис с ID {entity.policy_id} не найден")
             
@@ -68,30 +93,73 @@ class ClaimServiceImpl(ClaimService):
             if entity.client_id is None and policy.client_id:
                 entity.client_id = policy.client_id
         
-        # Проверяем существование клиента
-        if entity.client_id:
-            client = self.client_repository.get_by_id(entity.client_id)
-            if not client:
-                raise ValueError(f"Клиент с ID {entity.client_id} не найден")
+        # Проверяем существование указанного клиента; клиент полиса существует благодаря внешнему ключу
+        if client_id and refs.client_id is None:
+            raise ValueError(f"Клиент с ID {client_id} не найден")
         
         return self.claim_repository.create(entity)
     
+    def _load_refs(self, client_id: Optional[UUID], policy_id: Optional[UUID]) -> EntityRefs:
+        """
+        Находит клиента и полис, на которые ссылается новый страховой случай: одним запросом или,
+        без репозитория ссылок, запросами только нужных столбцов к репозиториям клиентов и полисов
+        """
+        if self.reference_repository is not None:
+            return self.reference_repository.get_refs(client_id, policy_id)
+        return EntityRefs(
+            client_id=client_id if client_id and self.client_repository.exists(client_id) else None,
+            policy=self.policy_repository.get_ref(policy_id) if policy_id else None
+        )
+    
+    def _claim_number(self, claim_id: UUID) -> str:
+        """Номер нового страхового случая; без генератора номеров (в тестах) производится от идентификатора"""
+        if self.number_generator is None:
+            return f"CLM-{str(claim_id)[:8].upper()}"
+        return f"CLM-{self.number_generator.next_value('claim'):010d}"
+    
     def get_by_id(self, entity_id: UUID) -> Optional[Claim]:
         """Получает страховой случай по идентификатору"""
         return self.claim_repository.get_by_id(entity_id)
     
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        """Получает номер версии и время изменения, не загружая запись целиком"""
+        return self.claim_repository.get_version(entity_id)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """Получает версии страницы списка страховых случаев"""
+        return self.claim_repository.get_versions(skip, limit, policy_id, client_id, reported_from, reported_to)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Claim]:
         """Получает список страховых случаев с пагинацией"""
         return self.claim_repository.get_all(skip, limit)
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Claim]:
+        """Потоково перебирает все страховые случаи для выгрузки"""
+        return self.claim_repository.iter_all(batch_size)
+    
     def update(self, entity: Claim) -> Claim:
         """Обновляет существующий страховой случай"""
-        entity.updated_at = date.today()
-        return self.claim_repository.update(entity)
+        entity.updated_at = datetime.utcnow()
+        claim = self.claim_repository.update(entity)
+        self._invalidate("claims", [claim.id])
+        return claim
     
     def delete(self, entity_id: UUID) -> bool:
         """Удаляет страховой случай по идентификатору"""
-        return self.claim_repository.delete(entity_id)
+        deleted = self.claim_repository.delete(entity_id)
+        self._invalidate("claims", [entity_id])
+        # Вместе со случаем удалены его платежи, их идентификаторы заранее неизвестны
+        if deleted and self.cache_invalidator is not None:
+            self.cache_invalidator.invalidate(["payments"])
+        return deleted
     
     def get_by_claim_number(self, claim_number: str) -> Optional[Claim]:
         """Получает страховой случай по номеру"""
@@ -105,16 +173,57 @@ class ClaimServiceImpl(ClaimService):
         """Получает список страховых случаев клиента"""
         return self.claim_repository.get_by_client_id(client_id, skip, limit)
     
-    def update_status(self, claim_id: UUID, status: ClaimStatus) -> Claim:
+    def get_by_period(
+        self,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None
+    ) -> List[Claim]:
+        """Получает список страховых случаев, заявленных за период"""
+        return self.claim_repository.get_by_period(reported_from, reported_to, skip, limit, policy_id, client_id)
+    
+    def update_status(self, claim_id: UUID, status: ClaimStatus, expected_version: Optional[int] = None) -> Claim:
         """Обновляет статус страхового случая"""
         claim = self.claim_repository.get_by_id(claim_id)
         if not claim:
             raise ValueError(f"Страховой случай с ID {claim_id} не найден")
+        if expected_version is not None:
+            claim.version = expected_version
         
         claim.status = status
-        claim.updated_at = date.today()
+        claim.updated_at = datetime.utcnow()
+        
+        claim = self.claim_repository.update(claim)
+        self._invalidate("claims", [claim.id])
+        return claim
+    
+    def update_status_batch(self, claim_ids: List[UUID], status: ClaimStatus) -> ClaimStatusChangeResult:
+        """Переводит набор страховых случаев в новый статус с проверкой допустимых переходов"""
+        # Утверждение требует суммы выплаты и выполняется отдельно
+        if status == ClaimStatus.APPROVED:
+            raise ValueError("Для утверждения страховых случаев необходимо указать сумму выплаты")
         
-        return self.claim_repository.update(claim)
+        unique_ids = list(dict.fromkeys(claim_ids))
+        
+        # Переход выполняется одним запросом только для случаев в допустимых статусах
+        updated_ids = self.claim_repository.update_status_bulk(
+            unique_ids, status, allowed_source_statuses(status)
+        )
+        self._invalidate("claims", updated_ids)
+        
+        # Для пропущенных случаев получаем текущий статус, чтобы сообщить причину
+        updated = set(updated_ids)
+        skipped_ids = [claim_id for claim_id in unique_ids if claim_id not in updated]
+        statuses = self.claim_repository.get_statuses(skipped_ids) if skipped_ids else {}
+        
+        return ClaimStatusChangeResult(
+            status=status,
+            updated_ids=updated_ids,
+            skipped={claim_id: statuses.get(claim_id) for claim_id in skipped_ids}
+        )
     
     def approve_claim(self, claim_id: UUID, approved_amount: float) -> Claim:
         """Утверждает страховой случай с указанной суммой выплаты"""
@@ -138,6 +247,65 @@ class ClaimServiceImpl(ClaimService):
         
         claim.approved_amount = Decimal(str(approved_amount))
         claim.status = ClaimStatus.APPROVED
-        claim.updated_at = date.today()
+        claim.updated_at = datetime.utcnow()
+        
+        self._record_event(self._claim_approved(claim))
+        claim = self.claim_repository.update(claim)
+        self._invalidate("claims", [claim.id])
+        return claim
+    
+    @staticmethod
+    def _claim_approved(claim: Claim) -> ClaimApproved:
+        return ClaimApproved(
+            claim_id=claim.id,
+            policy_id=claim.policy_id,
+            client_id=claim.client_id,
+            approved_amount=claim.approved_amount
+        )
+    
+    def approve_claims_bulk(self, approvals: Dict[UUID, Decimal]) -> ClaimApprovalResult:
+        """Утверждает набор страховых случаев с указанными суммами выплат в одной транзакции"""
+        # Загружаем все страховые случаи одним запросом с блокировкой строк до записи
+        claims = {
+            claim.id: claim
+            for claim in self.claim_repository.get_by_ids(list(approvals), for_update=True)
+        }
         
-        return self.claim_repository.update(claim)
+        # Загружаем все связанные полисы вторым запросом
+        policy_ids = {claim.policy_id for claim in claims.values() if claim.policy_id}
+        coverage = {
+            policy.id: policy.coverage_amount
+            for policy in self.policy_repository.get_by_ids(list(policy_ids))
+        }
+        
+        allowed_statuses = allowed_source_statuses(ClaimStatus.APPROVED)
+        now = datetime.utcnow()
+        approved = []
+        rejected = {}
+        
+        for claim_id, amount in approvals.items():
+            claim = claims.get(claim_id)
+            if claim is None:
+                rejected[claim_id] = "not_found"
+            elif claim.status not in allowed_statuses:
+                rejected[claim_id] = "invalid_status"
+            elif amount > claim.claim_amount:
+                rejected[claim_id] = "exceeds_claim_amount"
+            elif claim.policy_id and claim.policy_id not in coverage:
+                rejected[claim_id] = "policy_not_found"
+            elif claim.policy_id and amount > coverage[claim.policy_id]:
+                rejected[claim_id] = "exceeds_coverage_amount"
+            else:
+                claim.approved_amount = amount
+                claim.status = ClaimStatus.APPROVED
+                claim.updated_at = now
+                approved.append(claim)
+        
+        # Записываем все утверждения и события об утверждении одной транзакцией
+        for claim in approved:
+            self._record_event(self._claim_approved(claim))
+        self.claim_repository.approve_bulk(approved)
+        self._invalidate("claims", [claim.id for claim in approved])
+        
+        return ClaimApprovalResult(approved=approved, rejected=rejected)
+
@@ -1,18 +1,22 @@
 import uuid
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
 from insurance_app.application.interfaces.client_repository import ClientRepository
 from insurance_app.application.interfaces.client_service import ClientService
+from insurance_app.application.services.mixins import CacheInvalidationMixin
 from insurance_app.domain.models.client import Client
+from insurance_app.domain.models.version import EntityVersion
 
 
-class ClientServiceImpl(ClientService):
+class ClientServiceImpl(CacheInvalidationMixin, ClientService):
     """Реализация сервиса для работы с клиентами"""
     
-    def __init__(self, client_repository: ClientRepository):
+    def __init__(self, client_repository: ClientRepository, cache_invalidator: Optional[CacheInvalidator] = None):
         self.client_repository = client_repository
+        self.cache_invalidator = cache_invalidator
     
     def create(self, entity: Client) -> Client:
         """Создает нового клиента"""
@@ -30,17 +34,33 @@ class ClientServiceImpl(ClientService):
         """Получает клиента по идентификатору"""
         return self.client_repository.get_by_id(entity_id)
     
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        """Получает номер версии и время изменения, не загружая запись целиком"""
+        return self.client_repository.get_version(entity_id)
+    
+    def get_versions(self, skip: int = 0, limit: int = 100, name: Optional[str] = None) -> List[EntityVersion]:
+        """Получает версии страницы списка клиентов"""
+        return self.client_repository.get_versions(skip, limit, name)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
         """Получает список клиентов с пагинацией"""
         return self.client_repository.get_all(skip, limit)
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Client]:
+        """Потоково перебирает все клиентов для выгрузки"""
+        return self.client_repository.iter_all(batch_size)
+    
     def update(self, entity: Client) -> Client:
         """Обновляет существующего клиента"""
-        return self.client_repository.update(entity)
+        client = self.client_repository.update(entity)
+        self._invalidate("clients", [client.id])
+        return client
     
     def delete(self, entity_id: UUID) -> bool:
         """Удаляет клиента по идентификатору"""
-        return self.client_repository.delete(entity_id)
+        deleted = self.client_repository.delete(entity_id)
+        self._invalidate("clients", [entity_id])
+        return deleted
     
     def get_by_email(self, email: str) -> Optional[Client]:
         """Получает клиента по адресу электронной почты"""
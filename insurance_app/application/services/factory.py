@@ -1,3 +1,4 @@
+from typing import List
 from sqlalchemy.orm import Session
 import os
 
@@ -6,15 +7,30 @@ from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.application.interfaces.claim_service import ClaimService
 from insurance_app.application.interfaces.payment_service import PaymentService
 from insurance_app.application.interfaces.user_service import UserService
+from insurance_app.application.interfaces.idempotency_service import IdempotencyService
+from insurance_app.application.interfaces.job_service import JobService
+from insurance_app.application.interfaces.event_sink import EventSink
+from insurance_app.application.interfaces.change_feed_service import ChangeFeedService
+from insurance_app.application.interfaces.import_service import ImportService
+from insurance_app.application.interfaces.partition_service import PartitionService
+from insurance_app.application.interfaces.number_generator import NumberGenerator
 from insurance_app.application.services import (
     ClientServiceImpl,
     PolicyServiceImpl,
     ClaimServiceImpl,
     PaymentServiceImpl,
-    UserServiceImpl
+    UserServiceImpl,
+    IdempotencyServiceImpl,
+    JobServiceImpl,
+    ChangeFeedServiceImpl,
+    ImportServiceImpl,
+    PartitionServiceImpl,
+    NumberGeneratorImpl
 )
+from insurance_app.application.services.outbox_relay import OutboxRelay
 from insurance_app.infrastructure.database.repositories.factory import RepositoryFactory
 from insurance_app.infrastructure.auth.auth_service import AuthService
+from insurance_app.infrastructure.caching.config import response_cache
 
 
 class ServiceFactory:
@@ -24,14 +40,18 @@ class ServiceFactory:
     def create_client_service(session: Session) -> ClientService:
         """Создает сервис для работы с клиентами"""
         client_repository = RepositoryFactory.create_client_repository(session)
-        return ClientServiceImpl(client_repository)
+        return ClientServiceImpl(client_repository, response_cache)
     
     @staticmethod
     def create_policy_service(session: Session) -> PolicyService:
         """Создает сервис для работы с полисами"""
         policy_repository = RepositoryFactory.create_policy_repository(session)
         client_repository = RepositoryFactory.create_client_repository(session)
-        return PolicyServiceImpl(policy_repository, client_repository)
+        outbox_repository = RepositoryFactory.create_outbox_repository(session)
+        number_generator = ServiceFactory.create_number_generator(session)
+        return PolicyServiceImpl(
+            policy_repository, client_repository, outbox_repository, response_cache, number_generator
+        )
     
     @staticmethod
     def create_claim_service(session: Session) -> ClaimService:
@@ -39,7 +59,18 @@ class ServiceFactory:
         claim_repository = RepositoryFactory.create_claim_repository(session)
         policy_repository = RepositoryFactory.create_policy_repository(session)
         client_repository = RepositoryFactory.create_client_repository(session)
-        return ClaimServiceImpl(claim_repository, policy_repository, client_repository)
+        outbox_repository = RepositoryFactory.create_outbox_repository(session)
+        number_generator = ServiceFactory.create_number_generator(session)
+        reference_repository = RepositoryFactory.create_reference_repository(session)
+        return ClaimServiceImpl(
+            claim_repository,
+            policy_repository,
+            client_repository,
+            outbox_repository,
+            response_cache,
+            number_generator,
+            reference_repository
+        )
     
     @staticmethod
     def create_payment_service(session: Session) -> PaymentService:
@@ -48,11 +79,18 @@ class ServiceFactory:
         policy_repository = RepositoryFactory.create_policy_repository(session)
         claim_repository = RepositoryFactory.create_claim_repository(session)
         client_repository = RepositoryFactory.create_client_repository(session)
+        outbox_repository = RepositoryFactory.create_outbox_repository(session)
+        number_generator = ServiceFactory.create_number_generator(session)
+        reference_repository = RepositoryFactory.create_reference_repository(session)
         return PaymentServiceImpl(
             payment_repository,
             policy_repository,
             claim_repository,
-            client_repository
+            client_repository,
+            outbox_repository,
+            response_cache,
+            number_generator,
+            reference_repository
         )
         
     @staticmethod
@@ -62,3 +100,47 @@ class ServiceFactory:
         secret_key = os.environ.get("SECRET_KEY", "your-secret-key")
         auth_service = AuthService(secret_key=secret_key)
         return UserServiceImpl(user_repository, auth_service)
+    
+    @staticmethod
+    def create_idempotency_service(session: Session) -> IdempotencyService:
+        """Создает сервис ключей идемпотентности"""
+        idempotency_repository = RepositoryFactory.create_idempotency_repository(session)
+        return IdempotencyServiceImpl(idempotency_repository)
+    
+    @staticmethod
+    def create_job_service(session: Session) -> JobService:
+        """Создает сервис очереди фоновых задач"""
+        job_repository = RepositoryFactory.create_job_repository(session)
+        return JobServiceImpl(job_repository)
+    
+    @staticmethod
+    def create_change_feed_service(session: Session) -> ChangeFeedService:
+        """Создает сервис ленты изменений"""
+        claim_repository = RepositoryFactory.create_claim_repository(session)
+        payment_repository = RepositoryFactory.create_payment_repository(session)
+        return ChangeFeedServiceImpl(claim_repository, payment_repository)
+    
+    @staticmethod
+    def create_import_service(session: Session) -> ImportService:
+        """Создает сервис массовой загрузки данных"""
+        import_repository = RepositoryFactory.create_import_repository(session)
+        return ImportServiceImpl(import_repository, response_cache)
+    
+    @staticmethod
+    def create_partition_service(session: Session) -> PartitionService:
+        """Создает сервис обслуживания секций таблиц"""
+        partition_repository = RepositoryFactory.create_partition_repository(session)
+        return PartitionServiceImpl(partition_repository)
+    
+    @staticmethod
+    def create_number_generator(session: Session) -> NumberGenerator:
+        """Создает генератор номеров с блоками, общими для процесса"""
+        sequence_repository = RepositoryFactory.create_number_sequence_repository(session)
+        return NumberGeneratorImpl(sequence_repository)
+    
+    @staticmethod
+    def create_outbox_relay(session: Session, sinks: List[EventSink]) -> OutboxRelay:
+        """Создает ретранслятор исходящих событий"""
+        outbox_repository = RepositoryFactory.create_outbox_repository(session)
+        return OutboxRelay(outbox_repository, sinks)
+
@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from insurance_app.application.interfaces.idempotency_repository import IdempotencyRepository
+from insurance_app.application.interfaces.idempotency_service import IdempotencyService
+from insurance_app.domain.exceptions import IdempotencyConflictException
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+
+
+class IdempotencyCache:
+    """
+    Кэш выполненных запросов в памяти процесса (LRU с учетом срока хранения).
+    Повторы запроса обслуживаются из кэша без обращения к базе данных.
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], IdempotencyRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, user_id: str, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            record = self._entries.get((user_id, key))
+            if record is None:
+                return None
+            if record.expires_at <= now:
+                del self._entries[(user_id, key)]
+                return None
+            self._entries.move_to_end((user_id, key))
+            return record
+    
+    def put(self, record: IdempotencyRecord) -> None:
+        with self._lock:
+            self._entries[(record.user_id, record.key)] = record
+            self._entries.move_to_end((record.user_id, record.key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Общий для всех запросов процесса кэш выполненных запросов
+idempotency_cache = IdempotencyCache()
+
+
+class IdempotencyServiceImpl(IdempotencyService):
+    """Реализация сервиса ключей идемпотентности"""
+    
+    def __init__(
+        self,
+        idempotency_repository: IdempotencyRepository,
+        cache: IdempotencyCache = idempotency_cache,
+        ttl: timedelta = timedelta(hours=24)
+    ):
+        self.idempotency_repository = idempotency_repository
+        self.cache = cache
+        self.ttl = ttl
+    
+    def begin(self, user_id: str, key: str, request_hash: str) -> Optional[IdempotencyRecord]:
+        """Начинает выполнение запроса или возвращает сохраненный ответ"""
+        now = datetime.utcnow()
+        
+        cached = self.cache.get(user_id, key, now)
+        if cached is not None:
+            return self._check(cached, request_hash)
+        
+        record = self.idempotency_repository.get(user_id, key)
+        if record is not None and record.expires_at <= now:
+            self.idempotency_repository.delete(user_id, key)
+            record = None
+        
+        if record is None:
+            created = self.idempotency_repository.try_create(IdempotencyRecord(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                expires_at=now + self.ttl,
+                created_at=now
+            ))
+            if created:
+                return None
+            # Параллельный запрос с тем же ключом успел создать запись
+            record = self.idempotency_repository.get(user_id, key)
+            if record is None:
+                raise IdempotencyConflictException(key, in_progress=True)
+        
+        return self._check(record, request_hash)
+    
+    def _check(self, record: IdempotencyRecord, request_hash: str) -> IdempotencyRecord:
+        """Проверяет, что сохраненная запись относится к тому же запросу и выполнена"""
+        if record.request_hash != request_hash:
+            raise IdempotencyConflictException(record.key, in_progress=False)
+        if not record.is_completed:
+            raise IdempotencyConflictException(record.key, in_progress=True)
+        self.cache.put(record)
+        return record
+    
+    def complete(self, user_id: str, key: str, request_hash: str, status_code: int, response_body: str) -> None:
+        """Сохраняет ответ выполненного запроса в базе данных и в кэше"""
+        now = datetime.utcnow()
+        self.idempotency_repository.complete(user_id, key, status_code, response_body)
+        self.cache.put(IdempotencyRecord(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            expires_at=now + self.ttl,
+            status_code=status_code,
+            response_body=response_body,
+            created_at=now
+        ))
+    
+    def release(self, user_id: str, key: str) -> None:
+        """Освобождает ключ запроса, завершившегося ошибкой"""
+        self.idempotency_repository.delete(user_id, key)
+    
+    def purge_expired(self) -> int:
+        """Удаляет сохраненные ответы с истекшим сроком хранения"""
+        return self.idempotency_repository.delete_expired(datetime.utcnow())
@@ -0,0 +1,45 @@
+from typing import BinaryIO, Callable, Optional
+
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
+from insurance_app.application.interfaces.import_repository import ImportRepository
+from insurance_app.application.interfaces.import_service import ImportService
+from insurance_app.domain.models.bulk_import import ImportEntity, ImportResult
+
+
+class ImportServiceImpl(ImportService):
+    """Реализация сервиса массовой загрузки данных из CSV"""
+
+    def __init__(self, import_repository: ImportRepository, cache_invalidator: Optional[CacheInvalidator] = None):
+        self.import_repository = import_repository
+        self.cache_invalidator = cache_invalidator
+
+    def import_csv(
+        self,
+        entity: ImportEntity,
+        stream: BinaryIO,
+        progress: Optional[Callable[[int], None]] = None,
+        strict: bool = False,
+        max_rejections: int = 100
+    ) -> ImportResult:
+        entity = ImportEntity(entity)
+        try:
+            loaded = self.import_repository.stage(entity, stream, progress)
+            rejected = self.import_repository.validate(entity)
+            result = ImportResult(
+                entity=entity,
+                loaded=loaded,
+                rejected=rejected,
+                rejections=self.import_repository.get_rejections(entity, max_rejections) if rejected else []
+            )
+            if strict and rejected:
+                self.import_repository.discard(entity)
+                result.merged = False
+                return result
+            result.inserted, result.updated = self.import_repository.merge(entity)
+            # Обновленные записи заранее неизвестны: сбрасываются все ответы с записями сущности
+            if result.updated and self.cache_invalidator is not None:
+                self.cache_invalidator.invalidate([entity.value])
+            return result
+        except Exception:
+            self.import_repository.discard(entity)
+            raise
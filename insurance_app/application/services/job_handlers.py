@@ -0,0 +1,168 @@
+"""
+Обработчики фоновых задач.
+Обработчик получает сессию базы данных, параметры задачи и функцию для сообщения о прогрессе
+и возвращает результат в виде словаря, пригодного для сериализации в JSON.
+"""
+import os
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+JobHandler = Callable[[Session, Dict[str, Any], ProgressCallback], Optional[Dict[str, Any]]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+# Каталог, из которого задача import.csv читает файлы; без него загрузка через очередь задач отключена
+IMPORT_DIR = os.getenv("IMPORT_DIR")
+
+
+def job_handler(job_type: str):
+    """Регистрирует обработчик для типа задачи"""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = handler
+        return handler
+    return register
+
+
+@job_handler("payouts.run")
+def run_payouts(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Выполняет конвейер страховых выплат, пока не будут обработаны все утвержденные случаи"""
+    from insurance_app.application.services.factory import ServiceFactory
+    
+    batch_size = int(payload.get("batch_size", 500))
+    max_batches = payload.get("max_batches")
+    payment_service = ServiceFactory.create_payment_service(session)
+    
+    batches = payouts_created = claims_paid = 0
+    while max_batches is None or batches < max_batches:
+        result = payment_service.run_payout_pipeline(batch_size)
+        batches += 1
+        payouts_created += len(result.payouts)
+        claims_paid += len(result.paid_claim_ids)
+        progress(payouts_created, None)
+        if result.claims_scanned < batch_size and len(result.paid_claim_ids) < batch_size:
+            break
+    
+    return {"batches": batches, "payouts_created": payouts_created, "claims_paid": claims_paid}
+
+
+@job_handler("policies.expire")
+def expire_policies(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Переводит полисы с истекшим сроком в статус EXPIRED и продлевает полисы с auto_renew"""
+    from insurance_app.application.services.factory import ServiceFactory
+    
+    batch_size = int(payload.get("batch_size", 500))
+    as_of = date.fromisoformat(payload["as_of"]) if payload.get("as_of") else None
+    policy_service = ServiceFactory.create_policy_service(session)
+    
+    batches = expired = renewed = 0
+    while True:
+        result = policy_service.process_expirations(batch_size, as_of)
+        batches += 1
+        expired += len(result.expired_ids)
+        renewed += len(result.renewals)
+        progress(expired, None)
+        if result.policies_scanned < batch_size:
+            break
+    
+    return {"batches": batches, "expired": expired, "renewed": renewed}
+
+
+@job_handler("claims.approve_batch")
+def approve_claims(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Утверждает страховые случаи пачками и при необходимости создает выплаты"""
+    from insurance_app.application.services.factory import ServiceFactory
+    
+    approvals = [(UUID(claim_id), Decimal(str(amount))) for claim_id, amount in payload["approvals"].items()]
+    chunk_size = int(payload.get("chunk_size", 1000))
+    create_payouts = bool(payload.get("create_payouts", False))
+    claim_service = ServiceFactory.create_claim_service(session)
+    payment_service = ServiceFactory.create_payment_service(session)
+    
+    approved, rejected, payout_ids = [], {}, []
+    for start in range(0, len(approvals), chunk_size):
+        result = claim_service.approve_claims_bulk(dict(approvals[start:start + chunk_size]))
+        approved.extend(str(claim.id) for claim in result.approved)
+        rejected.update({str(claim_id): reason for claim_id, reason in result.rejected.items()})
+        if create_payouts and result.approved:
+            payout_ids.extend(str(payment.id) for payment in payment_service.create_claim_payouts(result.approved))
+        progress(min(start + chunk_size, len(approvals)), len(approvals))
+    
+    return {"approved": approved, "rejected": rejected, "payout_ids": payout_ids}
+
+
+@job_handler("idempotency.purge")
+def purge_idempotency_keys(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Удаляет сохраненные ответы запросов с истекшим сроком хранения"""
+    from insurance_app.application.services.factory import ServiceFactory
+    
+    deleted = ServiceFactory.create_idempotency_service(session).purge_expired()
+    progress(deleted, deleted)
+    return {"deleted": deleted}
+
+
+@job_handler("partitions.maintain")
+def maintain_partitions(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """Создает помесячные секции на следующие месяцы; старые секции отсоединяет только скрипт обслуживания"""
+    from insurance_app.application.services.factory import ServiceFactory
+    
+    if "retain_months" in payload or "archive_schema" in payload:
+        raise ValueError("Отсоединение секций выполняется только скриптом partition_maintenance")
+    result = ServiceFactory.create_partition_service(session).maintain(months_ahead=int(payload.get("months_ahead", 3)))
+    progress(len(result.created), None)
+    return {"created": [partition.name for partition in result.created]}
+
+
+def import_file_path(path: str, import_dir: Optional[str] = None) -> str:
+    """
+    Путь файла загрузки внутри каталога IMPORT_DIR: относительный путь отсчитывается от каталога,
+    символические ссылки и «..» раскрываются до проверки
+    """
+    import_dir = import_dir or IMPORT_DIR
+    if not import_dir:
+        raise ValueError("Загрузка файлов через очередь задач отключена: не задан каталог IMPORT_DIR")
+    root = os.path.realpath(import_dir)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"Файл {path} находится вне каталога загрузки")
+    return resolved
+
+
+@job_handler("import.csv")
+def import_csv(session: Session, payload: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    """
+    Загружает файлы CSV сущностей из каталога IMPORT_DIR: {"files": {"clients": путь, "policies": путь, ...}}.
+    Файлы загружаются в порядке clients, policies, claims, payments; прогресс — в байтах после каждого файла
+    """
+    from insurance_app.application.services.factory import ServiceFactory
+    from insurance_app.domain.models.bulk_import import ImportEntity
+    
+    files = {ImportEntity(entity): import_file_path(path) for entity, path in payload["files"].items()}
+    strict = bool(payload.get("strict", False))
+    max_rejections = int(payload.get("max_rejections", 100))
+    import_service = ServiceFactory.create_import_service(session)
+    
+    total = sum(os.path.getsize(path) for path in files.values())
+    done = 0
+    results = {}
+    for entity in ImportEntity:
+        if entity not in files:
+            continue
+        with open(files[entity], "rb") as stream:
+            result = import_service.import_csv(entity, stream, strict=strict, max_rejections=max_rejections)
+        results[entity.value] = {
+            "loaded": result.loaded,
+            "inserted": result.inserted,
+            "updated": result.updated,
+            "rejected": result.rejected,
+            "merged": result.merged,
+            "rejections": [{"row": rejection.row, "reason": rejection.reason} for rejection in result.rejections],
+        }
+        # Прогресс сохраняется после фиксации загрузки файла: внутри загрузки сессию фиксировать нельзя
+        done += os.path.getsize(files[entity])
+        progress(done, total)
+    return results
@@ -0,0 +1,88 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Collection, Dict, Optional
+from uuid import UUID
+
+from insurance_app.application.interfaces.job_repository import JobRepository
+from insurance_app.application.interfaces.job_service import JobService
+from insurance_app.application.services.job_handlers import JOB_HANDLERS
+from insurance_app.domain.models.job import Job, JobStatus
+
+
+class JobServiceImpl(JobService):
+    """Реализация сервиса очереди фоновых задач"""
+    
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        retry_base_delay: timedelta = timedelta(seconds=10),
+        retry_max_delay: timedelta = timedelta(hours=1),
+        lock_timeout: timedelta = timedelta(minutes=30)
+    ):
+        self.job_repository = job_repository
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.lock_timeout = lock_timeout
+    
+    def submit(self, job_type: str, payload: Dict[str, Any], max_attempts: int = 3) -> Job:
+        """Помещает задачу в очередь"""
+        if job_type not in JOB_HANDLERS:
+            raise ValueError(f"Неизвестный тип задачи: {job_type}")
+        if max_attempts < 1:
+            raise ValueError("Количество попыток должно быть не меньше 1")
+        
+        now = datetime.utcnow()
+        job = Job(
+            id=uuid.uuid4(),
+            job_type=job_type,
+            payload=payload,
+            status=JobStatus.PENDING,
+            max_attempts=max_attempts,
+            run_after=now,
+            created_at=now,
+            updated_at=now
+        )
+        return self.job_repository.create(job)
+    
+    def get_by_id(self, job_id: UUID) -> Optional[Job]:
+        """Получает задачу по идентификатору"""
+        return self.job_repository.get_by_id(job_id)
+    
+    def claim_next(self, worker_id: str, job_types: Optional[Collection[str]] = None) -> Optional[Job]:
+        """Выбирает следующую готовую к выполнению задачу для обработчика"""
+        return self.job_repository.claim_next(worker_id, datetime.utcnow(), job_types)
+    
+    def report_progress(self, job: Job, current: int, total: Optional[int] = None) -> None:
+        """Сохраняет прогресс выполнения задачи и продлевает ее блокировку"""
+        self.job_repository.update_progress(job.id, job.locked_by, current, total)
+    
+    def heartbeat(self, job: Job) -> bool:
+        """Продлевает блокировку выполняемой задачи"""
+        return self.job_repository.heartbeat(job.id, job.locked_by, datetime.utcnow())
+    
+    def complete(self, job: Job, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Отмечает задачу как успешно выполненную"""
+        return self.job_repository.mark_succeeded(job.id, job.locked_by, result, datetime.utcnow())
+    
+    def retry_delay(self, attempts: int) -> timedelta:
+        """Задержка перед повтором: удваивается с каждой попыткой и ограничена retry_max_delay"""
+        return min(self.retry_base_delay * (2 ** (attempts - 1)), self.retry_max_delay)
+    
+    def fail(self, job: Job, error: str) -> Job:
+        """Отмечает неудачную попытку и при необходимости планирует повтор"""
+        now = datetime.utcnow()
+        if job.attempts < job.max_attempts:
+            job.status = JobStatus.PENDING
+            job.run_after = now + self.retry_delay(job.attempts)
+        else:
+            job.status = JobStatus.FAILED
+            job.run_after = None
+            job.finished_at = now
+        job.error = error
+        
+        self.job_repository.mark_failed(job.id, job.locked_by, error, now, job.run_after)
+        return job
+    
+    def requeue_stale(self) -> int:
+        """Возвращает в очередь задачи, блокировка которых не продлевалась дольше lock_timeout"""
+        return self.job_repository.requeue_stale(datetime.utcnow() - self.lock_timeout)
@@ -0,0 +1,29 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator, entity_tags
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.domain.events import DomainEvent
+from insurance_app.domain.models.outbox import OutboxEvent
+
+
+class EventRecorderMixin:
+    """Запись доменных событий сервиса в таблицу исходящих событий; без outbox_repository события не записываются"""
+    
+    outbox_repository: Optional[OutboxRepository] = None
+    
+    def _record_event(self, event: DomainEvent) -> None:
+        """Добавляет доменное событие в таблицу исходящих событий в текущей транзакции"""
+        if self.outbox_repository is not None:
+            self.outbox_repository.add(OutboxEvent.from_domain_event(event))
+
+
+class CacheInvalidationMixin:
+    """Сброс кэшированных ответов сервиса по измененным записям; без cache_invalidator кэш не сбрасывается"""
+    
+    cache_invalidator: Optional[CacheInvalidator] = None
+    
+    def _invalidate(self, kind: str, entity_ids: Iterable[UUID]) -> None:
+        """Сбрасывает кэшированные ответы с измененными записями после фиксации изменения"""
+        if self.cache_invalidator is not None:
+            self.cache_invalidator.invalidate(entity_tags(kind, entity_ids))
@@ -0,0 +1,52 @@
+import threading
+from typing import Callable, Dict, Tuple
+
+from insurance_app.application.interfaces.number_generator import NumberGenerator
+from insurance_app.application.interfaces.number_sequence_repository import NumberSequenceRepository
+
+# Номеров в блоке. Блок hi содержит номера (hi - 1) * NUMBER_BLOCK_SIZE + 1 ... hi * NUMBER_BLOCK_SIZE,
+# поэтому размер нельзя менять, не переведя последовательности за уже выданные номера
+NUMBER_BLOCK_SIZE = 100
+
+
+class NumberBlocks:
+    """Блоки номеров, выделенные процессу; общие для всех сессий и потоков процесса"""
+
+    def __init__(self, block_size: int = NUMBER_BLOCK_SIZE):
+        self.block_size = block_size
+        # Последовательность -> (следующий номер, последний номер блока)
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def next_value(self, sequence: str, allocate_block: Callable[[], int]) -> int:
+        """Следующий номер текущего блока; для исчерпанного блока вызывает allocate_block"""
+        with self._lock:
+            current, last = self._blocks.get(sequence, (1, 0))
+            if current <= last:
+                self._blocks[sequence] = (current + 1, last)
+                return current
+
+        # Блок выделяется вне блокировки, чтобы ожидание базы не задерживало другие потоки.
+        # Если параллельно выделен еще один блок, остаток текущего пропускается
+        first = (allocate_block() - 1) * self.block_size + 1
+        with self._lock:
+            self._blocks[sequence] = (first + 1, first + self.block_size - 1)
+        return first
+
+
+# Блоки номеров процесса
+number_blocks = NumberBlocks()
+
+
+class NumberGeneratorImpl(NumberGenerator):
+    """
+    Генератор номеров по алгоритму hi/lo: процесс получает из базы блок номеров одним запросом
+    и выдает номера блока без обращения к базе.
+    """
+
+    def __init__(self, sequence_repository: NumberSequenceRepository, blocks: NumberBlocks = number_blocks):
+        self.sequence_repository = sequence_repository
+        self.blocks = blocks
+
+    def next_value(self, sequence: str) -> int:
+        return self.blocks.next_value(sequence, lambda: self.sequence_repository.next_block(sequence))
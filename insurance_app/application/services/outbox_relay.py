@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List
+
+from insurance_app.application.interfaces.event_sink import EventSink
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+
+
+class OutboxRelay:
+    """
+    Ретранслятор исходящих событий: читает неопубликованные события пачками
+    и передает их всем получателям. Доставка выполняется не менее одного раза:
+    если получатель недоступен, пачка остается неопубликованной и будет отправлена повторно.
+    """
+    
+    def __init__(self, outbox_repository: OutboxRepository, sinks: List[EventSink]):
+        self.outbox_repository = outbox_repository
+        self.sinks = sinks
+    
+    def relay_batch(self, batch_size: int = 100) -> int:
+        """Публикует одну пачку событий, возвращает количество опубликованных"""
+        events = self.outbox_repository.get_unpublished(batch_size)
+        if not events:
+            return 0
+        
+        event_ids = [event.id for event in events]
+        try:
+            for sink in self.sinks:
+                sink.publish(events)
+        except Exception as e:
+            self.outbox_repository.mark_failed(event_ids, f"{type(e).__name__}: {e}")
+            raise
+        
+        self.outbox_repository.mark_published(event_ids, datetime.utcnow())
+        return len(events)
@@ -0,0 +1,53 @@
+from datetime import date
+from typing import Optional
+
+from insurance_app.application.interfaces.partition_repository import PartitionRepository
+from insurance_app.application.interfaces.partition_service import PartitionService
+from insurance_app.domain.models.partition import PartitionMaintenanceResult
+
+
+def _add_months(month: date, months: int) -> date:
+    """Первое число месяца, отстоящего от month на months месяцев"""
+    years, index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, index + 1, 1)
+
+
+class PartitionServiceImpl(PartitionService):
+    """Реализация сервиса обслуживания помесячных секций"""
+
+    def __init__(self, partition_repository: PartitionRepository):
+        self.partition_repository = partition_repository
+
+    def ensure_partitions(self, start: date, end: date) -> PartitionMaintenanceResult:
+        result = PartitionMaintenanceResult()
+        last = end.replace(day=1)
+        for table in self.partition_repository.get_partitioned_tables():
+            existing = self.partition_repository.get_partitions(table)
+            month = start.replace(day=1)
+            while month <= last:
+                following = _add_months(month, 1)
+                # Месяц, пересекающийся с существующей секцией (в том числе нестандартной длины), пропускается
+                if not any(partition.start < following and month < partition.end for partition in existing):
+                    result.created.append(self.partition_repository.create_partition(table, month, following))
+                month = following
+        return result
+
+    def maintain(
+        self,
+        months_ahead: int = 3,
+        retain_months: Optional[int] = None,
+        archive_schema: str = "archive",
+        today: Optional[date] = None
+    ) -> PartitionMaintenanceResult:
+        current = (today or date.today()).replace(day=1)
+        result = self.ensure_partitions(current, _add_months(current, months_ahead))
+        if retain_months is None:
+            return result
+
+        cutoff = _add_months(current, -retain_months)
+        for table in self.partition_repository.get_partitioned_tables():
+            for partition in self.partition_repository.get_partitions(table):
+                if partition.end <= cutoff:
+                    self.partition_repository.detach_partition(partition, archive_schema)
+                    result.detached.append(partition)
+        return result
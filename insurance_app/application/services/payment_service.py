@@ -1,19 +1,27 @@
 import uuid
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
 from insurance_app.application.interfaces.payment_repository import PaymentRepository
 from insurance_app.application.interfaces.payment_service import PaymentService
 from insurance_app.application.interfaces.policy_repository import PolicyRepository
 from insurance_app.application.interfaces.claim_repository import ClaimRepository
 from insurance_app.application.interfaces.client_repository import ClientRepository
-from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType
-from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.application.interfaces.number_generator import NumberGenerator
+from insurance_app.application.interfaces.reference_repository import ReferenceRepository
+from insurance_app.application.services.mixins import CacheInvalidationMixin, EventRecorderMixin
+from insurance_app.domain.events import PaymentCompleted
+from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType, PayoutRunResult
+from insurance_app.domain.models.reference import EntityRefs
+from insurance_app.domain.models.version import EntityVersion
+from insurance_app.domain.models.claim import Claim, ClaimStatus, allowed_source_statuses
 
 
-class PaymentServiceImpl(PaymentService):
+class PaymentServiceImpl(EventRecorderMixin, CacheInvalidationMixin, PaymentService):
     """Реализация сервиса для работы с платежами"""
     
     def __init__(
@@ -21,36 +29,80 @@ class PaymentServiceImpl(PaymentService):
         payment_repository: PaymentRepository,
         policy_repository: PolicyRepository,
         claim_repository: ClaimRepository,
-        client_repository: ClientRepository
+        client_repository: ClientRepository,
+        outbox_repository: Optional[OutboxRepository] = None,
+        cache_invalidator: Optional[CacheInvalidator] = None,
+        number_generator: Optional[NumberGenerator] = None,
+        reference_repository: Optional[ReferenceRepository] = None
     ):
         self.payment_repository = payment_repository
         self.policy_repository = policy_repository
         self.claim_repository = claim_repository
         self.client_repository = client_repository
+        self.outbox_repository = outbox_repository
+        self.cache_invalidator = cache_invalidator
+        self.number_generator = number_generator
+        self.reference_repository = reference_repository
     
-    def create(self, entity: Payment) -> Payment:
-        """Создает новый платеж"""
+    def _payment_number(self, payment_id: UUID) -> str:
+        """Номер нового платежа; без генератора номеров (в тестах) производится от идентификатора"""
+        if self.number_generator is None:
+            return f"PAY-{str(payment_id)[:8].upper()}"
+        return f"PAY-{self.number_generator.next_value('payment'):010d}"
+    
+    def _load_refs(
+        self,
+        client_id: Optional[UUID],
+        policy_id: Optional[UUID],
+        claim_id: Optional[UUID]
+    ) -> EntityRefs:
+        """
+        Находит клиента, полис и страховой случай, на которые ссылается новый платеж: одним запросом или,
+        без репозитория ссылок, запросами только нужных столбцов к репозиториям этих записей
+        """
+        if self.reference_repository is not None:
+            return self.reference_repository.get_refs(client_id, policy_id, claim_id)
+        return EntityRefs(
+            client_id=client_id if client_id and self.client_repository.exists(client_id) else None,
+            policy=self.policy_repository.get_ref(policy_id) if policy_id else None,
+            claim=self.claim_repository.get_ref(claim_id) if claim_id else None
+        )
+    
+    def _assign_defaults(self, entity: Payment) -> Payment:
+        """Заполняет идентификатор, номер и дату создания платежа, если они не заданы"""
         # Генерируем ID если его нет
         if entity.id is None:
             entity.id = uuid.uuid4()
         
         # Генерируем номер платежа если его нет
         if not entity.payment_number:
-            entity.payment_number = f"PAY-{str(entity.id)[:8].upper()}"
+            entity.payment_number = self._payment_number(entity.id)
         
         # Устанавливаем дату создания
         if entity.created_at is None:
             entity.created_at = date.today()
         
+        return entity
+    
+    def create(self, entity: Payment) -> Payment:
+        """Создает новый платеж"""
+        # Указанный номер проверяется на занятость: секционированная таблица в PostgreSQL
+        # не имеет уникального индекса номера
+        if entity.payment_number and self.payment_repository.get_by_payment_number(entity.payment_number) is not None:
+            raise ValueError(f"Платеж с номером {entity.payment_number} уже существует")
+        self._assign_defaults(entity)
+        
+        # Клиент, полис и страховой случай, взятые из других записей, существуют благодаря внешним ключам,
+        # поэтому проверяются только указанные в платеже
+        refs = self._load_refs(entity.client_id, entity.policy_id, entity.claim_id)
+        
         # Проверяем существование клиента
-        if entity.client_id:
-            client = self.client_repository.get_by_id(entity.client_id)
-            if not client:
-                raise ValueError(f"Клиент с ID {entity.client_id} не найден")
+        if entity.client_id and refs.client_id is None:
+            raise ValueError(f"Клиент с ID {entity.client_id} не найден")
         
         # Проверяем существование полиса если указан
         if entity.policy_id:
-            policy = self.policy_repository.get_by_id(entity.policy_id)
+            policy = refs.policy
             if not policy:
                 raise ValueError(f"Полис с ID {entity.policy_id} не найден")
             
@@ -60,7 +112,7 @@ class PaymentServiceImpl(PaymentService):
         
         # Проверяем существование страхового случая если указан
         if entity.claim_id:
-            claim = self.claim_repository.get_by_id(entity.claim_id)
+            claim = refs.claim
             if not claim:
                 raise ValueError(f"Страховой случай с ID {entity.claim_id} не найден")
             
@@ -78,17 +130,44 @@ class PaymentServiceImpl(PaymentService):
         """Получает платеж по идентификатору"""
         return self.payment_repository.get_by_id(entity_id)
     
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        """Получает номер версии и время изменения, не загружая запись целиком"""
+        return self.payment_repository.get_version(entity_id)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        """Получает версии страницы списка платежей"""
+        return self.payment_repository.get_versions(
+            skip, limit, client_id, policy_id, claim_id, created_from, created_to
+        )
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Payment]:
         """Получает список платежей с пагинацией"""
         return self.payment_repository.get_all(skip, limit)
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Payment]:
+        """Потоково перебирает все платежи для выгрузки"""
+        return self.payment_repository.iter_all(batch_size)
+    
     def update(self, entity: Payment) -> Payment:
         """Обновляет существующий платеж"""
-        return self.payment_repository.update(entity)
+        payment = self.payment_repository.update(entity)
+        self._invalidate("payments", [payment.id])
+        return payment
     
     def delete(self, entity_id: UUID) -> bool:
         """Удаляет платеж по идентификатору"""
-        return self.payment_repository.delete(entity_id)
+        deleted = self.payment_repository.delete(entity_id)
+        self._invalidate("payments", [entity_id])
+        return deleted
     
     def get_by_payment_number(self, payment_number: str) -> Optional[Payment]:
         """Получает платеж по номеру"""
@@ -106,6 +185,21 @@ class PaymentServiceImpl(PaymentService):
         """Получает список платежей по страховому случаю"""
         return self.payment_repository.get_by_claim_id(claim_id, skip, limit)
     
+    def get_by_period(
+        self,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> List[Payment]:
+        """Получает список платежей, созданных за период"""
+        return self.payment_repository.get_by_period(
+            created_from, created_to, skip, limit, client_id, policy_id, claim_id
+        )
+    
     def process_payment(self, payment_id: UUID, payment_date: date = None) -> Payment:
         """Обрабатывает платеж, меняя его статус на COMPLETED"""
         payment = self.payment_repository.get_by_id(payment_id)
@@ -119,7 +213,26 @@ class PaymentServiceImpl(PaymentService):
         payment.payment_date = payment_date
         payment.status = PaymentStatus.COMPLETED
         
-        return self.payment_repository.update(payment)
+        self._record_event(PaymentCompleted(
+            payment_id=payment.id,
+            payment_type=payment.payment_type,
+            amount=payment.amount,
+            payment_date=payment.payment_date,
+            client_id=payment.client_id,
+            policy_id=payment.policy_id,
+            claim_id=payment.claim_id
+        ))
+        payment = self.payment_repository.update(payment)
+        self._invalidate("payments", [payment.id])
+        
+        # Проведенная страховая выплата завершает страховой случай
+        if payment.payment_type == PaymentType.CLAIM_PAYOUT and payment.claim_id:
+            paid_ids = self.claim_repository.update_status_bulk(
+                [payment.claim_id], ClaimStatus.PAID, allowed_source_statuses(ClaimStatus.PAID)
+            )
+            self._invalidate("claims", paid_ids)
+        
+        return payment
     
     def create_premium_payment(self, policy_id: UUID) -> Payment:
         """Создает платеж страховой премии для полиса"""
@@ -140,12 +253,8 @@ class PaymentServiceImpl(PaymentService):
         
         return self.create(payment)
     
-    def create_claim_payout(self, claim_id: UUID) -> Payment:
-        """Создает платеж страховой выплаты по страховому случаю"""
-        claim = self.claim_repository.get_by_id(claim_id)
-        if not claim:
-            raise ValueError(f"Страховой случай с ID {claim_id} не найден")
-        
+    def _build_claim_payout(self, claim: Claim) -> Payment:
+        """Формирует платеж страховой выплаты по утвержденному страховому случаю"""
         # Проверяем что страховой случай утвержден
         if claim.status != ClaimStatus.APPROVED:
             raise ValueError("Страховой случай должен быть утвержден для создания выплаты")
@@ -154,8 +263,7 @@ class PaymentServiceImpl(PaymentService):
         if claim.approved_amount is None:
             raise ValueError("Сумма выплаты не установлена")
         
-        # Создаем платеж
-        payment = Payment(
+        return Payment(
             claim_id=claim.id,
             policy_id=claim.policy_id,
             client_id=claim.client_id,
@@ -164,5 +272,45 @@ class PaymentServiceImpl(PaymentService):
             status=PaymentStatus.PENDING,
             description=f"Страховая выплата по страховому случаю {claim.claim_number}"
         )
+    
+    def create_claim_payout(self, claim_id: UUID) -> Payment:
+        """Создает платеж страховой выплаты по страховому случаю"""
+        claim = self.claim_repository.get_by_id(claim_id)
+        if not claim:
+            raise ValueError(f"Страховой случай с ID {claim_id} не найден")
+        
+        # Создаем платеж
+        payment = self._build_claim_payout(claim)
+        
+        # Проверяем что выплата по страховому случаю еще не создана. Блокировка строки случая
+        # до фиксации платежа исключает одновременное создание второй выплаты
+        self.claim_repository.get_by_ids([claim_id], for_update=True)
+        if any(
+            existing.payment_type == PaymentType.CLAIM_PAYOUT
+            for existing in self.payment_repository.get_by_claim_id(claim_id)
+        ):
+            raise ValueError(f"Страховая выплата по страховому случаю {claim.claim_number} уже создана")
         
         return self.create(payment)
+    
+    def create_claim_payouts(self, claims: List[Claim]) -> List[Payment]:
+        """
+        Создает платежи страховых выплат по уже загруженным утвержденным страховым случаям.
+        Существование связанных сущностей не перепроверяется, все платежи записываются одним пакетом.
+        Случаи, по которым выплата уже существует, пропускаются.
+        """
+        payments = [self._assign_defaults(self._build_claim_payout(claim)) for claim in claims]
+        return self.payment_repository.create_payouts_bulk(payments)
+    
+    def run_payout_pipeline(self, batch_size: int = 500) -> PayoutRunResult:
+        """Выполняет один проход конвейера страховых выплат"""
+        claims = self.claim_repository.get_approved_without_payout(batch_size)
+        payouts = self.create_claim_payouts(claims) if claims else []
+        paid_claim_ids = self.claim_repository.mark_paid_by_completed_payouts(batch_size)
+        self._invalidate("claims", paid_claim_ids)
+        
+        return PayoutRunResult(
+            claims_scanned=len(claims),
+            payouts=payouts,
+            paid_claim_ids=paid_claim_ids
+        )
@@ -1,21 +1,37 @@
 import uuid
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
 from insurance_app.application.interfaces.policy_repository import PolicyRepository
 from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.application.interfaces.client_repository import ClientRepository
-from insurance_app.domain.models.policy import Policy, PolicyType, PolicyStatus
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.application.interfaces.number_generator import NumberGenerator
+from insurance_app.application.services.mixins import CacheInvalidationMixin, EventRecorderMixin
+from insurance_app.domain.events import PolicyRenewed, PolicyStatusChanged
+from insurance_app.domain.models.policy import Policy, PolicyExpiryResult, PolicyType, PolicyStatus
+from insurance_app.domain.models.version import EntityVersion
 
 
-class PolicyServiceImpl(PolicyService):
+class PolicyServiceImpl(EventRecorderMixin, CacheInvalidationMixin, PolicyService):
     """Реализация сервиса для работы с полисами"""
     
-    def __init__(self, policy_repository: PolicyRepository, client_repository: ClientRepository):
+    def __init__(
+        self,
+        policy_repository: PolicyRepository,
+        client_repository: ClientRepository,
+        outbox_repository: Optional[OutboxRepository] = None,
+        cache_invalidator: Optional[CacheInvalidator] = None,
+        number_generator: Optional[NumberGenerator] = None
+    ):
         self.policy_repository = policy_repository
         self.client_repository = client_repository
+        self.outbox_repository = outbox_repository
+        self.cache_invalidator = cache_invalidator
+        self.number_generator = number_generator
     
     def create(self, entity: Policy) -> Policy:
         """Создает новый полис"""
@@ -23,7 +39,7 @@ class PolicyServiceImpl(PolicyService):
             entity.id = uuid.uuid4()
         
         if not entity.policy_number:
-            entity.policy_number = f"POL-{str(entity.id)[:8].upper()}"
+            entity.policy_number = self._policy_number(entity.id)
         
         if entity.created_at is None:
             entity.created_at = date.today()
@@ -38,21 +54,58 @@ class PolicyServiceImpl(PolicyService):
         
         return self.policy_repository.create(entity)
     
+    def _policy_number(self, policy_id: UUID) -> str:
+        """Номер нового полиса; без генератора номеров (в тестах) производится от идентификатора"""
+        if self.number_generator is None:
+            return f"POL-{str(policy_id)[:8].upper()}"
+        return f"POL-{self.number_generator.next_value('policy'):010d}"
+    
     def get_by_id(self, entity_id: UUID) -> Optional[Policy]:
         """Получает полис по идентификатору"""
         return self.policy_repository.get_by_id(entity_id)
     
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        """Получает номер версии и время изменения, не загружая запись целиком"""
+        return self.policy_repository.get_version(entity_id)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        active_only: bool = False
+    ) -> List[EntityVersion]:
+        """Получает версии страницы списка полисов"""
+        return self.policy_repository.get_versions(skip, limit, client_id, active_only)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Policy]:
         """Получает список полисов с пагинацией"""
         return self.policy_repository.get_all(skip, limit)
     
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Policy]:
+        """Потоково перебирает все полисы для выгрузки"""
+        return self.policy_repository.iter_all(batch_size)
+    
     def update(self, entity: Policy) -> Policy:
         """Обновляет существующий полис"""
-        return self.policy_repository.update(entity)
+        if self.outbox_repository is not None:
+            current = self.policy_repository.get_by_id(entity.id)
+            if current is not None and current.status != entity.status:
+                self._record_event(PolicyStatusChanged(
+                    policy_id=entity.id,
+                    client_id=entity.client_id,
+                    old_status=current.status,
+                    new_status=entity.status
+                ))
+        policy = self.policy_repository.update(entity)
+        self._invalidate("policies", [policy.id])
+        return policy
     
     def delete(self, entity_id: UUID) -> bool:
         """Удаляет полис по идентификатору"""
-        return self.policy_repository.delete(entity_id)
+        deleted = self.policy_repository.delete(entity_id)
+        self._invalidate("policies", [entity_id])
+        return deleted
     
     def get_by_policy_number(self, policy_number: str) -> Optional[Policy]:
         """Получает полис по номеру"""
@@ -66,6 +119,59 @@ class PolicyServiceImpl(PolicyService):
         """Получает список активных полисов"""
         return self.policy_repository.get_active_policies(skip, limit)
     
+    def _renewal(self, policy: Policy) -> Policy:
+        """Полис на следующий срок той же длительности с пересчитанной премией"""
+        term = policy.end_date - policy.start_date if policy.start_date else timedelta(days=365)
+        start_date = policy.end_date + timedelta(days=1)
+        renewal_id = uuid.uuid4()
+        renewal = Policy(
+            id=renewal_id,
+            policy_number=self._policy_number(renewal_id),
+            client_id=policy.client_id,
+            type=policy.type,
+            status=PolicyStatus.ACTIVE,
+            start_date=start_date,
+            end_date=start_date + term,
+            coverage_amount=policy.coverage_amount,
+            payment_frequency=policy.payment_frequency,
+            description=policy.description,
+            auto_renew=True
+        )
+        return self.calculate_premium(renewal)
+    
+    def process_expirations(self, batch_size: int = 500, as_of: Optional[date] = None) -> PolicyExpiryResult:
+        """Выполняет один проход обработки полисов с истекшим сроком"""
+        policies = self.policy_repository.get_expired_active(as_of or date.today(), batch_size)
+        renewals = {policy.id: self._renewal(policy) for policy in policies if policy.auto_renew}
+        
+        # События попадают в ту же транзакцию, что и изменение статусов
+        for policy in policies:
+            self._record_event(PolicyStatusChanged(
+                policy_id=policy.id,
+                client_id=policy.client_id,
+                old_status=PolicyStatus.ACTIVE,
+                new_status=PolicyStatus.EXPIRED
+            ))
+            renewal = renewals.get(policy.id)
+            if renewal is not None:
+                self._record_event(PolicyRenewed(
+                    policy_id=policy.id,
+                    renewal_id=renewal.id,
+                    client_id=policy.client_id,
+                    start_date=renewal.start_date,
+                    end_date=renewal.end_date,
+                    premium_amount=renewal.premium_amount
+                ))
+        
+        expired_ids = self.policy_repository.expire_and_renew([policy.id for policy in policies], renewals)
+        self._invalidate("policies", expired_ids)
+        expired = set(expired_ids)
+        return PolicyExpiryResult(
+            policies_scanned=len(policies),
+            expired_ids=expired_ids,
+            renewals=[renewal for policy_id, renewal in renewals.items() if policy_id in expired]
+        )
+    
     def calculate_premium(self, policy: Policy) -> Policy:
         """Рассчитывает страховую премию для полиса"""
         base_rate = Decimal("0.05") 
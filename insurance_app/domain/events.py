@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, ClassVar, Dict, Optional
+from uuid import UUID
+
+from insurance_app.domain.models.payment import PaymentType
+from insurance_app.domain.models.policy import PolicyStatus
+
+
+def _json_value(value):
+    """Приводит значение поля события к виду, пригодному для JSON"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent(ABC):
+    """Базовый класс доменных событий"""
+    aggregate_type: ClassVar[str] = ""
+
+    @property
+    def event_type(self) -> str:
+        return type(self).__name__
+
+    @property
+    @abstractmethod
+    def aggregate_id(self) -> UUID:
+        """Идентификатор записи, к которой относится событие"""
+        pass
+
+    def payload(self) -> Dict[str, Any]:
+        return {field.name: _json_value(getattr(self, field.name)) for field in fields(self)}
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimApproved(DomainEvent):
+    """Страховой случай утвержден"""
+    aggregate_type: ClassVar[str] = "claim"
+    claim_id: UUID
+    policy_id: Optional[UUID]
+    client_id: Optional[UUID]
+    approved_amount: Decimal
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.claim_id
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentCompleted(DomainEvent):
+    """Платеж проведен"""
+    aggregate_type: ClassVar[str] = "payment"
+    payment_id: UUID
+    payment_type: PaymentType
+    amount: Decimal
+    payment_date: Optional[date]
+    client_id: Optional[UUID]
+    policy_id: Optional[UUID]
+    claim_id: Optional[UUID]
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.payment_id
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyStatusChanged(DomainEvent):
+    """Изменился статус полиса"""
+    aggregate_type: ClassVar[str] = "policy"
+    policy_id: UUID
+    client_id: Optional[UUID]
+    old_status: Optional[PolicyStatus]
+    new_status: PolicyStatus
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.policy_id
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyRenewed(DomainEvent):
+    """Полис продлен: создан полис на следующий срок"""
+    aggregate_type: ClassVar[str] = "policy"
+    policy_id: UUID
+    renewal_id: UUID
+    client_id: Optional[UUID]
+    start_date: Optional[date]
+    end_date: Optional[date]
+    premium_amount: Decimal
+
+    @property
+    def aggregate_id(self) -> UUID:
+        return self.policy_id
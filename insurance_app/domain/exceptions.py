@@ -33,4 +33,27 @@ class AuthorizationException(DomainException):
             message = f"Недостаточно прав. Требуется роль: {required_role}"
         else:
             message = "Недостаточно прав"
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class IdempotencyConflictException(DomainException):
+    """Исключение, возникающее при повторном использовании ключа идемпотентности"""
+    def __init__(self, key: str, in_progress: bool):
+        self.key = key
+        self.in_progress = in_progress
+        if in_progress:
+            message = f"Запрос с ключом идемпотентности {key} еще выполняется"
+        else:
+            message = f"Ключ идемпотентности {key} уже использован для другого запроса"
+        super().__init__(message)
+
+
+class ConcurrencyConflictException(DomainException):
+    """Исключение, возникающее при изменении записи, которую уже изменил другой запрос"""
+    def __init__(self, entity_type: str, entity_id, expected_version: int):
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        super().__init__(
+            f"{entity_type} с ID {entity_id} изменен другим запросом после версии {expected_version}, "
+            f"получите актуальную версию и повторите изменение"
+        )
@@ -3,11 +3,23 @@ from .policy import Policy, PolicyStatus, PolicyType
 from .claim import Claim, ClaimStatus
 from .payment import Payment, PaymentStatus, PaymentType
 from .user import User
+from .job import Job, JobStatus
+from .change import Change, ChangeBatch, ChangePosition
+from .version import EntityVersion
+from .reference import ClaimRef, EntityRefs, PolicyRef
+from .bulk_import import ImportEntity, ImportRejection, ImportResult
+from .partition import PartitionMaintenanceResult, TablePartition
 
 __all__ = [
     'Client',
     'Policy', 'PolicyStatus', 'PolicyType',
     'Claim', 'ClaimStatus',
     'Payment', 'PaymentStatus', 'PaymentType',
-    'User'
+    'User',
+    'Job', 'JobStatus',
+    'Change', 'ChangeBatch', 'ChangePosition',
+    'EntityVersion',
+    'ClaimRef', 'EntityRefs', 'PolicyRef',
+    'ImportEntity', 'ImportRejection', 'ImportResult',
+    'PartitionMaintenanceResult', 'TablePartition'
 ]
\ No newline at end of file
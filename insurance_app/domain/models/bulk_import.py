@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List
+
+
+class ImportEntity(str, Enum):
+    """Загружаемые сущности в порядке загрузки: каждая ссылается только на предыдущие"""
+    CLIENTS = "clients"
+    POLICIES = "policies"
+    CLAIMS = "claims"
+    PAYMENTS = "payments"
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRejection:
+    """Отклоненная строка файла: номер записи без учета заголовка и причина"""
+    row: int
+    reason: str
+
+
+@dataclass(slots=True)
+class ImportResult:
+    """Результат загрузки файла одной сущности"""
+    entity: ImportEntity
+    loaded: int
+    inserted: int = 0
+    updated: int = 0
+    rejected: int = 0
+    # Первые отклоненные строки, не более заданного количества
+    rejections: List[ImportRejection] = field(default_factory=list)
+    # False, если строгая загрузка отменена из-за отклоненных строк
+    merged: bool = True
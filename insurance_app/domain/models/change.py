@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Union
+from uuid import UUID
+
+from insurance_app.domain.models.claim import Claim
+from insurance_app.domain.models.payment import Payment
+
+
+@dataclass(frozen=True, slots=True)
+class ChangePosition:
+    """Позиция в ленте изменений одной таблицы: время последнего изменения и идентификатор записи"""
+    updated_at: datetime
+    id: UUID
+
+
+@dataclass(slots=True)
+class Change:
+    """Изменение сущности: созданная или обновленная запись в ее текущем состоянии"""
+    entity_type: str
+    entity: Union[Claim, Payment]
+
+    @property
+    def position(self) -> ChangePosition:
+        return ChangePosition(self.entity.updated_at, self.entity.id)
+
+
+@dataclass(slots=True)
+class ChangeBatch:
+    """Страница ленты изменений"""
+    changes: List[Change]
+    # Непрозрачный курсор для чтения следующей страницы
+    cursor: str
+    # Есть изменения, не вошедшие в страницу
+    has_more: bool
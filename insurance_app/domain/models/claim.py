@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Dict, FrozenSet, List, Optional
 from uuid import UUID
 
 
@@ -15,7 +15,25 @@ class ClaimStatus(str, Enum):
     CLOSED = "closed"
 
 
-@dataclass
+# Допустимые переходы статусов страхового случая: текущий статус -> возможные новые статусы
+CLAIM_STATUS_TRANSITIONS = {
+    ClaimStatus.PENDING: frozenset({ClaimStatus.UNDER_REVIEW, ClaimStatus.DENIED, ClaimStatus.CLOSED}),
+    ClaimStatus.UNDER_REVIEW: frozenset({ClaimStatus.APPROVED, ClaimStatus.DENIED, ClaimStatus.CLOSED}),
+    ClaimStatus.APPROVED: frozenset({ClaimStatus.PAID, ClaimStatus.CLOSED}),
+    ClaimStatus.DENIED: frozenset({ClaimStatus.UNDER_REVIEW, ClaimStatus.CLOSED}),
+    ClaimStatus.PAID: frozenset({ClaimStatus.CLOSED}),
+    ClaimStatus.CLOSED: frozenset(),
+}
+
+
+def allowed_source_statuses(target: ClaimStatus) -> FrozenSet[ClaimStatus]:
+    """Возвращает статусы, из которых допустим переход в указанный статус"""
+    return frozenset(
+        source for source, targets in CLAIM_STATUS_TRANSITIONS.items() if target in targets
+    )
+
+
+@dataclass(slots=True)
 class Claim:
     id: Optional[UUID] = None
     claim_number: str = ""
@@ -29,4 +47,23 @@ class Claim:
     approved_amount: Optional[Decimal] = None
     created_at: Optional[date] = None
     updated_at: Optional[date] = None
-    is_active: bool = True
\ No newline at end of file
+    is_active: bool = True
+    version: int = 1
+
+
+@dataclass(slots=True)
+class ClaimStatusChangeResult:
+    """Результат пакетного изменения статуса страховых случаев"""
+    status: ClaimStatus
+    updated_ids: List[UUID]
+    # Пропущенные случаи и их текущий статус (None, если случай не найден)
+    skipped: Dict[UUID, Optional[ClaimStatus]]
+
+
+@dataclass(slots=True)
+class ClaimApprovalResult:
+    """Результат пакетного утверждения страховых случаев"""
+    approved: List[Claim]
+    # Страховые случаи, не прошедшие проверку, и причина отказа
+    rejected: Dict[UUID, str]
+
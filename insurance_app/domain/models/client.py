@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Client:
     id: Optional[UUID] = None
     first_name: str = ""
@@ -15,4 +15,6 @@ class Client:
     address: str = ""
     passport_number: str = ""
     created_at: Optional[date] = None
-    is_active: bool = True
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+    is_active: bool = True
+    version: int = 1
\ No newline at end of file
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class IdempotencyRecord:
+    """Сохраненный результат запроса с ключом идемпотентности"""
+    user_id: str
+    key: str
+    request_hash: str
+    expires_at: datetime
+    # Код и тело ответа отсутствуют, пока запрос выполняется
+    status_code: Optional[int] = None
+    response_body: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @property
+    def is_completed(self) -> bool:
+        return self.status_code is not None
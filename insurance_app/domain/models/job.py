@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class Job:
+    """Фоновая задача, выполняемая обработчиком очереди"""
+    id: Optional[UUID] = None
+    job_type: str = ""
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    max_attempts: int = 3
+    # Прогресс выполнения: обработано progress_current из progress_total (если общее количество известно)
+    progress_current: int = 0
+    progress_total: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    # Задача не будет выбрана обработчиком раньше этого времени (используется для повторов с задержкой)
+    run_after: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    locked_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
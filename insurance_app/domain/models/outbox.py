@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class OutboxEvent:
+    """Доменное событие, сохраненное в таблице исходящих событий для последующей публикации"""
+    # Порядковый номер события, задается базой данных
+    id: Optional[int] = None
+    event_type: str = ""
+    aggregate_type: str = ""
+    aggregate_id: Optional[UUID] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    @classmethod
+    def from_domain_event(cls, event, created_at: Optional[datetime] = None) -> "OutboxEvent":
+        """Создает исходящее событие из доменного события"""
+        return cls(
+            event_type=event.event_type,
+            aggregate_type=event.aggregate_type,
+            aggregate_id=event.aggregate_id,
+            payload=event.payload(),
+            created_at=created_at or datetime.utcnow()
+        )
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List
+
+
+@dataclass(frozen=True, slots=True)
+class TablePartition:
+    """Секция таблицы, секционированной по диапазонам дат: строки с датой в [start, end)"""
+    table: str
+    name: str
+    start: date
+    end: date
+
+
+@dataclass(slots=True)
+class PartitionMaintenanceResult:
+    """Результат обслуживания секций: созданные и отсоединенные в архив секции"""
+    created: List[TablePartition] = field(default_factory=list)
+    detached: List[TablePartition] = field(default_factory=list)
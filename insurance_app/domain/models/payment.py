@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -19,7 +19,7 @@ class PaymentType(str, Enum):
     REFUND = "refund"
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     id: Optional[UUID] = None
     payment_number: str = ""
@@ -34,4 +34,17 @@ class Payment:
     payment_method: str = ""
     description: str = ""
     created_at: Optional[date] = None
-    is_active: bool = True
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+    is_active: bool = True
+    version: int = 1
+
+
+@dataclass(slots=True)
+class PayoutRunResult:
+    """Результат одного прохода конвейера страховых выплат"""
+    # Количество выбранных утвержденных страховых случаев без выплаты
+    claims_scanned: int
+    payouts: List[Payment]
+    # Страховые случаи, переведенные в статус PAID после проведения выплаты
+    paid_claim_ids: List[UUID]
+
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -21,7 +21,7 @@ class PolicyType(str, Enum):
     TRAVEL = "travel"
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     id: Optional[UUID] = None
     policy_number: str = ""
@@ -34,5 +34,20 @@ class Policy:
     premium_amount: Decimal = Decimal("0.00")
     payment_frequency: str = "monthly"
     created_at: Optional[date] = None
+    updated_at: Optional[datetime] = None
     description: str = ""
-    is_active: bool = True
\ No newline at end of file
+    is_active: bool = True
+    # Продлевать полис при истечении срока действия
+    auto_renew: bool = False
+    version: int = 1
+
+
+@dataclass(slots=True)
+class PolicyExpiryResult:
+    """Результат одного прохода обработки полисов с истекшим сроком действия"""
+    # Количество выбранных действующих полисов с истекшим сроком
+    policies_scanned: int
+    # Полисы, переведенные в статус EXPIRED
+    expired_ids: List[UUID]
+    # Полисы-продления, созданные для истекших полисов с auto_renew
+    renewals: List[Policy]
\ No newline at end of file
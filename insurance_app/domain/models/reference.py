@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from insurance_app.domain.models.policy import PolicyStatus
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyRef:
+    """Поля полиса, нужные для проверки ссылок на него при создании страховых случаев и платежей"""
+    id: UUID
+    client_id: UUID
+    policy_number: str
+    status: PolicyStatus
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimRef:
+    """Поля страхового случая, нужные для проверки ссылок на него при создании платежей"""
+    id: UUID
+    client_id: UUID
+    policy_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class EntityRefs:
+    """Найденные записи, на которые ссылается создаваемая запись; None — не запрашивалась или не найдена"""
+    client_id: Optional[UUID] = None
+    policy: Optional[PolicyRef] = None
+    claim: Optional[ClaimRef] = None
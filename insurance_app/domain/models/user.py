@@ -4,7 +4,7 @@ from typing import Optional, List
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[UUID] = None
     username: str = ""
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class EntityVersion:
+    """Версия записи: номер версии увеличивается при каждом изменении"""
+    id: UUID
+    version: int
+    updated_at: Optional[datetime] = None
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import jwt
-from passlib.context import CryptContext
 from pydantic import ValidationError
 from uuid import UUID
 
@@ -9,6 +9,17 @@ from insurance_app.domain.models.user import User
 from insurance_app.domain.exceptions import AuthenticationException
 
 
+@lru_cache(maxsize=None)
+def _password_context():
+    """
+    Контекст хеширования паролей, общий для процесса. Создается при первой проверке или хешировании
+    пароля: passlib и bcrypt не загружаются при запуске и не инициализируются в каждом запросе
+    """
+    from passlib.context import CryptContext
+    
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
 class AuthService:
     """Сервис для аутентификации и авторизации пользователей"""
     
@@ -21,7 +32,11 @@ class AuthService:
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    
+    @property
+    def pwd_context(self):
+        """Контекст хеширования паролей"""
+        return _password_context()
     
     def create_password_hash(self, password: str) -> str:
         """Создает хеш пароля"""
@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+# Расширение OpenAPI операции со списком ролей, необходимых для доступа к маршруту
+ROLES_EXTENSION = "x-required-roles"
+
+
+def required_roles(*roles: str) -> dict:
+    """Метаданные маршрута (openapi_extra) с ролями, необходимыми для доступа к нему"""
+    return {ROLES_EXTENSION: sorted(roles)}
+
+
+@dataclass(frozen=True)
+class RouteAccess:
+    """Правило доступа к маршруту"""
+    public: bool = False
+    # Пустое множество — достаточно аутентификации
+    roles: FrozenSet[str] = frozenset()
+
+
+PUBLIC = RouteAccess(public=True)
+AUTHENTICATED = RouteAccess()
+
+
+@dataclass
+class _Node:
+    """Узел префиксного дерева по сегментам пути"""
+    children: Dict[str, "_Node"] = field(default_factory=dict)
+    # Сегмент-параметр {name}
+    param: Optional["_Node"] = None
+    # Параметр {name:path} поглощает остаток пути
+    catch_all: Optional["_Node"] = None
+    # Правила доступа по HTTP-методу; None — для всех методов
+    access: Dict[Optional[str], RouteAccess] = field(default_factory=dict)
+
+
+def _segments(path: str) -> List[str]:
+    return path.strip("/").split("/") if path.strip("/") else []
+
+
+class AuthorizationPolicy:
+    """
+    Скомпилированная политика доступа: префиксное дерево маршрутов, построенное один раз при запуске.
+    Поиск правила выполняется за один проход по сегментам пути, статические сегменты имеют
+    приоритет над параметрами. Пути, не найденные в дереве, требуют аутентификации.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+
+    def add(self, path: str, access: RouteAccess, methods: Optional[Iterable[str]] = None) -> None:
+        """Добавляет правило для шаблона пути Starlette, например /api/users/{user_id}"""
+        node = self._root
+        for segment in _segments(path):
+            if segment.startswith("{") and segment.endswith("}"):
+                if segment.endswith(":path}"):
+                    node.catch_all = node.catch_all or _Node()
+                    node = node.catch_all
+                    break
+                node.param = node.param or _Node()
+                node = node.param
+            else:
+                node = node.children.setdefault(segment, _Node())
+        for method in methods or [None]:
+            node.access[method] = access
+
+    def lookup(self, method: str, path: str) -> RouteAccess:
+        """Правило доступа для запроса"""
+        node = self._find(self._root, _segments(path), 0)
+        if node is None:
+            return AUTHENTICATED
+        # Открытый путь открыт для всех методов
+        access = node.access.get(None)
+        if access is None or not access.public:
+            access = node.access.get(method, access)
+        return access or AUTHENTICATED
+
+    def _find(self, node: _Node, segments: List[str], index: int) -> Optional[_Node]:
+        if index == len(segments):
+            return node if node.access else None
+        child = node.children.get(segments[index])
+        if child is not None:
+            found = self._find(child, segments, index + 1)
+            if found is not None:
+                return found
+        if node.param is not None:
+            found = self._find(node.param, segments, index + 1)
+            if found is not None:
+                return found
+        if node.catch_all is not None and node.catch_all.access:
+            return node.catch_all
+        return None
+
+    @classmethod
+    def from_routes(cls, routes: Iterable, public_paths: Iterable[str] = ()) -> "AuthorizationPolicy":
+        """
+        Строит политику по маршрутам приложения: роли берутся из метаданных маршрута
+        (openapi_extra с ключом x-required-roles), пути из public_paths доступны без аутентификации.
+        """
+        policy = cls()
+        for route in routes:
+            path = getattr(route, "path", None)
+            if path is None:
+                continue
+            extra = getattr(route, "openapi_extra", None) or {}
+            roles = frozenset(extra.get(ROLES_EXTENSION, ()))
+            policy.add(path, RouteAccess(roles=roles) if roles else AUTHENTICATED, getattr(route, "methods", None))
+        for path in public_paths:
+            policy.add(path, PUBLIC)
+        return policy
@@ -0,0 +1,18 @@
+from insurance_app.infrastructure.caching.backends import (
+    CachedResponse,
+    MemoryResponseCacheBackend,
+    RedisResponseCacheBackend,
+    ResponseCacheBackend,
+    create_response_cache_backend
+)
+from insurance_app.infrastructure.caching.cache import ResponseCache, RouteCacheStats
+
+__all__ = [
+    'CachedResponse',
+    'MemoryResponseCacheBackend',
+    'RedisResponseCacheBackend',
+    'ResponseCache',
+    'ResponseCacheBackend',
+    'RouteCacheStats',
+    'create_response_cache_backend'
+]
@@ -0,0 +1,167 @@
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Тело закэшированного ответа и теги записей, из которых оно построено"""
+    body: bytes
+    tags: Tuple[str, ...]
+    # Время начала чтения данных ответа из базы, unix-время
+    loaded_at: float
+    expires_at: float
+
+
+class ResponseCacheBackend(ABC):
+    """Хранилище закэшированных ответов и времени последнего сброса тегов"""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Возвращает непросроченный ответ по ключу"""
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Сохраняет ответ до entry.expires_at"""
+        pass
+    
+    @abstractmethod
+    def invalidated_at(self, tags: Sequence[str]) -> Dict[str, float]:
+        """Время последнего сброса тегов; теги, которые не сбрасывались, в результат не попадают"""
+        pass
+    
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str], at: float, retention: float) -> None:
+        """Запоминает время сброса тегов на retention секунд"""
+        pass
+
+
+class MemoryResponseCacheBackend(ResponseCacheBackend):
+    """
+    Ответы в памяти процесса с вытеснением давно не запрашиваемых (LRU) сверх max_entries.
+    Используется как локальный уровень кэша и как замена общего хранилища в тестах.
+    """
+    
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        # Тег -> (время сброса, время, до которого сброс хранится)
+        self._invalidations: Dict[str, Tuple[float, float]] = {}
+        # Обработчики маршрутов выполняются в пуле потоков
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidated_at(self, tags: Sequence[str]) -> Dict[str, float]:
+        with self._lock:
+            return {tag: self._invalidations[tag][0] for tag in tags if tag in self._invalidations}
+    
+    def invalidate(self, tags: Iterable[str], at: float, retention: float) -> None:
+        with self._lock:
+            if len(self._invalidations) >= self.max_entries:
+                self._invalidations = {
+                    tag: invalidation for tag, invalidation in self._invalidations.items() if invalidation[1] > at
+                }
+            for tag in tags:
+                self._invalidations[tag] = (at, at + retention)
+
+
+class RedisResponseCacheBackend(ResponseCacheBackend):
+    """
+    Ответы в Redis, общие для всех процессов и экземпляров приложения. Требует пакет redis.
+    При недоступности Redis ответы не кэшируются.
+    """
+    
+    def __init__(self, url: str, prefix: str = "responsecache:"):
+        import redis
+        
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            raw = self._client.get(self.prefix + key)
+        except Exception:
+            logger.warning("Хранилище кэша ответов недоступно", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CachedResponse(
+            data["body"].encode(), tuple(data["tags"]), data["loaded_at"], data["expires_at"]
+        )
+    
+    def set(self, key: str, entry: CachedResponse) -> None:
+        ttl_ms = int((entry.expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        raw = json.dumps({
+            "body": entry.body.decode(),
+            "tags": list(entry.tags),
+            "loaded_at": entry.loaded_at,
+            "expires_at": entry.expires_at
+        })
+        try:
+            self._client.set(self.prefix + key, raw, px=ttl_ms)
+        except Exception:
+            logger.warning("Хранилище кэша ответов недоступно", exc_info=True)
+    
+    def invalidated_at(self, tags: Sequence[str]) -> Dict[str, float]:
+        if not tags:
+            return {}
+        try:
+            values = self._client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        except Exception:
+            # Без сведений о сбросах ответ нельзя считать актуальным
+            logger.warning("Хранилище кэша ответов недоступно", exc_info=True)
+            return {tag: float("inf") for tag in tags}
+        return {tag: float(value) for tag, value in zip(tags, values) if value is not None}
+    
+    def invalidate(self, tags: Iterable[str], at: float, retention: float) -> None:
+        tags = list(tags)
+        try:
+            with self._client.pipeline(transaction=False) as pipeline:
+                for tag in tags:
+                    pipeline.set(f"{self.prefix}tag:{tag}", repr(at), px=int(retention * 1000) + 1)
+                pipeline.execute()
+        except Exception:
+            logger.warning("Не удалось сбросить теги кэша ответов %s", tags, exc_info=True)
+
+
+def create_response_cache_backend(spec: str) -> Optional[ResponseCacheBackend]:
+    """
+    Создает общее хранилище кэша ответов по строке настройки:
+    memory - только память процесса (общего хранилища нет), redis://... или rediss://... - Redis
+    """
+    if spec == "memory":
+        return None
+    if spec.startswith(("redis://", "rediss://")):
+        return RedisResponseCacheBackend(spec)
+    raise ValueError(f"Неизвестное хранилище кэша ответов: {spec}")
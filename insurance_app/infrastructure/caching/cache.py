@@ -0,0 +1,102 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from insurance_app.application.interfaces.cache_invalidator import CacheInvalidator
+from insurance_app.infrastructure.caching.backends import (
+    CachedResponse,
+    MemoryResponseCacheBackend,
+    ResponseCacheBackend
+)
+
+
+@dataclass
+class RouteCacheStats:
+    """Попадания и промахи кэша ответов маршрута"""
+    hits: int = 0
+    misses: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(CacheInvalidator):
+    """
+    Двухуровневый кэш ответов: LRU в памяти процесса и необязательное общее хранилище.
+
+    Ответ действителен, если ни один из его тегов не сбрасывался позже, чем за grace секунд
+    до начала чтения данных ответа. Поэтому ответ, прочитанный до фиксации изменения
+    или с отстающей реплики, не переживает сброс, а ответ из памяти процесса проверяется
+    по времени сброса в общем хранилище и сбрасывается изменениями в других процессах.
+    """
+    
+    def __init__(
+        self,
+        local: Optional[MemoryResponseCacheBackend] = None,
+        shared: Optional[ResponseCacheBackend] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        grace: float = 0.0,
+        max_ttl: float = 3600.0
+    ):
+        self.local = local if local is not None else MemoryResponseCacheBackend()
+        self.shared = shared
+        # Время жизни ответов маршрутов, переопределяющее значения по умолчанию; 0 отключает кэш маршрута
+        self.ttls = dict(ttls or {})
+        self.grace = grace
+        self.max_ttl = max_ttl
+        self._stats: Dict[str, RouteCacheStats] = {}
+        self._lock = threading.Lock()
+    
+    def ttl(self, route: str, default: float) -> float:
+        """Время жизни ответов маршрута, с"""
+        return min(self.ttls.get(route, default), self.max_ttl)
+    
+    def _is_fresh(self, entry: CachedResponse) -> bool:
+        backend = self.shared if self.shared is not None else self.local
+        invalidations = backend.invalidated_at(entry.tags)
+        return all(at < entry.loaded_at - self.grace for at in invalidations.values())
+    
+    def _record(self, route: str, hit: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(route, RouteCacheStats())
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+    
+    def get(self, route: str, key: str) -> Optional[bytes]:
+        """Тело действительного ответа или None"""
+        entry = self.local.get(key)
+        if entry is None and self.shared is not None:
+            entry = self.shared.get(key)
+            if entry is not None:
+                self.local.set(key, entry)
+        hit = entry is not None and self._is_fresh(entry)
+        self._record(route, hit)
+        return entry.body if hit else None
+    
+    def set(self, key: str, body: bytes, tags: Iterable[str], loaded_at: float, ttl: float) -> None:
+        """Сохраняет ответ, данные которого читались начиная с loaded_at"""
+        entry = CachedResponse(body, tuple(tags), loaded_at, time.time() + ttl)
+        self.local.set(key, entry)
+        if self.shared is not None:
+            self.shared.set(key, entry)
+    
+    def invalidate(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        if not tags:
+            return
+        at = time.time()
+        # Сброс хранится, пока могут существовать ответы, прочитанные до него
+        retention = self.max_ttl + self.grace
+        self.local.invalidate(tags, at, retention)
+        if self.shared is not None:
+            self.shared.invalidate(tags, at, retention)
+    
+    def stats(self) -> Dict[str, RouteCacheStats]:
+        """Снимок счетчиков попаданий по маршрутам"""
+        with self._lock:
+            return {route: RouteCacheStats(stats.hits, stats.misses) for route, stats in self._stats.items()}
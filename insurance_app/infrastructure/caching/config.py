@@ -0,0 +1,28 @@
+import os
+
+from insurance_app.infrastructure.caching.backends import MemoryResponseCacheBackend, create_response_cache_backend
+from insurance_app.infrastructure.caching.cache import ResponseCache
+from insurance_app.infrastructure.database.config import DATABASE_REPLICA_URLS, DB_REPLICA_MAX_LAG
+
+# Общее хранилище (memory — только память процесса, redis://... — Redis) и размер LRU в памяти процесса
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+
+
+def parse_ttls(spec: str) -> dict:
+    """Время жизни ответов маршрутов из строки вида policy_by_number=120,client_by_email=0"""
+    ttls = {}
+    for item in spec.split(","):
+        if item.strip():
+            route, _, ttl = item.partition("=")
+            ttls[route.strip()] = float(ttl)
+    return ttls
+
+
+# Кэш ответов процесса. Чтение с реплики может отставать от сброса тегов на DB_REPLICA_MAX_LAG секунд
+response_cache = ResponseCache(
+    local=MemoryResponseCacheBackend(RESPONSE_CACHE_MAX_ENTRIES),
+    shared=create_response_cache_backend(RESPONSE_CACHE_BACKEND),
+    ttls=parse_ttls(os.getenv("RESPONSE_CACHE_TTL", "")),
+    grace=DB_REPLICA_MAX_LAG if DATABASE_REPLICA_URLS else 0.0
+)
@@ -2,10 +2,20 @@ from .client import ClientModel
 from .policy import PolicyModel
 from .claim import ClaimModel
 from .payment import PaymentModel
+from .claim_payout import ClaimPayoutModel
+from .idempotency import IdempotencyKeyModel
+from .job import JobModel
+from .outbox import OutboxEventModel
+from .number_sequence import NumberSequenceModel
 
 __all__ = [
     'ClientModel',
     'PolicyModel',
     'ClaimModel',
-    'PaymentModel'
+    'PaymentModel',
+    'ClaimPayoutModel',
+    'IdempotencyKeyModel',
+    'JobModel',
+    'OutboxEventModel',
+    'NumberSequenceModel'
 ]
\ No newline at end of file
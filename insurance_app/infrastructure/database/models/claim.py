@@ -1,23 +1,29 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey, Numeric, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL, event, Column, Uuid, String, Boolean, Date, DateTime, ForeignKey, Index, Numeric, Enum, Integer,
+    UniqueConstraint, literal_column
+)
 from sqlalchemy.orm import relationship
 
 from insurance_app.domain.models.claim import ClaimStatus
 from insurance_app.infrastructure.database.config import Base
+from insurance_app.infrastructure.database.models.partitioning import unpartitioned
 
 
 class ClaimModel(Base):
     """ORM модель для таблицы claims"""
     __tablename__ = "claims"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    claim_number = Column(String, unique=True, nullable=False)
-    policy_id = Column(UUID(as_uuid=True), ForeignKey("policies.id"), nullable=False)
-    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # В PostgreSQL уникальность номера обеспечивается его формированием и проверкой сервиса: уникальный индекс
+    # секционированной таблицы обязан включать ключ секционирования
+    claim_number = Column(String, nullable=False)
+    policy_id = Column(Uuid(as_uuid=True), ForeignKey("policies.id"), nullable=False)
+    client_id = Column(Uuid(as_uuid=True), ForeignKey("clients.id"), nullable=False)
     incident_date = Column(Date, nullable=True)
-    report_date = Column(Date, nullable=False)
+    # Ключ секционирования по месяцам (PostgreSQL), поэтому входит в первичный ключ таблицы
+    report_date = Column(Date, primary_key=True)
     description = Column(String, nullable=True)
     status = Column(Enum(ClaimStatus), nullable=False, default=ClaimStatus.PENDING)
     claim_amount = Column(Numeric(10, 2), nullable=False)
@@ -25,10 +31,36 @@ class ClaimModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Номер версии записи: ORM сверяет его при изменении (оптимистическая блокировка),
+    # массовые обновления через Core увеличивают его выражением onupdate
+    version = Column(Integer, nullable=False, default=1, onupdate=literal_column("version") + 1)
+
+    __table_args__ = (
+        Index("ix_claims_claim_number", "claim_number"),
+        Index("ix_claims_status", "status"),
+        # Ключ постраничного чтения ленты изменений
+        Index("ix_claims_updated_at_id", "updated_at", "id"),
+        # Ограничения таблицы до секционирования сохраняются в СУБД без секционирования;
+        # уникальность id — цель внешнего ключа payments.claim_id
+        UniqueConstraint("claim_number", name="claims_claim_number_key").ddl_if(callable_=unpartitioned),
+        UniqueConstraint("id", name="uq_claims_id").ddl_if(callable_=unpartitioned),
+        {"postgresql_partition_by": "RANGE (report_date)"},
+    )
+    
+    # Записи идентифицируются по id, ключ секционирования в идентичность ORM не входит
+    __mapper_args__ = {"version_id_col": version, "primary_key": [id]}
 
     # Отношения
     policy = relationship("PolicyModel", backref="claims")
     client = relationship("ClientModel", backref="claims")
 
     def __repr__(self):
-        return f"<Claim {self.claim_number}>"
\ No newline at end of file
+        return f"<Claim {self.claim_number}>"
+
+
+# Секция по умолчанию принимает строки месяцев, для которых помесячная секция еще не создана (PostgreSQL)
+event.listen(
+    ClaimModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS claims_default PARTITION OF claims DEFAULT").execute_if(dialect="postgresql")
+)
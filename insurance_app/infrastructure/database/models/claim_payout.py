@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Uuid
+
+from insurance_app.infrastructure.database.config import Base
+
+
+class ClaimPayoutModel(Base):
+    """
+    ORM модель для таблицы claim_payouts: страховая выплата по страховому случаю.
+    Несекционированная таблица с первичным ключом по случаю обеспечивает не более одной выплаты на случай:
+    уникальный индекс секционированной таблицы payments обязан включать ключ секционирования.
+    Строка записывается в той же транзакции, что и платеж выплаты.
+    """
+    __tablename__ = "claim_payouts"
+
+    claim_id = Column(Uuid(as_uuid=True), primary_key=True)
+    payment_id = Column(Uuid(as_uuid=True), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<ClaimPayout {self.claim_id}:{self.payment_id}>"
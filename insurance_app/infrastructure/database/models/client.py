@@ -1,7 +1,6 @@
 import uuid
 from datetime import date, datetime
-from sqlalchemy import Column, String, Boolean, Date, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, String, Boolean, Date, DateTime, Integer, literal_column
 
 from insurance_app.infrastructure.database.config import Base
 
@@ -10,7 +9,7 @@ class ClientModel(Base):
     """ORM модель для таблицы clients"""
     __tablename__ = "clients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
@@ -19,7 +18,10 @@ class ClientModel(Base):
     address = Column(String, nullable=True)
     passport_number = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Номер версии записи, увеличивается при каждом изменении
+    version = Column(Integer, nullable=False, default=1, onupdate=literal_column("version") + 1)
 
     def __repr__(self):
         return f"<Client {self.first_name} {self.last_name}>"
\ No newline at end of file
@@ -0,0 +1,36 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, Uuid, String, Integer, Text, DateTime, Enum, JSON, Index
+
+from insurance_app.domain.models.job import JobStatus
+from insurance_app.infrastructure.database.config import Base
+
+
+class JobModel(Base):
+    """ORM модель для таблицы jobs"""
+    __tablename__ = "jobs"
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    progress_current = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Выбор следующей задачи обработчиком: status = PENDING AND run_after <= now ORDER BY run_after
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self):
+        return f"<Job {self.job_type} {self.id}>"
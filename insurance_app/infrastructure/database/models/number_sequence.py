@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Column, Sequence, String
+
+from insurance_app.infrastructure.database.config import Base
+
+# Последовательности блоков номеров в PostgreSQL: каждое значение — номер блока (hi) для алгоритма hi/lo
+NUMBER_SEQUENCES = {
+    name: Sequence(f"{name}_number_seq", metadata=Base.metadata)
+    for name in ("policy", "claim", "payment")
+}
+
+
+class NumberSequenceModel(Base):
+    """
+    ORM модель для таблицы number_sequences: последний выделенный блок номеров.
+    Используется вместо последовательностей в СУБД, где их нет (SQLite).
+    """
+    __tablename__ = "number_sequences"
+
+    name = Column(String, primary_key=True)
+    last_block = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<NumberSequence {self.name}:{self.last_block}>"
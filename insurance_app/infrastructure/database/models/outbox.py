@@ -0,0 +1,32 @@
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Integer, Uuid, String, Text, DateTime, JSON, Index
+
+from insurance_app.infrastructure.database.config import Base
+
+
+class OutboxEventModel(Base):
+    """ORM модель для таблицы outbox_events"""
+    __tablename__ = "outbox_events"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type = Column(String, nullable=False)
+    aggregate_type = Column(String, nullable=False)
+    aggregate_id = Column(Uuid(as_uuid=True), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    published_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # Частичный индекс по неопубликованным событиям: размер не растет вместе с историей
+        Index(
+            "ix_outbox_events_unpublished",
+            "id",
+            postgresql_where=published_at.is_(None),
+            sqlite_where=published_at.is_(None)
+        ),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent {self.id} {self.event_type}>"
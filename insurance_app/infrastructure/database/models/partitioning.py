@@ -0,0 +1,7 @@
+def unpartitioned(ddl, target, bind, dialect, **kw) -> bool:
+    """
+    Условие ddl_if для ограничений, невозможных в секционированных таблицах PostgreSQL
+    (уникальность без ключа секционирования, внешний ключ на секционированную таблицу).
+    В остальных СУБД таблицы не секционируются, и ограничения создаются как до секционирования.
+    """
+    return dialect.name != "postgresql"
@@ -1,22 +1,28 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey, Numeric, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL, event, Column, Uuid, String, Boolean, Date, DateTime, ForeignKey, ForeignKeyConstraint, Index, Numeric, Enum,
+    Integer, UniqueConstraint, literal_column, text
+)
 from sqlalchemy.orm import relationship
 
 from insurance_app.domain.models.payment import PaymentStatus, PaymentType
 from insurance_app.infrastructure.database.config import Base
+from insurance_app.infrastructure.database.models.partitioning import unpartitioned
 
 
 class PaymentModel(Base):
     """ORM модель для таблицы payments"""
     __tablename__ = "payments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    payment_number = Column(String, unique=True, nullable=False)
-    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False)
-    policy_id = Column(UUID(as_uuid=True), ForeignKey("policies.id"), nullable=True)
-    claim_id = Column(UUID(as_uuid=True), ForeignKey("claims.id"), nullable=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # В PostgreSQL уникальность номера обеспечивается его формированием и проверкой сервиса: уникальный индекс
+    # секционированной таблицы обязан включать ключ секционирования
+    payment_number = Column(String, nullable=False)
+    client_id = Column(Uuid(as_uuid=True), ForeignKey("clients.id"), nullable=False)
+    policy_id = Column(Uuid(as_uuid=True), ForeignKey("policies.id"), nullable=True)
+    # Внешний ключ на секционированную таблицу claims в PostgreSQL невозможен: ее первичный ключ включает report_date
+    claim_id = Column(Uuid(as_uuid=True), nullable=True)
     amount = Column(Numeric(10, 2), nullable=False)
     payment_date = Column(Date, nullable=True)
     due_date = Column(Date, nullable=True)
@@ -24,13 +30,51 @@ class PaymentModel(Base):
     payment_type = Column(Enum(PaymentType), nullable=False)
     payment_method = Column(String, nullable=True)
     description = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Ключ секционирования по месяцам (PostgreSQL), поэтому входит в первичный ключ таблицы
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Номер версии записи: ORM сверяет его при изменении (оптимистическая блокировка),
+    # массовые обновления через Core увеличивают его выражением onupdate
+    version = Column(Integer, nullable=False, default=1, onupdate=literal_column("version") + 1)
 
+    __table_args__ = (
+        Index("ix_payments_payment_number", "payment_number"),
+        # Поиск платежей по страховому случаю, в том числе проверка существования выплаты
+        Index("ix_payments_claim_id", "claim_id"),
+        # Ключ постраничного чтения ленты изменений
+        Index("ix_payments_updated_at_id", "updated_at", "id"),
+        # Ограничения таблицы до секционирования сохраняются в СУБД без секционирования
+        UniqueConstraint("payment_number", name="payments_payment_number_key").ddl_if(callable_=unpartitioned),
+        ForeignKeyConstraint(["claim_id"], ["claims.id"], name="payments_claim_id_fkey").ddl_if(callable_=unpartitioned),
+        Index(
+            "uq_payments_claim_payout",
+            "claim_id",
+            unique=True,
+            sqlite_where=text("payment_type = 'CLAIM_PAYOUT'")
+        ).ddl_if(callable_=unpartitioned),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    
+    # Записи идентифицируются по id, ключ секционирования в идентичность ORM не входит
+    __mapper_args__ = {"version_id_col": version, "primary_key": [id]}
+    
     # Отношения
     client = relationship("ClientModel", backref="payments")
     policy = relationship("PolicyModel", backref="payments")
-    claim = relationship("ClaimModel", backref="payments")
+    claim = relationship(
+        "ClaimModel",
+        primaryjoin="foreign(PaymentModel.claim_id) == ClaimModel.id",
+        backref="payments"
+    )
 
     def __repr__(self):
-        return f"<Payment {self.payment_number}>"
\ No newline at end of file
+        return f"<Payment {self.payment_number}>"
+
+
+# Секция по умолчанию принимает строки месяцев, для которых помесячная секция еще не создана (PostgreSQL)
+event.listen(
+    PaymentModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS payments_default PARTITION OF payments DEFAULT").execute_if(dialect="postgresql")
+)
@@ -1,7 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey, Numeric, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, String, Boolean, Date, DateTime, ForeignKey, Index, Numeric, Enum, Integer, false, literal_column
 from sqlalchemy.orm import relationship
 
 from insurance_app.domain.models.policy import PolicyStatus, PolicyType
@@ -12,9 +11,9 @@ class PolicyModel(Base):
     """ORM модель для таблицы policies"""
     __tablename__ = "policies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     policy_number = Column(String, unique=True, nullable=False)
-    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False)
+    client_id = Column(Uuid(as_uuid=True), ForeignKey("clients.id"), nullable=False)
     type = Column(Enum(PolicyType), nullable=False)
     status = Column(Enum(PolicyStatus), nullable=False, default=PolicyStatus.PENDING)
     start_date = Column(Date, nullable=True)
@@ -23,8 +22,20 @@ class PolicyModel(Base):
     premium_amount = Column(Numeric(10, 2), nullable=False)
     payment_frequency = Column(String, nullable=False, default="monthly")
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     description = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
+    auto_renew = Column(Boolean, nullable=False, default=False, server_default=false())
+    # Номер версии записи: ORM сверяет его при изменении (оптимистическая блокировка),
+    # массовые обновления через Core увеличивают его выражением onupdate
+    version = Column(Integer, nullable=False, default=1, onupdate=literal_column("version") + 1)
+
+    __table_args__ = (
+        # Выбор действующих полисов с истекшим сроком и фильтр действующих полисов в списках
+        Index("ix_policies_status_end_date", "status", "end_date"),
+    )
+    
+    __mapper_args__ = {"version_id_col": version}
 
     # Отношения
     client = relationship("ClientModel", backref="policies")
@@ -1,7 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, String, Boolean, DateTime, ARRAY, JSON
 
 from insurance_app.infrastructure.database.config import Base
 
@@ -10,14 +9,14 @@ class UserModel(Base):
     """ORM модель для таблицы users"""
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String, unique=True, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     full_name = Column(String, nullable=True)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
-    roles = Column(ARRAY(String), default=["user"])
+    roles = Column(ARRAY(String).with_variant(JSON(), "sqlite"), default=["user"])
     created_at = Column(DateTime, default=datetime.utcnow)
 
     def __repr__(self):
@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy.pool import QueuePool
+
+
+class PoolWaitMonitor:
+    """
+    Время ожидания соединения из пула процесса: скользящее среднее завершенных ожиданий
+    и длительность самого долгого текущего ожидания. Используется для сброса нагрузки.
+    """
+
+    def __init__(self, window: float = 5.0, smoothing: float = 0.2):
+        # Среднее старше window секунд считается устаревшим: без новых ожиданий пул свободен
+        self.window = window
+        self.smoothing = smoothing
+        self._average = 0.0
+        self._observed_at = 0.0
+        self._waiting: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def started(self) -> float:
+        """Отмечает начало ожидания текущим потоком"""
+        now = time.monotonic()
+        with self._lock:
+            self._waiting[threading.get_ident()] = now
+        return now
+
+    def finished(self, started: float) -> None:
+        """Отмечает окончание ожидания текущим потоком"""
+        now = time.monotonic()
+        with self._lock:
+            self._waiting.pop(threading.get_ident(), None)
+            self._average += self.smoothing * (now - started - self._average)
+            self._observed_at = now
+
+    def wait_time(self) -> float:
+        """Текущая оценка времени ожидания соединения, с"""
+        now = time.monotonic()
+        with self._lock:
+            average = self._average if now - self._observed_at <= self.window else 0.0
+            oldest = min(self._waiting.values(), default=now)
+        return max(average, now - oldest)
+
+
+# Монитор пула соединений процесса
+pool_wait_monitor = PoolWaitMonitor()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool, сообщающий монитору время получения соединения"""
+
+    _local = threading.local()
+
+    def _do_get(self):
+        # QueuePool._do_get вызывает себя повторно, учитывается только внешний вызов
+        if getattr(self._local, "timing", False):
+            return super()._do_get()
+        self._local.timing = True
+        started = pool_wait_monitor.started()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_monitor.finished(started)
+            self._local.timing = False
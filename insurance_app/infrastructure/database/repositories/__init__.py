@@ -4,6 +4,13 @@ from insurance_app.infrastructure.database.repositories.policy_repository import
 from insurance_app.infrastructure.database.repositories.claim_repository import ClaimRepositoryImpl
 from insurance_app.infrastructure.database.repositories.payment_repository import PaymentRepositoryImpl
 from insurance_app.infrastructure.database.repositories.user_repository import UserRepositoryImpl
+from insurance_app.infrastructure.database.repositories.idempotency_repository import IdempotencyRepositoryImpl
+from insurance_app.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from insurance_app.infrastructure.database.repositories.outbox_repository import OutboxRepositoryImpl
+from insurance_app.infrastructure.database.repositories.import_repository import ImportRepositoryImpl
+from insurance_app.infrastructure.database.repositories.partition_repository import PartitionRepositoryImpl
+from insurance_app.infrastructure.database.repositories.number_sequence_repository import NumberSequenceRepositoryImpl
+from insurance_app.infrastructure.database.repositories.reference_repository import ReferenceRepositoryImpl
 from insurance_app.infrastructure.database.repositories.factory import RepositoryFactory
 
 __all__ = [
@@ -12,5 +19,12 @@ __all__ = [
     'ClaimRepositoryImpl',
     'PaymentRepositoryImpl',
     'UserRepositoryImpl',
+    'IdempotencyRepositoryImpl',
+    'JobRepositoryImpl',
+    'OutboxRepositoryImpl',
+    'ImportRepositoryImpl',
+    'PartitionRepositoryImpl',
+    'NumberSequenceRepositoryImpl',
+    'ReferenceRepositoryImpl',
     'RepositoryFactory'
 ]
\ No newline at end of file
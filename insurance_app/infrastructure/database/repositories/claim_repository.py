@@ -1,15 +1,29 @@
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Collection, Dict, Iterator, List, Optional
 from uuid import UUID
+from sqlalchemy import bindparam, delete, exists, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from insurance_app.application.interfaces.claim_repository import ClaimRepository
-from insurance_app.domain.models.claim import Claim
+from insurance_app.domain.models.change import ChangePosition
+from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.domain.models.payment import PaymentStatus, PaymentType
+from insurance_app.domain.models.reference import ClaimRef
+from insurance_app.domain.models.version import EntityVersion
 from insurance_app.infrastructure.database.models.claim import ClaimModel
+from insurance_app.infrastructure.database.models.claim_payout import ClaimPayoutModel
+from insurance_app.infrastructure.database.models.payment import PaymentModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+from insurance_app.infrastructure.database.repositories.versioning import save_versioned
 
 
 class ClaimRepositoryImpl(ClaimRepository):
     """Реализация репозитория для работы с страховыми случаями"""
     
+    _reader = RowReader(ClaimModel, Claim)
+    _versions = RowReader(ClaimModel, EntityVersion)
+    _refs = RowReader(ClaimModel, ClaimRef)
+    
     def __init__(self, session: Session):
         self.session = session
     
@@ -28,7 +42,8 @@ class ClaimRepositoryImpl(ClaimRepository):
             approved_amount=model.approved_amount,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            is_active=model.is_active
+            is_active=model.is_active,
+            version=model.version
         )
     
     def _to_model(self, entity: Claim) -> ClaimModel:
@@ -60,20 +75,34 @@ class ClaimRepositoryImpl(ClaimRepository):
         model = self.session.query(ClaimModel).filter(ClaimModel.id == entity_id).first()
         return self._to_domain(model) if model else None
     
+    def get_by_ids(self, entity_ids: Collection[UUID], for_update: bool = False) -> List[Claim]:
+        if not entity_ids:
+            return []
+        stmt = self._reader.select().where(ClaimModel.id.in_(entity_ids))
+        if for_update:
+            stmt = stmt.with_for_update()
+        return self._reader.all(self.session, stmt)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Claim]:
-        models = self.session.query(ClaimModel).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        stmt = self._reader.select().offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Claim]:
+        return self._reader.stream(self.session, self._reader.select(), batch_size)
     
     def update(self, entity: Claim) -> Claim:
-        model = self._to_model(entity)
-        self.session.merge(model)
+        model = save_versioned(self.session, self._to_model(entity), entity.version, "Страховой случай")
+        updated = self._to_domain(model)
         self.session.commit()
-        return entity
+        return updated
     
     def delete(self, entity_id: UUID) -> bool:
         model = self.session.query(ClaimModel).filter(ClaimModel.id == entity_id).first()
         if not model:
             return False
+        # Внешнего ключа платежей на секционированную таблицу claims нет: платежи случая удаляются вместе с ним
+        self.session.execute(delete(ClaimPayoutModel).where(ClaimPayoutModel.claim_id == entity_id))
+        self.session.execute(delete(PaymentModel).where(PaymentModel.claim_id == entity_id))
         self.session.delete(model)
         self.session.commit()
         return True
@@ -82,14 +111,156 @@ class ClaimRepositoryImpl(ClaimRepository):
         model = self.session.query(ClaimModel).filter(ClaimModel.claim_number == claim_number).first()
         return self._to_domain(model) if model else None
     
+    def get_ref(self, entity_id: UUID) -> Optional[ClaimRef]:
+        stmt = self._refs.select().where(ClaimModel.id == entity_id)
+        return self._refs.first(self.session, stmt)
+    
     def get_by_policy_id(self, policy_id: UUID, skip: int = 0, limit: int = 100) -> List[Claim]:
-        models = self.session.query(ClaimModel).filter(
+        stmt = self._reader.select().where(
             ClaimModel.policy_id == policy_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
     
     def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Claim]:
-        models = self.session.query(ClaimModel).filter(
+        stmt = self._reader.select().where(
             ClaimModel.client_id == client_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    @staticmethod
+    def _filtered(
+        stmt,
+        policy_id: Optional[UUID],
+        client_id: Optional[UUID],
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None
+    ):
+        """Фильтры списка страховых случаев: связанная сущность и период по ключу секционирования report_date"""
+        if policy_id:
+            stmt = stmt.where(ClaimModel.policy_id == policy_id)
+        elif client_id:
+            stmt = stmt.where(ClaimModel.client_id == client_id)
+        # Сравнение столбца с константами позволяет PostgreSQL исключить секции вне периода при планировании
+        if reported_from:
+            stmt = stmt.where(ClaimModel.report_date >= reported_from)
+        if reported_to:
+            stmt = stmt.where(ClaimModel.report_date <= reported_to)
+        return stmt
+    
+    def get_by_period(
+        self,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None
+    ) -> List[Claim]:
+        stmt = self._filtered(self._reader.select(), policy_id, client_id, reported_from, reported_to)
+        return self._reader.all(self.session, stmt.offset(skip).limit(limit))
+    
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        stmt = self._versions.select().where(ClaimModel.id == entity_id)
+        return self._versions.first(self.session, stmt)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        policy_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        reported_from: Optional[date] = None,
+        reported_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        stmt = self._filtered(self._versions.select(), policy_id, client_id, reported_from, reported_to)
+        return self._versions.all(self.session, stmt.offset(skip).limit(limit))
+    
+    def update_status_bulk(
+        self,
+        claim_ids: Collection[UUID],
+        status: ClaimStatus,
+        from_statuses: Collection[ClaimStatus]
+    ) -> List[UUID]:
+        if not claim_ids or not from_statuses:
+            return []
+        stmt = update(ClaimModel).where(
+            ClaimModel.id.in_(claim_ids),
+            ClaimModel.status.in_(from_statuses)
+        ).values(
+            status=status,
+            updated_at=datetime.utcnow()
+        ).returning(ClaimModel.id).execution_options(synchronize_session=False)
+        updated_ids = list(self.session.execute(stmt).scalars())
+        self.session.commit()
+        return updated_ids
+    
+    def get_statuses(self, claim_ids: Collection[UUID]) -> Dict[UUID, ClaimStatus]:
+        if not claim_ids:
+            return {}
+        stmt = select(ClaimModel.id, ClaimModel.status).where(ClaimModel.id.in_(claim_ids))
+        return {claim_id: status for claim_id, status in self.session.execute(stmt)}
+    
+    def approve_bulk(self, claims: List[Claim]) -> None:
+        if claims:
+            table = ClaimModel.__table__
+            stmt = update(table).where(
+                table.c.id == bindparam("claim_id")
+            ).values(
+                status=bindparam("new_status"),
+                approved_amount=bindparam("new_approved_amount"),
+                updated_at=datetime.utcnow()
+            )
+            self.session.execute(stmt, [
+                {
+                    "claim_id": claim.id,
+                    "new_status": claim.status,
+                    "new_approved_amount": claim.approved_amount
+                }
+                for claim in claims
+            ])
+        # Фиксируем транзакцию и в том числе снимаем блокировки, полученные в get_by_ids(for_update=True)
+        self.session.commit()
+    
+    @staticmethod
+    def _payout_exists(*conditions):
+        """Подзапрос существования страховой выплаты по страховому случаю"""
+        return exists().where(
+            PaymentModel.claim_id == ClaimModel.id,
+            PaymentModel.payment_type == PaymentType.CLAIM_PAYOUT,
+            *conditions
+        )
+    
+    def get_approved_without_payout(self, limit: int = 500) -> List[Claim]:
+        stmt = self._reader.select().where(
+            ClaimModel.status == ClaimStatus.APPROVED,
+            ~self._payout_exists()
+        ).order_by(ClaimModel.updated_at).limit(limit).with_for_update(skip_locked=True, of=ClaimModel)
+        return self._reader.all(self.session, stmt)
+    
+    def mark_paid_by_completed_payouts(self, limit: int = 500) -> List[UUID]:
+        claim_ids = select(ClaimModel.id).where(
+            ClaimModel.status == ClaimStatus.APPROVED,
+            self._payout_exists(PaymentModel.status == PaymentStatus.COMPLETED)
+        ).limit(limit)
+        stmt = update(ClaimModel).where(
+            ClaimModel.id.in_(claim_ids),
+            ClaimModel.status == ClaimStatus.APPROVED
+        ).values(
+            status=ClaimStatus.PAID,
+            updated_at=datetime.utcnow()
+        ).returning(ClaimModel.id).execution_options(synchronize_session=False)
+        updated_ids = list(self.session.execute(stmt).scalars())
+        self.session.commit()
+        return updated_ids
+    
+    def get_changed_since(
+        self,
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int = 100
+    ) -> List[Claim]:
+        stmt = self._reader.select().where(ClaimModel.updated_at <= until)
+        if after is not None:
+            stmt = stmt.where(tuple_(ClaimModel.updated_at, ClaimModel.id) > (after.updated_at, after.id))
+        stmt = stmt.order_by(ClaimModel.updated_at, ClaimModel.id).limit(limit)
+        return self._reader.all(self.session, stmt)
@@ -1,15 +1,21 @@
-from typing import List, Optional
+from typing import Collection, Iterator, List, Optional
 from uuid import UUID
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from insurance_app.application.interfaces.client_repository import ClientRepository
 from insurance_app.domain.models.client import Client
+from insurance_app.domain.models.version import EntityVersion
 from insurance_app.infrastructure.database.models.client import ClientModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
 
 
 class ClientRepositoryImpl(ClientRepository):
     """Реализация репозитория для работы с клиентами"""
     
+    _reader = RowReader(ClientModel, Client)
+    _versions = RowReader(ClientModel, EntityVersion)
+    
     def __init__(self, session: Session):
         self.session = session
     
@@ -24,7 +30,9 @@ class ClientRepositoryImpl(ClientRepository):
             address=model.address,
             passport_number=model.passport_number,
             created_at=model.created_at,
-            is_active=model.is_active
+            updated_at=model.updated_at,
+            is_active=model.is_active,
+            version=model.version
         )
     
     def _to_model(self, entity: Client) -> ClientModel:
@@ -52,9 +60,18 @@ class ClientRepositoryImpl(ClientRepository):
         model = self.session.query(ClientModel).filter(ClientModel.id == entity_id).first()
         return self._to_domain(model) if model else None
     
+    def get_by_ids(self, entity_ids: Collection[UUID]) -> List[Client]:
+        if not entity_ids:
+            return []
+        stmt = self._reader.select().where(ClientModel.id.in_(entity_ids))
+        return self._reader.all(self.session, stmt)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        models = self.session.query(ClientModel).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        stmt = self._reader.select().offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Client]:
+        return self._reader.stream(self.session, self._reader.select(), batch_size)
     
     def update(self, entity: Client) -> Client:
         model = self._to_model(entity)
@@ -75,8 +92,25 @@ class ClientRepositoryImpl(ClientRepository):
         return self._to_domain(model) if model else None
     
     def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
-        models = self.session.query(ClientModel).filter(
+        stmt = self._reader.select().where(
             (ClientModel.first_name.ilike(f"%{name}%")) | 
             (ClientModel.last_name.ilike(f"%{name}%"))
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
\ No newline at end of file
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def exists(self, entity_id: UUID) -> bool:
+        stmt = select(ClientModel.id).where(ClientModel.id == entity_id).limit(1)
+        return self.session.execute(stmt).first() is not None
+    
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        stmt = self._versions.select().where(ClientModel.id == entity_id)
+        return self._versions.first(self.session, stmt)
+    
+    def get_versions(self, skip: int = 0, limit: int = 100, name: Optional[str] = None) -> List[EntityVersion]:
+        stmt = self._versions.select()
+        if name:
+            stmt = stmt.where(
+                (ClientModel.first_name.ilike(f"%{name}%")) | 
+                (ClientModel.last_name.ilike(f"%{name}%"))
+            )
+        return self._versions.all(self.session, stmt.offset(skip).limit(limit))
@@ -4,6 +4,13 @@ from insurance_app.application.interfaces.client_repository import ClientReposit
 from insurance_app.application.interfaces.policy_repository import PolicyRepository
 from insurance_app.application.interfaces.claim_repository import ClaimRepository
 from insurance_app.application.interfaces.payment_repository import PaymentRepository
+from insurance_app.application.interfaces.idempotency_repository import IdempotencyRepository
+from insurance_app.application.interfaces.job_repository import JobRepository
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.application.interfaces.import_repository import ImportRepository
+from insurance_app.application.interfaces.partition_repository import PartitionRepository
+from insurance_app.application.interfaces.number_sequence_repository import NumberSequenceRepository
+from insurance_app.application.interfaces.reference_repository import ReferenceRepository
 from insurance_app.domain.repositories.user_repository import UserRepository
 from insurance_app.infrastructure.database.repositories import (
     ClientRepositoryImpl,
@@ -11,6 +18,13 @@ from insurance_app.infrastructure.database.repositories import (
     ClaimRepositoryImpl,
     PaymentRepositoryImpl
 )
+from insurance_app.infrastructure.database.repositories.idempotency_repository import IdempotencyRepositoryImpl
+from insurance_app.infrastructure.database.repositories.job_repository import JobRepositoryImpl
+from insurance_app.infrastructure.database.repositories.outbox_repository import OutboxRepositoryImpl
+from insurance_app.infrastructure.database.repositories.import_repository import ImportRepositoryImpl
+from insurance_app.infrastructure.database.repositories.partition_repository import PartitionRepositoryImpl
+from insurance_app.infrastructure.database.repositories.number_sequence_repository import NumberSequenceRepositoryImpl
+from insurance_app.infrastructure.database.repositories.reference_repository import ReferenceRepositoryImpl
 from insurance_app.infrastructure.database.repositories.user_repository import UserRepositoryImpl
 
 
@@ -41,3 +55,38 @@ class RepositoryFactory:
     def create_user_repository(session: Session) -> UserRepository:
         """Создает репозиторий для работы с пользователями"""
         return UserRepositoryImpl(session)
+    
+    @staticmethod
+    def create_idempotency_repository(session: Session) -> IdempotencyRepository:
+        """Создает репозиторий сохраненных ответов для ключей идемпотентности"""
+        return IdempotencyRepositoryImpl(session)
+    
+    @staticmethod
+    def create_job_repository(session: Session) -> JobRepository:
+        """Создает репозиторий очереди фоновых задач"""
+        return JobRepositoryImpl(session)
+    
+    @staticmethod
+    def create_outbox_repository(session: Session) -> OutboxRepository:
+        """Создает репозиторий исходящих доменных событий"""
+        return OutboxRepositoryImpl(session)
+    
+    @staticmethod
+    def create_import_repository(session: Session) -> ImportRepository:
+        """Создает репозиторий массовой загрузки данных"""
+        return ImportRepositoryImpl(session)
+    
+    @staticmethod
+    def create_partition_repository(session: Session) -> PartitionRepository:
+        """Создает репозиторий секций таблиц"""
+        return PartitionRepositoryImpl(session)
+    
+    @staticmethod
+    def create_number_sequence_repository(session: Session) -> NumberSequenceRepository:
+        """Создает репозиторий последовательностей блоков номеров"""
+        return NumberSequenceRepositoryImpl(session)
+    
+    @staticmethod
+    def create_reference_repository(session: Session) -> ReferenceRepository:
+        """Создает репозиторий проверки ссылок на клиента, полис и страховой случай"""
+        return ReferenceRepositoryImpl(session)
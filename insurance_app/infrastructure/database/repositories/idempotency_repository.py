@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.idempotency_repository import IdempotencyRepository
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+from insurance_app.infrastructure.database.models.idempotency import IdempotencyKeyModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+
+
+class IdempotencyRepositoryImpl(IdempotencyRepository):
+    """Реализация репозитория сохраненных ответов для ключей идемпотентности"""
+    
+    _reader = RowReader(IdempotencyKeyModel, IdempotencyRecord)
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get(self, user_id: str, key: str) -> Optional[IdempotencyRecord]:
+        stmt = self._reader.select().where(
+            IdempotencyKeyModel.user_id == user_id,
+            IdempotencyKeyModel.key == key
+        )
+        return self._reader.first(self.session, stmt)
+    
+    def try_create(self, record: IdempotencyRecord) -> bool:
+        # Вставка в точке сохранения: конфликт ключа не откатывает остальную транзакцию сессии
+        try:
+            with self.session.begin_nested():
+                self.session.add(IdempotencyKeyModel(
+                    user_id=record.user_id,
+                    key=record.key,
+                    request_hash=record.request_hash,
+                    created_at=record.created_at,
+                    expires_at=record.expires_at
+                ))
+        except IntegrityError:
+            return False
+        self.session.commit()
+        return True
+    
+    def complete(self, user_id: str, key: str, status_code: int, response_body: str) -> None:
+        self.session.execute(
+            update(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.user_id == user_id,
+                IdempotencyKeyModel.key == key
+            ).values(status_code=status_code, response_body=response_body)
+        )
+        self.session.commit()
+    
+    def delete(self, user_id: str, key: str) -> None:
+        self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.user_id == user_id,
+                IdempotencyKeyModel.key == key
+            )
+        )
+        self.session.commit()
+    
+    def delete_expired(self, now: datetime) -> int:
+        result = self.session.execute(
+            delete(IdempotencyKeyModel).where(IdempotencyKeyModel.expires_at <= now)
+        )
+        self.session.commit()
+        return result.rowcount
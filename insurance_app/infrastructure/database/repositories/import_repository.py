@@ -0,0 +1,487 @@
+import csv
+import io
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    Uuid,
+    and_,
+    case,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    update
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.import_repository import ImportRepository
+from insurance_app.domain.exceptions import BusinessRuleViolationException
+from insurance_app.domain.models.bulk_import import ImportEntity, ImportRejection
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.payment import PaymentStatus, PaymentType
+from insurance_app.domain.models.policy import PolicyStatus, PolicyType
+from insurance_app.infrastructure.database.models.claim import ClaimModel
+from insurance_app.infrastructure.database.models.claim_payout import ClaimPayoutModel
+from insurance_app.infrastructure.database.models.client import ClientModel
+from insurance_app.infrastructure.database.models.payment import PaymentModel
+from insurance_app.infrastructure.database.models.policy import PolicyModel
+
+# Форматы значений проверяются регулярными выражениями до приведения типов,
+# чтобы ошибочная строка отклонялась, а не прерывала перенос всего файла
+DATE_PATTERN = r"^[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$"
+AMOUNT_PATTERN = r"^[0-9]{1,8}(\.[0-9]{1,2})?$"
+
+
+def _day_out_of_range(value):
+    """
+    Условие «день больше числа дней в месяце» для значения в формате ГГГГ-ММ-ДД (например, 2023-02-30).
+    Проверяется арифметикой, а не приведением типа: CAST и to_date в PostgreSQL прерывают запрос
+    """
+    year, month, day = (cast(func.substr(value, start, length), Integer) for start, length in ((1, 4), (6, 2), (9, 2)))
+    leap = or_(and_(year % 4 == 0, year % 100 != 0), year % 400 == 0)
+    days = case((month == 2, case((leap, 29), else_=28)), (month.in_([4, 6, 9, 11]), 30), else_=31)
+    return day > days
+
+
+@dataclass(frozen=True)
+class ImportField:
+    """Столбец файла загрузки: text, date, amount или enum (имя или значение элемента, без учета регистра)"""
+    name: str
+    kind: str = "text"
+    required: bool = False
+    choices: Tuple[str, ...] = ()
+
+
+def _enum(name: str, enum, required: bool = False) -> ImportField:
+    return ImportField(name, "enum", required, tuple(item.name for item in enum))
+
+
+# Столбцы файлов. Записи ссылаются друг на друга по естественным ключам:
+# полис на клиента по email, страховой случай и платеж на полис по номеру, платеж на случай по номеру
+IMPORT_FIELDS: Dict[ImportEntity, List[ImportField]] = {
+    ImportEntity.CLIENTS: [
+        ImportField("email", required=True),
+        ImportField("first_name", required=True),
+        ImportField("last_name", required=True),
+        ImportField("phone"),
+        ImportField("birth_date", "date"),
+        ImportField("address"),
+        ImportField("passport_number"),
+    ],
+    ImportEntity.POLICIES: [
+        ImportField("policy_number", required=True),
+        ImportField("client_email", required=True),
+        _enum("type", PolicyType, required=True),
+        _enum("status", PolicyStatus),
+        ImportField("start_date", "date"),
+        ImportField("end_date", "date"),
+        ImportField("coverage_amount", "amount", required=True),
+        ImportField("premium_amount", "amount", required=True),
+        ImportField("payment_frequency"),
+        ImportField("description"),
+    ],
+    ImportEntity.CLAIMS: [
+        ImportField("claim_number", required=True),
+        ImportField("policy_number", required=True),
+        ImportField("incident_date", "date", required=True),
+        ImportField("report_date", "date"),
+        ImportField("description"),
+        _enum("status", ClaimStatus),
+        ImportField("claim_amount", "amount", required=True),
+        ImportField("approved_amount", "amount"),
+    ],
+    ImportEntity.PAYMENTS: [
+        ImportField("payment_number", required=True),
+        ImportField("policy_number", required=True),
+        ImportField("claim_number"),
+        ImportField("amount", "amount", required=True),
+        ImportField("payment_date", "date"),
+        ImportField("due_date", "date"),
+        _enum("status", PaymentStatus),
+        _enum("payment_type", PaymentType, required=True),
+        ImportField("payment_method"),
+        ImportField("description"),
+    ],
+}
+
+# Естественный ключ, по которому существующая запись обновляется
+IMPORT_KEYS = {
+    ImportEntity.CLIENTS: "email",
+    ImportEntity.POLICIES: "policy_number",
+    ImportEntity.CLAIMS: "claim_number",
+    ImportEntity.PAYMENTS: "payment_number",
+}
+
+_TARGETS = {
+    ImportEntity.CLIENTS: ClientModel.__table__,
+    ImportEntity.POLICIES: PolicyModel.__table__,
+    ImportEntity.CLAIMS: ClaimModel.__table__,
+    ImportEntity.PAYMENTS: PaymentModel.__table__,
+}
+
+# Столбцы, которые не изменяются при обновлении существующей записи
+_PRESERVED = {"id", "created_at", "is_active", "version"}
+
+
+class _CountingReader(io.RawIOBase):
+    """Поток файла, сообщающий количество прочитанных байт"""
+
+    def __init__(self, stream: BinaryIO, progress: Optional[Callable[[int], None]], consumed: int = 0):
+        self.stream = stream
+        self.progress = progress
+        self.consumed = consumed
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        if size:
+            self.consumed += size
+            if self.progress:
+                self.progress(self.consumed)
+        return size
+
+
+class ImportRepositoryImpl(ImportRepository):
+    """
+    Реализация репозитория массовой загрузки. В PostgreSQL файл передается в промежуточную таблицу
+    командой COPY без разбора в Python, в остальных СУБД — пакетными INSERT. Проверка и перенос
+    выполняются несколькими SQL-запросами над всей промежуточной таблицей.
+    """
+
+    def __init__(self, session: Session, batch_size: int = 5000):
+        self.session = session
+        # Размер пакета INSERT для СУБД без COPY
+        self.batch_size = batch_size
+        self._staging: Dict[ImportEntity, Table] = {}
+
+    @property
+    def _dialect(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _staging_table(self, entity: ImportEntity) -> Table:
+        postgres = self._dialect == "postgresql"
+        return Table(
+            f"import_{entity.value}",
+            MetaData(),
+            # Номер записи в файле; COPY и пакетные INSERT сохраняют порядок строк
+            Column("row_number", Integer, primary_key=True, autoincrement=True),
+            # Идентификатор новой записи: в PostgreSQL генерируется при COPY
+            Column("id", Uuid(as_uuid=True), server_default=func.gen_random_uuid() if postgres else None),
+            *(Column(field.name, Text) for field in IMPORT_FIELDS[entity]),
+            Column("error", Text),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP"
+        )
+
+    @staticmethod
+    def _read_header(entity: ImportEntity, stream: BinaryIO) -> List[str]:
+        line = stream.readline().decode("utf-8-sig")
+        columns = [name.strip().lower() for name in next(csv.reader([line]), [])]
+        known = {field.name for field in IMPORT_FIELDS[entity]}
+        unknown = [name for name in columns if name not in known]
+        if unknown:
+            raise ValueError(f"Неизвестные столбцы файла {entity.value}: {', '.join(unknown)}")
+        missing = [field.name for field in IMPORT_FIELDS[entity] if field.required and field.name not in columns]
+        if missing:
+            raise ValueError(f"В файле {entity.value} нет обязательных столбцов: {', '.join(missing)}")
+        if len(set(columns)) != len(columns):
+            raise ValueError(f"Столбцы файла {entity.value} повторяются")
+        return columns
+
+    def stage(
+        self,
+        entity: ImportEntity,
+        stream: BinaryIO,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        columns = self._read_header(entity, stream)
+        table = self._staging_table(entity)
+        connection = self.session.connection()
+        connection.execute(text(f"DROP TABLE IF EXISTS {table.name}"))
+        table.create(connection)
+        self._staging[entity] = table
+
+        reader = _CountingReader(stream, progress, consumed=stream.tell() if stream.seekable() else 0)
+        if self._dialect == "postgresql":
+            loaded = self._copy(table, columns, reader)
+        else:
+            loaded = self._insert(table, columns, reader)
+
+        # Индекс для поиска повторов ключа создается после загрузки: так загрузка быстрее
+        Index(f"ix_{table.name}_key", table.c[IMPORT_KEYS[entity]]).create(connection)
+        if self._dialect == "postgresql":
+            # Временные таблицы не анализируются автоматически
+            connection.execute(text(f"ANALYZE {table.name}"))
+        return loaded
+
+    def _copy(self, table: Table, columns: List[str], reader: _CountingReader) -> int:
+        column_list = ", ".join(columns)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            # FORCE_NULL: пустые значения, в том числе в кавычках, загружаются как NULL
+            cursor.copy_expert(
+                f"COPY {table.name} ({column_list}) FROM STDIN WITH (FORMAT csv, FORCE_NULL ({column_list}))",
+                reader
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def _insert(self, table: Table, columns: List[str], reader: _CountingReader) -> int:
+        stream = io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8", newline="")
+        stmt = insert(table)
+        loaded = 0
+        batch = []
+        try:
+            for values in csv.reader(stream):
+                if not values:
+                    continue
+                row = {name: value or None for name, value in zip(columns, values)}
+                row["id"] = uuid4()
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    self.session.execute(stmt, batch)
+                    loaded += len(batch)
+                    batch = []
+            if batch:
+                self.session.execute(stmt, batch)
+                loaded += len(batch)
+        finally:
+            # Исходный поток закрывает вызывающий код
+            stream.detach()
+        return loaded
+
+    def _checks(self, entity: ImportEntity, staging: Table) -> List[tuple]:
+        """Условия отклонения строки и причины в порядке проверки"""
+        checks = []
+        for field in IMPORT_FIELDS[entity]:
+            value = staging.c[field.name]
+            if field.required:
+                checks.append((value.is_(None), f"{field.name}: обязательное поле"))
+            if field.kind == "date":
+                checks.append((
+                    and_(value.isnot(None), ~value.regexp_match(DATE_PATTERN)),
+                    f"{field.name}: ожидается дата в формате ГГГГ-ММ-ДД"
+                ))
+                # Условия CASE проверяются по порядку: сюда доходят только значения в формате ГГГГ-ММ-ДД
+                checks.append((
+                    and_(value.isnot(None), _day_out_of_range(value)),
+                    f"{field.name}: несуществующая дата"
+                ))
+            elif field.kind == "amount":
+                checks.append((
+                    and_(value.isnot(None), ~value.regexp_match(AMOUNT_PATTERN)),
+                    f"{field.name}: ожидается неотрицательная сумма с точностью до копеек"
+                ))
+            elif field.kind == "enum":
+                checks.append((
+                    and_(value.isnot(None), func.upper(value).notin_(field.choices)),
+                    f"{field.name}: допустимые значения {', '.join(choice.lower() for choice in field.choices)}"
+                ))
+
+        key = IMPORT_KEYS[entity]
+        earlier = staging.alias("earlier")
+        checks.append((
+            exists().where(earlier.c[key] == staging.c[key], earlier.c.row_number < staging.c.row_number),
+            f"{key}: значение повторяется в файле"
+        ))
+
+        if entity == ImportEntity.POLICIES:
+            checks.append((
+                ~exists().where(ClientModel.email == staging.c.client_email),
+                "client_email: клиент не найден"
+            ))
+        elif entity in (ImportEntity.CLAIMS, ImportEntity.PAYMENTS):
+            checks.append((
+                ~exists().where(PolicyModel.policy_number == staging.c.policy_number),
+                "policy_number: полис не найден"
+            ))
+
+        if entity == ImportEntity.PAYMENTS:
+            payout = func.upper(staging.c.payment_type) == PaymentType.CLAIM_PAYOUT.name
+            checks.append((
+                and_(staging.c.claim_number.isnot(None), ~exists().where(
+                    ClaimModel.claim_number == staging.c.claim_number,
+                    PolicyModel.id == ClaimModel.policy_id,
+                    PolicyModel.policy_number == staging.c.policy_number
+                )),
+                "claim_number: страховой случай по этому полису не найден"
+            ))
+            checks.append((and_(payout, staging.c.claim_number.is_(None)), "claim_number: обязателен для выплаты"))
+            # Не более одной выплаты на страховой случай
+            checks.append((
+                and_(payout, exists().where(
+                    ClaimModel.claim_number == staging.c.claim_number,
+                    PaymentModel.claim_id == ClaimModel.id,
+                    PaymentModel.payment_type == PaymentType.CLAIM_PAYOUT,
+                    PaymentModel.payment_number != staging.c.payment_number
+                )),
+                "claim_number: по страховому случаю уже есть выплата"
+            ))
+            checks.append((
+                and_(payout, exists().where(
+                    earlier.c.claim_number == staging.c.claim_number,
+                    func.upper(earlier.c.payment_type) == PaymentType.CLAIM_PAYOUT.name,
+                    earlier.c.row_number < staging.c.row_number
+                )),
+                "claim_number: выплата по страховому случаю повторяется в файле"
+            ))
+        return checks
+
+    def validate(self, entity: ImportEntity) -> int:
+        staging = self._staging[entity]
+        # Одно обновление проверяет все строки; CASE возвращает первую нарушенную проверку
+        self.session.execute(update(staging).values(error=case(*self._checks(entity, staging), else_=None)))
+        return self.session.execute(
+            select(func.count()).select_from(staging).where(staging.c.error.isnot(None))
+        ).scalar_one()
+
+    def get_rejections(self, entity: ImportEntity, limit: int = 100) -> List[ImportRejection]:
+        staging = self._staging[entity]
+        rows = self.session.execute(
+            select(staging.c.row_number, staging.c.error)
+            .where(staging.c.error.isnot(None))
+            .order_by(staging.c.row_number)
+            .limit(limit)
+        )
+        return [ImportRejection(row=row_number, reason=error) for row_number, error in rows]
+
+    def _typed(self, value, column: Column):
+        # SQLite хранит даты и суммы в текстовом представлении, PostgreSQL требует приведения типа
+        return cast(value, column.type) if self._dialect == "postgresql" else value
+
+    def _source(self, entity: ImportEntity, staging: Table):
+        """Источник переноса: промежуточная таблица со ссылками и значения столбцов основной таблицы"""
+        target = _TARGETS[entity]
+        now = datetime.utcnow()
+        # Дата создания в ответах API — дата без времени
+        created_at = datetime.combine(now.date(), datetime.min.time())
+        values = {
+            "id": staging.c.id,
+            "created_at": literal(created_at, target.c.created_at.type),
+            "updated_at": literal(now, target.c.updated_at.type),
+            "is_active": true(),
+            "version": literal(1),
+        }
+
+        def typed(name: str, default=None):
+            value = staging.c[name]
+            field = next(field for field in IMPORT_FIELDS[entity] if field.name == name)
+            if field.kind == "enum":
+                value = func.upper(value)
+            if default is not None:
+                value = func.coalesce(value, default)
+            return self._typed(value, target.c[name])
+
+        source = staging
+        if entity == ImportEntity.CLIENTS:
+            for name in ("email", "first_name", "last_name", "phone", "birth_date", "address", "passport_number"):
+                values[name] = typed(name)
+        elif entity == ImportEntity.POLICIES:
+            source = staging.join(ClientModel.__table__, ClientModel.email == staging.c.client_email)
+            values["client_id"] = ClientModel.id
+            for name in ("policy_number", "type", "start_date", "end_date", "coverage_amount",
+                         "premium_amount", "description"):
+                values[name] = typed(name)
+            values["status"] = typed("status", PolicyStatus.PENDING.name)
+            values["payment_frequency"] = typed("payment_frequency", "monthly")
+        elif entity == ImportEntity.CLAIMS:
+            source = staging.join(PolicyModel.__table__, PolicyModel.policy_number == staging.c.policy_number)
+            values["policy_id"] = PolicyModel.id
+            values["client_id"] = PolicyModel.client_id
+            for name in ("claim_number", "incident_date", "description", "claim_amount", "approved_amount"):
+                values[name] = typed(name)
+            values["report_date"] = typed("report_date", date.today().isoformat())
+            values["status"] = typed("status", ClaimStatus.PENDING.name)
+        else:
+            source = staging.join(
+                PolicyModel.__table__, PolicyModel.policy_number == staging.c.policy_number
+            ).outerjoin(
+                ClaimModel.__table__, ClaimModel.claim_number == staging.c.claim_number
+            )
+            values["policy_id"] = PolicyModel.id
+            values["client_id"] = PolicyModel.client_id
+            values["claim_id"] = ClaimModel.id
+            for name in ("payment_number", "amount", "payment_date", "due_date", "payment_type",
+                         "payment_method", "description"):
+                values[name] = typed(name)
+            values["status"] = typed("status", PaymentStatus.PENDING.name)
+        return source, values
+
+    def _register_payouts(self, rows) -> None:
+        """Пересоздает записи claim_payouts для загруженных платежей"""
+        merged = PaymentModel.payment_number.in_(select(rows.c.payment_number))
+        self.session.execute(delete(ClaimPayoutModel).where(
+            ClaimPayoutModel.payment_id.in_(select(PaymentModel.id).where(merged))
+        ))
+        # Проверка validate выполняется без блокировок: выплату по тому же случаю могли создать после нее,
+        # тогда первичный ключ claim_payouts отклоняет загрузку
+        try:
+            with self.session.begin_nested():
+                self.session.execute(insert(ClaimPayoutModel).from_select(
+                    ["claim_id", "payment_id"],
+                    select(PaymentModel.claim_id, PaymentModel.id).where(
+                        merged,
+                        PaymentModel.payment_type == PaymentType.CLAIM_PAYOUT,
+                        PaymentModel.claim_id.isnot(None)
+                    )
+                ))
+        except IntegrityError:
+            raise BusinessRuleViolationException("По страховому случаю из файла уже создана страховая выплата")
+
+    def merge(self, entity: ImportEntity) -> Tuple[int, int]:
+        staging = self._staging[entity]
+        target = _TARGETS[entity]
+        key = IMPORT_KEYS[entity]
+
+        source, values = self._source(entity, staging)
+        rows = select(*(value.label(name) for name, value in values.items())).select_from(source).where(
+            staging.c.error.is_(None)
+        ).subquery("incoming")
+        matched = target.c[key] == rows.c[key]
+
+        # Существующие записи обновляются, остальные вставляются. ON CONFLICT не используется: он требует
+        # уникального индекса по ключу, а в секционированных таблицах такой индекс включает ключ секционирования
+        updated = self.session.execute(
+            update(target).where(matched).values({
+                **{name: rows.c[name] for name in values if name not in _PRESERVED and name != key},
+                "version": target.c.version + 1,
+            })
+        ).rowcount
+        inserted = self.session.execute(
+            insert(target).from_select(list(values), select(rows).where(~exists().where(matched)))
+        ).rowcount
+        if entity == ImportEntity.PAYMENTS:
+            self._register_payouts(rows)
+        del self._staging[entity]
+        self.session.execute(text(f"DROP TABLE {staging.name}"))
+        self.session.commit()
+        return inserted, updated
+
+    def discard(self, entity: ImportEntity) -> None:
+        staging = self._staging.pop(entity, None)
+        self.session.rollback()
+        if staging is not None:
+            # Драйвер SQLite не начинает транзакцию перед DDL, поэтому откат не удаляет таблицу
+            self.session.execute(text(f"DROP TABLE IF EXISTS {staging.name}"))
+            self.session.commit()
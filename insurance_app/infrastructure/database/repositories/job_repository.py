@@ -0,0 +1,148 @@
+from typing import Any, Collection, Dict, Optional
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import and_, select, update
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.job_repository import JobRepository
+from insurance_app.domain.models.job import Job, JobStatus
+from insurance_app.infrastructure.database.models.job import JobModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+
+
+class JobRepositoryImpl(JobRepository):
+    """Реализация репозитория очереди фоновых задач"""
+    
+    _reader = RowReader(JobModel, Job)
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def create(self, job: Job) -> Job:
+        self.session.add(JobModel(**{column.key: getattr(job, column.key) for column in self._reader.columns}))
+        self.session.commit()
+        return job
+    
+    def get_by_id(self, job_id: UUID) -> Optional[Job]:
+        stmt = self._reader.select().where(JobModel.id == job_id)
+        return self._reader.first(self.session, stmt)
+    
+    def claim_next(self, worker_id: str, now: datetime, job_types: Optional[Collection[str]] = None) -> Optional[Job]:
+        candidate = select(JobModel.id).where(
+            JobModel.status == JobStatus.PENDING,
+            JobModel.run_after <= now
+        )
+        if job_types:
+            candidate = candidate.where(JobModel.job_type.in_(job_types))
+        # На PostgreSQL строка выбирается с FOR UPDATE SKIP LOCKED, и параллельные обработчики берут разные задачи.
+        # SQLite игнорирует FOR UPDATE: там UPDATE выполняется под блокировкой записи базы данных,
+        # а повторная проверка статуса не дает двум обработчикам взять одну задачу.
+        candidate = candidate.order_by(JobModel.run_after).limit(1).with_for_update(skip_locked=True)
+        
+        table = JobModel.__table__
+        stmt = update(table).where(
+            table.c.id == candidate.scalar_subquery(),
+            table.c.status == JobStatus.PENDING
+        ).values(
+            status=JobStatus.RUNNING,
+            attempts=table.c.attempts + 1,
+            locked_by=worker_id,
+            locked_at=now,
+            updated_at=now
+        ).returning(*self._reader.columns)
+        row = self.session.execute(stmt).first()
+        self.session.commit()
+        return Job(*row) if row else None
+    
+    def _update(self, job_id: UUID, worker_id: str, **values) -> bool:
+        # Изменяется только задача, которую еще выполняет этот обработчик: задачу, возвращенную в очередь
+        # и выбранную другим обработчиком, прежний обработчик не перезаписывает
+        table = JobModel.__table__
+        result = self.session.execute(
+            update(table).where(
+                table.c.id == job_id,
+                table.c.status == JobStatus.RUNNING,
+                table.c.locked_by == worker_id
+            ).values(**values)
+        )
+        self.session.commit()
+        return result.rowcount == 1
+    
+    def update_progress(self, job_id: UUID, worker_id: str, current: int, total: Optional[int] = None) -> bool:
+        now = datetime.utcnow()
+        return self._update(
+            job_id, worker_id, progress_current=current, progress_total=total, locked_at=now, updated_at=now
+        )
+    
+    def heartbeat(self, job_id: UUID, worker_id: str, now: datetime) -> bool:
+        return self._update(job_id, worker_id, locked_at=now)
+    
+    def mark_succeeded(self, job_id: UUID, worker_id: str, result: Optional[Dict[str, Any]], now: datetime) -> bool:
+        return self._update(
+            job_id,
+            worker_id,
+            status=JobStatus.SUCCEEDED,
+            result=result,
+            error=None,
+            locked_by=None,
+            locked_at=None,
+            updated_at=now,
+            finished_at=now
+        )
+    
+    def mark_failed(
+        self,
+        job_id: UUID,
+        worker_id: str,
+        error: str,
+        now: datetime,
+        retry_at: Optional[datetime] = None
+    ) -> bool:
+        if retry_at is not None:
+            return self._update(
+                job_id,
+                worker_id,
+                status=JobStatus.PENDING,
+                error=error,
+                run_after=retry_at,
+                locked_by=None,
+                locked_at=None,
+                updated_at=now
+            )
+        return self._update(
+            job_id,
+            worker_id,
+            status=JobStatus.FAILED,
+            error=error,
+            locked_by=None,
+            locked_at=None,
+            updated_at=now,
+            finished_at=now
+        )
+    
+    def requeue_stale(self, locked_before: datetime) -> int:
+        now = datetime.utcnow()
+        table = JobModel.__table__
+        stale = and_(table.c.status == JobStatus.RUNNING, table.c.locked_at < locked_before)
+        # Попытка засчитывается при выборе задачи: задача, обработчик которой перестал отвечать
+        # на последней попытке, завершается ошибкой, а не выполняется снова
+        failed = self.session.execute(
+            update(table).where(stale, table.c.attempts >= table.c.max_attempts).values(
+                status=JobStatus.FAILED,
+                error="Обработчик перестал отвечать, попытки исчерпаны",
+                locked_by=None,
+                locked_at=None,
+                updated_at=now,
+                finished_at=now
+            )
+        ).rowcount
+        requeued = self.session.execute(
+            update(table).where(stale).values(
+                status=JobStatus.PENDING,
+                locked_by=None,
+                locked_at=None,
+                updated_at=now
+            )
+        ).rowcount
+        self.session.commit()
+        return failed + requeued
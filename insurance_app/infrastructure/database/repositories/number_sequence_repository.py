@@ -0,0 +1,42 @@
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.number_sequence_repository import NumberSequenceRepository
+from insurance_app.infrastructure.database.models.number_sequence import NUMBER_SEQUENCES, NumberSequenceModel
+
+
+class NumberSequenceRepositoryImpl(NumberSequenceRepository):
+    """
+    Реализация репозитория блоков номеров. В PostgreSQL блок выделяется nextval последовательности,
+    который не откатывается вместе с транзакцией. В остальных СУБД счетчик блоков хранится
+    в таблице number_sequences и увеличивается в отдельной транзакции.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def next_block(self, sequence: str) -> int:
+        if sequence not in NUMBER_SEQUENCES:
+            raise ValueError(f"Неизвестная последовательность номеров: {sequence}")
+        bind = self.session.get_bind(clause=update(NumberSequenceModel))
+        if bind.dialect.name == "postgresql":
+            return self.session.execute(select(NUMBER_SEQUENCES[sequence].next_value())).scalar_one()
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self._increment(connection, sequence)
+        # Сессия привязана к соединению с внешней транзакцией (тесты): отдельная транзакция невозможна
+        return self._increment(self.session.connection(), sequence)
+
+    @staticmethod
+    def _increment(connection: Connection, sequence: str) -> int:
+        block = connection.execute(
+            update(NumberSequenceModel)
+            .where(NumberSequenceModel.name == sequence)
+            .values(last_block=NumberSequenceModel.last_block + 1)
+            .returning(NumberSequenceModel.last_block)
+        ).scalar()
+        if block is None:
+            block = 1
+            connection.execute(insert(NumberSequenceModel).values(name=sequence, last_block=block))
+        return block
@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Collection, List
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.outbox_repository import OutboxRepository
+from insurance_app.domain.models.outbox import OutboxEvent
+from insurance_app.infrastructure.database.models.outbox import OutboxEventModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+
+
+class OutboxRepositoryImpl(OutboxRepository):
+    """Реализация репозитория исходящих доменных событий"""
+    
+    _reader = RowReader(OutboxEventModel, OutboxEvent)
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def add(self, event: OutboxEvent) -> None:
+        self.session.add(OutboxEventModel(
+            event_type=event.event_type,
+            aggregate_type=event.aggregate_type,
+            aggregate_id=event.aggregate_id,
+            payload=event.payload,
+            created_at=event.created_at
+        ))
+    
+    def get_unpublished(self, limit: int = 100) -> List[OutboxEvent]:
+        stmt = self._reader.select().where(
+            OutboxEventModel.published_at.is_(None)
+        ).order_by(OutboxEventModel.id).limit(limit).with_for_update(skip_locked=True)
+        return self._reader.all(self.session, stmt)
+    
+    def mark_published(self, event_ids: Collection[int], now: datetime) -> None:
+        if event_ids:
+            self.session.execute(
+                update(OutboxEventModel).where(OutboxEventModel.id.in_(event_ids)).values(
+                    published_at=now,
+                    attempts=OutboxEventModel.attempts + 1,
+                    last_error=None
+                ).execution_options(synchronize_session=False)
+            )
+        self.session.commit()
+    
+    def mark_failed(self, event_ids: Collection[int], error: str) -> None:
+        if event_ids:
+            self.session.execute(
+                update(OutboxEventModel).where(OutboxEventModel.id.in_(event_ids)).values(
+                    attempts=OutboxEventModel.attempts + 1,
+                    last_error=error
+                ).execution_options(synchronize_session=False)
+            )
+        self.session.commit()
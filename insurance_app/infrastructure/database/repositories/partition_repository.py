@@ -0,0 +1,108 @@
+import re
+from datetime import date
+from typing import List
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.partition_repository import PartitionRepository
+from insurance_app.domain.models.partition import TablePartition
+from insurance_app.infrastructure.database.models.claim import ClaimModel
+from insurance_app.infrastructure.database.models.payment import PaymentModel
+
+# Таблицы, секционируемые в PostgreSQL по диапазонам ключа (postgresql_partition_by моделей), и ключи
+PARTITION_KEYS = {PaymentModel.__tablename__: "created_at", ClaimModel.__tablename__: "report_date"}
+PARTITIONED_TABLES = tuple(PARTITION_KEYS)
+
+# Границы диапазонной секции в выводе pg_get_expr: FOR VALUES FROM ('2026-10-01') TO ('2026-11-01');
+# для столбцов timestamp значения содержат и время
+_BOUNDS = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})[^']*'\) TO \('(\d{4}-\d{2}-\d{2})[^']*'\)")
+
+
+class PartitionRepositoryImpl(PartitionRepository):
+    """
+    Реализация репозитория секций для PostgreSQL. В остальных СУБД таблицы создаются без секционирования,
+    и репозиторий не находит секционированных таблиц.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @property
+    def _postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _quote(self, name: str) -> str:
+        return self.session.get_bind().dialect.identifier_preparer.quote(name)
+
+    @staticmethod
+    def _check_table(table: str) -> None:
+        if table not in PARTITIONED_TABLES:
+            raise ValueError(f"Таблица {table} не секционируется")
+
+    def get_partitioned_tables(self) -> List[str]:
+        if not self._postgresql:
+            return []
+        stmt = text(
+            "SELECT relname FROM pg_class "
+            "WHERE relkind = 'p' AND relname IN :tables AND pg_table_is_visible(oid)"
+        ).bindparams(bindparam("tables", expanding=True))
+        found = set(self.session.execute(stmt, {"tables": list(PARTITIONED_TABLES)}).scalars())
+        return [table for table in PARTITIONED_TABLES if table in found]
+
+    def get_partitions(self, table: str) -> List[TablePartition]:
+        self._check_table(table)
+        if not self._postgresql:
+            return []
+        rows = self.session.execute(text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ), {"table": table})
+        partitions = []
+        for name, bound in rows:
+            match = _BOUNDS.search(bound or "")
+            # Секция по умолчанию и диапазоны с MINVALUE/MAXVALUE обслуживаются вручную
+            if match:
+                start, end = (date.fromisoformat(value) for value in match.groups())
+                partitions.append(TablePartition(table=table, name=name, start=start, end=end))
+        return sorted(partitions, key=lambda partition: partition.start)
+
+    def create_partition(self, table: str, start: date, end: date) -> TablePartition:
+        self._check_table(table)
+        if not self._postgresql:
+            raise NotImplementedError("Секционирование таблиц поддерживается только в PostgreSQL")
+        name = f"{table}_p{start:%Y_%m}"
+        bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        exists = text("SELECT to_regclass(:name) IS NOT NULL")
+        if self.session.execute(exists, {"name": name}).scalar():
+            return TablePartition(table=table, name=name, start=start, end=end)
+
+        quoted = self._quote(name)
+        default = f"{table}_default"
+        if self.session.execute(exists, {"name": default}).scalar():
+            # Секцию нельзя создать, пока строки ее диапазона лежат в секции по умолчанию: они переносятся
+            # в новую таблицу, которая затем присоединяется как секция, в одной транзакции
+            key = PARTITION_KEYS[table]
+            self.session.execute(text(f"CREATE TABLE {quoted} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+            self.session.execute(text(
+                f"WITH moved AS (DELETE FROM {default} WHERE {key} >= :start AND {key} < :end RETURNING *) "
+                f"INSERT INTO {quoted} SELECT * FROM moved"
+            ), {"start": start, "end": end})
+            self.session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {quoted} {bounds}"))
+        else:
+            self.session.execute(text(f"CREATE TABLE {quoted} PARTITION OF {table} {bounds}"))
+        self.session.commit()
+        return TablePartition(table=table, name=name, start=start, end=end)
+
+    def detach_partition(self, partition: TablePartition, archive_schema: str) -> None:
+        self._check_table(partition.table)
+        if not self._postgresql:
+            raise NotImplementedError("Секционирование таблиц поддерживается только в PostgreSQL")
+        name = self._quote(partition.name)
+        schema = self._quote(archive_schema)
+        self.session.execute(text(f"ALTER TABLE {partition.table} DETACH PARTITION {name}"))
+        self.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        self.session.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        self.session.commit()
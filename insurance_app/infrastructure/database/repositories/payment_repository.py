@@ -1,15 +1,28 @@
-from typing import List, Optional
-from uuid import UUID
+from datetime import date, datetime, time, timedelta
+from typing import Collection, Iterator, List, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from insurance_app.application.interfaces.payment_repository import PaymentRepository
-from insurance_app.domain.models.payment import Payment
+from insurance_app.domain.exceptions import BusinessRuleViolationException
+from insurance_app.domain.models.change import ChangePosition
+from insurance_app.domain.models.payment import Payment, PaymentType
+from insurance_app.domain.models.version import EntityVersion
+from insurance_app.infrastructure.database.models.claim import ClaimModel
+from insurance_app.infrastructure.database.models.claim_payout import ClaimPayoutModel
 from insurance_app.infrastructure.database.models.payment import PaymentModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+from insurance_app.infrastructure.database.repositories.versioning import save_versioned
 
 
 class PaymentRepositoryImpl(PaymentRepository):
     """Реализация репозитория для работы с платежами"""
     
+    _reader = RowReader(PaymentModel, Payment)
+    _versions = RowReader(PaymentModel, EntityVersion)
+    
     def __init__(self, session: Session):
         self.session = session
     
@@ -29,7 +42,9 @@ class PaymentRepositoryImpl(PaymentRepository):
             payment_method=model.payment_method,
             description=model.description,
             created_at=model.created_at,
-            is_active=model.is_active
+            updated_at=model.updated_at,
+            is_active=model.is_active,
+            version=model.version
         )
     
     def _to_model(self, entity: Payment) -> PaymentModel:
@@ -48,34 +63,110 @@ class PaymentRepositoryImpl(PaymentRepository):
             payment_method=entity.payment_method,
             description=entity.description,
             created_at=entity.created_at,
+            updated_at=entity.updated_at,
             is_active=entity.is_active
         )
     
+    def _insert_rows(self, entities: List[Payment]) -> List[dict]:
+        """
+        Готовит строки для множественной вставки.
+        Отметки времени проставляются явно: при переданном None значение по умолчанию столбца не применяется.
+        """
+        now = datetime.utcnow()
+        for entity in entities:
+            entity.created_at = entity.created_at or now.date()
+            entity.updated_at = entity.updated_at or now
+        columns = self._reader.columns
+        return [{column.key: getattr(entity, column.key) for column in columns} for entity in entities]
+    
+    def _register_payouts(self, entities: List[Payment]) -> None:
+        """
+        Записывает страховые выплаты из entities в claim_payouts в текущей транзакции.
+        Если по случаю выплата уже есть, транзакция откатывается и выбрасывается BusinessRuleViolationException.
+        """
+        rows = [
+            {"claim_id": entity.claim_id, "payment_id": entity.id}
+            for entity in entities
+            if entity.payment_type == PaymentType.CLAIM_PAYOUT and entity.claim_id is not None
+        ]
+        if not rows:
+            return
+        try:
+            with self.session.begin_nested():
+                self.session.execute(insert(ClaimPayoutModel), rows)
+        except IntegrityError:
+            self.session.rollback()
+            raise BusinessRuleViolationException("По страховому случаю уже создана страховая выплата")
+    
     def create(self, entity: Payment) -> Payment:
+        # Выплата записывается в claim_payouts до платежа: конфликт определяет эта таблица,
+        # а не индекс uq_payments_claim_payout СУБД без секционирования
+        entity.id = entity.id or uuid4()
+        self._register_payouts([entity])
         model = self._to_model(entity)
         self.session.add(model)
         self.session.commit()
         self.session.refresh(model)
         return self._to_domain(model)
     
+    def create_bulk(self, entities: List[Payment]) -> List[Payment]:
+        if entities:
+            self._register_payouts(entities)
+            self.session.execute(insert(PaymentModel), self._insert_rows(entities))
+        self.session.commit()
+        return entities
+    
+    def create_payouts_bulk(self, entities: List[Payment]) -> List[Payment]:
+        if not entities:
+            return []
+        # Выплаты по случаям, для которых выплата уже есть, отсеиваются запросом к claim_payouts. Строки случаев
+        # блокируются до проверки в той же транзакции, и параллельное создание выплат по тому же случаю
+        # ждет фиксации, а не завершается ошибкой первичного ключа; порядок по id исключает взаимную блокировку
+        claim_ids = sorted({entity.claim_id for entity in entities})
+        self.session.execute(
+            select(ClaimModel.id).where(ClaimModel.id.in_(claim_ids)).order_by(ClaimModel.id).with_for_update()
+        )
+        paid_claim_ids = set(self.session.execute(
+            select(ClaimPayoutModel.claim_id).where(ClaimPayoutModel.claim_id.in_(claim_ids))
+        ).scalars())
+        created = []
+        for entity in entities:
+            if entity.claim_id not in paid_claim_ids:
+                paid_claim_ids.add(entity.claim_id)
+                created.append(entity)
+        return self.create_bulk(created)
+    
     def get_by_id(self, entity_id: UUID) -> Optional[Payment]:
         model = self.session.query(PaymentModel).filter(PaymentModel.id == entity_id).first()
         return self._to_domain(model) if model else None
     
+    def get_by_ids(self, entity_ids: Collection[UUID]) -> List[Payment]:
+        if not entity_ids:
+            return []
+        stmt = self._reader.select().where(PaymentModel.id.in_(entity_ids))
+        return self._reader.all(self.session, stmt)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Payment]:
-        models = self.session.query(PaymentModel).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        stmt = self._reader.select().offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Payment]:
+        return self._reader.stream(self.session, self._reader.select(), batch_size)
     
     def update(self, entity: Payment) -> Payment:
-        model = self._to_model(entity)
-        self.session.merge(model)
+        # Тип платежа и страховой случай могли измениться: запись выплаты пересоздается
+        self.session.execute(delete(ClaimPayoutModel).where(ClaimPayoutModel.payment_id == entity.id))
+        self._register_payouts([entity])
+        model = save_versioned(self.session, self._to_model(entity), entity.version, "Платеж")
+        updated = self._to_domain(model)
         self.session.commit()
-        return entity
+        return updated
     
     def delete(self, entity_id: UUID) -> bool:
         model = self.session.query(PaymentModel).filter(PaymentModel.id == entity_id).first()
         if not model:
             return False
+        self.session.execute(delete(ClaimPayoutModel).where(ClaimPayoutModel.payment_id == entity_id))
         self.session.delete(model)
         self.session.commit()
         return True
@@ -85,19 +176,84 @@ class PaymentRepositoryImpl(PaymentRepository):
         return self._to_domain(model) if model else None
     
     def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Payment]:
-        models = self.session.query(PaymentModel).filter(
+        stmt = self._reader.select().where(
             PaymentModel.client_id == client_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
     
     def get_by_policy_id(self, policy_id: UUID, skip: int = 0, limit: int = 100) -> List[Payment]:
-        models = self.session.query(PaymentModel).filter(
+        stmt = self._reader.select().where(
             PaymentModel.policy_id == policy_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
     
     def get_by_claim_id(self, claim_id: UUID, skip: int = 0, limit: int = 100) -> List[Payment]:
-        models = self.session.query(PaymentModel).filter(
+        stmt = self._reader.select().where(
             PaymentModel.claim_id == claim_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    @staticmethod
+    def _filtered(
+        stmt,
+        client_id: Optional[UUID],
+        policy_id: Optional[UUID],
+        claim_id: Optional[UUID],
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None
+    ):
+        """Фильтры списка платежей: связанная сущность и период по ключу секционирования created_at"""
+        if claim_id:
+            stmt = stmt.where(PaymentModel.claim_id == claim_id)
+        elif policy_id:
+            stmt = stmt.where(PaymentModel.policy_id == policy_id)
+        elif client_id:
+            stmt = stmt.where(PaymentModel.client_id == client_id)
+        # Сравнение столбца с константами позволяет PostgreSQL исключить секции вне периода при планировании
+        if created_from:
+            stmt = stmt.where(PaymentModel.created_at >= datetime.combine(created_from, time.min))
+        if created_to:
+            stmt = stmt.where(PaymentModel.created_at < datetime.combine(created_to + timedelta(days=1), time.min))
+        return stmt
+    
+    def get_by_period(
+        self,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> List[Payment]:
+        stmt = self._filtered(self._reader.select(), client_id, policy_id, claim_id, created_from, created_to)
+        return self._reader.all(self.session, stmt.offset(skip).limit(limit))
+    
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        stmt = self._versions.select().where(PaymentModel.id == entity_id)
+        return self._versions.first(self.session, stmt)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None,
+        created_from: Optional[date] = None,
+        created_to: Optional[date] = None
+    ) -> List[EntityVersion]:
+        stmt = self._filtered(self._versions.select(), client_id, policy_id, claim_id, created_from, created_to)
+        return self._versions.all(self.session, stmt.offset(skip).limit(limit))
+    
+    def get_changed_since(
+        self,
+        after: Optional[ChangePosition],
+        until: datetime,
+        limit: int = 100
+    ) -> List[Payment]:
+        stmt = self._reader.select().where(PaymentModel.updated_at <= until)
+        if after is not None:
+            stmt = stmt.where(tuple_(PaymentModel.updated_at, PaymentModel.id) > (after.updated_at, after.id))
+        stmt = stmt.order_by(PaymentModel.updated_at, PaymentModel.id).limit(limit)
+        return self._reader.all(self.session, stmt)
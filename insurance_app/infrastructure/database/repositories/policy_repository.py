@@ -1,15 +1,25 @@
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Collection, Dict, Iterator, List, Optional
 from uuid import UUID
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from insurance_app.application.interfaces.policy_repository import PolicyRepository
 from insurance_app.domain.models.policy import Policy, PolicyStatus
+from insurance_app.domain.models.reference import PolicyRef
+from insurance_app.domain.models.version import EntityVersion
 from insurance_app.infrastructure.database.models.policy import PolicyModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+from insurance_app.infrastructure.database.repositories.versioning import save_versioned
 
 
 class PolicyRepositoryImpl(PolicyRepository):
     """Реализация репозитория для работы с полисами"""
     
+    _reader = RowReader(PolicyModel, Policy)
+    _versions = RowReader(PolicyModel, EntityVersion)
+    _refs = RowReader(PolicyModel, PolicyRef)
+    
     def __init__(self, session: Session):
         self.session = session
     
@@ -26,8 +36,11 @@ class PolicyRepositoryImpl(PolicyRepository):
             premium_amount=model.premium_amount,
             payment_frequency=model.payment_frequency,
             created_at=model.created_at,
+            updated_at=model.updated_at,
             description=model.description,
-            is_active=model.is_active
+            is_active=model.is_active,
+            auto_renew=model.auto_renew,
+            version=model.version
         )
     
     def _to_model(self, entity: Policy) -> PolicyModel:
@@ -44,7 +57,8 @@ class PolicyRepositoryImpl(PolicyRepository):
             payment_frequency=entity.payment_frequency,
             created_at=entity.created_at,
             description=entity.description,
-            is_active=entity.is_active
+            is_active=entity.is_active,
+            auto_renew=entity.auto_renew
         )
     
     def create(self, entity: Policy) -> Policy:
@@ -58,15 +72,24 @@ class PolicyRepositoryImpl(PolicyRepository):
         model = self.session.query(PolicyModel).filter(PolicyModel.id == entity_id).first()
         return self._to_domain(model) if model else None
     
+    def get_by_ids(self, entity_ids: Collection[UUID]) -> List[Policy]:
+        if not entity_ids:
+            return []
+        stmt = self._reader.select().where(PolicyModel.id.in_(entity_ids))
+        return self._reader.all(self.session, stmt)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Policy]:
-        models = self.session.query(PolicyModel).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        stmt = self._reader.select().offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Policy]:
+        return self._reader.stream(self.session, self._reader.select(), batch_size)
     
     def update(self, entity: Policy) -> Policy:
-        model = self._to_model(entity)
-        self.session.merge(model)
+        model = save_versioned(self.session, self._to_model(entity), entity.version, "Полис")
+        updated = self._to_domain(model)
         self.session.commit()
-        return entity
+        return updated
     
     def delete(self, entity_id: UUID) -> bool:
         model = self.session.query(PolicyModel).filter(PolicyModel.id == entity_id).first()
@@ -80,15 +103,79 @@ class PolicyRepositoryImpl(PolicyRepository):
         model = self.session.query(PolicyModel).filter(PolicyModel.policy_number == policy_number).first()
         return self._to_domain(model) if model else None
     
+    def get_ref(self, entity_id: UUID) -> Optional[PolicyRef]:
+        stmt = self._refs.select().where(PolicyModel.id == entity_id)
+        return self._refs.first(self.session, stmt)
+    
     def get_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Policy]:
-        models = self.session.query(PolicyModel).filter(
+        stmt = self._reader.select().where(
             PolicyModel.client_id == client_id
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+        ).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
     
-    def get_active_policies(self, skip: int = 0, limit: int = 100) -> List[Policy]:
-        models = self.session.query(PolicyModel).filter(
+    @staticmethod
+    def _in_force():
+        """Условие действующего полиса: статус ACTIVE и срок действия не истек, даже если полис еще не обработан"""
+        return (
             (PolicyModel.status == PolicyStatus.ACTIVE) & 
-            (PolicyModel.is_active == True)
-        ).offset(skip).limit(limit).all()
-        return [self._to_domain(model) for model in models]
+            (PolicyModel.is_active == True) & 
+            (PolicyModel.end_date.is_(None) | (PolicyModel.end_date >= date.today()))
+        )
+    
+    def get_active_policies(self, skip: int = 0, limit: int = 100) -> List[Policy]:
+        stmt = self._reader.select().where(self._in_force()).offset(skip).limit(limit)
+        return self._reader.all(self.session, stmt)
+    
+    def get_expired_active(self, as_of: date, limit: int = 500) -> List[Policy]:
+        # Диапазон по индексу ix_policies_status_end_date
+        stmt = self._reader.select().where(
+            PolicyModel.status == PolicyStatus.ACTIVE,
+            PolicyModel.end_date < as_of
+        ).order_by(PolicyModel.end_date).limit(limit).with_for_update(skip_locked=True)
+        return self._reader.all(self.session, stmt)
+    
+    def expire_and_renew(self, policy_ids: Collection[UUID], renewals: Dict[UUID, Policy]) -> List[UUID]:
+        if not policy_ids:
+            return []
+        now = datetime.utcnow()
+        stmt = update(PolicyModel).where(
+            PolicyModel.id.in_(policy_ids),
+            PolicyModel.status == PolicyStatus.ACTIVE
+        ).values(
+            status=PolicyStatus.EXPIRED,
+            updated_at=now
+        ).returning(PolicyModel.id).execution_options(synchronize_session=False)
+        expired_ids = list(self.session.execute(stmt).scalars())
+        
+        # Продления создаются только для полисов, которые истекли в этой транзакции
+        created = [renewals[policy_id] for policy_id in expired_ids if policy_id in renewals]
+        if created:
+            midnight = datetime.combine(now.date(), datetime.min.time())
+            for entity in created:
+                entity.created_at = entity.created_at or midnight
+                entity.updated_at = entity.updated_at or now
+            columns = self._reader.columns
+            self.session.execute(
+                insert(PolicyModel),
+                [{column.key: getattr(entity, column.key) for column in columns} for entity in created]
+            )
+        self.session.commit()
+        return expired_ids
+    
+    def get_version(self, entity_id: UUID) -> Optional[EntityVersion]:
+        stmt = self._versions.select().where(PolicyModel.id == entity_id)
+        return self._versions.first(self.session, stmt)
+    
+    def get_versions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        client_id: Optional[UUID] = None,
+        active_only: bool = False
+    ) -> List[EntityVersion]:
+        stmt = self._versions.select()
+        if client_id:
+            stmt = stmt.where(PolicyModel.client_id == client_id)
+        elif active_only:
+            stmt = stmt.where(self._in_force())
+        return self._versions.all(self.session, stmt.offset(skip).limit(limit))
@@ -0,0 +1,59 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.reference_repository import ReferenceRepository
+from insurance_app.domain.models.reference import ClaimRef, EntityRefs, PolicyRef
+from insurance_app.infrastructure.database.models.claim import ClaimModel
+from insurance_app.infrastructure.database.models.client import ClientModel
+from insurance_app.infrastructure.database.models.policy import PolicyModel
+from insurance_app.infrastructure.database.repositories.row_reader import RowReader
+
+
+class ReferenceRepositoryImpl(ReferenceRepository):
+    """
+    Реализация репозитория проверки ссылок. Клиент, полис и страховой случай присоединяются левыми
+    соединениями к запросу из одной строки, поэтому результат — всегда одна строка, а ненайденной
+    записи соответствуют NULL в ее столбцах.
+    """
+
+    _policies = RowReader(PolicyModel, PolicyRef)
+    _claims = RowReader(ClaimModel, ClaimRef)
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_refs(
+        self,
+        client_id: Optional[UUID] = None,
+        policy_id: Optional[UUID] = None,
+        claim_id: Optional[UUID] = None
+    ) -> EntityRefs:
+        if not (client_id or policy_id or claim_id):
+            return EntityRefs()
+
+        joined = select(literal(1).label("anchor")).subquery()
+        columns = []
+        sources = (
+            (client_id, ClientModel, (ClientModel.__table__.c.id,)),
+            (policy_id, PolicyModel, self._policies.columns),
+            (claim_id, ClaimModel, self._claims.columns),
+        )
+        for entity_id, model, entity_columns in sources:
+            if entity_id:
+                joined = joined.outerjoin(model, model.id == entity_id)
+                columns.extend(entity_columns)
+        row = iter(self.session.execute(select(*columns).select_from(joined)).one())
+
+        found_client = next(row) if client_id else None
+        policy = self._entity(PolicyRef, row, len(self._policies.columns)) if policy_id else None
+        claim = self._entity(ClaimRef, row, len(self._claims.columns)) if claim_id else None
+        return EntityRefs(client_id=found_client, policy=policy, claim=claim)
+
+    @staticmethod
+    def _entity(entity_cls, row, size: int):
+        values = [next(row) for _ in range(size)]
+        # Первый столбец — идентификатор: NULL означает, что запись не найдена
+        return entity_cls(*values) if values[0] is not None else None
@@ -0,0 +1,45 @@
+from dataclasses import fields
+from typing import Generic, Iterator, List, Optional, Type, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+T = TypeVar('T')
+
+
+class RowReader(Generic[T]):
+    """
+    Путь чтения через Core для репозиториев.
+    Выбирает столбцы таблицы в порядке полей доменной модели и создает доменные объекты
+    напрямую из кортежей строк, минуя identity map и инструментирование ORM.
+    """
+
+    def __init__(self, model, entity_cls: Type[T]):
+        self.entity_cls = entity_cls
+        table = model.__table__
+        self.columns = tuple(table.c[field.name] for field in fields(entity_cls))
+
+    def select(self) -> Select:
+        """Возвращает запрос на выборку столбцов доменной модели"""
+        return select(*self.columns)
+
+    def all(self, session: Session, stmt: Select) -> List[T]:
+        """Выполняет запрос и возвращает список доменных объектов"""
+        entity_cls = self.entity_cls
+        return [entity_cls(*row) for row in session.execute(stmt)]
+
+    def first(self, session: Session, stmt: Select) -> Optional[T]:
+        """Выполняет запрос и возвращает первый доменный объект или None"""
+        row = session.execute(stmt.limit(1)).first()
+        return self.entity_cls(*row) if row else None
+
+    def stream(self, session: Session, stmt: Select, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Потоково читает результат запроса пачками по batch_size строк.
+        На PostgreSQL используется серверный курсор, поэтому выгрузка не держит в памяти всю таблицу.
+        """
+        entity_cls = self.entity_cls
+        result = session.execute(stmt.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            for row in partition:
+                yield entity_cls(*row)
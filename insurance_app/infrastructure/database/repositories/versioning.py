@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from insurance_app.domain.exceptions import ConcurrencyConflictException
+
+
+def save_versioned(session: Session, model, expected_version: int, entity_type: str):
+    """
+    Сохраняет изменения записи с оптимистической блокировкой и возвращает ее ORM модель с новой версией.
+
+    Версия, загруженная при слиянии, сверяется с ожидаемой, а UPDATE выполняется
+    с условием version = ожидаемая версия (version_id_col модели), поэтому изменение,
+    зафиксированное другим запросом между чтением и записью, не перезаписывается.
+    Строки не блокируются. При конфликте транзакция откатывается и выбрасывается
+    ConcurrencyConflictException.
+    """
+    persistent = session.merge(model)
+    try:
+        if persistent.version != expected_version:
+            raise StaleDataError()
+        session.flush()
+    except StaleDataError:
+        session.rollback()
+        raise ConcurrencyConflictException(entity_type, model.id, expected_version)
+    return persistent
@@ -0,0 +1,140 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import CompoundSelect, Select
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+# Отставание реплики PostgreSQL, с. Реплика, применившая весь полученный WAL, не отстает, даже если
+# последняя транзакция была давно; на ведущем сервере функции возвращают NULL
+POSTGRESQL_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+def replication_lag(engine: Engine) -> float:
+    """Отставание реплики в секундах; для СУБД без репликации — 0"""
+    if engine.dialect.name != "postgresql":
+        return 0.0
+    with engine.connect() as connection:
+        lag = connection.execute(POSTGRESQL_LAG_SQL).scalar()
+    return float(lag or 0.0)
+
+
+class Replica:
+    """Движок реплики, количество выданных соединений и последнее измеренное отставание"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.in_use = 0
+        self.lag = 0.0
+        self.checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        event.listen(engine, "checkout", self._checked_out)
+        event.listen(engine, "checkin", self._checked_in)
+
+    def _checked_out(self, *args) -> None:
+        with self._lock:
+            self.in_use += 1
+
+    def _checked_in(self, *args) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+
+class ReplicaSet:
+    """
+    Реплики для чтения с балансировкой по кругу (round_robin) или по наименьшему числу
+    занятых соединений (least_connections). Реплика, отстающая больше max_lag секунд
+    или недоступная, не выбирается; отставание измеряется не чаще раза в lag_check_interval секунд.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        balancing: str = ROUND_ROBIN,
+        max_lag: float = 5.0,
+        lag_check_interval: float = 1.0,
+        lag_probe: Callable[[Engine], float] = replication_lag
+    ):
+        if balancing not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"Неизвестная стратегия балансировки: {balancing}")
+        self.replicas = [Replica(engine) for engine in engines]
+        self.balancing = balancing
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.lag_probe = lag_probe
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _measure(self, replica: Replica) -> float:
+        now = time.monotonic()
+        with self._lock:
+            if replica.checked_at is not None and now - replica.checked_at < self.lag_check_interval:
+                return replica.lag
+            # Остальные потоки до окончания измерения используют прежнее значение
+            replica.checked_at = now
+        try:
+            replica.lag = self.lag_probe(replica.engine)
+        except Exception:
+            logger.warning("Реплика %s недоступна", replica.engine.url, exc_info=True)
+            replica.lag = float("inf")
+        return replica.lag
+
+    def available(self) -> List[Replica]:
+        """Реплики, отставание которых не превышает max_lag"""
+        return [replica for replica in self.replicas if self._measure(replica) <= self.max_lag]
+
+    def choose(self) -> Optional[Engine]:
+        """Движок реплики для чтения или None, если подходящих реплик нет"""
+        candidates = self.available()
+        if not candidates:
+            return None
+        if self.balancing == LEAST_CONNECTIONS:
+            return min(candidates, key=lambda replica: replica.in_use).engine
+        return candidates[next(self._counter) % len(candidates)].engine
+
+
+class RoutingSession(Session):
+    """
+    Сессия, направляющая чтение на реплику, а запись — на ведущий сервер.
+
+    Реплика выбирается при первом чтении и сохраняется до конца сессии. После первой записи
+    (flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, текстовый SQL) все последующие запросы сессии
+    выполняются на ведущем сервере, чтобы читать собственные изменения.
+    Без replicas или с use_replicas=False сессия работает только с ведущим сервером.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, use_replicas: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.use_replicas = use_replicas and replicas is not None
+        self.replica: Optional[Engine] = None
+        self.wrote = False
+
+    @staticmethod
+    def _is_read(clause) -> bool:
+        if isinstance(clause, Select):
+            return clause._for_update_arg is None
+        return isinstance(clause, CompoundSelect)
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self.use_replicas and not self.wrote:
+            if self._flushing or not self._is_read(clause):
+                self.wrote = True
+            else:
+                if self.replica is None:
+                    self.replica = self.replicas.choose()
+                if self.replica is not None:
+                    return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
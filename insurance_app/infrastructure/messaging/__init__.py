@@ -0,0 +1,7 @@
+from insurance_app.infrastructure.messaging.event_sinks import FileEventSink, HttpEventSink, create_event_sink
+
+__all__ = [
+    'FileEventSink',
+    'HttpEventSink',
+    'create_event_sink'
+]
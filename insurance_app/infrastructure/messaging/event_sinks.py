@@ -0,0 +1,65 @@
+import json
+import os
+import urllib.request
+from typing import Any, Dict, List
+
+from insurance_app.application.interfaces.event_sink import EventSink
+from insurance_app.domain.models.outbox import OutboxEvent
+
+
+def event_message(event: OutboxEvent) -> Dict[str, Any]:
+    """Формирует сообщение о событии для внешних получателей"""
+    return {
+        "id": event.id,
+        "event_type": event.event_type,
+        "aggregate_type": event.aggregate_type,
+        "aggregate_id": str(event.aggregate_id),
+        "payload": event.payload,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+    }
+
+
+class FileEventSink(EventSink):
+    """Дописывает события в файл в формате JSON Lines"""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def publish(self, events: List[OutboxEvent]) -> None:
+        lines = "".join(json.dumps(event_message(event), ensure_ascii=False) + "\n" for event in events)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class HttpEventSink(EventSink):
+    """Отправляет пачку событий одним POST-запросом с JSON-массивом"""
+    
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+    
+    def publish(self, events: List[OutboxEvent]) -> None:
+        body = json.dumps([event_message(event) for event in events], ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(
+            self.url,
+            data=body,
+            method="POST",
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if response.status >= 300:
+                raise RuntimeError(f"Получатель событий вернул код {response.status}")
+
+
+def create_event_sink(spec: str) -> EventSink:
+    """
+    Создает получателя событий по строке настройки:
+    file:<путь> - файл JSON Lines, http://... или https://... - HTTP-получатель
+    """
+    if spec.startswith("file:"):
+        return FileEventSink(spec[len("file:"):])
+    if spec.startswith(("http://", "https://")):
+        return HttpEventSink(spec)
+    raise ValueError(f"Неизвестный получатель событий: {spec}")
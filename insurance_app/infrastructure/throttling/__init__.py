@@ -0,0 +1,16 @@
+from insurance_app.infrastructure.throttling.backends import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    create_rate_limit_backend
+)
+from insurance_app.infrastructure.throttling.middleware import RouteGroup, ThrottlingMiddleware
+
+__all__ = [
+    'MemoryRateLimitBackend',
+    'RateLimitBackend',
+    'RedisRateLimitBackend',
+    'RouteGroup',
+    'ThrottlingMiddleware',
+    'create_rate_limit_backend'
+]
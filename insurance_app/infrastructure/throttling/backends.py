@@ -0,0 +1,110 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """Хранилище корзин токенов для ограничения частоты запросов"""
+    
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """
+        Забирает один токен из корзины key, пополняемой со скоростью rate токенов в секунду
+        до емкости burst. Возвращает 0, если токен выдан, иначе время в секундах до появления токена.
+        """
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Корзины токенов в памяти процесса. При нескольких обработчиках лимит действует
+    в каждом процессе отдельно; для общего лимита используется RedisRateLimitBackend.
+    """
+    
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # Ключ -> (токенов, время последнего пополнения)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+    
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        # Вызывается в цикле событий, поэтому блокировка не нужна
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        if tokens >= 1:
+            self._store(key, (tokens - 1, now), rate, burst)
+            return 0.0
+        self._store(key, (tokens, now), rate, burst)
+        return (1 - tokens) / rate
+    
+    def _store(self, key: str, bucket: Tuple[float, float], rate: float, burst: int) -> None:
+        if key not in self._buckets and len(self._buckets) >= self.max_keys:
+            self._evict_full(bucket[1], rate, burst)
+        self._buckets[key] = bucket
+    
+    def _evict_full(self, now: float, rate: float, burst: int) -> None:
+        """Удаляет корзины, успевшие пополниться до емкости: они не отличаются от новых"""
+        idle = burst / rate
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if now - bucket[1] < idle}
+        if len(self._buckets) >= self.max_keys:
+            # Все корзины активны: освобождаем место за счет самых старых
+            for key in list(self._buckets)[:len(self._buckets) // 10 or 1]:
+                del self._buckets[key]
+
+
+# Атомарное пополнение и списание в Redis; время берется с сервера Redis, общее для всех процессов
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Корзины токенов в Redis, общие для всех процессов и экземпляров приложения.
+    Требует пакет redis. При недоступности Redis запросы пропускаются без ограничения.
+    """
+    
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis.asyncio as redis
+        
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(_TOKEN_BUCKET_SCRIPT)
+    
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        try:
+            return float(await self._script(keys=[self.prefix + key], args=[rate, burst]))
+        except Exception:
+            logger.warning("Хранилище ограничения частоты запросов недоступно", exc_info=True)
+            return 0.0
+
+
+def create_rate_limit_backend(spec: str) -> RateLimitBackend:
+    """
+    Создает хранилище корзин токенов по строке настройки:
+    memory - память процесса, redis://... или rediss://... - общее хранилище Redis
+    """
+    if spec == "memory":
+        return MemoryRateLimitBackend()
+    if spec.startswith(("redis://", "rediss://")):
+        return RedisRateLimitBackend(spec)
+    raise ValueError(f"Неизвестное хранилище ограничения частоты запросов: {spec}")
@@ -0,0 +1,122 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from fastapi import status
+from starlette.responses import JSONResponse
+
+from insurance_app.infrastructure.database.pool import PoolWaitMonitor
+from insurance_app.infrastructure.throttling.backends import RateLimitBackend
+
+
+@dataclass(frozen=True)
+class RouteGroup:
+    """Группа маршрутов с общим ограничением одновременных запросов в процессе"""
+    name: str
+    limit: int
+    # Регулярное выражение, которое ищется в пути запроса
+    pattern: str
+    methods: Optional[FrozenSet[str]] = None
+
+
+class ThrottlingMiddleware:
+    """
+    Middleware ограничения нагрузки:
+    - сброс нагрузки: 503, пока время ожидания соединения из пула больше порога;
+    - частота запросов: корзина токенов на пользователя из JWT или на IP-адрес клиента, 429;
+    - одновременные запросы группы маршрутов (выгрузки, пакетные операции), 503.
+    Отказ возвращается сразу с заголовком Retry-After, а не после ожидания в очереди.
+    """
+    
+    def __init__(
+        self,
+        app,
+        backend: RateLimitBackend,
+        rate: float = 0,
+        burst: int = 0,
+        groups: Iterable[RouteGroup] = (),
+        pool_monitor: Optional[PoolWaitMonitor] = None,
+        shed_threshold: float = 0,
+        exempt_paths: Iterable[str] = ()
+    ):
+        self.app = app
+        self.backend = backend
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.groups = {f"g{index}": group for index, group in enumerate(groups)}
+        # Одно выражение для всех групп: имя сработавшей альтернативы определяет группу
+        self.group_pattern = re.compile(
+            "|".join(f"(?P<{name}>{group.pattern})" for name, group in self.groups.items())
+        ) if self.groups else None
+        self.in_flight: Dict[str, int] = {group.name: 0 for group in self.groups.values()}
+        self.pool_monitor = pool_monitor
+        self.shed_threshold = shed_threshold
+        self.exempt_paths = frozenset(exempt_paths)
+    
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса в соответствии с ASGI спецификацией"""
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.exempt_paths:
+            return await self.app(scope, receive, send)
+        
+        if self.pool_monitor is not None and self.shed_threshold > 0:
+            wait = self.pool_monitor.wait_time()
+            if wait > self.shed_threshold:
+                return await self._overloaded_response(scope, receive, send, wait)
+        
+        if self.rate > 0:
+            wait = await self.backend.take(self._client_key(scope), self.rate, self.burst)
+            if wait > 0:
+                return await self._rate_limited_response(scope, receive, send, wait)
+        
+        group = self._group(scope)
+        if group is None:
+            return await self.app(scope, receive, send)
+        if self.in_flight[group.name] >= group.limit:
+            return await self._overloaded_response(scope, receive, send, 1, group.name)
+        self.in_flight[group.name] += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight[group.name] -= 1
+    
+    def _client_key(self, scope) -> str:
+        """Ключ корзины: пользователь, если JWT middleware уже проверил токен, иначе IP-адрес клиента"""
+        user = scope.get("user")
+        if isinstance(user, dict) and user.get("sub"):
+            return f"user:{user['sub']}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+    
+    def _group(self, scope) -> Optional[RouteGroup]:
+        if self.group_pattern is None:
+            return None
+        match = self.group_pattern.search(scope["path"])
+        if match is None:
+            return None
+        group = self.groups[match.lastgroup]
+        if group.methods is not None and scope["method"] not in group.methods:
+            return None
+        return group
+    
+    async def _rate_limited_response(self, scope, receive, send, wait: float):
+        """Возвращает ответ 429 Too Many Requests"""
+        retry_after = max(1, math.ceil(wait))
+        response = JSONResponse(
+            {"error": "rate_limit_exceeded", "message": "Слишком много запросов, повторите позже",
+             "details": {"retry_after": retry_after}},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)}
+        )
+        await response(scope, receive, send)
+    
+    async def _overloaded_response(self, scope, receive, send, wait: float, group: Optional[str] = None):
+        """Возвращает ответ 503 Service Unavailable"""
+        retry_after = min(max(1, math.ceil(wait)), 60)
+        response = JSONResponse(
+            {"error": "service_overloaded", "message": "Сервис перегружен, повторите позже",
+             "details": {"retry_after": retry_after, "route_group": group}},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(retry_after)}
+        )
+        await response(scope, receive, send)
@@ -35,7 +35,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
         status.HTTP_409_CONFLICT: {"description": "User already exists"}
     }
 )
-async def register(
+def register(
     user_data: UserCreateDTO,
     user_service: UserService = Depends(get_user_service)
 ):
@@ -70,7 +70,7 @@ async def register(
         status.HTTP_400_BAD_REQUEST: {"description": "Invalid credentials"}
     }
 )
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends(get_user_service),
     auth_service = Depends(get_auth_service)
@@ -110,7 +110,7 @@ async def login(
         status.HTTP_401_UNAUTHORIZED: {"description": "Invalid token"}
     }
 )
-async def refresh_token(
+def refresh_token(
     token: str = Depends(oauth2_scheme),
     auth_service = Depends(get_auth_service),
     user_service: UserService = Depends(get_user_service)
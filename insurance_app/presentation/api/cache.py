@@ -0,0 +1,35 @@
+from fastapi import APIRouter, status
+
+from insurance_app.infrastructure.auth.policy import required_roles
+from insurance_app.infrastructure.caching.config import response_cache
+from insurance_app.presentation.schemas import CacheStatsResponse
+
+
+router = APIRouter(
+    prefix="/cache",
+    tags=["cache"],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Forbidden"},
+    }
+)
+
+
+@router.get(
+    "/stats",
+    response_model=CacheStatsResponse,
+    summary="Статистика кэша ответов",
+    openapi_extra=required_roles("admin")
+)
+def get_cache_stats():
+    """
+    Возвращает количество ответов в памяти процесса и попадания в кэш по маршрутам.
+    Счетчики ведутся в каждом процессе-обработчике отдельно с момента его запуска.
+    """
+    return {
+        "entries": len(response_cache.local),
+        "routes": {
+            route: {"hits": stats.hits, "misses": stats.misses, "hit_rate": stats.hit_rate}
+            for route, stats in response_cache.stats().items()
+        }
+    }
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from insurance_app.application.dto.change_dto import ChangeFeedDTO
+from insurance_app.application.dto.mappers import ChangeMapper
+from insurance_app.application.interfaces.change_feed_service import ChangeFeedService
+from insurance_app.domain.models.change import ChangeBatch
+from insurance_app.infrastructure.database.config import get_primary_db
+from insurance_app.presentation.api.dependencies import get_change_feed_service
+from insurance_app.presentation.schemas import ErrorResponse
+
+# Пауза между опросами ленты, когда новых изменений нет
+STREAM_POLL_INTERVAL = 1.0
+# Интервал комментариев keep-alive, не дающих прокси закрыть простаивающее соединение
+STREAM_HEARTBEAT_INTERVAL = 15.0
+# Задержка переподключения EventSource после обрыва соединения, мс
+STREAM_RETRY_MS = 3000
+
+
+router = APIRouter(
+    prefix="/changes",
+    tags=["changes"],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Некорректный курсор"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    }
+)
+
+
+def _sse_event(batch: ChangeBatch) -> str:
+    """Формирует событие SSE со страницей изменений; идентификатор события — курсор для возобновления"""
+    data = json.dumps(jsonable_encoder(ChangeMapper.to_feed_dto(batch)), ensure_ascii=False, separators=(",", ":"))
+    return f"id: {batch.cursor}\nevent: changes\ndata: {data}\n\n"
+
+
+@router.get(
+    "",
+    response_model=ChangeFeedDTO,
+    summary="Получить изменения после курсора",
+    responses={
+        status.HTTP_200_OK: {"description": "Страница изменений успешно получена"}
+    }
+)
+async def get_changes(
+    since: Optional[str] = Query(None, description="Курсор из предыдущего ответа; без курсора лента читается с начала"),
+    limit: int = Query(100, ge=1, le=1000, description="Максимальное количество изменений в странице"),
+    change_service: ChangeFeedService = Depends(get_change_feed_service)
+):
+    """
+    Возвращает страховые случаи и платежи, созданные или измененные после курсора, в порядке времени изменения.
+
+    Клиент сохраняет cursor из ответа и передает его в параметре since следующего запроса,
+    пока has_more равно true, после чего может перейти на поток GET /api/changes/stream.
+    """
+    try:
+        return ChangeMapper.to_feed_dto(change_service.get_changes(since, limit))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/stream",
+    summary="Поток изменений (Server-Sent Events)",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"description": "Поток событий changes", "content": {"text/event-stream": {}}}
+    }
+)
+async def stream_changes(
+    request: Request,
+    since: Optional[str] = Query(None, description="Курсор, с которого начинается поток; без курсора — с текущего момента"),
+    limit: int = Query(100, ge=1, le=1000, description="Максимальное количество изменений в одном событии"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="Курсор последнего полученного события"),
+    db: Session = Depends(get_primary_db),
+    change_service: ChangeFeedService = Depends(get_change_feed_service)
+):
+    """
+    Передает изменения страховых случаев и платежей в формате text/event-stream.
+
+    Каждое событие changes содержит страницу изменений, идентификатор события равен курсору,
+    поэтому при переподключении EventSource продолжает поток с места обрыва по заголовку Last-Event-ID.
+    """
+    def poll(cursor: str) -> ChangeBatch:
+        try:
+            return change_service.get_changes(cursor, limit)
+        finally:
+            # Транзакция чтения завершается после каждого опроса, соединение между опросами возвращается в пул
+            db.rollback()
+
+    cursor = last_event_id or since
+    try:
+        pending = await run_in_threadpool(poll, cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if cursor is None:
+        cursor = change_service.head_cursor()
+
+    async def events() -> AsyncIterator[str]:
+        nonlocal cursor, pending
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            batch = pending or await run_in_threadpool(poll, cursor)
+            pending = None
+            if batch.changes:
+                yield _sse_event(batch)
+                cursor = batch.cursor
+                last_sent = time.monotonic()
+                if batch.has_more:
+                    continue
+            elif time.monotonic() - last_sent >= STREAM_HEARTBEAT_INTERVAL:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,15 +1,27 @@
 from typing import List, Optional
 from uuid import UUID
 from decimal import Decimal
+from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from insurance_app.application.dto.claim_dto import ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO, ClaimApproveDTO
+from insurance_app.application.dto.claim_dto import (
+    ClaimCreateDTO, ClaimUpdateDTO, ClaimResponseDTO, ClaimApproveDTO, ClaimStatusBatchDTO, ClaimStatusBatchResultDTO,
+    ClaimBulkApproveDTO, ClaimBulkApproveResultDTO
+)
 from insurance_app.application.dto.common_dto import PaginatedResponseDTO
 from insurance_app.application.dto.mappers import ClaimMapper
 from insurance_app.application.interfaces.claim_service import ClaimService
-from insurance_app.domain.models.claim import ClaimStatus
-from insurance_app.presentation.api.dependencies import get_claim_service
+from insurance_app.application.interfaces.payment_service import PaymentService
+from insurance_app.domain.models.claim import Claim, ClaimStatus
+from insurance_app.presentation.api.csv_export import csv_response
+from insurance_app.presentation.api.dependencies import get_claim_service, get_payment_service
+from insurance_app.presentation.api.response_cache import LOOKUP_CACHE_TTL, cached_json, record_tags
+from insurance_app.presentation.api.conditional import (
+    check_entity, check_list, entity_etag, if_match_version, last_modified, list_etag, set_validators
+)
+from insurance_app.presentation.api.idempotency import IdempotentRequest, idempotent_request
 from insurance_app.presentation.schemas import ErrorResponse
 
 
@@ -34,12 +46,14 @@ router = APIRouter(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис или клиент не найдены"}
     }
 )
-async def create_claim(
+def create_claim(
     claim_data: ClaimCreateDTO,
-    claim_service: ClaimService = Depends(get_claim_service)
+    claim_service: ClaimService = Depends(get_claim_service),
+    idempotency: IdempotentRequest = Depends(idempotent_request)
 ):
     """
     Создает новый страховой случай в системе.
+    Поддерживает заголовок Idempotency-Key: повтор запроса с тем же ключом возвращает сохраненный ответ.
     
     - **claim_number**: номер страхового случая (опционально, генерируется автоматически)
     - **policy_id**: ID полиса
@@ -49,6 +63,10 @@ async def create_claim(
     - **description**: описание страхового случая
     - **claim_amount**: требуемая сумма выплаты
     """
+    replayed = idempotency.replay()
+    if replayed is not None:
+        return replayed
+    
     try:
         # Преобразуем DTO в доменную модель
         claim = ClaimMapper.to_domain(claim_data)
@@ -57,7 +75,7 @@ async def create_claim(
         created_claim = claim_service.create(claim)
         
         # Преобразуем доменную модель в DTO для ответа
-        return ClaimMapper.to_dto(created_claim)
+        return idempotency.save(status.HTTP_201_CREATED, ClaimMapper.to_dto(created_claim))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,44 +88,82 @@ async def create_claim(
     response_model=List[ClaimResponseDTO],
     summary="Получить список страховых случаев",
     responses={
-        status.HTTP_200_OK: {"description": "Список страховых случаев успешно получен"}
+        status.HTTP_200_OK: {"description": "Список страховых случаев успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Страница списка не изменилась (If-None-Match)"}
     }
 )
-async def get_claims(
+def get_claims(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Количество пропускаемых записей"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальное количество записей"),
     client_id: Optional[UUID] = Query(None, description="ID клиента для фильтрации"),
     policy_id: Optional[UUID] = Query(None, description="ID полиса для фильтрации"),
+    reported_from: Optional[date] = Query(None, description="Начало периода даты заявления (включительно)"),
+    reported_to: Optional[date] = Query(None, description="Конец периода даты заявления (включительно)"),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
     """
-    Получает список страховых случаев с возможностью фильтрации по клиенту и полису.
+    Получает список страховых случаев с возможностью фильтрации по клиенту и полису и по периоду заявления.
     
     - **skip**: количество пропускаемых записей (для пагинации)
     - **limit**: максимальное количество возвращаемых записей (для пагинации)
     - **client_id**: опциональный параметр для фильтрации по ID клиента
     - **policy_id**: опциональный параметр для фильтрации по ID полиса
+    - **reported_from**, **reported_to**: опциональный период даты заявления; таблица страховых случаев
+      секционирована по месяцам даты заявления, и запрос за период просматривает только секции этого периода
     """
-    if policy_id:
+    unchanged = check_list(request, lambda: claim_service.get_versions(
+        skip, limit, policy_id, client_id, reported_from, reported_to
+    ))
+    if unchanged:
+        return unchanged
+    
+    if reported_from or reported_to:
+        claims = claim_service.get_by_period(reported_from, reported_to, skip, limit, policy_id, client_id)
+    elif policy_id:
         claims = claim_service.get_by_policy_id(policy_id, skip, limit)
     elif client_id:
         claims = claim_service.get_by_client_id(client_id, skip, limit)
     else:
         claims = claim_service.get_all(skip, limit)
     
+    set_validators(response, list_etag(claims), last_modified(claims))
     return ClaimMapper.to_dto_list(claims)
 
 
+@router.get(
+    "/export",
+    summary="Выгрузить страховые случаи в CSV",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"description": "CSV выгрузка страховых случаев", "content": {"text/csv": {}}}
+    }
+)
+def export_claims(
+    claim_service: ClaimService = Depends(get_claim_service)
+):
+    """
+    Выгружает все страховые случаи в формате CSV.
+    
+    Данные читаются потоково пачками, поэтому выгрузка не загружает всю таблицу в память.
+    """
+    return csv_response(claim_service.iter_all(), Claim, "claims.csv")
+
+
 @router.get(
     "/{claim_id}",
     response_model=ClaimResponseDTO,
     summary="Получить страховой случай по ID",
     responses={
         status.HTTP_200_OK: {"description": "Страховой случай успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Страховой случай не изменился (If-None-Match, If-Modified-Since)"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Страховой случай не найден"}
     }
 )
-async def get_claim(
+def get_claim(
+    request: Request,
+    response: Response,
     claim_id: UUID = Path(..., description="ID страхового случая"),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
@@ -116,6 +172,10 @@ async def get_claim(
     
     - **claim_id**: уникальный идентификатор страхового случая
     """
+    unchanged = check_entity(request, lambda: claim_service.get_version(claim_id))
+    if unchanged:
+        return unchanged
+    
     claim = claim_service.get_by_id(claim_id)
     if not claim:
         raise HTTPException(
@@ -123,6 +183,7 @@ async def get_claim(
             detail=f"Страховой случай с ID {claim_id} не найден"
         )
     
+    set_validators(response, entity_etag(claim), claim.updated_at)
     return ClaimMapper.to_dto(claim)
 
 
@@ -133,12 +194,15 @@ async def get_claim(
     responses={
         status.HTTP_200_OK: {"description": "Данные страхового случая успешно обновлены"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Страховой случай не найден"},
-        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные страхового случая"}
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные страхового случая"},
+        status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Страховой случай изменен другим запросом"}
     }
 )
-async def update_claim(
+def update_claim(
     claim_data: ClaimUpdateDTO,
+    response: Response,
     claim_id: UUID = Path(..., description="ID страхового случая"),
+    expected_version: Optional[int] = Depends(if_match_version),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
     """
@@ -146,6 +210,7 @@ async def update_claim(
     
     - **claim_id**: уникальный идентификатор страхового случая
     - **claim_data**: новые данные страхового случая
+    - **If-Match**: ETag записи, полученный при чтении; если запись с тех пор изменена, возвращается 409
     """
     # Проверяем существование страхового случая
     claim = claim_service.get_by_id(claim_id)
@@ -155,11 +220,15 @@ async def update_claim(
             detail=f"Страховой случай с ID {claim_id} не найден"
         )
     
+    if expected_version is not None:
+        claim.version = expected_version
+    
     try:
         # Обновляем данные страхового случая
         updated_claim = ClaimMapper.to_domain(claim_data, claim)
         updated_claim = claim_service.update(updated_claim)
         
+        response.headers["ETag"] = entity_etag(updated_claim)
         return ClaimMapper.to_dto(updated_claim)
     except ValueError as e:
         raise HTTPException(
@@ -177,7 +246,7 @@ async def update_claim(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Страховой случай не найден"}
     }
 )
-async def delete_claim(
+def delete_claim(
     claim_id: UUID = Path(..., description="ID страхового случая"),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
@@ -210,7 +279,8 @@ async def delete_claim(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Страховой случай не найден"}
     }
 )
-async def get_claim_by_number(
+def get_claim_by_number(
+    request: Request,
     claim_number: str = Path(..., description="Номер страхового случая"),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
@@ -219,14 +289,16 @@ async def get_claim_by_number(
     
     - **claim_number**: номер страхового случая
     """
-    claim = claim_service.get_by_claim_number(claim_number)
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Страховой случай с номером {claim_number} не найден"
-        )
+    def load():
+        claim = claim_service.get_by_claim_number(claim_number)
+        if not claim:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Страховой случай с номером {claim_number} не найден"
+            )
+        return ClaimMapper.to_dto(claim), record_tags("claims", claim.id)
     
-    return ClaimMapper.to_dto(claim)
+    return cached_json(request, "claim_by_number", LOOKUP_CACHE_TTL, load)
 
 
 @router.patch(
@@ -236,12 +308,15 @@ async def get_claim_by_number(
     responses={
         status.HTTP_200_OK: {"description": "Статус страхового случая успешно изменен"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Страховой случай не найден"},
-        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверный статус"}
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверный статус"},
+        status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Страховой случай изменен другим запросом"}
     }
 )
-async def update_claim_status(
+def update_claim_status(
     status_data: ClaimStatus,
+    response: Response,
     claim_id: UUID = Path(..., description="ID страхового случая"),
+    expected_version: Optional[int] = Depends(if_match_version),
     claim_service: ClaimService = Depends(get_claim_service)
 ):
     """
@@ -249,9 +324,11 @@ async def update_claim_status(
     
     - **claim_id**: уникальный идентификатор страхового случая
     - **status_data**: новый статус страхового случая
+    - **If-Match**: ETag записи, полученный при чтении; если запись с тех пор изменена, возвращается 409
     """
     try:
-        updated_claim = claim_service.update_status(claim_id, status_data)
+        updated_claim = claim_service.update_status(claim_id, status_data, expected_version)
+        response.headers["ETag"] = entity_etag(updated_claim)
         return ClaimMapper.to_dto(updated_claim)
     except ValueError as e:
         raise HTTPException(
@@ -260,6 +337,70 @@ async def update_claim_status(
         )
 
 
+@router.post(
+    "/status:batch",
+    response_model=ClaimStatusBatchResultDTO,
+    summary="Изменить статус набора страховых случаев",
+    responses={
+        status.HTTP_200_OK: {"description": "Статусы страховых случаев изменены, пропущенные случаи перечислены в ответе"},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Недопустимый целевой статус"}
+    }
+)
+def update_claims_status_batch(
+    batch_data: ClaimStatusBatchDTO,
+    claim_service: ClaimService = Depends(get_claim_service)
+):
+    """
+    Переводит набор страховых случаев в новый статус одним запросом к базе данных.
+    
+    Обновляются только случаи, для которых переход из текущего статуса допустим.
+    Остальные возвращаются в списке **skipped** с причиной пропуска.
+    
+    - **claim_ids**: идентификаторы страховых случаев (до 1000)
+    - **status**: новый статус страховых случаев
+    """
+    try:
+        result = claim_service.update_status_batch(batch_data.claim_ids, batch_data.status)
+        return ClaimMapper.to_status_batch_dto(result)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/approve:batch",
+    response_model=ClaimBulkApproveResultDTO,
+    summary="Утвердить набор страховых случаев",
+    responses={
+        status.HTTP_200_OK: {"description": "Страховые случаи утверждены, не прошедшие проверку перечислены в ответе"}
+    }
+)
+def approve_claims_batch(
+    approve_data: ClaimBulkApproveDTO,
+    claim_service: ClaimService = Depends(get_claim_service),
+    payment_service: PaymentService = Depends(get_payment_service)
+):
+    """
+    Утверждает набор страховых случаев, например при массовых событиях.
+    
+    Страховые случаи и их полисы загружаются двумя запросами, суммы проверяются для всего пакета,
+    утверждения записываются в одной транзакции. Утверждаются случаи в статусе UNDER_REVIEW.
+    
+    - **approvals**: пары идентификатор страхового случая и утвержденная сумма (до 5000)
+    - **create_payouts**: создать платежи страховых выплат по утвержденным случаям
+    """
+    approvals = {item.claim_id: item.approved_amount for item in approve_data.approvals}
+    result = claim_service.approve_claims_bulk(approvals)
+    
+    payouts = []
+    if approve_data.create_payouts and result.approved:
+        payouts = payment_service.create_claim_payouts(result.approved)
+    
+    return ClaimMapper.to_bulk_approve_dto(result, payouts)
+
+
 @router.post(
     "/{claim_id}/approve",
     response_model=ClaimResponseDTO,
@@ -270,7 +411,7 @@ async def update_claim_status(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверная сумма или статус"}
     }
 )
-async def approve_claim(
+def approve_claim(
     approve_data: ClaimApproveDTO,
     claim_id: UUID = Path(..., description="ID страхового случая"),
     claim_service: ClaimService = Depends(get_claim_service)
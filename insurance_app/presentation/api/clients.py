@@ -1,7 +1,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
 
 from insurance_app.application.dto.client_dto import ClientCreateDTO, ClientUpdateDTO, ClientResponseDTO
 from insurance_app.application.dto.common_dto import PaginatedResponseDTO
@@ -9,6 +9,10 @@ from insurance_app.application.dto.mappers import ClientMapper
 from insurance_app.application.interfaces.client_service import ClientService
 from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.presentation.api.dependencies import get_client_service, get_policy_service
+from insurance_app.presentation.api.response_cache import LOOKUP_CACHE_TTL, cached_json, record_tags
+from insurance_app.presentation.api.conditional import (
+    check_entity, check_list, entity_etag, last_modified, list_etag, set_validators
+)
 from insurance_app.presentation.schemas import ErrorResponse
 
 
@@ -33,7 +37,7 @@ router = APIRouter(
         status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Клиент с таким email уже существует"}
     }
 )
-async def create_client(
+def create_client(
     client_data: ClientCreateDTO,
     client_service: ClientService = Depends(get_client_service)
 ):
@@ -71,10 +75,13 @@ async def create_client(
     response_model=List[ClientResponseDTO],
     summary="Получить список клиентов",
     responses={
-        status.HTTP_200_OK: {"description": "Список клиентов успешно получен"}
+        status.HTTP_200_OK: {"description": "Список клиентов успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Страница списка не изменилась (If-None-Match)"}
     }
 )
-async def get_clients(
+def get_clients(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Количество пропускаемых записей"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальное количество записей"),
     name: Optional[str] = Query(None, description="Имя или фамилия для поиска"),
@@ -87,11 +94,16 @@ async def get_clients(
     - **limit**: максимальное количество возвращаемых записей (для пагинации)
     - **name**: опциональный параметр для поиска по имени или фамилии
     """
+    unchanged = check_list(request, lambda: client_service.get_versions(skip, limit, name))
+    if unchanged:
+        return unchanged
+    
     if name:
         clients = client_service.search_by_name(name, skip, limit)
     else:
         clients = client_service.get_all(skip, limit)
     
+    set_validators(response, list_etag(clients), last_modified(clients))
     return ClientMapper.to_dto_list(clients)
 
 
@@ -101,10 +113,13 @@ async def get_clients(
     summary="Получить клиента по ID",
     responses={
         status.HTTP_200_OK: {"description": "Клиент успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Клиент не изменился (If-None-Match, If-Modified-Since)"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Клиент не найден"}
     }
 )
-async def get_client(
+def get_client(
+    request: Request,
+    response: Response,
     client_id: UUID = Path(..., description="ID клиента"),
     client_service: ClientService = Depends(get_client_service)
 ):
@@ -113,6 +128,10 @@ async def get_client(
     
     - **client_id**: уникальный идентификатор клиента
     """
+    unchanged = check_entity(request, lambda: client_service.get_version(client_id))
+    if unchanged:
+        return unchanged
+    
     client = client_service.get_by_id(client_id)
     if not client:
         raise HTTPException(
@@ -120,6 +139,7 @@ async def get_client(
             detail=f"Клиент с ID {client_id} не найден"
         )
     
+    set_validators(response, entity_etag(client), client.updated_at)
     return ClientMapper.to_dto(client)
 
 
@@ -134,7 +154,7 @@ async def get_client(
         status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Указанный email уже используется"}
     }
 )
-async def update_client(
+def update_client(
     client_data: ClientUpdateDTO,
     client_id: UUID = Path(..., description="ID клиента"),
     client_service: ClientService = Depends(get_client_service)
@@ -179,7 +199,7 @@ async def update_client(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Невозможно удалить клиента с активными полисами"}
     }
 )
-async def delete_client(
+def delete_client(
     client_id: UUID = Path(..., description="ID клиента"),
     client_service: ClientService = Depends(get_client_service),
     policy_service: PolicyService = Depends(get_policy_service)
@@ -224,7 +244,8 @@ async def delete_client(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Клиент не найден"}
     }
 )
-async def get_client_by_email(
+def get_client_by_email(
+    request: Request,
     email: str = Path(..., description="Email клиента"),
     client_service: ClientService = Depends(get_client_service)
 ):
@@ -233,11 +254,13 @@ async def get_client_by_email(
     
     - **email**: адрес электронной почты клиента
     """
-    client = client_service.get_by_email(email)
-    if not client:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Клиент с email {email} не найден"
-        )
+    def load():
+        client = client_service.get_by_email(email)
+        if not client:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с email {email} не найден"
+            )
+        return ClientMapper.to_dto(client), record_tags("clients", client.id)
     
-    return ClientMapper.to_dto(client)
+    return cached_json(request, "client_by_email", LOOKUP_CACHE_TTL, load)
@@ -0,0 +1,132 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Iterable, List, Optional
+
+from fastapi import Header, HTTPException, Request, Response, status
+
+from insurance_app.domain.models.version import EntityVersion
+
+
+def entity_etag(entity) -> str:
+    """Строгий ETag записи по номеру ее версии"""
+    return f'"{entity.version}"'
+
+
+def list_etag(entities: Iterable) -> str:
+    """Строгий ETag страницы списка: хеш идентификаторов и версий записей в порядке выдачи"""
+    digest = hashlib.blake2b(digest_size=16)
+    for entity in entities:
+        digest.update(f"{entity.id}:{entity.version};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def last_modified(entities: Iterable) -> Optional[datetime]:
+    """Наибольшее время изменения среди записей"""
+    return max((entity.updated_at for entity in entities if entity.updated_at), default=None)
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Слабое сравнение для If-None-Match (RFC 9110, 13.1.2)"""
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def is_conditional(request: Request) -> bool:
+    """Проверяет, содержит ли запрос условные заголовки"""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, etag: str, modified_at: Optional[datetime] = None) -> bool:
+    """
+    Проверяет условия запроса. If-None-Match имеет приоритет, If-Modified-Since учитывается
+    только без него и только при известном времени изменения.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or modified_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return modified_at.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+def validator_headers(etag: str, modified_at: Optional[datetime] = None) -> dict:
+    """Заголовки валидаторов ответа; no-cache требует от клиента перепроверки при каждом использовании"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if modified_at is not None:
+        headers["Last-Modified"] = _http_date(modified_at)
+    return headers
+
+
+def not_modified(etag: str, modified_at: Optional[datetime] = None) -> Response:
+    """Ответ 304 без тела"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, modified_at))
+
+
+def set_validators(response: Response, etag: str, modified_at: Optional[datetime] = None) -> None:
+    """Добавляет валидаторы к ответу"""
+    response.headers.update(validator_headers(etag, modified_at))
+
+
+def check_entity(request: Request, get_version: Callable[[], Optional[EntityVersion]]) -> Optional[Response]:
+    """
+    Для условного запроса записи выполняет облегченный запрос версии и возвращает 304,
+    если запись не изменилась. В остальных случаях возвращает None.
+    """
+    if not is_conditional(request):
+        return None
+    version = get_version()
+    if version is None or not is_not_modified(request, entity_etag(version), version.updated_at):
+        return None
+    return not_modified(entity_etag(version), version.updated_at)
+
+
+def check_list(request: Request, get_versions: Callable[[], List[EntityVersion]]) -> Optional[Response]:
+    """
+    Для условного запроса страницы списка выполняет облегченный запрос версий ее записей
+    и возвращает 304, если страница не изменилась. Для списков учитывается только If-None-Match:
+    время изменения не отражает удаление записей и сдвиг страницы.
+    """
+    if "if-none-match" not in request.headers:
+        return None
+    versions = get_versions()
+    etag = list_etag(versions)
+    if not is_not_modified(request, etag):
+        return None
+    return not_modified(etag, last_modified(versions))
+
+
+def if_match_version(
+    if_match: Optional[str] = Header(
+        None,
+        alias="If-Match",
+        description="ETag версии записи, на основе которой сделано изменение; при несовпадении возвращается 409"
+    )
+) -> Optional[int]:
+    """
+    Зависимость эндпоинтов изменения: ожидаемая версия записи из заголовка If-Match.
+    Возвращает None, если заголовок не передан или равен *. If-Match сравнивается строго,
+    поэтому слабый или некорректный ETag отклоняется с ошибкой 400.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    etag = if_match.strip()
+    if len(etag) > 2 and etag[0] == etag[-1] == '"' and etag[1:-1].isdigit():
+        return int(etag[1:-1])
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Заголовок If-Match должен содержать ETag записи из заголовка ETag ответа"
+    )
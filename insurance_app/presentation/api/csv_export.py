@@ -0,0 +1,42 @@
+import csv
+import io
+from dataclasses import fields
+from enum import Enum
+from typing import Iterable, Iterator, Type
+
+from fastapi.responses import StreamingResponse
+
+
+def _csv_value(value):
+    """Приводит значение поля доменной модели к виду, пригодному для CSV"""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def stream_csv(entities: Iterable, entity_cls: Type, chunk_rows: int = 1000) -> Iterator[str]:
+    """Формирует CSV из доменных объектов и отдает его частями по chunk_rows строк"""
+    names = [field.name for field in fields(entity_cls)]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    
+    for index, entity in enumerate(entities, 1):
+        writer.writerow([_csv_value(getattr(entity, name)) for name in names])
+        if index % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue()
+
+
+def csv_response(entities: Iterable, entity_cls: Type, filename: str) -> StreamingResponse:
+    """Возвращает потоковый ответ с CSV выгрузкой"""
+    return StreamingResponse(
+        stream_csv(entities, entity_cls),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -8,8 +8,11 @@ from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.application.interfaces.claim_service import ClaimService
 from insurance_app.application.interfaces.payment_service import PaymentService
 from insurance_app.application.interfaces.user_service import UserService
+from insurance_app.application.interfaces.idempotency_service import IdempotencyService
+from insurance_app.application.interfaces.job_service import JobService
+from insurance_app.application.interfaces.change_feed_service import ChangeFeedService
 from insurance_app.application.services.factory import ServiceFactory
-from insurance_app.infrastructure.database.config import get_db
+from insurance_app.infrastructure.database.config import get_db, get_primary_db
 from insurance_app.infrastructure.auth.auth_service import AuthService
 from insurance_app.domain.exceptions import AuthenticationException
 
@@ -42,6 +45,21 @@ def get_user_service(db: Session = Depends(get_db)) -> UserService:
     return ServiceFactory.create_user_service(db)
 
 
+def get_idempotency_service(db: Session = Depends(get_db)) -> IdempotencyService:
+    """Получает сервис ключей идемпотентности"""
+    return ServiceFactory.create_idempotency_service(db)
+
+
+def get_job_service(db: Session = Depends(get_db)) -> JobService:
+    """Получает сервис очереди фоновых задач"""
+    return ServiceFactory.create_job_service(db)
+
+
+def get_change_feed_service(db: Session = Depends(get_primary_db)) -> ChangeFeedService:
+    """Получает сервис ленты изменений"""
+    return ServiceFactory.create_change_feed_service(db)
+
+
 def get_auth_service() -> AuthService:
     """Получает сервис для аутентификации"""
     secret_key = os.environ.get("SECRET_KEY", "your-secret-key")
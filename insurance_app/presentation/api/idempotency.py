@@ -0,0 +1,102 @@
+import hashlib
+import json
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from insurance_app.application.interfaces.idempotency_service import IdempotencyService
+from insurance_app.domain.exceptions import IdempotencyConflictException
+from insurance_app.presentation.api.dependencies import get_idempotency_service
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotentRequest:
+    """
+    Запрос с ключом идемпотентности.
+    Если ключ не передан, replay ничего не возвращает, а save только возвращает ответ.
+    """
+    
+    def __init__(
+        self,
+        service: Optional[IdempotencyService] = None,
+        user_id: str = "",
+        key: Optional[str] = None,
+        request_hash: str = ""
+    ):
+        self.service = service
+        self.user_id = user_id
+        self.key = key
+        self.request_hash = request_hash
+        self.started = False
+        self.completed = False
+    
+    def replay(self) -> Optional[Response]:
+        """Возвращает сохраненный ответ повторного запроса или начинает выполнение нового"""
+        if self.key is None:
+            return None
+        try:
+            record = self.service.begin(self.user_id, self.key, self.request_hash)
+        except IdempotencyConflictException as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT if e.in_progress else status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
+        if record is None:
+            self.started = True
+            return None
+        return Response(
+            content=record.response_body,
+            status_code=record.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"}
+        )
+    
+    def save(self, status_code: int, response):
+        """Сохраняет ответ выполненного запроса и возвращает его"""
+        if self.started:
+            body = json.dumps(jsonable_encoder(response), ensure_ascii=False, separators=(",", ":"))
+            self.service.complete(self.user_id, self.key, self.request_hash, status_code, body)
+            self.completed = True
+        return response
+
+
+async def idempotent_request(
+    request: Request,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_HEADER,
+        max_length=255,
+        description="Ключ идемпотентности: повтор запроса с тем же ключом вернет сохраненный ответ"
+    ),
+    idempotency_service: IdempotencyService = Depends(get_idempotency_service)
+):
+    """
+    Зависимость для эндпоинтов создания, поддерживающих заголовок Idempotency-Key.
+    Ключ освобождается, если запрос завершился без сохранения ответа (например, ошибкой).
+    """
+    if not idempotency_key:
+        yield IdempotentRequest()
+        return
+    
+    user = request.scope.get("user") or {}
+    body = await request.body()
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(body)
+    
+    idempotent = IdempotentRequest(
+        idempotency_service,
+        user_id=str(user.get("sub", "")),
+        key=idempotency_key,
+        request_hash=digest.hexdigest()
+    )
+    try:
+        yield idempotent
+    finally:
+        if idempotent.started and not idempotent.completed:
+            idempotency_service.release(idempotent.user_id, idempotent.key)
@@ -0,0 +1,90 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+
+from insurance_app.application.dto.job_dto import JobCreateDTO, JobResponseDTO
+from insurance_app.application.dto.mappers import JobMapper
+from insurance_app.application.interfaces.job_service import JobService
+from insurance_app.infrastructure.auth.policy import required_roles
+from insurance_app.presentation.api.dependencies import get_job_service
+from insurance_app.presentation.schemas import ErrorResponse
+
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Forbidden"},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse},
+    }
+)
+
+
+@router.post(
+    "",
+    response_model=JobResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Поставить фоновую задачу в очередь",
+    openapi_extra=required_roles("admin"),
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Задача поставлена в очередь"},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неизвестный тип задачи"}
+    }
+)
+def submit_job(
+    job_data: JobCreateDTO,
+    job_service: JobService = Depends(get_job_service)
+):
+    """
+    Ставит длительную операцию в очередь фоновых задач. Состояние задачи доступно через GET /api/jobs/{job_id}.
+    Задачи изменяют данные всех клиентов, поэтому ставить их и читать их параметры и результаты может только администратор.
+
+    - **job_type**: тип задачи:
+        - **payouts.run**: конвейер страховых выплат (batch_size, max_batches)
+        - **policies.expire**: перевод полисов с истекшим сроком в статус EXPIRED и продление полисов с auto_renew (batch_size, as_of)
+        - **claims.approve_batch**: пакетное утверждение страховых случаев (approvals: {claim_id: amount}, create_payouts, chunk_size)
+        - **idempotency.purge**: удаление сохраненных ответов с истекшим сроком хранения
+        - **partitions.maintain**: создание секций платежей и страховых случаев на следующие месяцы (months_ahead); старые секции отсоединяет только скрипт partition_maintenance
+        - **import.csv**: массовая загрузка файлов CSV из каталога IMPORT_DIR сервера (files: {clients|policies|claims|payments: путь в каталоге}, strict, max_rejections)
+    - **payload**: параметры задачи
+    - **max_attempts**: максимальное количество попыток выполнения
+    """
+    try:
+        job = job_service.submit(job_data.job_type, job_data.payload, job_data.max_attempts)
+        return JobMapper.to_dto(job)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponseDTO,
+    summary="Получить состояние фоновой задачи",
+    openapi_extra=required_roles("admin"),
+    responses={
+        status.HTTP_200_OK: {"description": "Состояние задачи успешно получено"},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Задача не найдена"}
+    }
+)
+def get_job(
+    job_id: UUID = Path(..., description="ID задачи"),
+    job_service: JobService = Depends(get_job_service)
+):
+    """
+    Получает статус, прогресс и результат фоновой задачи.
+
+    - **job_id**: уникальный идентификатор задачи
+    """
+    job = job_service.get_by_id(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Задача с ID {job_id} не найдена"
+        )
+
+    return JobMapper.to_dto(job)
@@ -2,14 +2,21 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from insurance_app.application.dto.payment_dto import PaymentCreateDTO, PaymentUpdateDTO, PaymentResponseDTO, PaymentProcessDTO
 from insurance_app.application.dto.common_dto import PaginatedResponseDTO
 from insurance_app.application.dto.mappers import PaymentMapper
 from insurance_app.application.interfaces.payment_service import PaymentService
-from insurance_app.domain.models.payment import PaymentStatus, PaymentType
+from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType
+from insurance_app.presentation.api.csv_export import csv_response
 from insurance_app.presentation.api.dependencies import get_payment_service
+from insurance_app.presentation.api.response_cache import LOOKUP_CACHE_TTL, cached_json, record_tags
+from insurance_app.presentation.api.conditional import (
+    check_entity, check_list, entity_etag, if_match_version, last_modified, list_etag, set_validators
+)
+from insurance_app.presentation.api.idempotency import IdempotentRequest, idempotent_request
 from insurance_app.presentation.schemas import ErrorResponse
 
 
@@ -34,12 +41,14 @@ router = APIRouter(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Клиент, полис или страховой случай не найдены"}
     }
 )
-async def create_payment(
+def create_payment(
     payment_data: PaymentCreateDTO,
-    payment_service: PaymentService = Depends(get_payment_service)
+    payment_service: PaymentService = Depends(get_payment_service),
+    idempotency: IdempotentRequest = Depends(idempotent_request)
 ):
     """
     Создает новый платеж в системе.
+    Поддерживает заголовок Idempotency-Key: повтор запроса с тем же ключом возвращает сохраненный ответ.
     
     - **payment_number**: номер платежа (опционально, генерируется автоматически)
     - **client_id**: ID клиента (опционально, если не указан, берется из полиса или страхового случая)
@@ -53,6 +62,10 @@ async def create_payment(
     - **due_date**: срок оплаты (опционально)
     - **payment_date**: дата платежа (опционально)
     """
+    replayed = idempotency.replay()
+    if replayed is not None:
+        return replayed
+    
     try:
         # Преобразуем DTO в доменную модель
         payment = PaymentMapper.to_domain(payment_data)
@@ -61,7 +74,7 @@ async def create_payment(
         created_payment = payment_service.create(payment)
         
         # Преобразуем доменную модель в DTO для ответа
-        return PaymentMapper.to_dto(created_payment)
+        return idempotency.save(status.HTTP_201_CREATED, PaymentMapper.to_dto(created_payment))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -74,27 +87,45 @@ async def create_payment(
     response_model=List[PaymentResponseDTO],
     summary="Получить список платежей",
     responses={
-        status.HTTP_200_OK: {"description": "Список платежей успешно получен"}
+        status.HTTP_200_OK: {"description": "Список платежей успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Страница списка не изменилась (If-None-Match)"}
     }
 )
-async def get_payments(
+def get_payments(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Количество пропускаемых записей"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальное количество записей"),
     client_id: Optional[UUID] = Query(None, description="ID клиента для фильтрации"),
     policy_id: Optional[UUID] = Query(None, description="ID полиса для фильтрации"),
     claim_id: Optional[UUID] = Query(None, description="ID страхового случая для фильтрации"),
+    created_from: Optional[date] = Query(None, description="Начало периода создания платежа (включительно)"),
+    created_to: Optional[date] = Query(None, description="Конец периода создания платежа (включительно)"),
     payment_service: PaymentService = Depends(get_payment_service)
 ):
     """
-    Получает список платежей с возможностью фильтрации по клиенту, полису или страховому случаю.
+    Получает список платежей с возможностью фильтрации по клиенту, полису или страховому случаю
+    и по периоду создания.
     
     - **skip**: количество пропускаемых записей (для пагинации)
     - **limit**: максимальное количество возвращаемых записей (для пагинации)
     - **client_id**: опциональный параметр для фильтрации по ID клиента
     - **policy_id**: опциональный параметр для фильтрации по ID полиса
     - **claim_id**: опциональный параметр для фильтрации по ID страхового случая
+    - **created_from**, **created_to**: опциональный период даты создания; таблица платежей секционирована
+      по месяцам даты создания, и запрос за период просматривает только секции этого периода
     """
-    if claim_id:
+    unchanged = check_list(request, lambda: payment_service.get_versions(
+        skip, limit, client_id, policy_id, claim_id, created_from, created_to
+    ))
+    if unchanged:
+        return unchanged
+    
+    if created_from or created_to:
+        payments = payment_service.get_by_period(
+            created_from, created_to, skip, limit, client_id, policy_id, claim_id
+        )
+    elif claim_id:
         payments = payment_service.get_by_claim_id(claim_id, skip, limit)
     elif policy_id:
         payments = payment_service.get_by_policy_id(policy_id, skip, limit)
@@ -103,19 +134,42 @@ async def get_payments(
     else:
         payments = payment_service.get_all(skip, limit)
     
+    set_validators(response, list_etag(payments), last_modified(payments))
     return PaymentMapper.to_dto_list(payments)
 
 
+@router.get(
+    "/export",
+    summary="Выгрузить платежи в CSV",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"description": "CSV выгрузка платежей", "content": {"text/csv": {}}}
+    }
+)
+def export_payments(
+    payment_service: PaymentService = Depends(get_payment_service)
+):
+    """
+    Выгружает все платежи в формате CSV.
+    
+    Данные читаются потоково пачками, поэтому выгрузка не загружает всю таблицу в память.
+    """
+    return csv_response(payment_service.iter_all(), Payment, "payments.csv")
+
+
 @router.get(
     "/{payment_id}",
     response_model=PaymentResponseDTO,
     summary="Получить платеж по ID",
     responses={
         status.HTTP_200_OK: {"description": "Платеж успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Платеж не изменился (If-None-Match, If-Modified-Since)"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Платеж не найден"}
     }
 )
-async def get_payment(
+def get_payment(
+    request: Request,
+    response: Response,
     payment_id: UUID = Path(..., description="ID платежа"),
     payment_service: PaymentService = Depends(get_payment_service)
 ):
@@ -124,6 +178,10 @@ async def get_payment(
     
     - **payment_id**: уникальный идентификатор платежа
     """
+    unchanged = check_entity(request, lambda: payment_service.get_version(payment_id))
+    if unchanged:
+        return unchanged
+    
     payment = payment_service.get_by_id(payment_id)
     if not payment:
         raise HTTPException(
@@ -131,6 +189,7 @@ async def get_payment(
             detail=f"Платеж с ID {payment_id} не найден"
         )
     
+    set_validators(response, entity_etag(payment), payment.updated_at)
     return PaymentMapper.to_dto(payment)
 
 
@@ -141,12 +200,15 @@ async def get_payment(
     responses={
         status.HTTP_200_OK: {"description": "Данные платежа успешно обновлены"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Платеж не найден"},
-        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные платежа"}
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные платежа"},
+        status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Платеж изменен другим запросом"}
     }
 )
-async def update_payment(
+def update_payment(
     payment_data: PaymentUpdateDTO,
+    response: Response,
     payment_id: UUID = Path(..., description="ID платежа"),
+    expected_version: Optional[int] = Depends(if_match_version),
     payment_service: PaymentService = Depends(get_payment_service)
 ):
     """
@@ -154,6 +216,7 @@ async def update_payment(
     
     - **payment_id**: уникальный идентификатор платежа
     - **payment_data**: новые данные платежа
+    - **If-Match**: ETag записи, полученный при чтении; если запись с тех пор изменена, возвращается 409
     """
     # Проверяем существование платежа
     payment = payment_service.get_by_id(payment_id)
@@ -163,11 +226,15 @@ async def update_payment(
             detail=f"Платеж с ID {payment_id} не найден"
         )
     
+    if expected_version is not None:
+        payment.version = expected_version
+    
     try:
         # Обновляем данные платежа
         updated_payment = PaymentMapper.to_domain(payment_data, payment)
         updated_payment = payment_service.update(updated_payment)
         
+        response.headers["ETag"] = entity_etag(updated_payment)
         return PaymentMapper.to_dto(updated_payment)
     except ValueError as e:
         raise HTTPException(
@@ -185,7 +252,7 @@ async def update_payment(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Платеж не найден"}
     }
 )
-async def delete_payment(
+def delete_payment(
     payment_id: UUID = Path(..., description="ID платежа"),
     payment_service: PaymentService = Depends(get_payment_service)
 ):
@@ -218,7 +285,8 @@ async def delete_payment(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Платеж не найден"}
     }
 )
-async def get_payment_by_number(
+def get_payment_by_number(
+    request: Request,
     payment_number: str = Path(..., description="Номер платежа"),
     payment_service: PaymentService = Depends(get_payment_service)
 ):
@@ -227,14 +295,16 @@ async def get_payment_by_number(
     
     - **payment_number**: номер платежа
     """
-    payment = payment_service.get_by_payment_number(payment_number)
-    if not payment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Платеж с номером {payment_number} не найден"
-        )
+    def load():
+        payment = payment_service.get_by_payment_number(payment_number)
+        if not payment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Платеж с номером {payment_number} не найден"
+            )
+        return PaymentMapper.to_dto(payment), record_tags("payments", payment.id)
     
-    return PaymentMapper.to_dto(payment)
+    return cached_json(request, "payment_by_number", LOOKUP_CACHE_TTL, load)
 
 
 @router.post(
@@ -247,7 +317,7 @@ async def get_payment_by_number(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверный статус платежа"}
     }
 )
-async def process_payment(
+def process_payment(
     process_data: PaymentProcessDTO,
     payment_id: UUID = Path(..., description="ID платежа"),
     payment_service: PaymentService = Depends(get_payment_service)
@@ -279,18 +349,24 @@ async def process_payment(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Ошибка при создании платежа"}
     }
 )
-async def create_premium_payment(
+def create_premium_payment(
     policy_id: UUID = Path(..., description="ID полиса"),
-    payment_service: PaymentService = Depends(get_payment_service)
+    payment_service: PaymentService = Depends(get_payment_service),
+    idempotency: IdempotentRequest = Depends(idempotent_request)
 ):
     """
     Создает платеж страховой премии для указанного полиса.
+    Поддерживает заголовок Idempotency-Key.
     
     - **policy_id**: уникальный идентификатор полиса
     """
+    replayed = idempotency.replay()
+    if replayed is not None:
+        return replayed
+    
     try:
         payment = payment_service.create_premium_payment(policy_id)
-        return PaymentMapper.to_dto(payment)
+        return idempotency.save(status.HTTP_201_CREATED, PaymentMapper.to_dto(payment))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -309,18 +385,24 @@ async def create_premium_payment(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Страховой случай не утвержден или ошибка при создании платежа"}
     }
 )
-async def create_claim_payout(
+def create_claim_payout(
     claim_id: UUID = Path(..., description="ID страхового случая"),
-    payment_service: PaymentService = Depends(get_payment_service)
+    payment_service: PaymentService = Depends(get_payment_service),
+    idempotency: IdempotentRequest = Depends(idempotent_request)
 ):
     """
     Создает платеж страховой выплаты для указанного страхового случая.
+    Поддерживает заголовок Idempotency-Key.
     
     - **claim_id**: уникальный идентификатор страхового случая
     """
+    replayed = idempotency.replay()
+    if replayed is not None:
+        return replayed
+    
     try:
         payment = payment_service.create_claim_payout(claim_id)
-        return PaymentMapper.to_dto(payment)
+        return idempotency.save(status.HTTP_201_CREATED, PaymentMapper.to_dto(payment))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
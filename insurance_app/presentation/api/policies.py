@@ -1,7 +1,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response, status
 
 from insurance_app.application.dto.policy_dto import PolicyCreateDTO, PolicyUpdateDTO, PolicyResponseDTO
 from insurance_app.application.dto.common_dto import PaginatedResponseDTO
@@ -9,6 +9,10 @@ from insurance_app.application.dto.mappers import PolicyMapper
 from insurance_app.application.interfaces.policy_service import PolicyService
 from insurance_app.domain.models.policy import PolicyStatus
 from insurance_app.presentation.api.dependencies import get_policy_service
+from insurance_app.presentation.api.response_cache import LOOKUP_CACHE_TTL, cached_json, record_tags
+from insurance_app.presentation.api.conditional import (
+    check_entity, check_list, entity_etag, if_match_version, last_modified, list_etag, set_validators
+)
 from insurance_app.presentation.schemas import ErrorResponse
 
 
@@ -33,7 +37,7 @@ router = APIRouter(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Клиент не найден"}
     }
 )
-async def create_policy(
+def create_policy(
     policy_data: PolicyCreateDTO,
     policy_service: PolicyService = Depends(get_policy_service)
 ):
@@ -48,6 +52,7 @@ async def create_policy(
     - **coverage_amount**: страховая сумма
     - **payment_frequency**: частота платежей (по умолчанию "monthly")
     - **description**: описание полиса (опционально)
+    - **auto_renew**: продлевать полис при истечении срока действия (по умолчанию false)
     """
     try:
         # Преобразуем DTO в доменную модель
@@ -70,10 +75,13 @@ async def create_policy(
     response_model=List[PolicyResponseDTO],
     summary="Получить список полисов",
     responses={
-        status.HTTP_200_OK: {"description": "Список полисов успешно получен"}
+        status.HTTP_200_OK: {"description": "Список полисов успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Страница списка не изменилась (If-None-Match)"}
     }
 )
-async def get_policies(
+def get_policies(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Количество пропускаемых записей"),
     limit: int = Query(100, ge=1, le=1000, description="Максимальное количество записей"),
     client_id: Optional[UUID] = Query(None, description="ID клиента для фильтрации"),
@@ -86,8 +94,12 @@ async def get_policies(
     - **skip**: количество пропускаемых записей (для пагинации)
     - **limit**: максимальное количество возвращаемых записей (для пагинации)
     - **client_id**: опциональный параметр для фильтрации по ID клиента
-    - **active_only**: если true, возвращает только активные полисы
+    - **active_only**: если true, возвращает только действующие полисы (статус ACTIVE, срок действия не истек)
     """
+    unchanged = check_list(request, lambda: policy_service.get_versions(skip, limit, client_id, active_only))
+    if unchanged:
+        return unchanged
+    
     if client_id:
         policies = policy_service.get_by_client_id(client_id, skip, limit)
     elif active_only:
@@ -95,6 +107,7 @@ async def get_policies(
     else:
         policies = policy_service.get_all(skip, limit)
     
+    set_validators(response, list_etag(policies), last_modified(policies))
     return PolicyMapper.to_dto_list(policies)
 
 
@@ -104,10 +117,13 @@ async def get_policies(
     summary="Получить полис по ID",
     responses={
         status.HTTP_200_OK: {"description": "Полис успешно получен"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Полис не изменился (If-None-Match, If-Modified-Since)"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис не найден"}
     }
 )
-async def get_policy(
+def get_policy(
+    request: Request,
+    response: Response,
     policy_id: UUID = Path(..., description="ID полиса"),
     policy_service: PolicyService = Depends(get_policy_service)
 ):
@@ -116,6 +132,10 @@ async def get_policy(
     
     - **policy_id**: уникальный идентификатор полиса
     """
+    unchanged = check_entity(request, lambda: policy_service.get_version(policy_id))
+    if unchanged:
+        return unchanged
+    
     policy = policy_service.get_by_id(policy_id)
     if not policy:
         raise HTTPException(
@@ -123,6 +143,7 @@ async def get_policy(
             detail=f"Полис с ID {policy_id} не найден"
         )
     
+    set_validators(response, entity_etag(policy), policy.updated_at)
     return PolicyMapper.to_dto(policy)
 
 
@@ -133,12 +154,15 @@ async def get_policy(
     responses={
         status.HTTP_200_OK: {"description": "Данные полиса успешно обновлены"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис не найден"},
-        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные полиса"}
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверные данные полиса"},
+        status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Полис изменен другим запросом"}
     }
 )
-async def update_policy(
+def update_policy(
     policy_data: PolicyUpdateDTO,
+    response: Response,
     policy_id: UUID = Path(..., description="ID полиса"),
+    expected_version: Optional[int] = Depends(if_match_version),
     policy_service: PolicyService = Depends(get_policy_service)
 ):
     """
@@ -146,6 +170,7 @@ async def update_policy(
     
     - **policy_id**: уникальный идентификатор полиса
     - **policy_data**: новые данные полиса
+    - **If-Match**: ETag записи, полученный при чтении; если запись с тех пор изменена, возвращается 409
     """
     # Проверяем существование полиса
     policy = policy_service.get_by_id(policy_id)
@@ -155,11 +180,15 @@ async def update_policy(
             detail=f"Полис с ID {policy_id} не найден"
         )
     
+    if expected_version is not None:
+        policy.version = expected_version
+    
     try:
         # Обновляем данные полиса
         updated_policy = PolicyMapper.to_domain(policy_data, policy)
         updated_policy = policy_service.update(updated_policy)
         
+        response.headers["ETag"] = entity_etag(updated_policy)
         return PolicyMapper.to_dto(updated_policy)
     except ValueError as e:
         raise HTTPException(
@@ -177,7 +206,7 @@ async def update_policy(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис не найден"}
     }
 )
-async def delete_policy(
+def delete_policy(
     policy_id: UUID = Path(..., description="ID полиса"),
     policy_service: PolicyService = Depends(get_policy_service)
 ):
@@ -210,7 +239,8 @@ async def delete_policy(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис не найден"}
     }
 )
-async def get_policy_by_number(
+def get_policy_by_number(
+    request: Request,
     policy_number: str = Path(..., description="Номер полиса"),
     policy_service: PolicyService = Depends(get_policy_service)
 ):
@@ -219,14 +249,16 @@ async def get_policy_by_number(
     
     - **policy_number**: номер полиса
     """
-    policy = policy_service.get_by_policy_number(policy_number)
-    if not policy:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Полис с номером {policy_number} не найден"
-        )
+    def load():
+        policy = policy_service.get_by_policy_number(policy_number)
+        if not policy:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Полис с номером {policy_number} не найден"
+            )
+        return PolicyMapper.to_dto(policy), record_tags("policies", policy.id)
     
-    return PolicyMapper.to_dto(policy)
+    return cached_json(request, "policy_by_number", LOOKUP_CACHE_TTL, load)
 
 
 @router.patch(
@@ -236,12 +268,15 @@ async def get_policy_by_number(
     responses={
         status.HTTP_200_OK: {"description": "Статус полиса успешно изменен"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Полис не найден"},
-        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверный статус"}
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Неверный статус"},
+        status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Полис изменен другим запросом"}
     }
 )
-async def update_policy_status(
+def update_policy_status(
     status_data: PolicyStatus,
+    response: Response,
     policy_id: UUID = Path(..., description="ID полиса"),
+    expected_version: Optional[int] = Depends(if_match_version),
     policy_service: PolicyService = Depends(get_policy_service)
 ):
     """
@@ -249,6 +284,7 @@ async def update_policy_status(
     
     - **policy_id**: уникальный идентификатор полиса
     - **status_data**: новый статус полиса
+    - **If-Match**: ETag записи, полученный при чтении; если запись с тех пор изменена, возвращается 409
     """
     # Проверяем существование полиса
     policy = policy_service.get_by_id(policy_id)
@@ -259,7 +295,10 @@ async def update_policy_status(
         )
     
     # Изменяем статус полиса
+    if expected_version is not None:
+        policy.version = expected_version
     policy.status = status_data
     updated_policy = policy_service.update(policy)
     
+    response.headers["ETag"] = entity_etag(updated_policy)
     return PolicyMapper.to_dto(updated_policy)
@@ -0,0 +1,72 @@
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from insurance_app.application.interfaces.cache_invalidator import entity_tags
+from insurance_app.infrastructure.caching.cache import ResponseCache
+from insurance_app.infrastructure.caching.config import response_cache
+
+# Заголовок ответа с результатом обращения к кэшу: HIT или MISS
+CACHE_HEADER = "X-Cache"
+# Время жизни ответов поиска по номеру и email по умолчанию, с
+LOOKUP_CACHE_TTL = 60.0
+
+
+def record_tags(kind: str, entity_id) -> Tuple[str, ...]:
+    """Теги ответа с одной записью: сама запись и все записи сущности (для массовых изменений)"""
+    return (kind, *entity_tags(kind, [entity_id]))
+
+
+def access_scope(request: Request) -> str:
+    """Область доступа пользователя: ответы различаются только правами, а не конкретным пользователем"""
+    user = request.scope.get("user")
+    if not isinstance(user, dict):
+        return "anonymous"
+    if user.get("is_superuser"):
+        return "superuser"
+    return ",".join(sorted(user.get("roles") or ())) or "authenticated"
+
+
+def cache_key(request: Request, route: str) -> str:
+    """Ключ ответа: маршрут, параметры пути и запроса, область доступа"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, value in sorted(request.path_params.items()):
+        digest.update(f"p:{name}={value};".encode())
+    for name, value in sorted(request.query_params.multi_items()):
+        digest.update(f"q:{name}={value};".encode())
+    digest.update(f"s:{access_scope(request)}".encode())
+    return f"{route}:{digest.hexdigest()}"
+
+
+def cached_json(
+    request: Request,
+    route: str,
+    ttl: float,
+    load: Callable[[], Tuple[Any, Iterable[str]]],
+    cache: ResponseCache = response_cache
+) -> Response:
+    """
+    Возвращает JSON-ответ маршрута из кэша или строит его вызовом load, возвращающим данные ответа
+    и теги записей, из которых они получены. Исключения load (например, 404) не кэшируются.
+    ttl — время жизни по умолчанию, переопределяется настройкой RESPONSE_CACHE_TTL.
+    """
+    ttl = cache.ttl(route, ttl)
+    if ttl <= 0:
+        content, _ = load()
+        return JSONResponse(jsonable_encoder(content))
+    
+    key = cache_key(request, route)
+    body = cache.get(route, key)
+    if body is not None:
+        return Response(body, media_type="application/json", headers={CACHE_HEADER: "HIT"})
+    
+    # Время фиксируется до чтения: изменение, сброшенное во время чтения, делает ответ недействительным
+    loaded_at = time.time()
+    content, tags = load()
+    response = JSONResponse(jsonable_encoder(content), headers={CACHE_HEADER: "MISS"})
+    cache.set(key, response.body, tags, loaded_at, ttl)
+    return response
@@ -9,6 +9,7 @@ from insurance_app.application.interfaces.user_service import UserService
 from insurance_app.presentation.api.dependencies import get_user_service, get_current_user
 from insurance_app.domain.models.user import User
 from insurance_app.domain.exceptions import EntityNotFoundException, BusinessRuleViolationException, AuthenticationException
+from insurance_app.infrastructure.auth.policy import required_roles
 
 # Создаем роутер для пользователей
 router = APIRouter(
@@ -24,11 +25,12 @@ router = APIRouter(
     "",
     response_model=PaginatedResponseDTO[UserResponseDTO],
     summary="Получение списка пользователей",
+    openapi_extra=required_roles("admin"),
     responses={
         status.HTTP_403_FORBIDDEN: {"description": "Forbidden"}
     }
 )
-async def list_users(
+def list_users(
     pagination: PaginationDTO = Depends(),
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
@@ -59,12 +61,13 @@ async def list_users(
     "/{user_id}",
     response_model=UserResponseDTO,
     summary="Получение информации о пользователе",
+    openapi_extra=required_roles("admin"),
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "User not found"},
         status.HTTP_403_FORBIDDEN: {"description": "Forbidden"}
     }
 )
-async def get_user(
+def get_user(
     user_id: UUID,
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
@@ -94,13 +97,14 @@ async def get_user(
     "/{user_id}",
     response_model=UserResponseDTO,
     summary="Обновление информации о пользователе",
+    openapi_extra=required_roles("admin"),
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "User not found"},
         status.HTTP_403_FORBIDDEN: {"description": "Forbidden"},
         status.HTTP_409_CONFLICT: {"description": "Conflict"}
     }
 )
-async def update_user(
+def update_user(
     user_id: UUID,
     user_data: UserUpdateDTO,
     current_user: User = Depends(get_current_user),
@@ -143,12 +147,13 @@ async def update_user(
     "/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Удаление пользователя",
+    openapi_extra=required_roles("admin"),
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "User not found"},
         status.HTTP_403_FORBIDDEN: {"description": "Forbidden"}
     }
 )
-async def delete_user(
+def delete_user(
     user_id: UUID,
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
@@ -188,7 +193,7 @@ async def delete_user(
         status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"}
     }
 )
-async def get_current_user_info(
+def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -206,7 +211,7 @@ async def get_current_user_info(
         status.HTTP_409_CONFLICT: {"description": "Conflict"}
     }
 )
-async def update_current_user(
+def update_current_user(
     user_data: UserUpdateDTO,
     current_user: User = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
@@ -240,7 +245,7 @@ async def update_current_user(
         status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"}
     }
 )
-async def change_current_user_password(
+def change_current_user_password(
     current_password: str,
     new_password: str,
     current_user: User = Depends(get_current_user),
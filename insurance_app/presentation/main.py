@@ -12,9 +12,17 @@ from insurance_app.presentation.api.claims import router as claims_router
 from insurance_app.presentation.api.payments import router as payments_router
 from insurance_app.presentation.api.auth import router as auth_router
 from insurance_app.presentation.api.users import router as users_router
+from insurance_app.presentation.api.jobs import router as jobs_router
+from insurance_app.presentation.api.changes import router as changes_router
+from insurance_app.presentation.api.cache import router as cache_router
 from insurance_app.presentation.schemas import HealthCheckResponse, ErrorResponse
-from insurance_app.domain.exceptions import DomainException, AuthenticationException, AuthorizationException
+from insurance_app.domain.exceptions import (
+    DomainException, AuthenticationException, AuthorizationException, ConcurrencyConflictException
+)
 from insurance_app.infrastructure.auth.middleware import JWTAuthMiddleware
+from insurance_app.infrastructure.database.config import dispose_engines
+from insurance_app.infrastructure.database.pool import pool_wait_monitor
+from insurance_app.infrastructure.throttling import RouteGroup, ThrottlingMiddleware, create_rate_limit_backend
 
 
 app = FastAPI(
@@ -22,6 +30,7 @@ app = FastAPI(
     description="API для страховой компании",
     version="1.0.0",
     docs_url="/api/docs",
+    swagger_ui_oauth2_redirect_url="/api/docs/oauth2-redirect",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json"
 )
@@ -32,15 +41,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["Authorization", "Content-Type", "Accept", "Origin", 
-                   "X-Requested-With", "X-CSRF-Token", "Access-Control-Allow-Origin"],
-    expose_headers=["Authorization", "Content-Type"],
+                   "X-Requested-With", "X-CSRF-Token", "Access-Control-Allow-Origin",
+                   "If-None-Match", "If-Modified-Since", "If-Match"],
+    expose_headers=["Authorization", "Content-Type", "ETag", "Last-Modified", "X-Cache"],
 )
 
 secret_key = os.environ.get("SECRET_KEY", "your-secret-key")
 
-# Пути, которые не требуют аутентификации
+# Пути, которые не требуют аутентификации. Политика доступа сравнивает пути целиком,
+# поэтому вложенные страницы документации перечисляются отдельно
 excluded_paths = [
     "/api/docs",
+    "/api/docs/oauth2-redirect",
     "/api/redoc",
     "/api/openapi.json",
     "/api/health-check",
@@ -59,18 +71,29 @@ async def health_check():
         "timestamp": datetime.datetime.now().isoformat()
     }
 
-def get_required_roles(path: str) -> list:
-    """Возвращает список ролей, необходимых для доступа к пути"""
-    if path.startswith("/api/users") and not path.endswith("/me"):
-        return ["admin"]
-    return []
+# Ограничение нагрузки. Добавляется до JWT middleware, поэтому выполняется после него
+# и ограничивает частоту запросов аутентифицированного пользователя по его идентификатору
+app.add_middleware(
+    ThrottlingMiddleware,
+    backend=create_rate_limit_backend(os.environ.get("RATE_LIMIT_BACKEND", "memory")),
+    rate=float(os.environ.get("RATE_LIMIT_PER_SECOND", "20")),
+    burst=int(os.environ.get("RATE_LIMIT_BURST", "40")),
+    groups=[
+        RouteGroup("exports", int(os.environ.get("EXPORT_CONCURRENCY", "4")), r"/export$", frozenset({"GET"})),
+        RouteGroup("batch", int(os.environ.get("BATCH_CONCURRENCY", "8")), r":batch$", frozenset({"POST"})),
+        RouteGroup("streams", int(os.environ.get("STREAM_CONCURRENCY", "100")), r"/stream$", frozenset({"GET"})),
+    ],
+    pool_monitor=pool_wait_monitor,
+    shed_threshold=float(os.environ.get("LOAD_SHED_POOL_WAIT", "2")),
+    exempt_paths=["/api/health-check", "/api/health"]
+)
 
-# Добавление middleware для JWT-аутентификации
+# Добавление middleware для JWT-аутентификации; роли берутся из метаданных маршрутов
 app.add_middleware(
     JWTAuthMiddleware,
     secret_key=secret_key,
     excluded_paths=excluded_paths,
-    required_roles=get_required_roles
+    routes=app.routes
 )
 
 app.include_router(clients_router, prefix="/api")
@@ -79,6 +102,15 @@ app.include_router(claims_router, prefix="/api")
 app.include_router(payments_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
 app.include_router(users_router, prefix="/api")
+app.include_router(jobs_router, prefix="/api")
+app.include_router(changes_router, prefix="/api")
+app.include_router(cache_router, prefix="/api")
+
+
+@app.on_event("shutdown")
+def dispose_engine():
+    """Закрывает соединения пулов ведущего сервера и реплик при остановке процесса"""
+    dispose_engines()
 
 
 @app.exception_handler(RequestValidationError)
@@ -99,6 +131,15 @@ async def domain_exception_handler(request: Request, exc: DomainException):
     )
 
 
+@app.exception_handler(ConcurrencyConflictException)
+async def concurrency_conflict_exception_handler(request: Request, exc: ConcurrencyConflictException):
+    """Обработчик конфликтов параллельного изменения записи"""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"error": "concurrency_conflict", "message": str(exc), "details": {"expected_version": exc.expected_version}},
+    )
+
+
 @app.exception_handler(AuthenticationException)
 async def authentication_exception_handler(request: Request, exc: AuthenticationException):
     """Обработчик ошибок аутентификации"""
@@ -1,7 +1,11 @@
 # Файл для инициализации пакета
-from insurance_app.presentation.schemas.base import HealthCheckResponse, ErrorResponse
+from insurance_app.presentation.schemas.base import (
+    HealthCheckResponse, ErrorResponse, CacheStatsResponse, RouteCacheStatsResponse
+)
 
 __all__ = [
     'HealthCheckResponse',
-    'ErrorResponse'
+    'ErrorResponse',
+    'CacheStatsResponse',
+    'RouteCacheStatsResponse'
 ]
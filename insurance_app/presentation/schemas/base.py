@@ -15,3 +15,16 @@ class ErrorResponse(BaseModel):
     details: Optional[Union[List[Dict[str, Any]], Dict[str, Any], str]] = Field(
         None, description="Дополнительные детали ошибки"
     )
+
+
+class RouteCacheStatsResponse(BaseModel):
+    """Счетчики кэша ответов маршрута"""
+    hits: int = Field(..., description="Ответы из кэша")
+    misses: int = Field(..., description="Ответы, построенные заново")
+    hit_rate: float = Field(..., description="Доля ответов из кэша")
+
+
+class CacheStatsResponse(BaseModel):
+    """Схема ответа со статистикой кэша ответов процесса"""
+    entries: int = Field(..., description="Ответов в памяти процесса")
+    routes: Dict[str, RouteCacheStatsResponse] = Field(..., description="Счетчики по маршрутам")
@@ -0,0 +1,49 @@
+"""
+Локальная замена внешнего получателя событий для разработки.
+Принимает POST-запросы с JSON-массивом событий и дописывает их в файл JSON Lines.
+
+Запуск:
+    python -m insurance_app.scripts.event_sink_server --port 8090 --output received_events.jsonl
+"""
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(output: str):
+    class EventSinkHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                events = json.loads(self.rfile.read(length))
+            except ValueError:
+                self.send_error(400, "Ожидается JSON-массив событий")
+                return
+            with open(output, "a", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self.send_response(204)
+            self.end_headers()
+
+    return EventSinkHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный HTTP-получатель доменных событий")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--output", default="received_events.jsonl", help="Файл для полученных событий")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.output))
+    print(f"Получатель событий слушает http://{args.host}:{args.port}, запись в {args.output}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
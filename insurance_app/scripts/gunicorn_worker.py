@@ -0,0 +1,19 @@
+"""
+Обработчик uvicorn для мастер-процесса gunicorn (см. insurance_app.scripts.serve).
+Модуль импортируется только gunicorn, поэтому может зависеть от него.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class ProductionUvicornWorker(UvicornWorker):
+    """Обработчик uvicorn с параметрами, которые gunicorn не передает: цикл событий, HTTP-парсер, лимит соединений"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        settings = self.app.settings
+        self.config.loop = settings.loop
+        self.config.http = settings.http
+        self.config.limit_concurrency = settings.limit_concurrency
+        # Обработчик прерывает зависшие запросы раньше, чем мастер завершит его по SIGKILL,
+        # чтобы успели выполниться обработчики остановки приложения
+        self.config.timeout_graceful_shutdown = max(1, settings.graceful_timeout - 5)
@@ -0,0 +1,92 @@
+"""
+Массовая загрузка данных из файлов CSV.
+
+Файлы клиентов, полисов, страховых случаев и платежей загружаются в промежуточные таблицы
+(в PostgreSQL командой COPY), проверяются SQL-запросами над всей таблицей и переносятся
+в основные таблицы: новые записи вставляются, существующие с тем же номером (email клиента) обновляются.
+Каждый файл загружается в своей транзакции.
+
+Запуск:
+    python -m insurance_app.scripts.import_data --clients clients.csv --policies policies.csv \\
+        --claims claims.csv --payments payments.csv
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.models.bulk_import import ImportEntity
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressLogger:
+    """Сообщает о прогрессе загрузки файла не чаще раза в interval секунд"""
+
+    def __init__(self, entity: ImportEntity, total: int, interval: float = 5.0):
+        self.entity = entity
+        self.total = total
+        self.interval = interval
+        self.started = self.reported = time.monotonic()
+
+    def __call__(self, consumed: int) -> None:
+        now = time.monotonic()
+        if now - self.reported >= self.interval:
+            self.reported = now
+            logger.info(
+                "%s: прочитано %.1f из %.1f МБ (%.0f%%), %.1f МБ/с",
+                self.entity.value, consumed / 2 ** 20, self.total / 2 ** 20,
+                100 * consumed / self.total if self.total else 100, consumed / 2 ** 20 / (now - self.started)
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Массовая загрузка данных из файлов CSV")
+    for entity in ImportEntity:
+        parser.add_argument(f"--{entity.value}", default=None, help=f"Файл CSV ({entity.value})")
+    parser.add_argument("--url", default=None, help="URL базы данных (по умолчанию DATABASE_URL)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Отменять загрузку файла целиком, если отклонена хотя бы одна строка")
+    parser.add_argument("--max-rejections", type=int, default=20, help="Сколько отклоненных строк выводить")
+    args = parser.parse_args()
+    files = {entity: getattr(args, entity.value) for entity in ImportEntity if getattr(args, entity.value)}
+    if not files:
+        parser.error("Не задан ни один файл")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.url:
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=create_engine(args.url))
+    else:
+        from insurance_app.infrastructure.database.config import SessionLocal as session_factory
+
+    failed = False
+    session = session_factory()
+    try:
+        import_service = ServiceFactory.create_import_service(session)
+        # Порядок перечисления — порядок ссылок: клиенты до полисов, полисы до случаев и платежей
+        for entity, path in files.items():
+            started = time.monotonic()
+            with open(path, "rb") as stream:
+                result = import_service.import_csv(
+                    entity, stream, ProgressLogger(entity, os.path.getsize(path)), args.strict, args.max_rejections
+                )
+            logger.info(
+                "%s: строк %d, вставлено %d, обновлено %d, отклонено %d за %.1f с%s",
+                entity.value, result.loaded, result.inserted, result.updated, result.rejected,
+                time.monotonic() - started, "" if result.merged else " — загрузка отменена"
+            )
+            for rejection in result.rejections:
+                logger.warning("%s, запись %d: %s", entity.value, rejection.row, rejection.reason)
+            failed = failed or not result.merged
+    finally:
+        session.close()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Обработчик очереди фоновых задач.
+Выбирает задачи из таблицы jobs, выполняет зарегистрированные обработчики,
+сохраняет прогресс и результат, при ошибке планирует повтор с экспоненциальной задержкой.
+Пока задача выполняется, ее блокировка продлевается каждые --heartbeat секунд.
+
+Запуск:
+    python -m insurance_app.scripts.job_worker --processes 4 --interval 1
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Collection, Optional
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.application.services.job_handlers import JOB_HANDLERS
+from insurance_app.domain.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Выполняет задачи из очереди до получения сигнала остановки"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        worker_id: Optional[str] = None,
+        job_types: Optional[Collection[str]] = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 60.0
+    ):
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.job_types = job_types
+        self.poll_interval = poll_interval
+        # Должен быть заметно меньше lock_timeout сервиса задач, иначе задачу вернет в очередь другой обработчик
+        self.heartbeat_interval = heartbeat_interval
+        self.processed = 0
+        self._stopping = False
+
+    def stop(self, *args) -> None:
+        """Останавливает обработчик после завершения текущей задачи"""
+        self._stopping = True
+
+    def _heartbeat(self, job: Job, finished: threading.Event) -> None:
+        """
+        Продлевает блокировку задачи, пока ее выполняет обработчик, в том числе не сообщающий прогресс.
+        Работает в отдельном потоке и поэтому с отдельной сессией.
+        """
+        while not finished.wait(self.heartbeat_interval):
+            session = self.session_factory()
+            try:
+                if not ServiceFactory.create_job_service(session).heartbeat(job):
+                    logger.warning("Задача %s возвращена в очередь и выполняется другим обработчиком", job.id)
+                    return
+            except Exception:
+                logger.exception("Не удалось продлить блокировку задачи %s", job.id)
+            finally:
+                session.close()
+
+    def run_once(self) -> Optional[Job]:
+        """Выбирает и выполняет одну задачу. Возвращает задачу или None, если очередь пуста"""
+        session = self.session_factory()
+        try:
+            job_service = ServiceFactory.create_job_service(session)
+            job = job_service.claim_next(self.worker_id, self.job_types)
+            if job is None:
+                return None
+
+            handler = JOB_HANDLERS.get(job.job_type)
+            started = time.monotonic()
+            finished = threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(job, finished), daemon=True)
+            heartbeat.start()
+            try:
+                if handler is None:
+                    raise ValueError(f"Неизвестный тип задачи: {job.job_type}")
+                result = handler(
+                    session,
+                    job.payload,
+                    lambda current, total=None: job_service.report_progress(job, current, total)
+                )
+            except Exception as e:
+                session.rollback()
+                job = job_service.fail(job, f"{type(e).__name__}: {e}")
+                logger.warning(
+                    "Задача %s (%s), попытка %d из %d завершилась ошибкой: %s",
+                    job.id, job.job_type, job.attempts, job.max_attempts, job.error
+                )
+                return job
+            finally:
+                finished.set()
+                heartbeat.join()
+
+            if not job_service.complete(job, result):
+                logger.warning("Задача %s выполнена, но уже передана другому обработчику: результат не сохранен", job.id)
+                return job
+            job.status = JobStatus.SUCCEEDED
+            job.result = result
+            self.processed += 1
+            logger.info("Задача %s (%s) выполнена за %.3f с", job.id, job.job_type, time.monotonic() - started)
+            return job
+        finally:
+            session.close()
+
+    def requeue_stale(self) -> int:
+        """Возвращает в очередь задачи обработчиков, которые перестали отвечать"""
+        session = self.session_factory()
+        try:
+            return ServiceFactory.create_job_service(session).requeue_stale()
+        finally:
+            session.close()
+
+    def run(self, max_jobs: Optional[int] = None) -> int:
+        """Выполняет задачи подряд, при пустой очереди ждет poll_interval секунд"""
+        while not self._stopping and (max_jobs is None or self.processed < max_jobs):
+            if self.run_once() is None:
+                if self.requeue_stale():
+                    continue
+                if max_jobs is not None:
+                    break
+                time.sleep(self.poll_interval)
+        return self.processed
+
+
+def _run_process(job_types: Optional[Collection[str]], poll_interval: float, heartbeat_interval: float) -> None:
+    """Точка входа процесса-обработчика"""
+    from insurance_app.infrastructure.database.config import SessionLocal, dispose_engines
+
+    # Соединения пула, унаследованные от родительского процесса, не используются совместно
+    dispose_engines(close=False)
+    worker = JobWorker(
+        SessionLocal, job_types=job_types, poll_interval=poll_interval, heartbeat_interval=heartbeat_interval
+    )
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+    logger.info("Обработчик %s остановлен, выполнено задач: %d", worker.worker_id, worker.processed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Обработчик очереди фоновых задач")
+    parser.add_argument("--processes", type=int, default=1, help="Количество процессов-обработчиков")
+    parser.add_argument("--interval", type=float, default=1.0, help="Пауза в секундах, когда очередь пуста")
+    parser.add_argument("--job-type", action="append", dest="job_types", help="Выполнять только задачи этого типа")
+    parser.add_argument("--heartbeat", type=float, default=60.0,
+                        help="Период продления блокировки выполняемой задачи в секундах")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(levelname)s %(message)s")
+
+    if args.processes == 1:
+        _run_process(args.job_types, args.interval, args.heartbeat)
+        return
+
+    processes = [
+        multiprocessing.Process(target=_run_process, args=(args.job_types, args.interval, args.heartbeat), name=f"job-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def shutdown(*_):
+        for process in processes:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
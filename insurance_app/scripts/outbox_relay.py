@@ -0,0 +1,97 @@
+"""
+Ретранслятор исходящих доменных событий.
+Читает неопубликованные события из таблицы outbox_events пачками и публикует их получателям.
+
+Запуск:
+    python -m insurance_app.scripts.outbox_relay --sink file:events.jsonl --sink http://localhost:8090/events
+"""
+import argparse
+import logging
+import signal
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.interfaces.event_sink import EventSink
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.infrastructure.messaging.event_sinks import create_event_sink
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelayWorker:
+    """Циклически публикует исходящие события до получения сигнала остановки"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sinks: List[EventSink],
+        batch_size: int = 100,
+        idle_interval: float = 1.0
+    ):
+        self.session_factory = session_factory
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.idle_interval = idle_interval
+        self.published = 0
+        self._stopping = False
+
+    def stop(self, *args) -> None:
+        """Останавливает ретранслятор после завершения текущей пачки"""
+        self._stopping = True
+
+    def run_once(self) -> int:
+        """Публикует одну пачку событий в отдельной сессии"""
+        session = self.session_factory()
+        try:
+            published = ServiceFactory.create_outbox_relay(session, self.sinks).relay_batch(self.batch_size)
+        finally:
+            session.close()
+        self.published += published
+        return published
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """Публикует события, пока находятся полные пачки, иначе ждет idle_interval секунд"""
+        batches = 0
+        while not self._stopping and (max_batches is None or batches < max_batches):
+            batches += 1
+            try:
+                published = self.run_once()
+            except Exception as e:
+                logger.warning("Не удалось опубликовать пачку событий: %s", e)
+                published = 0
+            else:
+                if published:
+                    logger.info("Опубликовано событий: %d (всего %d)", published, self.published)
+            if published < self.batch_size and not self._stopping:
+                time.sleep(self.idle_interval)
+        return self.published
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ретранслятор исходящих доменных событий")
+    parser.add_argument("--sink", action="append", required=True,
+                        help="Получатель событий: file:<путь> или http(s)://<адрес> (можно указать несколько)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Количество событий в пачке")
+    parser.add_argument("--interval", type=float, default=1.0, help="Пауза в секундах, когда новых событий нет")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from insurance_app.infrastructure.database.config import SessionLocal
+
+    worker = OutboxRelayWorker(
+        SessionLocal,
+        [create_event_sink(spec) for spec in args.sink],
+        batch_size=args.batch_size,
+        idle_interval=args.interval
+    )
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+    logger.info("Ретранслятор остановлен, опубликовано событий: %d", worker.published)
+
+
+if __name__ == "__main__":
+    main()
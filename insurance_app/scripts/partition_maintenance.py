@@ -0,0 +1,57 @@
+"""
+Обслуживание помесячных секций таблиц платежей (по created_at) и страховых случаев (по report_date) в PostgreSQL.
+
+Создает секции на текущий и следующие месяцы, чтобы вставка новых записей не завершалась ошибкой
+из-за отсутствующей секции, и отсоединяет секции старше срока хранения в архивную схему.
+Перед загрузкой исторических данных секции за прошлые периоды создаются параметром --from.
+
+Запуск по расписанию (например, из cron раз в сутки):
+    python -m insurance_app.scripts.partition_maintenance --months-ahead 3 --retain-months 60
+"""
+import argparse
+import logging
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from insurance_app.application.services.factory import ServiceFactory
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Обслуживание секций таблиц платежей и страховых случаев")
+    parser.add_argument("--url", default=None, help="URL базы данных (по умолчанию DATABASE_URL)")
+    parser.add_argument("--months-ahead", type=int, default=3, help="На сколько месяцев вперед создавать секции")
+    parser.add_argument("--retain-months", type=int, default=None,
+                        help="Срок хранения в месяцах: более старые секции отсоединяются (по умолчанию не отсоединяются)")
+    parser.add_argument("--archive-schema", default="archive", help="Схема для отсоединенных секций")
+    parser.add_argument("--from", dest="since", type=date.fromisoformat, default=None,
+                        help="Создать также секции начиная с этой даты, ГГГГ-ММ-ДД")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.url:
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=create_engine(args.url))
+    else:
+        from insurance_app.infrastructure.database.config import SessionLocal as session_factory
+
+    session = session_factory()
+    try:
+        partition_service = ServiceFactory.create_partition_service(session)
+        created = partition_service.ensure_partitions(args.since, date.today()).created if args.since else []
+        result = partition_service.maintain(args.months_ahead, args.retain_months, args.archive_schema)
+    finally:
+        session.close()
+
+    for partition in created + result.created:
+        logger.info("Создана секция %s: %s — %s", partition.name, partition.start, partition.end)
+    for partition in result.detached:
+        logger.info("Секция %s отсоединена в схему %s", partition.name, args.archive_schema)
+    if not created and not result.created and not result.detached:
+        logger.info("Изменений нет")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Фоновый обработчик конвейера страховых выплат.
+Создает выплаты по утвержденным страховым случаям без выплаты и переводит
+в статус PAID случаи с проведенной выплатой.
+
+Запуск:
+    python -m insurance_app.scripts.payout_worker --batch-size 500 --interval 5
+"""
+import argparse
+import logging
+import signal
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.models.payment import PayoutRunResult
+
+logger = logging.getLogger(__name__)
+
+
+class PayoutMetrics:
+    """Накопительные метрики пропускной способности обработчика выплат"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.cycles = 0
+        self.payouts_created = 0
+        self.claims_paid = 0
+        self.busy_seconds = 0.0
+
+    def record(self, result: PayoutRunResult, elapsed: float) -> None:
+        """Учитывает результат одного прохода"""
+        self.cycles += 1
+        self.payouts_created += len(result.payouts)
+        self.claims_paid += len(result.paid_claim_ids)
+        self.busy_seconds += elapsed
+
+    @property
+    def payouts_per_second(self) -> float:
+        """Количество созданных выплат в секунду рабочего времени (без простоя)"""
+        return self.payouts_created / self.busy_seconds if self.busy_seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "cycles": self.cycles,
+            "payouts_created": self.payouts_created,
+            "claims_paid": self.claims_paid,
+            "payouts_per_second": round(self.payouts_per_second, 1),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+        }
+
+
+class PayoutWorker:
+    """Циклически выполняет конвейер страховых выплат до получения сигнала остановки"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 500,
+        idle_interval: float = 5.0
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.idle_interval = idle_interval
+        self.metrics = PayoutMetrics()
+        self._stopping = False
+
+    def stop(self, *args) -> None:
+        """Останавливает обработчик после завершения текущего прохода"""
+        self._stopping = True
+
+    def run_once(self) -> PayoutRunResult:
+        """Выполняет один проход конвейера в отдельной сессии"""
+        started = time.monotonic()
+        session = self.session_factory()
+        try:
+            payment_service = ServiceFactory.create_payment_service(session)
+            result = payment_service.run_payout_pipeline(self.batch_size)
+        finally:
+            session.close()
+        elapsed = time.monotonic() - started
+
+        self.metrics.record(result, elapsed)
+        logger.info(
+            "Проход %d: выбрано случаев %d, создано выплат %d, оплачено случаев %d за %.3f с; %s",
+            self.metrics.cycles,
+            result.claims_scanned,
+            len(result.payouts),
+            len(result.paid_claim_ids),
+            elapsed,
+            self.metrics.as_dict()
+        )
+        return result
+
+    def run(self, max_cycles: Optional[int] = None) -> PayoutMetrics:
+        """
+        Выполняет проходы подряд, пока находятся полные пачки, и ждет idle_interval секунд,
+        когда очередь утвержденных случаев исчерпана
+        """
+        while not self._stopping and (max_cycles is None or self.metrics.cycles < max_cycles):
+            result = self.run_once()
+            drained = result.claims_scanned < self.batch_size and len(result.paid_claim_ids) < self.batch_size
+            if drained and not self._stopping:
+                time.sleep(self.idle_interval)
+        return self.metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Фоновый обработчик страховых выплат")
+    parser.add_argument("--batch-size", type=int, default=500, help="Количество страховых случаев в пачке")
+    parser.add_argument("--interval", type=float, default=5.0, help="Пауза в секундах, когда новых случаев нет")
+    parser.add_argument("--once", action="store_true", help="Выполнить один проход и завершиться")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from insurance_app.infrastructure.database.config import SessionLocal
+
+    worker = PayoutWorker(SessionLocal, batch_size=args.batch_size, idle_interval=args.interval)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+
+    metrics = worker.run(max_cycles=1 if args.once else None)
+    logger.info("Обработчик выплат остановлен: %s", metrics.as_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Обработчик полисов с истекшим сроком действия.
+Переводит действующие полисы, срок которых закончился, в статус EXPIRED, создает продления
+полисов с auto_renew и записывает события PolicyStatusChanged и PolicyRenewed.
+
+Запуск по расписанию (например, из cron раз в сутки):
+    python -m insurance_app.scripts.policy_expiry_worker --batch-size 1000 --once
+"""
+import argparse
+import logging
+import signal
+import time
+from datetime import date
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.models.policy import PolicyExpiryResult
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryMetrics:
+    """Накопительные метрики обработчика полисов с истекшим сроком"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.cycles = 0
+        self.policies_expired = 0
+        self.policies_renewed = 0
+        self.busy_seconds = 0.0
+
+    def record(self, result: PolicyExpiryResult, elapsed: float) -> None:
+        """Учитывает результат одного прохода"""
+        self.cycles += 1
+        self.policies_expired += len(result.expired_ids)
+        self.policies_renewed += len(result.renewals)
+        self.busy_seconds += elapsed
+
+    @property
+    def policies_per_second(self) -> float:
+        """Количество обработанных полисов в секунду рабочего времени (без простоя)"""
+        return self.policies_expired / self.busy_seconds if self.busy_seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "cycles": self.cycles,
+            "policies_expired": self.policies_expired,
+            "policies_renewed": self.policies_renewed,
+            "policies_per_second": round(self.policies_per_second, 1),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+        }
+
+
+class PolicyExpiryWorker:
+    """Обрабатывает полисы с истекшим сроком пачками; в непрерывном режиме — до получения сигнала остановки"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 500,
+        idle_interval: float = 3600.0,
+        as_of: Optional[date] = None
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.idle_interval = idle_interval
+        # Дата, на которую определяется истечение срока; по умолчанию текущая дата каждого прохода
+        self.as_of = as_of
+        self.metrics = ExpiryMetrics()
+        self._stopping = False
+
+    def stop(self, *args) -> None:
+        """Останавливает обработчик после завершения текущего прохода"""
+        self._stopping = True
+
+    def run_once(self) -> PolicyExpiryResult:
+        """Выполняет один проход в отдельной сессии"""
+        started = time.monotonic()
+        session = self.session_factory()
+        try:
+            policy_service = ServiceFactory.create_policy_service(session)
+            result = policy_service.process_expirations(self.batch_size, self.as_of)
+        finally:
+            session.close()
+        elapsed = time.monotonic() - started
+
+        self.metrics.record(result, elapsed)
+        logger.info(
+            "Проход %d: выбрано полисов %d, истекло %d, продлено %d за %.3f с; %s",
+            self.metrics.cycles,
+            result.policies_scanned,
+            len(result.expired_ids),
+            len(result.renewals),
+            elapsed,
+            self.metrics.as_dict()
+        )
+        return result
+
+    def run(self, drain_only: bool = False) -> ExpiryMetrics:
+        """
+        Выполняет проходы подряд, пока находятся полные пачки. Затем при drain_only завершается,
+        иначе ждет idle_interval секунд и повторяет
+        """
+        while not self._stopping:
+            result = self.run_once()
+            if result.policies_scanned < self.batch_size:
+                if drain_only:
+                    break
+                time.sleep(self.idle_interval)
+        return self.metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Обработчик полисов с истекшим сроком действия")
+    parser.add_argument("--batch-size", type=int, default=500, help="Количество полисов в пачке")
+    parser.add_argument("--interval", type=float, default=3600.0, help="Пауза в секундах между запусками")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                        help="Дата, на которую проверяется срок действия, ГГГГ-ММ-ДД (по умолчанию сегодня)")
+    parser.add_argument("--once", action="store_true", help="Обработать все истекшие полисы и завершиться")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from insurance_app.infrastructure.database.config import SessionLocal
+
+    worker = PolicyExpiryWorker(SessionLocal, batch_size=args.batch_size, idle_interval=args.interval, as_of=args.as_of)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+
+    metrics = worker.run(drain_only=args.once)
+    logger.info("Обработчик полисов остановлен: %s", metrics.as_dict())
+
+
+if __name__ == "__main__":
+    main()
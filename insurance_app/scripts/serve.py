@@ -0,0 +1,181 @@
+"""
+Запуск API в production-режиме.
+
+Мастер-процесс gunicorn загружает приложение до fork, поэтому код и данные модулей
+разделяются процессами-обработчиками по принципу copy-on-write, запускает N обработчиков
+uvicorn и перезапускает упавшие. Соединения пула, созданные до fork, закрываются в каждом
+обработчике. По SIGTERM обработчики перестают принимать соединения и завершают начатые запросы.
+Без gunicorn (например, в Windows) используется многопроцессный режим uvicorn без предзагрузки.
+
+Запуск:
+    python -m insurance_app.scripts.serve --workers 4 --port 8000
+"""
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+APP = "insurance_app.presentation.main:app"
+
+
+def default_workers() -> int:
+    """
+    Количество процессов-обработчиков: по одному на доступное ядро процессора.
+    Асинхронному обработчику не нужен запас процессов на ожидание ввода-вывода, как синхронному.
+    Переменная окружения WEB_CONCURRENCY имеет приоритет.
+    """
+    if os.getenv("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    try:
+        # Учитывает ограничение набора ядер контейнера или taskset
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return max(1, cpus)
+
+
+def event_loop() -> str:
+    """Цикл событий uvloop, если он установлен"""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    """HTTP-парсер httptools, если он установлен"""
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """Параметры сервера"""
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    # Очередь соединений, ожидающих accept, на время всплесков нагрузки
+    backlog: int = 2048
+    # Дольше типичного тайм-аута простоя балансировщика (60 с), чтобы соединение закрывал он,
+    # а не сервер посреди отправки следующего запроса
+    keepalive: int = 75
+    # Одновременных соединений на обработчик; сверх лимита сразу возвращается 503
+    limit_concurrency: Optional[int] = 1000
+    # Плановый перезапуск обработчика ограничивает рост памяти; разброс не дает перезапуститься всем сразу
+    max_requests: int = 10000
+    max_requests_jitter: int = 1000
+    # Время на завершение начатых запросов при остановке
+    graceful_timeout: int = 30
+    timeout: int = 60
+    preload: bool = True
+    loop: str = "asyncio"
+    http: str = "h11"
+
+
+def dispose_engine_after_fork(server=None, worker=None) -> None:
+    """Хук post_fork: соединения пула, унаследованные от мастер-процесса, не используются совместно"""
+    from insurance_app.infrastructure.database.config import dispose_engines
+
+    dispose_engines(close=False)
+
+
+def run_gunicorn(settings: ServerSettings) -> None:
+    """Запускает мастер-процесс gunicorn с обработчиками uvicorn"""
+    from gunicorn.app.base import BaseApplication
+    
+    class Application(BaseApplication):
+        def __init__(self):
+            # Параметры читает обработчик ProductionUvicornWorker
+            self.settings = settings
+            super().__init__()
+        
+        def load_config(self):
+            options = {
+                "bind": f"{settings.host}:{settings.port}",
+                "workers": settings.workers,
+                "worker_class": "insurance_app.scripts.gunicorn_worker.ProductionUvicornWorker",
+                "backlog": settings.backlog,
+                "keepalive": settings.keepalive,
+                "max_requests": settings.max_requests,
+                "max_requests_jitter": settings.max_requests_jitter,
+                "graceful_timeout": settings.graceful_timeout,
+                "timeout": settings.timeout,
+                "preload_app": settings.preload,
+                "post_fork": dispose_engine_after_fork,
+                "errorlog": "-",
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from insurance_app.presentation.main import app
+
+            return app
+
+    Application().run()
+
+
+def run_uvicorn(settings: ServerSettings) -> None:
+    """Запускает многопроцессный режим uvicorn: обработчики импортируют приложение самостоятельно"""
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop=settings.loop,
+        http=settings.http,
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.keepalive,
+        limit_concurrency=settings.limit_concurrency,
+        timeout_graceful_shutdown=settings.graceful_timeout,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Запуск API в production-режиме")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"), help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")), help="Порт")
+    parser.add_argument("--workers", type=int, default=default_workers(),
+                        help="Количество процессов-обработчиков (по умолчанию по числу ядер или WEB_CONCURRENCY)")
+    parser.add_argument("--backlog", type=int, default=ServerSettings.backlog, help="Размер очереди входящих соединений")
+    parser.add_argument("--keepalive", type=int, default=ServerSettings.keepalive,
+                        help="Время в секундах, в течение которого простаивающее keep-alive соединение остается открытым")
+    parser.add_argument("--limit-concurrency", type=int, default=ServerSettings.limit_concurrency,
+                        help="Максимум одновременных соединений на обработчик, сверх него возвращается 503")
+    parser.add_argument("--max-requests", type=int, default=ServerSettings.max_requests,
+                        help="Перезапускать обработчик после этого количества запросов (0 — не перезапускать)")
+    parser.add_argument("--graceful-timeout", type=int, default=ServerSettings.graceful_timeout,
+                        help="Время в секундах на завершение начатых запросов при остановке")
+    parser.add_argument("--no-preload", action="store_true", help="Не загружать приложение в мастер-процессе до fork")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    settings = ServerSettings(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        backlog=args.backlog,
+        keepalive=args.keepalive,
+        limit_concurrency=args.limit_concurrency or None,
+        max_requests=args.max_requests,
+        graceful_timeout=args.graceful_timeout,
+        preload=not args.no_preload,
+        loop=event_loop(),
+        http=http_protocol(),
+    )
+    # gunicorn не работает в Windows
+    gunicorn_available = sys.platform != "win32" and importlib.util.find_spec("gunicorn") is not None
+    logger.info("Запуск сервера (%s): %s", "gunicorn" if gunicorn_available else "uvicorn", asdict(settings))
+
+    if gunicorn_available:
+        run_gunicorn(settings)
+    else:
+        run_uvicorn(settings)
+
+
+if __name__ == "__main__":
+    main()
@@ -62,7 +62,7 @@ def app_client():
     from insurance_app.presentation.main import app
     
     # Переопределяем зависимость для тестов
-    from insurance_app.presentation.api.dependencies import get_db
+    from insurance_app.presentation.api.dependencies import get_db, get_primary_db
     
     # Создаем движок SQLite в памяти
     test_engine = create_engine(
@@ -87,6 +87,7 @@ def app_client():
     
     # Устанавливаем переопределенную зависимость
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_primary_db] = override_get_db
     
     # Создаем тестового клиента
     client = TestClient(app)
@@ -11,6 +11,7 @@ from insurance_app.domain.models.client import Client
 from insurance_app.domain.models.policy import Policy, PolicyStatus, PolicyType
 from insurance_app.domain.models.claim import Claim, ClaimStatus
 from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType
+from insurance_app.domain.models.reference import ClaimRef, PolicyRef
 from insurance_app.domain.models.user import User
 
 fake = Faker('ru_RU')
@@ -95,6 +96,7 @@ class PaymentFactory(factory.Factory):
     payment_method = factory.LazyFunction(lambda: fake.random_element(elements=["card", "bank_transfer", "cash"]))
     description = factory.Faker('text', max_nb_chars=100, locale='ru_RU')
     created_at = factory.LazyFunction(datetime.utcnow)
+    updated_at = factory.LazyFunction(datetime.utcnow)
     is_active = True
 
 
@@ -113,3 +115,13 @@ class UserFactory(factory.Factory):
     is_superuser = False
     roles = ["user"]
     created_at = factory.LazyFunction(datetime.utcnow)
+
+
+def policy_ref(policy: Policy) -> PolicyRef:
+    """Поля полиса, которые возвращает проверка ссылки на него"""
+    return PolicyRef(policy.id, policy.client_id, policy.policy_number, policy.status, policy.start_date, policy.end_date)
+
+
+def claim_ref(claim: Claim) -> ClaimRef:
+    """Поля страхового случая, которые возвращает проверка ссылки на него"""
+    return ClaimRef(claim.id, claim.client_id, claim.policy_id)
@@ -177,3 +177,9 @@ class TestAuthAPI:
         assert new_token_data["token_type"] == "bearer"
         # Проверяем, что токены разные
         assert new_token_data["access_token"] != access_token
+    
+    def test_documentation_is_public(self, app_client):
+        """Тестирование доступа к документации API без токена"""
+        # Act & Assert
+        for path in ("/api/docs", "/api/docs/oauth2-redirect", "/api/openapi.json"):
+            assert app_client.get(path).status_code == 200
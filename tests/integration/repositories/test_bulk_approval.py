@@ -0,0 +1,50 @@
+"""
+Интеграционные тесты пакетного утверждения страховых случаев и создания выплат
+"""
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.payment import PaymentType
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory
+
+
+def test_approve_bulk_and_create_payouts(db_session: Session):
+    """Утверждения и выплаты записываются пакетами и читаются обратно"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    claim_repository = ClaimRepositoryImpl(db_session)
+    claims = [
+        claim_repository.create(ClaimFactory(policy_id=policy.id, client_id=client.id, status=ClaimStatus.UNDER_REVIEW))
+        for _ in range(3)
+    ]
+    
+    loaded = claim_repository.get_by_ids([claim.id for claim in claims] + [uuid4()], for_update=True)
+    assert {claim.id for claim in loaded} == {claim.id for claim in claims}
+    
+    for claim in loaded:
+        claim.status = ClaimStatus.APPROVED
+        claim.approved_amount = Decimal("100.00")
+    claim_repository.approve_bulk(loaded)
+    
+    for claim in claim_repository.get_by_ids([claim.id for claim in claims]):
+        assert claim.status == ClaimStatus.APPROVED
+        assert claim.approved_amount == Decimal("100.00")
+    
+    payment_repository = PaymentRepositoryImpl(db_session)
+    payments = [
+        PaymentFactory(client_id=client.id, policy_id=policy.id, claim_id=claim.id, payment_type=PaymentType.CLAIM_PAYOUT)
+        for claim in loaded
+    ]
+    payment_repository.create_bulk(payments)
+    
+    stored = payment_repository.get_by_ids([payment.id for payment in payments])
+    assert {payment.claim_id for payment in stored} == {claim.id for claim in claims}
@@ -0,0 +1,168 @@
+"""
+Интеграционные тесты массовой загрузки данных из CSV
+"""
+import io
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services import job_handlers
+from insurance_app.application.services.import_service import ImportServiceImpl
+from insurance_app.domain.exceptions import BusinessRuleViolationException
+from insurance_app.domain.models.bulk_import import ImportEntity
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.payment import PaymentType
+from insurance_app.domain.models.policy import PolicyStatus, PolicyType
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    ImportRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import PaymentFactory
+
+
+def _csv(*lines: str) -> io.BytesIO:
+    return io.BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+
+
+@pytest.fixture
+def import_service(db_session: Session) -> ImportServiceImpl:
+    # Маленький пакет, чтобы загрузка проходила несколькими INSERT
+    return ImportServiceImpl(ImportRepositoryImpl(db_session, batch_size=2))
+
+
+def test_import_book_of_business(db_session: Session, import_service: ImportServiceImpl):
+    """Клиенты, полисы, случаи и платежи загружаются по естественным ключам"""
+    consumed = []
+    clients_file = _csv(
+        "email,first_name,last_name,birth_date",
+        "ivanov@example.com,Иван,Иванов,1980-05-01",
+        "petrova@example.com,Мария,Петрова,",
+        "sidorov@example.com,Петр,Сидоров,1990-01-01",
+    )
+    clients = import_service.import_csv(ImportEntity.CLIENTS, clients_file, progress=consumed.append)
+    assert (clients.loaded, clients.inserted, clients.rejected) == (3, 3, 0)
+    assert consumed[-1] == len(clients_file.getvalue())
+
+    policies = import_service.import_csv(ImportEntity.POLICIES, _csv(
+        "policy_number,client_email,type,status,start_date,end_date,coverage_amount,premium_amount",
+        "LEG-1,ivanov@example.com,vehicle,active,2024-01-01,2025-01-01,500000.00,12000.50",
+        "LEG-2,petrova@example.com,HEALTH,,2024-02-01,2025-02-01,100000,3000",
+    ))
+    assert (policies.inserted, policies.rejected) == (2, 0)
+
+    claims = import_service.import_csv(ImportEntity.CLAIMS, _csv(
+        "claim_number,policy_number,incident_date,report_date,status,claim_amount,approved_amount",
+        "LCL-1,LEG-1,2024-03-01,2024-03-02,paid,20000,15000",
+    ))
+    payments = import_service.import_csv(ImportEntity.PAYMENTS, _csv(
+        "payment_number,policy_number,claim_number,amount,payment_date,status,payment_type",
+        "LPY-1,LEG-1,,1000.00,2024-01-05,completed,premium",
+        "LPY-2,LEG-1,LCL-1,15000,2024-03-10,completed,claim_payout",
+    ))
+    assert (claims.inserted, payments.inserted) == (1, 2)
+
+    client = ClientRepositoryImpl(db_session).get_by_email("ivanov@example.com")
+    policy = PolicyRepositoryImpl(db_session).get_by_policy_number("LEG-1")
+    assert policy.client_id == client.id
+    assert (policy.type, policy.status, policy.premium_amount) == (PolicyType.VEHICLE, PolicyStatus.ACTIVE, Decimal("12000.50"))
+    assert PolicyRepositoryImpl(db_session).get_by_policy_number("LEG-2").status == PolicyStatus.PENDING
+
+    claim = ClaimRepositoryImpl(db_session).get_by_claim_number("LCL-1")
+    assert (claim.policy_id, claim.client_id, claim.status) == (policy.id, client.id, ClaimStatus.PAID)
+    payout = PaymentRepositoryImpl(db_session).get_by_payment_number("LPY-2")
+    assert (payout.claim_id, payout.payment_type) == (claim.id, PaymentType.CLAIM_PAYOUT)
+    # Загруженная выплата занимает случай для последующих выплат
+    with pytest.raises(BusinessRuleViolationException):
+        PaymentRepositoryImpl(db_session).create(PaymentFactory(
+            client_id=client.id, policy_id=policy.id, claim_id=claim.id, payment_type=PaymentType.CLAIM_PAYOUT
+        ))
+
+
+def test_import_rejects_invalid_rows_and_updates_existing(db_session: Session, import_service: ImportServiceImpl):
+    import_service.import_csv(ImportEntity.CLIENTS, _csv(
+        "email,first_name,last_name",
+        "ivanov@example.com,Иван,Иванов",
+    ))
+
+    result = import_service.import_csv(ImportEntity.POLICIES, _csv(
+        "policy_number,client_email,type,coverage_amount,premium_amount,start_date",
+        "LEG-1,ivanov@example.com,life,100000,1000,2024-01-01",
+        "LEG-2,unknown@example.com,life,100000,1000,2024-01-01",
+        "LEG-3,ivanov@example.com,boat,100000,1000,2024-01-01",
+        "LEG-4,ivanov@example.com,life,сто,1000,2024-01-01",
+        "LEG-5,ivanov@example.com,life,100000,1000,2024-13-01",
+        "LEG-1,ivanov@example.com,life,200000,2000,2024-01-01",
+    ))
+    assert (result.loaded, result.inserted, result.rejected) == (6, 1, 5)
+    assert [rejection.row for rejection in result.rejections] == [2, 3, 4, 5, 6]
+    assert result.rejections[0].reason == "client_email: клиент не найден"
+    assert result.rejections[1].reason.startswith("type:")
+    assert result.rejections[4].reason == "policy_number: значение повторяется в файле"
+
+    updated = import_service.import_csv(ImportEntity.POLICIES, _csv(
+        "policy_number,client_email,type,coverage_amount,premium_amount",
+        "LEG-1,ivanov@example.com,life,300000,3000",
+    ))
+    assert (updated.inserted, updated.updated) == (0, 1)
+    policy = PolicyRepositoryImpl(db_session).get_by_policy_number("LEG-1")
+    assert (policy.coverage_amount, policy.version) == (Decimal("300000"), 2)
+
+
+def test_import_checks_header(import_service: ImportServiceImpl):
+    with pytest.raises(ValueError, match="нет обязательных столбцов: last_name"):
+        import_service.import_csv(ImportEntity.CLIENTS, _csv("email,first_name", "a@example.com,Иван"))
+    with pytest.raises(ValueError, match="Неизвестные столбцы"):
+        import_service.import_csv(ImportEntity.CLIENTS, _csv("email,first_name,last_name,salary", "a@example.com,И,И,1"))
+
+
+def test_import_rejects_impossible_dates(db_session: Session, import_service: ImportServiceImpl):
+    result = import_service.import_csv(ImportEntity.CLIENTS, _csv(
+        "email,first_name,last_name,birth_date",
+        "a@example.com,Иван,Иванов,2023-02-30",
+        "b@example.com,Мария,Петрова,2023-02-29",
+        "c@example.com,Петр,Сидоров,2023-04-31",
+        "d@example.com,Анна,Смирнова,2024-02-29",
+        "e@example.com,Олег,Орлов,2000-02-29",
+        "f@example.com,Елена,Козлова,1900-02-29",
+    ))
+    
+    assert (result.inserted, result.rejected) == (2, 4)
+    assert [rejection.row for rejection in result.rejections] == [1, 2, 3, 6]
+    assert result.rejections[0].reason == "birth_date: несуществующая дата"
+    assert {client.email for client in ClientRepositoryImpl(db_session).get_all()} == {"d@example.com", "e@example.com"}
+
+
+def test_strict_import_discards_file(db_session: Session, import_service: ImportServiceImpl):
+    result = import_service.import_csv(ImportEntity.CLIENTS, _csv(
+        "email,first_name,last_name",
+        "ivanov@example.com,Иван,Иванов",
+        "petrova@example.com,Мария,",
+    ), strict=True)
+
+    assert (result.merged, result.rejected, result.inserted) == (False, 1, 0)
+    assert result.rejections[0].reason == "last_name: обязательное поле"
+    assert ClientRepositoryImpl(db_session).get_by_email("ivanov@example.com") is None
+
+
+def test_import_job_reads_only_import_dir(db_session: Session, tmp_path, monkeypatch):
+    """Задача import.csv читает файлы только из каталога IMPORT_DIR"""
+    import_dir = tmp_path / "import"
+    import_dir.mkdir()
+    (import_dir / "clients.csv").write_text("email,first_name,last_name\nivanov@example.com,Иван,Иванов\n")
+    (tmp_path / "secret.csv").write_text("root:x:0:0\n")
+    progress = lambda current, total: None
+
+    monkeypatch.setattr(job_handlers, "IMPORT_DIR", str(import_dir))
+    result = job_handlers.import_csv(db_session, {"files": {"clients": "clients.csv"}}, progress)
+    assert result["clients"]["inserted"] == 1
+    for path in ("../secret.csv", str(tmp_path / "secret.csv")):
+        with pytest.raises(ValueError, match="вне каталога загрузки"):
+            job_handlers.import_csv(db_session, {"files": {"clients": path}}, progress)
+
+    monkeypatch.setattr(job_handlers, "IMPORT_DIR", None)
+    with pytest.raises(ValueError, match="IMPORT_DIR"):
+        job_handlers.import_csv(db_session, {"files": {"clients": "clients.csv"}}, progress)
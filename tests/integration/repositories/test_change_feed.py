@@ -0,0 +1,80 @@
+"""
+Интеграционные тесты ленты изменений
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.change_feed_service import ChangeFeedServiceImpl
+from insurance_app.domain.models.change import ChangePosition
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory
+
+
+@pytest.fixture
+def changed_entities(db_session: Session):
+    """Создает страховые случаи и платежи с известным временем изменения"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    base = datetime.utcnow() - timedelta(minutes=10)
+    claims = ClaimRepositoryImpl(db_session)
+    payments = PaymentRepositoryImpl(db_session)
+    return [
+        claims.create(ClaimFactory(policy_id=policy.id, client_id=client.id, updated_at=base)),
+        payments.create(PaymentFactory(client_id=client.id, policy_id=policy.id, updated_at=base + timedelta(seconds=1))),
+        claims.create(ClaimFactory(policy_id=policy.id, client_id=client.id, updated_at=base + timedelta(seconds=2))),
+        payments.create(PaymentFactory(client_id=client.id, policy_id=policy.id, updated_at=base + timedelta(seconds=3))),
+    ]
+
+
+def test_get_changed_since_uses_keyset(db_session: Session, changed_entities):
+    """Записи читаются строго после позиции в порядке (updated_at, id)"""
+    repository = ClaimRepositoryImpl(db_session)
+    first, _, second, _ = changed_entities
+    until = datetime.utcnow()
+    
+    assert [c.id for c in repository.get_changed_since(None, until)] == [first.id, second.id]
+    after_first = ChangePosition(first.updated_at, first.id)
+    assert [c.id for c in repository.get_changed_since(after_first, until)] == [second.id]
+    assert repository.get_changed_since(None, first.updated_at - timedelta(seconds=1)) == []
+
+
+def test_feed_pages_through_all_changes(db_session: Session, changed_entities):
+    """Постраничное чтение по курсору возвращает все изменения ровно один раз в порядке времени"""
+    service = ChangeFeedServiceImpl(ClaimRepositoryImpl(db_session), PaymentRepositoryImpl(db_session))
+    
+    seen = []
+    cursor = None
+    while True:
+        batch = service.get_changes(cursor, limit=3)
+        seen.extend(change.entity.id for change in batch.changes)
+        cursor = batch.cursor
+        if not batch.has_more:
+            break
+    
+    assert seen == [entity.id for entity in changed_entities]
+    assert service.get_changes(cursor).changes == []
+
+
+def test_update_moves_entity_past_cursor(db_session: Session, changed_entities):
+    """Измененная запись снова появляется в ленте после курсора"""
+    service = ChangeFeedServiceImpl(
+        ClaimRepositoryImpl(db_session),
+        PaymentRepositoryImpl(db_session),
+        settle_delay=timedelta(0)
+    )
+    cursor = service.get_changes(limit=100).cursor
+    
+    payment = changed_entities[1]
+    payment.description = "Изменено"
+    payment.updated_at = datetime.utcnow()
+    PaymentRepositoryImpl(db_session).update(payment)
+    
+    batch = service.get_changes(cursor)
+    assert [(change.entity_type, change.entity.id) for change in batch.changes] == [("payment", payment.id)]
@@ -0,0 +1,51 @@
+"""
+Интеграционные тесты репозитория страховых случаев
+"""
+import pytest
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.models.claim import ClaimStatus, allowed_source_statuses
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClaimFactory, ClientFactory, PolicyFactory
+
+
+@pytest.fixture
+def claims(db_session: Session):
+    """Создает страховые случаи в разных статусах"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    repository = ClaimRepositoryImpl(db_session)
+    return {
+        status: repository.create(ClaimFactory(policy_id=policy.id, client_id=client.id, status=status))
+        for status in (ClaimStatus.PENDING, ClaimStatus.DENIED, ClaimStatus.CLOSED)
+    }
+
+
+def test_update_status_bulk_only_allowed_transitions(db_session: Session, claims):
+    """Одним запросом обновляются только случаи в допустимых исходных статусах"""
+    repository = ClaimRepositoryImpl(db_session)
+    claim_ids = [claim.id for claim in claims.values()] + [uuid4()]
+    
+    updated_ids = repository.update_status_bulk(
+        claim_ids, ClaimStatus.UNDER_REVIEW, allowed_source_statuses(ClaimStatus.UNDER_REVIEW)
+    )
+    
+    assert set(updated_ids) == {claims[ClaimStatus.PENDING].id, claims[ClaimStatus.DENIED].id}
+    assert repository.get_by_id(claims[ClaimStatus.PENDING].id).status == ClaimStatus.UNDER_REVIEW
+    assert repository.get_by_id(claims[ClaimStatus.CLOSED].id).status == ClaimStatus.CLOSED
+
+
+def test_get_statuses(db_session: Session, claims):
+    """Статусы возвращаются только для существующих случаев"""
+    repository = ClaimRepositoryImpl(db_session)
+    closed = claims[ClaimStatus.CLOSED]
+    
+    result = repository.get_statuses([closed.id, uuid4()])
+    
+    assert result == {closed.id: ClaimStatus.CLOSED}
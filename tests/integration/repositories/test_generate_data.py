@@ -0,0 +1,52 @@
+"""
+Интеграционные тесты генератора синтетических данных
+"""
+from datetime import date
+
+from sqlalchemy import create_engine, text
+
+from insurance_app.scripts.generate_data import COLUMNS, generate, generate_chunk, prepare
+
+AS_OF = date(2026, 1, 1)
+
+
+def test_chunk_boundaries_do_not_change_data():
+    whole = generate_chunk(0, 20, seed=7, as_of=AS_OF)
+    first, second = generate_chunk(0, 8, seed=7, as_of=AS_OF), generate_chunk(8, 12, seed=7, as_of=AS_OF)
+
+    for (table, rows), (_, head), (_, tail) in zip(whole.rows(), first.rows(), second.rows()):
+        assert rows == head + tail, table
+    assert generate_chunk(0, 20, seed=8, as_of=AS_OF).clients != whole.clients
+
+
+def test_generated_rows_are_correlated():
+    chunk = generate_chunk(0, 200, seed=1, as_of=AS_OF)
+    column = {table: {name: i for i, name in enumerate(columns)} for table, columns in COLUMNS.items()}
+    policies = {row[column["policies"]["id"]]: row for row in chunk.policies}
+    client_ids = {row[column["clients"]["id"]] for row in chunk.clients}
+
+    assert all(row[column["policies"]["client_id"]] in client_ids for row in policies.values())
+    for claim in chunk.claims:
+        policy = policies[claim[column["claims"]["policy_id"]]]
+        assert claim[column["claims"]["client_id"]] == policy[column["policies"]["client_id"]]
+        assert claim[column["claims"]["claim_amount"]] <= policy[column["policies"]["coverage_amount"]]
+        assert policy[column["policies"]["start_date"]] <= claim[column["claims"]["incident_date"]] <= AS_OF
+    assert len({row[column["payments"]["payment_number"]] for row in chunk.payments}) == len(chunk.payments)
+
+
+def test_generate_writes_all_tables(tmp_path):
+    url = f"sqlite:///{tmp_path / 'generated.db'}"
+    prepare(url, reset=True)
+
+    totals = generate(url, clients=50, seed=3, as_of=AS_OF, workers=4, chunk_size=20)
+
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        for table, count in totals.items():
+            assert connection.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() == count
+        orphans = connection.execute(text(
+            "SELECT COUNT(*) FROM payments p LEFT JOIN policies po ON po.id = p.policy_id WHERE po.id IS NULL"
+        )).scalar()
+    engine.dispose()
+    assert totals["clients"] == 50
+    assert orphans == 0
@@ -0,0 +1,44 @@
+"""
+Интеграционные тесты репозитория ключей идемпотентности
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+from insurance_app.infrastructure.database.repositories import IdempotencyRepositoryImpl
+
+
+def _record(key: str, expires_in: timedelta = timedelta(hours=1)) -> IdempotencyRecord:
+    return IdempotencyRecord(
+        user_id="user",
+        key=key,
+        request_hash="hash",
+        expires_at=datetime.utcnow() + expires_in,
+        created_at=datetime.utcnow()
+    )
+
+
+def test_try_create_and_complete(db_session: Session):
+    """Повторное создание записи с тем же ключом отклоняется, ответ сохраняется"""
+    repository = IdempotencyRepositoryImpl(db_session)
+    
+    assert repository.try_create(_record("key"))
+    assert not repository.try_create(_record("key"))
+    
+    repository.complete("user", "key", 201, '{"id": 1}')
+    
+    stored = repository.get("user", "key")
+    assert stored.is_completed
+    assert (stored.status_code, stored.response_body) == (201, '{"id": 1}')
+
+
+def test_delete_expired(db_session: Session):
+    """Удаляются только записи с истекшим сроком хранения"""
+    repository = IdempotencyRepositoryImpl(db_session)
+    repository.try_create(_record("expired", timedelta(seconds=-1)))
+    repository.try_create(_record("actual"))
+    
+    assert repository.delete_expired(datetime.utcnow()) == 1
+    assert repository.get("user", "expired") is None
+    assert repository.get("user", "actual") is not None
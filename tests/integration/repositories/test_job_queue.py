@@ -0,0 +1,137 @@
+"""
+Интеграционные тесты очереди фоновых задач
+"""
+import threading
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.job_handlers import JOB_HANDLERS
+from insurance_app.domain.models.job import Job, JobStatus
+from insurance_app.infrastructure.database.repositories import JobRepositoryImpl
+from insurance_app.scripts.job_worker import JobWorker
+
+
+def _job(job_type: str, run_after: datetime, **kwargs) -> Job:
+    return Job(id=uuid4(), job_type=job_type, run_after=run_after, created_at=run_after, **kwargs)
+
+
+@pytest.fixture
+def test_handlers():
+    """Регистрирует обработчики задач на время теста"""
+    calls = []
+    
+    def succeed(session, payload, progress):
+        progress(1, 2)
+        calls.append(payload)
+        return {"ok": True}
+    
+    def explode(session, payload, progress):
+        raise RuntimeError("сбой")
+    
+    JOB_HANDLERS["test.succeed"] = succeed
+    JOB_HANDLERS["test.explode"] = explode
+    yield calls
+    del JOB_HANDLERS["test.succeed"]
+    del JOB_HANDLERS["test.explode"]
+
+
+def test_claim_next_respects_order_and_schedule(db_session: Session):
+    """Задачи выбираются по времени готовности, отложенные и уже выбранные пропускаются"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    later = repository.create(_job("test.succeed", now - timedelta(seconds=1)))
+    first = repository.create(_job("test.succeed", now - timedelta(seconds=10)))
+    repository.create(_job("test.succeed", now + timedelta(hours=1)))
+    
+    claimed = [repository.claim_next("worker", now) for _ in range(3)]
+    
+    assert [job.id if job else None for job in claimed] == [first.id, later.id, None]
+    assert claimed[0].status == JobStatus.RUNNING
+    assert claimed[0].attempts == 1
+    assert claimed[0].locked_by == "worker"
+
+
+def test_requeue_stale(db_session: Session):
+    """Задачи зависших обработчиков возвращаются в очередь"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    job = repository.create(_job("test.succeed", now - timedelta(hours=2)))
+    repository.claim_next("worker", now - timedelta(hours=1))
+    
+    assert repository.requeue_stale(now - timedelta(minutes=30)) == 1
+    assert repository.get_by_id(job.id).status == JobStatus.PENDING
+
+
+def test_requeue_stale_fails_exhausted_jobs(db_session: Session):
+    """Задача, обработчик которой перестал отвечать на последней попытке, завершается ошибкой"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    job = repository.create(_job("test.succeed", now - timedelta(hours=2), max_attempts=1))
+    repository.claim_next("worker", now - timedelta(hours=1))
+    
+    assert repository.requeue_stale(now - timedelta(minutes=30)) == 1
+    failed = repository.get_by_id(job.id)
+    assert (failed.status, failed.locked_by) == (JobStatus.FAILED, None)
+    assert repository.claim_next("worker", now) is None
+
+
+def test_progress_extends_lock_and_stale_worker_cannot_finish(db_session: Session):
+    """Прогресс продлевает блокировку; обработчик, чью задачу вернули в очередь, не перезаписывает ее"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    job = repository.create(_job("test.succeed", now - timedelta(hours=2)))
+    repository.claim_next("first", now - timedelta(hours=1))
+    
+    assert repository.update_progress(job.id, "first", 10)
+    assert repository.requeue_stale(now - timedelta(minutes=30)) == 0
+    
+    assert repository.heartbeat(job.id, "first", now - timedelta(hours=1))
+    assert repository.requeue_stale(now - timedelta(minutes=30)) == 1
+    repository.claim_next("second", now)
+    
+    assert not repository.update_progress(job.id, "first", 20)
+    assert not repository.mark_succeeded(job.id, "first", {"ok": True}, now)
+    assert repository.mark_succeeded(job.id, "second", {"ok": False}, now)
+    done = repository.get_by_id(job.id)
+    assert (done.status, done.result, done.progress_current) == (JobStatus.SUCCEEDED, {"ok": False}, 10)
+
+
+def test_worker_runs_and_retries_jobs(db_session: Session, test_handlers):
+    """Обработчик сохраняет прогресс и результат, при ошибке планирует повтор"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    succeeded = repository.create(_job("test.succeed", now - timedelta(seconds=2), payload={"n": 1}))
+    failed = repository.create(_job("test.explode", now - timedelta(seconds=1), max_attempts=2))
+    
+    worker = JobWorker(lambda: db_session, worker_id="worker")
+    assert worker.run_once().status == JobStatus.SUCCEEDED
+    assert worker.run_once().status == JobStatus.PENDING
+    assert worker.run_once() is None
+    
+    done = repository.get_by_id(succeeded.id)
+    assert (done.status, done.result, done.progress_current, done.progress_total) == (JobStatus.SUCCEEDED, {"ok": True}, 1, 2)
+    assert test_handlers == [{"n": 1}]
+    
+    retried = repository.get_by_id(failed.id)
+    assert retried.status == JobStatus.PENDING
+    assert retried.error == "RuntimeError: сбой"
+    assert retried.run_after > now
+
+
+def test_worker_heartbeat_extends_lock(db_session: Session):
+    """Обработчик продлевает блокировку задачи, пока она выполняется, даже без сообщений о прогрессе"""
+    repository = JobRepositoryImpl(db_session)
+    now = datetime.utcnow()
+    job = repository.create(_job("test.succeed", now - timedelta(hours=2)))
+    claimed = repository.claim_next("worker", now - timedelta(hours=1))
+    worker = JobWorker(lambda: db_session, worker_id="worker", heartbeat_interval=0.01)
+    finished = threading.Event()
+    threading.Timer(0.1, finished.set).start()
+    
+    worker._heartbeat(claimed, finished)
+    
+    assert repository.get_by_id(job.id).locked_at > now - timedelta(minutes=1)
+    assert repository.requeue_stale(now - timedelta(minutes=30)) == 0
@@ -0,0 +1,54 @@
+"""
+Интеграционные тесты выделения блоков номеров
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from insurance_app.application.services.number_generator import NumberBlocks, NumberGeneratorImpl
+from insurance_app.application.services.policy_service import PolicyServiceImpl
+from insurance_app.infrastructure.database.config import Base
+from insurance_app.infrastructure.database.repositories import (
+    ClientRepositoryImpl,
+    NumberSequenceRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClientFactory, PolicyFactory
+
+
+def test_blocks_are_allocated_per_sequence(db_session: Session):
+    """Блоки последовательностей нумеруются с 1 независимо друг от друга"""
+    repository = NumberSequenceRepositoryImpl(db_session)
+    
+    assert [repository.next_block("policy") for _ in range(3)] == [1, 2, 3]
+    assert repository.next_block("claim") == 1
+    with pytest.raises(ValueError):
+        repository.next_block("users")
+
+
+def test_block_allocation_survives_rollback(tmp_path):
+    """Блок выделяется в отдельной транзакции и не выдается повторно после отката сессии"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'numbers.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    
+    first = NumberSequenceRepositoryImpl(session).next_block("payment")
+    session.rollback()
+    second = NumberSequenceRepositoryImpl(session).next_block("payment")
+    
+    assert (first, second) == (1, 2)
+    session.close()
+    engine.dispose()
+
+
+def test_policy_numbers_come_from_sequence(db_session: Session):
+    """Номера новых полисов выдаются из блоков последовательности policy"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    number_generator = NumberGeneratorImpl(NumberSequenceRepositoryImpl(db_session), NumberBlocks(block_size=2))
+    service = PolicyServiceImpl(
+        PolicyRepositoryImpl(db_session), ClientRepositoryImpl(db_session), number_generator=number_generator
+    )
+    
+    policies = [service.create(PolicyFactory(client_id=client.id, policy_number=None)) for _ in range(3)]
+    
+    assert [policy.policy_number for policy in policies] == ["POL-0000000001", "POL-0000000002", "POL-0000000003"]
@@ -0,0 +1,74 @@
+"""
+Интеграционные тесты таблицы исходящих событий
+"""
+import json
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.events import ClaimApproved
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.outbox import OutboxEvent
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    OutboxRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from insurance_app.infrastructure.messaging import FileEventSink
+from tests.factories import ClaimFactory, ClientFactory, PolicyFactory
+
+
+def _claim_under_review(db_session: Session):
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(
+        PolicyFactory(client_id=client.id, coverage_amount=Decimal("100000.00"))
+    )
+    return ClaimRepositoryImpl(db_session).create(ClaimFactory(
+        policy_id=policy.id,
+        client_id=client.id,
+        status=ClaimStatus.UNDER_REVIEW,
+        claim_amount=Decimal("5000.00")
+    ))
+
+
+def test_event_committed_with_state_change(db_session: Session):
+    """Событие сохраняется в той же транзакции, что и утверждение страхового случая"""
+    claim = _claim_under_review(db_session)
+    
+    ServiceFactory.create_claim_service(db_session).approve_claim(claim.id, Decimal("1000.00"))
+    
+    events = OutboxRepositoryImpl(db_session).get_unpublished()
+    assert [(event.event_type, event.aggregate_id) for event in events] == [("ClaimApproved", claim.id)]
+
+
+def test_event_discarded_on_rollback(db_session: Session):
+    """Событие не сохраняется, если транзакция с изменением состояния откатывается"""
+    claim = _claim_under_review(db_session)
+    repository = OutboxRepositoryImpl(db_session)
+    
+    repository.add(OutboxEvent.from_domain_event(ClaimApproved(
+        claim_id=claim.id,
+        policy_id=claim.policy_id,
+        client_id=claim.client_id,
+        approved_amount=Decimal("1000.00")
+    )))
+    db_session.rollback()
+    
+    assert repository.get_unpublished() == []
+
+
+def test_relay_publishes_to_file_sink(db_session: Session, tmp_path):
+    """Ретранслятор публикует события и больше не выбирает их"""
+    claim = _claim_under_review(db_session)
+    ServiceFactory.create_claim_service(db_session).approve_claim(claim.id, Decimal("1000.00"))
+    path = tmp_path / "events.jsonl"
+    
+    relay = ServiceFactory.create_outbox_relay(db_session, [FileEventSink(str(path))])
+    
+    assert relay.relay_batch() == 1
+    assert relay.relay_batch() == 0
+    message = json.loads(path.read_text(encoding="utf-8"))
+    assert message["event_type"] == "ClaimApproved"
+    assert message["payload"]["claim_id"] == str(claim.id)
@@ -0,0 +1,71 @@
+"""
+Интеграционные тесты выборок по ключу секционирования и обслуживания секций
+"""
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.job_handlers import maintain_partitions
+from insurance_app.application.services.partition_service import PartitionServiceImpl
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    PartitionRepositoryImpl,
+    PaymentRepositoryImpl
+)
+from tests.factories import ClaimFactory, PaymentFactory
+
+
+def test_payments_by_creation_period(db_session: Session):
+    """Платежи выбираются за период создания включительно, версии страницы — с теми же фильтрами"""
+    repository = PaymentRepositoryImpl(db_session)
+    september, october_first, october_last, november = [
+        repository.create(PaymentFactory(created_at=created_at))
+        for created_at in (
+            datetime(2026, 9, 30, 23, 59), datetime(2026, 10, 1), datetime(2026, 10, 31, 18, 30), datetime(2026, 11, 1)
+        )
+    ]
+
+    october = repository.get_by_period(date(2026, 10, 1), date(2026, 10, 31))
+    since_october = repository.get_by_period(created_from=date(2026, 10, 1), client_id=november.client_id)
+    versions = repository.get_versions(created_from=date(2026, 10, 1), created_to=date(2026, 10, 31))
+
+    assert {payment.id for payment in october} == {october_first.id, october_last.id}
+    assert [payment.id for payment in since_october] == [november.id]
+    assert {version.id for version in versions} == {october_first.id, october_last.id}
+    assert repository.get_by_period(created_to=date(2026, 9, 30))[0].id == september.id
+
+
+def test_claims_by_report_period(db_session: Session):
+    """Страховые случаи выбираются за период заявления включительно"""
+    repository = ClaimRepositoryImpl(db_session)
+    claims = [
+        repository.create(ClaimFactory(report_date=report_date))
+        for report_date in (date(2026, 9, 30), date(2026, 10, 1), date(2026, 10, 31), date(2026, 11, 1))
+    ]
+
+    october = repository.get_by_period(date(2026, 10, 1), date(2026, 10, 31))
+    by_policy = repository.get_by_period(date(2026, 10, 1), date(2026, 10, 31), policy_id=claims[1].policy_id)
+
+    assert {claim.id for claim in october} == {claims[1].id, claims[2].id}
+    assert [claim.id for claim in by_policy] == [claims[1].id]
+    assert len(repository.get_versions(reported_from=date(2026, 10, 1))) == 3
+
+
+def test_partition_maintenance_without_partitioning(db_session: Session):
+    """В SQLite таблицы не секционированы, и обслуживание секций ничего не делает"""
+    repository = PartitionRepositoryImpl(db_session)
+    result = PartitionServiceImpl(repository).maintain(months_ahead=3, retain_months=12)
+
+    assert repository.get_partitioned_tables() == []
+    assert (result.created, result.detached) == ([], [])
+
+
+def test_partition_job_does_not_detach(db_session: Session):
+    """Фоновая задача только создает секции, отсоединение через API задач запрещено"""
+    progress = lambda current, total: None
+
+    assert maintain_partitions(db_session, {"months_ahead": 3}, progress) == {"created": []}
+    for payload in ({"retain_months": 0}, {"archive_schema": "public"}):
+        with pytest.raises(ValueError, match="partition_maintenance"):
+            maintain_partitions(db_session, payload, progress)
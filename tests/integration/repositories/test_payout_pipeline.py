@@ -0,0 +1,150 @@
+"""
+Интеграционные тесты конвейера страховых выплат
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.exceptions import BusinessRuleViolationException
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.domain.models.payment import PaymentStatus, PaymentType
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from insurance_app.scripts.payout_worker import PayoutWorker
+from tests.factories import ClaimFactory, ClientFactory, PaymentFactory, PolicyFactory
+
+
+@pytest.fixture
+def approved_claims(db_session: Session):
+    """Создает утвержденные страховые случаи без выплат"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    repository = ClaimRepositoryImpl(db_session)
+    return [
+        repository.create(ClaimFactory(
+            policy_id=policy.id,
+            client_id=client.id,
+            status=ClaimStatus.APPROVED,
+            approved_amount=Decimal("500.00")
+        ))
+        for _ in range(3)
+    ]
+
+
+def _payout(claim, status=PaymentStatus.PENDING):
+    return PaymentFactory(
+        client_id=claim.client_id,
+        policy_id=claim.policy_id,
+        claim_id=claim.id,
+        payment_type=PaymentType.CLAIM_PAYOUT,
+        status=status
+    )
+
+
+def test_create_payouts_bulk_is_idempotent(db_session: Session, approved_claims):
+    """Повторная выплата по страховому случаю пропускается"""
+    repository = PaymentRepositoryImpl(db_session)
+    first, second, third = approved_claims
+    
+    created = repository.create_payouts_bulk([_payout(first), _payout(second)])
+    repeated = repository.create_payouts_bulk([_payout(first), _payout(third)])
+    
+    assert [payment.claim_id for payment in created] == [first.id, second.id]
+    assert [payment.claim_id for payment in repeated] == [third.id]
+    assert len(repository.get_by_claim_id(first.id)) == 1
+
+
+def test_create_payouts_bulk_locks_claims(db_session: Session, approved_claims):
+    """Строки страховых случаев блокируются до проверки существующих выплат"""
+    statements = []
+    event.listen(db_session, "do_orm_execute", lambda state: statements.append(state.statement))
+    first, second, _ = approved_claims
+    
+    PaymentRepositoryImpl(db_session).create_payouts_bulk([_payout(second), _payout(first)])
+    
+    sql = [str(statement.compile(dialect=postgresql.dialect())) for statement in statements[:2]]
+    assert "FROM claims" in sql[0] and sql[0].endswith("FOR UPDATE")
+    assert "FROM claim_payouts" in sql[1]
+
+
+def test_second_payout_per_claim_is_rejected(db_session: Session, approved_claims):
+    """Вторая выплата по случаю отклоняется, в том числе без блокировки строки случая вызывающим кодом"""
+    repository = PaymentRepositoryImpl(db_session)
+    repository.create(_payout(approved_claims[0]))
+    
+    with pytest.raises(BusinessRuleViolationException):
+        repository.create(_payout(approved_claims[0]))
+
+
+def test_update_to_second_payout_is_rejected(db_session: Session, approved_claims):
+    """Платеж нельзя превратить во вторую выплату по случаю"""
+    repository = PaymentRepositoryImpl(db_session)
+    first = approved_claims[0]
+    repository.create(_payout(first))
+    premium = repository.create(PaymentFactory(client_id=first.client_id, policy_id=first.policy_id))
+    premium.claim_id, premium.payment_type = first.id, PaymentType.CLAIM_PAYOUT
+    
+    with pytest.raises(BusinessRuleViolationException):
+        repository.update(premium)
+
+
+def test_deleted_payout_frees_claim(db_session: Session, approved_claims):
+    """После удаления выплаты по случаю можно создать новую"""
+    repository = PaymentRepositoryImpl(db_session)
+    first = approved_claims[0]
+    payout = repository.create(_payout(first))
+    
+    assert repository.delete(payout.id)
+    assert repository.create(_payout(first)).claim_id == first.id
+
+
+
+def test_get_approved_without_payout_and_mark_paid(db_session: Session, approved_claims):
+    """Выбираются только случаи без выплаты, в PAID переводятся случаи с проведенной выплатой"""
+    claim_repository = ClaimRepositoryImpl(db_session)
+    first, second, third = approved_claims
+    PaymentRepositoryImpl(db_session).create_payouts_bulk([
+        _payout(first, PaymentStatus.COMPLETED),
+        _payout(second)
+    ])
+    
+    pending = claim_repository.get_approved_without_payout(limit=10)
+    paid_ids = claim_repository.mark_paid_by_completed_payouts()
+    
+    assert [claim.id for claim in pending] == [third.id]
+    assert paid_ids == [first.id]
+    assert claim_repository.get_statuses([first.id, second.id]) == {
+        first.id: ClaimStatus.PAID,
+        second.id: ClaimStatus.APPROVED
+    }
+
+
+def test_payout_worker_drains_approved_claims(db_session: Session, approved_claims):
+    """Обработчик создает выплаты пачками и учитывает их в метриках"""
+    worker = PayoutWorker(lambda: db_session, batch_size=2, idle_interval=0)
+    
+    metrics = worker.run(max_cycles=3)
+    
+    assert metrics.cycles == 3
+    assert metrics.payouts_created == 3
+    assert ClaimRepositoryImpl(db_session).get_approved_without_payout() == []
+
+
+def test_deleted_claim_takes_its_payments(db_session: Session, approved_claims):
+    """Платежи страхового случая удаляются вместе с ним: внешнего ключа на секционированную таблицу нет"""
+    payment_repository = PaymentRepositoryImpl(db_session)
+    first, second, _ = approved_claims
+    payout = payment_repository.create(_payout(first))
+    kept = payment_repository.create(_payout(second))
+    
+    assert ClaimRepositoryImpl(db_session).delete(first.id)
+    
+    assert payment_repository.get_by_id(payout.id) is None
+    assert payment_repository.get_by_id(kept.id) is not None
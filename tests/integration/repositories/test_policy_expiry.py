@@ -0,0 +1,56 @@
+"""
+Интеграционные тесты обработки полисов с истекшим сроком действия
+"""
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from insurance_app.application.services.factory import ServiceFactory
+from insurance_app.domain.models.policy import PolicyStatus
+from insurance_app.infrastructure.database.repositories import (
+    ClientRepositoryImpl,
+    OutboxRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from insurance_app.scripts.policy_expiry_worker import PolicyExpiryWorker
+from tests.factories import ClientFactory, PolicyFactory
+
+
+def test_expired_policies_are_expired_and_renewed(db_session: Session):
+    """Истекшие полисы переводятся в EXPIRED пачками, полисы с auto_renew продлеваются"""
+    today = date.today()
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    repository = PolicyRepositoryImpl(db_session)
+
+    def policy(end_date, **kwargs):
+        return repository.create(PolicyFactory(
+            client_id=client.id, status=PolicyStatus.ACTIVE,
+            start_date=end_date - timedelta(days=364), end_date=end_date, **kwargs
+        ))
+
+    renewable = policy(today - timedelta(days=1), auto_renew=True)
+    lapsed = [policy(today - timedelta(days=days)) for days in (2, 3)]
+    current = policy(today)
+
+    assert {p.id for p in repository.get_active_policies()} == {current.id}
+
+    worker = PolicyExpiryWorker(lambda: db_session, batch_size=2)
+    metrics = worker.run(drain_only=True)
+
+    assert (metrics.cycles, metrics.policies_expired, metrics.policies_renewed) == (2, 3, 1)
+    for expired in [renewable, *lapsed]:
+        assert repository.get_by_id(expired.id).status == PolicyStatus.EXPIRED
+    assert repository.get_by_id(current.id).status == PolicyStatus.ACTIVE
+
+    known = {renewable.id, current.id, *(p.id for p in lapsed)}
+    renewals = [p for p in repository.get_by_client_id(client.id) if p.id not in known]
+    assert len(renewals) == 1
+    renewal = renewals[0]
+    assert (renewal.start_date, renewal.end_date) == (today, today + timedelta(days=364))
+    assert renewal.status == PolicyStatus.ACTIVE and renewal.auto_renew
+    assert renewal.premium_amount > 0
+    assert {p.id for p in repository.get_active_policies()} == {current.id, renewal.id}
+
+    events = OutboxRepositoryImpl(db_session).get_unpublished()
+    assert sorted(event.event_type for event in events) == ["PolicyRenewed"] + ["PolicyStatusChanged"] * 3
+    assert ServiceFactory.create_policy_service(db_session).process_expirations().policies_scanned == 0
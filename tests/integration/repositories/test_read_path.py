@@ -0,0 +1,91 @@
+"""
+Интеграционные тесты пути чтения репозиториев через Core
+"""
+import pytest
+from uuid import uuid4
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.models.payment import Payment, PaymentStatus
+from insurance_app.infrastructure.database.models.payment import PaymentModel
+from insurance_app.infrastructure.database.repositories import (
+    ClientRepositoryImpl,
+    PaymentRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClientFactory, PaymentFactory, PolicyFactory
+
+
+@pytest.fixture
+def client(db_session: Session):
+    """Создает клиента в БД"""
+    return ClientRepositoryImpl(db_session).create(ClientFactory(first_name="Анна", last_name="Смирнова"))
+
+
+@pytest.fixture
+def payments(db_session: Session, client):
+    """Создает несколько платежей клиента в БД"""
+    repository = PaymentRepositoryImpl(db_session)
+    return [
+        repository.create(PaymentFactory(client_id=client.id, policy_id=None, amount=Decimal(i * 100)))
+        for i in range(1, 6)
+    ]
+
+
+def test_get_all_returns_domain_objects(db_session: Session, payments):
+    """Список через Core совпадает с данными, загруженными через ORM"""
+    repository = PaymentRepositoryImpl(db_session)
+    
+    result = repository.get_all(0, 100)
+    
+    assert all(isinstance(payment, Payment) for payment in result)
+    expected = {model.id: repository._to_domain(model) for model in db_session.query(PaymentModel).all()}
+    assert {payment.id: payment for payment in result} == expected
+
+
+def test_core_read_does_not_populate_identity_map(db_session: Session, payments):
+    """Чтение списка не загружает ORM экземпляры в сессию"""
+    db_session.expunge_all()
+    
+    PaymentRepositoryImpl(db_session).get_all(0, 100)
+    
+    assert len(db_session.identity_map) == 0
+
+
+def test_get_by_client_id_with_pagination(db_session: Session, client, payments):
+    """Фильтрация и пагинация выполняются в запросе"""
+    repository = PaymentRepositoryImpl(db_session)
+    
+    assert len(repository.get_by_client_id(client.id, 0, 3)) == 3
+    assert len(repository.get_by_client_id(client.id, 3, 100)) == 2
+    assert repository.get_by_client_id(uuid4()) == []
+
+
+def test_iter_all_streams_every_row(db_session: Session, payments):
+    """Потоковая выгрузка возвращает все строки при любом размере пачки"""
+    repository = PaymentRepositoryImpl(db_session)
+    
+    result = list(repository.iter_all(batch_size=2))
+    
+    assert sorted(payment.id for payment in result) == sorted(payment.id for payment in payments)
+    assert all(payment.status == PaymentStatus.PENDING for payment in result)
+
+
+def test_search_by_name(db_session: Session, client):
+    """Поиск клиентов по имени через Core"""
+    repository = ClientRepositoryImpl(db_session)
+    
+    result = repository.search_by_name("Смирн")
+    
+    assert [found.id for found in result] == [client.id]
+
+
+def test_get_active_policies(db_session: Session, client):
+    """Выборка активных полисов через Core"""
+    repository = PolicyRepositoryImpl(db_session)
+    policy = repository.create(PolicyFactory(client_id=client.id))
+    
+    result = repository.get_active_policies()
+    
+    assert [found.id for found in result] == [policy.id]
@@ -0,0 +1,50 @@
+"""
+Интеграционные тесты проверки ссылок на клиента, полис и страховой случай
+"""
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.models.reference import EntityRefs
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PolicyRepositoryImpl,
+    ReferenceRepositoryImpl
+)
+from tests.factories import ClaimFactory, ClientFactory, PolicyFactory, claim_ref, policy_ref
+
+
+def create_claim(session: Session):
+    client = ClientRepositoryImpl(session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(session).create(PolicyFactory(client_id=client.id))
+    claim = ClaimRepositoryImpl(session).create(ClaimFactory(client_id=client.id, policy_id=policy.id))
+    return client, policy, claim
+
+
+def test_repository_projections(db_session: Session):
+    """Репозитории возвращают только поля для проверки ссылок, а для отсутствующей записи — None"""
+    client, policy, claim = create_claim(db_session)
+    clients, policies, claims = (
+        ClientRepositoryImpl(db_session), PolicyRepositoryImpl(db_session), ClaimRepositoryImpl(db_session)
+    )
+    
+    assert clients.exists(client.id)
+    assert not clients.exists(uuid4())
+    assert policies.get_ref(policy.id) == policy_ref(policy)
+    assert policies.get_ref(uuid4()) is None
+    assert claims.get_ref(claim.id) == claim_ref(claim)
+    assert claims.get_ref(uuid4()) is None
+
+
+def test_refs_in_one_query(db_session: Session):
+    """Клиент, полис и страховой случай находятся одним запросом; ненайденные и незапрошенные записи — None"""
+    client, policy, claim = create_claim(db_session)
+    repository = ReferenceRepositoryImpl(db_session)
+    
+    assert repository.get_refs(client.id, policy.id, claim.id) == EntityRefs(
+        client_id=client.id, policy=policy_ref(policy), claim=claim_ref(claim)
+    )
+    assert repository.get_refs(policy_id=policy.id) == EntityRefs(policy=policy_ref(policy))
+    assert repository.get_refs(uuid4(), policy.id, uuid4()) == EntityRefs(policy=policy_ref(policy))
+    assert repository.get_refs() == EntityRefs()
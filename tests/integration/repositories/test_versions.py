@@ -0,0 +1,88 @@
+"""
+Интеграционные тесты версий записей
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from insurance_app.domain.exceptions import ConcurrencyConflictException
+from insurance_app.domain.models.claim import ClaimStatus
+from insurance_app.infrastructure.database.repositories import (
+    ClaimRepositoryImpl,
+    ClientRepositoryImpl,
+    PolicyRepositoryImpl
+)
+from tests.factories import ClaimFactory, ClientFactory, PolicyFactory
+
+
+def test_version_increments_on_update(db_session: Session):
+    """Номер версии и время изменения обновляются при каждом изменении записи"""
+    repository = ClientRepositoryImpl(db_session)
+    client = repository.create(ClientFactory())
+    created = repository.get_version(client.id)
+    
+    client.phone = "+7 900 000-00-00"
+    repository.update(client)
+    updated = repository.get_version(client.id)
+    
+    assert created.version == 1
+    assert updated.version == 2
+    assert updated.updated_at >= created.updated_at
+    assert repository.get_by_id(client.id).version == 2
+    assert repository.get_version(ClientFactory().id) is None
+
+
+def test_version_increments_on_bulk_update(db_session: Session):
+    """Пакетное изменение статуса через Core также увеличивает номер версии"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    repository = ClaimRepositoryImpl(db_session)
+    claim = repository.create(ClaimFactory(policy_id=policy.id, client_id=client.id))
+    
+    repository.update_status_bulk([claim.id], ClaimStatus.UNDER_REVIEW, [ClaimStatus.PENDING])
+    
+    assert repository.get_version(claim.id).version == 2
+
+
+def test_page_versions_match_list(db_session: Session):
+    """Версии страницы списка соответствуют записям, возвращаемым тем же списком"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    repository = PolicyRepositoryImpl(db_session)
+    for _ in range(3):
+        repository.create(PolicyFactory(client_id=client.id))
+    
+    policies = repository.get_by_client_id(client.id, skip=1, limit=2)
+    versions = repository.get_versions(skip=1, limit=2, client_id=client.id)
+    
+    assert [(v.id, v.version) for v in versions] == [(p.id, p.version) for p in policies]
+
+
+def test_update_returns_new_version(db_session: Session):
+    """Изменение с актуальной версией возвращает запись со следующим номером версии"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    repository = PolicyRepositoryImpl(db_session)
+    policy = repository.create(PolicyFactory(client_id=client.id))
+    
+    policy.description = "Первое изменение"
+    policy = repository.update(policy)
+    policy.description = "Второе изменение"
+    policy = repository.update(policy)
+    
+    assert policy.version == 3
+    assert repository.get_version(policy.id).version == 3
+
+
+def test_stale_update_raises_conflict(db_session: Session):
+    """Изменение устаревшей версии записи отклоняется, а не перезаписывает параллельное изменение"""
+    client = ClientRepositoryImpl(db_session).create(ClientFactory())
+    policy = PolicyRepositoryImpl(db_session).create(PolicyFactory(client_id=client.id))
+    repository = ClaimRepositoryImpl(db_session)
+    claim = repository.create(ClaimFactory(policy_id=policy.id, client_id=client.id))
+    
+    # Параллельный запрос успевает изменить случай после чтения
+    repository.update_status_bulk([claim.id], ClaimStatus.UNDER_REVIEW, [ClaimStatus.PENDING])
+    claim.description = "Устаревшее изменение"
+    
+    with pytest.raises(ConcurrencyConflictException) as error:
+        repository.update(claim)
+    
+    assert error.value.expected_version == 1
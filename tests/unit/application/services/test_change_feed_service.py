@@ -0,0 +1,72 @@
+"""
+Модульные тесты для сервиса ленты изменений
+"""
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from insurance_app.application.services.change_feed_service import (
+    ChangeFeedServiceImpl,
+    decode_cursor,
+    encode_cursor
+)
+from insurance_app.domain.models.change import ChangePosition
+from insurance_app.domain.models.claim import Claim
+from insurance_app.domain.models.payment import Payment
+
+
+class TestChangeFeedService(unittest.TestCase):
+    """Тесты для сервиса ленты изменений"""
+    
+    def setUp(self):
+        self.claim_repository = MagicMock()
+        self.payment_repository = MagicMock()
+        self.service = ChangeFeedServiceImpl(self.claim_repository, self.payment_repository)
+        self.base = datetime(2024, 1, 1, 12, 0, 0)
+    
+    def test_cursor_round_trip(self):
+        """Курсор декодируется в исходные позиции"""
+        positions = {"claim": ChangePosition(self.base, uuid4())}
+        self.assertEqual(decode_cursor(encode_cursor(positions)), positions)
+    
+    def test_invalid_cursor(self):
+        """Некорректный курсор отклоняется"""
+        for cursor in ("not-a-cursor", "e30x", encode_cursor({})[:-1] + "!"):
+            with self.assertRaises(ValueError):
+                self.service.get_changes(cursor)
+    
+    def test_merges_sources_by_time(self):
+        """Изменения разных таблиц объединяются по времени изменения, курсор сдвигается по каждой таблице"""
+        claims = [Claim(id=uuid4(), updated_at=self.base + timedelta(seconds=s)) for s in (0, 2)]
+        payments = [Payment(id=uuid4(), updated_at=self.base + timedelta(seconds=s)) for s in (1, 3)]
+        self.claim_repository.get_changed_since.return_value = claims
+        self.payment_repository.get_changed_since.return_value = payments
+        
+        batch = self.service.get_changes(limit=3)
+        
+        self.assertEqual([c.entity for c in batch.changes], [claims[0], payments[0], claims[1]])
+        self.assertTrue(batch.has_more)
+        self.assertEqual(decode_cursor(batch.cursor), {
+            "claim": ChangePosition(claims[1].updated_at, claims[1].id),
+            "payment": ChangePosition(payments[0].updated_at, payments[0].id),
+        })
+        after, until, limit = self.claim_repository.get_changed_since.call_args[0]
+        self.assertIsNone(after)
+        self.assertEqual(limit, 4)
+    
+    def test_empty_page_keeps_cursor(self):
+        """Без новых изменений курсор не меняется"""
+        self.claim_repository.get_changed_since.return_value = []
+        self.payment_repository.get_changed_since.return_value = []
+        cursor = encode_cursor({"claim": ChangePosition(self.base, uuid4())})
+        
+        batch = self.service.get_changes(cursor)
+        
+        self.assertEqual(batch.changes, [])
+        self.assertFalse(batch.has_more)
+        self.assertEqual(decode_cursor(batch.cursor), decode_cursor(cursor))
+
+
+if __name__ == "__main__":
+    unittest.main()
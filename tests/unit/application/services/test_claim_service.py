@@ -13,8 +13,9 @@ from insurance_app.application.interfaces.policy_repository import PolicyReposit
 from insurance_app.application.interfaces.client_repository import ClientRepository
 from insurance_app.domain.models.claim import Claim, ClaimStatus
 from insurance_app.domain.models.policy import Policy, PolicyStatus
+from insurance_app.domain.models.reference import EntityRefs
 from insurance_app.domain.exceptions import EntityNotFoundException, BusinessRuleViolationException
-from tests.factories import ClaimFactory, PolicyFactory, ClientFactory
+from tests.factories import ClaimFactory, PolicyFactory, ClientFactory, policy_ref
 
 
 class TestClaimService:
@@ -69,8 +70,8 @@ class TestClaimService:
             is_active=True
         )
         
-        self.policy_repository.get_by_id.return_value = policy
-        self.client_repository.get_by_id.return_value = ClientFactory(id=client_id)
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
+        self.client_repository.exists.return_value = True
         self.claim_repository.create.return_value = expected_claim
         
         # Act
@@ -78,8 +79,78 @@ class TestClaimService:
         
         # Assert
         assert result == expected_claim
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.claim_repository.create.assert_called_once()
+        self.client_repository.get_by_id.assert_not_called()
+    
+    def test_create_claim_with_reference_repository(self):
+        """Тестирование проверки полиса и клиента одним запросом к репозиторию ссылок"""
+        # Arrange
+        reference_repository = MagicMock()
+        claim_service = ClaimServiceImpl(
+            self.claim_repository,
+            self.policy_repository,
+            self.client_repository,
+            reference_repository=reference_repository
+        )
+        policy = PolicyFactory(status=PolicyStatus.ACTIVE, start_date=date.today() - timedelta(days=30))
+        claim_data = Claim(
+            policy_id=policy.id,
+            incident_date=date.today() - timedelta(days=5),
+            description="Тестовый страховой случай",
+            claim_amount=Decimal("5000.00")
+        )
+        reference_repository.get_refs.return_value = EntityRefs(policy=policy_ref(policy))
+        self.claim_repository.create.side_effect = lambda claim: claim
+        
+        # Act
+        result = claim_service.create(claim_data)
+        
+        # Assert
+        assert result.client_id == policy.client_id
+        reference_repository.get_refs.assert_called_once_with(None, policy.id)
+        self.policy_repository.get_ref.assert_not_called()
+        self.client_repository.exists.assert_not_called()
+    
+    def test_create_claim_client_not_found(self):
+        """Тестирование создания страхового случая с несуществующим клиентом"""
+        # Arrange
+        policy = PolicyFactory(status=PolicyStatus.ACTIVE, start_date=date.today() - timedelta(days=30))
+        client_id = uuid4()
+        claim_data = Claim(
+            policy_id=policy.id,
+            client_id=client_id,
+            incident_date=date.today() - timedelta(days=5),
+            description="Тестовый страховой случай",
+            claim_amount=Decimal("5000.00")
+        )
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
+        self.client_repository.exists.return_value = False
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match=f"Клиент с ID {client_id} не найден"):
+            self.claim_service.create(claim_data)
+        
+        self.client_repository.exists.assert_called_once_with(client_id)
+        self.claim_repository.create.assert_not_called()
+    
+    def test_create_claim_number_taken(self):
+        """Тестирование создания страхового случая с занятым номером"""
+        # Arrange
+        claim_data = Claim(
+            claim_number="CLM-0000000001",
+            policy_id=uuid4(),
+            client_id=uuid4(),
+            claim_amount=Decimal("5000.00")
+        )
+        self.claim_repository.get_by_claim_number.return_value = ClaimFactory(claim_number="CLM-0000000001")
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="Страховой случай с номером CLM-0000000001 уже существует"):
+            self.claim_service.create(claim_data)
+        
+        self.claim_repository.get_by_claim_number.assert_called_once_with("CLM-0000000001")
+        self.claim_repository.create.assert_not_called()
     
     def test_create_claim_policy_not_found(self):
         """Тестирование создания страхового случая с несуществующим полисом"""
@@ -95,13 +166,13 @@ class TestClaimService:
             claim_amount=Decimal("5000.00")
         )
         
-        self.policy_repository.get_by_id.return_value = None
+        self.policy_repository.get_ref.return_value = None
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Полис с ID {policy_id} не найден"):
             self.claim_service.create(claim_data)
         
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.claim_repository.create.assert_not_called()
     
     def test_create_claim_with_inactive_policy(self):
@@ -123,13 +194,13 @@ class TestClaimService:
             claim_amount=Decimal("5000.00")
         )
         
-        self.policy_repository.get_by_id.return_value = policy
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Полис {policy.policy_number} не активен"):
             self.claim_service.create(claim_data)
         
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.claim_repository.create.assert_not_called()
     
     def test_create_claim_incident_date_before_policy_start(self):
@@ -153,13 +224,13 @@ class TestClaimService:
             claim_amount=Decimal("5000.00")
         )
         
-        self.policy_repository.get_by_id.return_value = policy
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Дата происшествия не может быть раньше даты начала действия полиса"):
             self.claim_service.create(claim_data)
         
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.claim_repository.create.assert_not_called()
     
     def test_create_claim_incident_date_after_policy_end(self):
@@ -184,13 +255,13 @@ class TestClaimService:
             claim_amount=Decimal("5000.00")
         )
         
-        self.policy_repository.get_by_id.return_value = policy
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Дата происшествия не может быть позже даты окончания действия полиса"):
             self.claim_service.create(claim_data)
         
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.claim_repository.create.assert_not_called()
     
     def test_get_all_claims(self):
@@ -542,3 +613,175 @@ class TestClaimService:
         # Assert
         assert result == expected_claim
         self.claim_repository.get_by_claim_number.assert_called_once_with(claim_number)
+    
+    def test_update_status_batch(self):
+        """Тестирование пакетного изменения статуса страховых случаев"""
+        # Arrange
+        updated_id = uuid4()
+        closed_id = uuid4()
+        missing_id = uuid4()
+        
+        self.claim_repository.update_status_bulk.return_value = [updated_id]
+        self.claim_repository.get_statuses.return_value = {closed_id: ClaimStatus.CLOSED}
+        
+        # Act
+        result = self.claim_service.update_status_batch(
+            [updated_id, closed_id, missing_id, updated_id],
+            ClaimStatus.UNDER_REVIEW
+        )
+        
+        # Assert
+        assert result.updated_ids == [updated_id]
+        assert result.skipped == {closed_id: ClaimStatus.CLOSED, missing_id: None}
+        ids, target, from_statuses = self.claim_repository.update_status_bulk.call_args.args
+        assert ids == [updated_id, closed_id, missing_id]
+        assert target == ClaimStatus.UNDER_REVIEW
+        assert from_statuses == {ClaimStatus.PENDING, ClaimStatus.DENIED}
+        self.claim_repository.get_statuses.assert_called_once_with([closed_id, missing_id])
+    
+    def test_update_status_batch_all_updated(self):
+        """Тестирование пакетного изменения статуса без пропущенных случаев"""
+        # Arrange
+        claim_ids = [uuid4(), uuid4()]
+        self.claim_repository.update_status_bulk.return_value = claim_ids
+        
+        # Act
+        result = self.claim_service.update_status_batch(claim_ids, ClaimStatus.CLOSED)
+        
+        # Assert
+        assert result.updated_ids == claim_ids
+        assert result.skipped == {}
+        self.claim_repository.get_statuses.assert_not_called()
+    
+    def test_update_status_batch_to_approved(self):
+        """Тестирование запрета пакетного утверждения без суммы выплаты"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="сумму выплаты"):
+            self.claim_service.update_status_batch([uuid4()], ClaimStatus.APPROVED)
+        
+        self.claim_repository.update_status_bulk.assert_not_called()
+
+    
+    def test_approve_claims_bulk(self):
+        """Тестирование пакетного утверждения страховых случаев"""
+        # Arrange
+        policy = PolicyFactory(coverage_amount=Decimal("50000.00"))
+        approved = ClaimFactory(policy_id=policy.id, status=ClaimStatus.UNDER_REVIEW, claim_amount=Decimal("10000.00"))
+        pending = ClaimFactory(policy_id=policy.id, status=ClaimStatus.PENDING, claim_amount=Decimal("10000.00"))
+        too_large = ClaimFactory(policy_id=policy.id, status=ClaimStatus.UNDER_REVIEW, claim_amount=Decimal("10000.00"))
+        missing_id = uuid4()
+        
+        self.claim_repository.get_by_ids.return_value = [approved, pending, too_large]
+        self.policy_repository.get_by_ids.return_value = [policy]
+        
+        # Act
+        result = self.claim_service.approve_claims_bulk({
+            approved.id: Decimal("8000.00"),
+            pending.id: Decimal("1000.00"),
+            too_large.id: Decimal("20000.00"),
+            missing_id: Decimal("1000.00")
+        })
+        
+        # Assert
+        assert result.approved == [approved]
+        assert approved.status == ClaimStatus.APPROVED
+        assert approved.approved_amount == Decimal("8000.00")
+        assert result.rejected == {
+            pending.id: "invalid_status",
+            too_large.id: "exceeds_claim_amount",
+            missing_id: "not_found"
+        }
+        assert self.claim_repository.get_by_ids.call_args.kwargs == {"for_update": True}
+        self.policy_repository.get_by_ids.assert_called_once_with([policy.id])
+        self.claim_repository.approve_bulk.assert_called_once_with([approved])
+    
+    def test_approve_claims_bulk_exceeds_coverage(self):
+        """Тестирование отказа в пакетном утверждении сверх страховой суммы полиса"""
+        # Arrange
+        policy = PolicyFactory(coverage_amount=Decimal("5000.00"))
+        claim = ClaimFactory(policy_id=policy.id, status=ClaimStatus.UNDER_REVIEW, claim_amount=Decimal("10000.00"))
+        
+        self.claim_repository.get_by_ids.return_value = [claim]
+        self.policy_repository.get_by_ids.return_value = [policy]
+        
+        # Act
+        result = self.claim_service.approve_claims_bulk({claim.id: Decimal("6000.00")})
+        
+        # Assert
+        assert result.approved == []
+        assert result.rejected == {claim.id: "exceeds_coverage_amount"}
+        assert claim.status == ClaimStatus.UNDER_REVIEW
+        self.claim_repository.approve_bulk.assert_called_once_with([])
+    
+    def test_approve_claim_records_event(self):
+        """Тестирование записи события ClaimApproved в таблицу исходящих событий"""
+        # Arrange
+        outbox_repository = MagicMock()
+        claim_service = ClaimServiceImpl(
+            self.claim_repository,
+            self.policy_repository,
+            self.client_repository,
+            outbox_repository
+        )
+        claim = ClaimFactory(status=ClaimStatus.UNDER_REVIEW, claim_amount=Decimal("5000.00"))
+        self.claim_repository.get_by_id.return_value = claim
+        self.policy_repository.get_by_id.return_value = PolicyFactory(coverage_amount=Decimal("10000.00"))
+        
+        # Act
+        claim_service.approve_claim(claim.id, Decimal("4500.00"))
+        
+        # Assert
+        event = outbox_repository.add.call_args.args[0]
+        assert event.event_type == "ClaimApproved"
+        assert event.aggregate_id == claim.id
+        assert event.payload["approved_amount"] == "4500.00"
+        self.claim_repository.update.assert_called_once()
+    
+    def test_status_changes_invalidate_cached_responses(self):
+        """Тестирование сброса кэшированных ответов измененных страховых случаев"""
+        # Arrange
+        cache_invalidator = MagicMock()
+        claim_service = ClaimServiceImpl(
+            self.claim_repository,
+            self.policy_repository,
+            self.client_repository,
+            cache_invalidator=cache_invalidator
+        )
+        claim = ClaimFactory(status=ClaimStatus.PENDING)
+        skipped_id = uuid4()
+        self.claim_repository.get_by_id.return_value = claim
+        self.claim_repository.update.side_effect = lambda entity: entity
+        self.claim_repository.update_status_bulk.return_value = [claim.id]
+        self.claim_repository.get_statuses.return_value = {}
+        
+        # Act
+        claim_service.update_status(claim.id, ClaimStatus.UNDER_REVIEW)
+        claim_service.update_status_batch([claim.id, skipped_id], ClaimStatus.DENIED)
+        
+        # Assert
+        assert [call.args[0] for call in cache_invalidator.invalidate.call_args_list] == [
+            [f"claims:{claim.id}"],
+            [f"claims:{claim.id}"]
+        ]
+    
+    def test_delete_invalidates_claim_payments(self):
+        """Тестирование сброса кэшированных платежей, удаленных вместе со страховым случаем"""
+        # Arrange
+        cache_invalidator = MagicMock()
+        claim_service = ClaimServiceImpl(
+            self.claim_repository,
+            self.policy_repository,
+            self.client_repository,
+            cache_invalidator=cache_invalidator
+        )
+        claim_id = uuid4()
+        self.claim_repository.delete.return_value = True
+        
+        # Act
+        claim_service.delete(claim_id)
+        
+        # Assert
+        assert [call.args[0] for call in cache_invalidator.invalidate.call_args_list] == [
+            [f"claims:{claim_id}"],
+            ["payments"]
+        ]
@@ -0,0 +1,109 @@
+"""
+Тесты для сервиса ключей идемпотентности
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from insurance_app.application.services.idempotency_service import IdempotencyCache, IdempotencyServiceImpl
+from insurance_app.domain.exceptions import IdempotencyConflictException
+from insurance_app.domain.models.idempotency import IdempotencyRecord
+
+
+class TestIdempotencyService:
+    """Тесты для сервиса ключей идемпотентности"""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.idempotency_repository = MagicMock()
+        self.cache = IdempotencyCache(max_entries=2)
+        self.idempotency_service = IdempotencyServiceImpl(self.idempotency_repository, self.cache)
+    
+    def _record(self, request_hash="hash", status_code=201, expires_in=timedelta(hours=1)):
+        return IdempotencyRecord(
+            user_id="user",
+            key="key",
+            request_hash=request_hash,
+            expires_at=datetime.utcnow() + expires_in,
+            status_code=status_code,
+            response_body='{"id": 1}' if status_code else None
+        )
+    
+    def test_begin_new_request(self):
+        """Тестирование начала выполнения нового запроса"""
+        # Arrange
+        self.idempotency_repository.get.return_value = None
+        self.idempotency_repository.try_create.return_value = True
+        
+        # Act
+        result = self.idempotency_service.begin("user", "key", "hash")
+        
+        # Assert
+        assert result is None
+        created = self.idempotency_repository.try_create.call_args.args[0]
+        assert (created.user_id, created.key, created.request_hash) == ("user", "key", "hash")
+        assert not created.is_completed
+    
+    def test_begin_replays_completed_request(self):
+        """Тестирование возврата сохраненного ответа и его кэширования"""
+        # Arrange
+        self.idempotency_repository.get.return_value = self._record()
+        
+        # Act
+        first = self.idempotency_service.begin("user", "key", "hash")
+        second = self.idempotency_service.begin("user", "key", "hash")
+        
+        # Assert
+        assert first.status_code == 201
+        assert second.response_body == '{"id": 1}'
+        # Повтор обслуживается из кэша без обращения к базе данных
+        self.idempotency_repository.get.assert_called_once_with("user", "key")
+        self.idempotency_repository.try_create.assert_not_called()
+    
+    def test_begin_request_hash_mismatch(self):
+        """Тестирование повторного использования ключа для другого запроса"""
+        # Arrange
+        self.idempotency_repository.get.return_value = self._record(request_hash="other")
+        
+        # Act & Assert
+        with pytest.raises(IdempotencyConflictException) as exc_info:
+            self.idempotency_service.begin("user", "key", "hash")
+        
+        assert not exc_info.value.in_progress
+    
+    def test_begin_request_in_progress(self):
+        """Тестирование повтора запроса, который еще выполняется"""
+        # Arrange
+        self.idempotency_repository.get.return_value = None
+        self.idempotency_repository.try_create.return_value = False
+        self.idempotency_repository.get.side_effect = [None, self._record(status_code=None)]
+        
+        # Act & Assert
+        with pytest.raises(IdempotencyConflictException) as exc_info:
+            self.idempotency_service.begin("user", "key", "hash")
+        
+        assert exc_info.value.in_progress
+    
+    def test_begin_expired_record(self):
+        """Тестирование повторного выполнения запроса после истечения срока хранения"""
+        # Arrange
+        self.idempotency_repository.get.return_value = self._record(expires_in=timedelta(seconds=-1))
+        self.idempotency_repository.try_create.return_value = True
+        
+        # Act
+        result = self.idempotency_service.begin("user", "key", "hash")
+        
+        # Assert
+        assert result is None
+        self.idempotency_repository.delete.assert_called_once_with("user", "key")
+    
+    def test_complete_populates_cache(self):
+        """Тестирование сохранения ответа в базе данных и в кэше"""
+        # Act
+        self.idempotency_service.complete("user", "key", "hash", 201, '{"id": 1}')
+        result = self.idempotency_service.begin("user", "key", "hash")
+        
+        # Assert
+        assert result.status_code == 201
+        self.idempotency_repository.complete.assert_called_once_with("user", "key", 201, '{"id": 1}')
+        self.idempotency_repository.get.assert_not_called()
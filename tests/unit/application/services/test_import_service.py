@@ -0,0 +1,66 @@
+"""
+Тесты для сервиса массовой загрузки данных
+"""
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from insurance_app.application.services.import_service import ImportServiceImpl
+from insurance_app.domain.models.bulk_import import ImportEntity, ImportRejection
+
+
+class TestImportService:
+    """Тесты для сервиса массовой загрузки данных"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.import_repository = MagicMock()
+        self.import_repository.stage.return_value = 3
+        self.import_service = ImportServiceImpl(self.import_repository)
+
+    def test_import_merges_valid_rows(self):
+        """Тестирование переноса строк, прошедших проверку"""
+        # Arrange
+        self.import_repository.validate.return_value = 1
+        self.import_repository.get_rejections.return_value = [ImportRejection(2, "email: обязательное поле")]
+        self.import_repository.merge.return_value = (1, 1)
+
+        # Act
+        result = self.import_service.import_csv("clients", io.BytesIO(), max_rejections=10)
+
+        # Assert
+        assert result.entity == ImportEntity.CLIENTS
+        assert (result.loaded, result.inserted, result.updated, result.rejected) == (3, 1, 1, 1)
+        assert result.merged
+        self.import_repository.get_rejections.assert_called_once_with(ImportEntity.CLIENTS, 10)
+        self.import_repository.discard.assert_not_called()
+
+    def test_strict_import_discards_on_rejections(self):
+        """Тестирование отмены строгой загрузки при отклоненных строках"""
+        # Arrange
+        self.import_repository.validate.return_value = 1
+
+        # Act
+        result = self.import_service.import_csv(ImportEntity.CLIENTS, io.BytesIO(), strict=True)
+
+        # Assert
+        assert not result.merged
+        assert result.inserted == 0
+        self.import_repository.merge.assert_not_called()
+        self.import_repository.discard.assert_called_once_with(ImportEntity.CLIENTS)
+
+    def test_import_discards_on_error(self):
+        """Тестирование отмены загрузки при ошибке"""
+        # Arrange
+        self.import_repository.stage.side_effect = ValueError("Неизвестные столбцы")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            self.import_service.import_csv(ImportEntity.POLICIES, io.BytesIO())
+        self.import_repository.discard.assert_called_once_with(ImportEntity.POLICIES)
+
+    def test_unknown_entity(self):
+        """Тестирование загрузки неизвестной сущности"""
+        with pytest.raises(ValueError):
+            self.import_service.import_csv("users", io.BytesIO())
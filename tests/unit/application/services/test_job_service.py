@@ -0,0 +1,83 @@
+"""
+Тесты для сервиса очереди фоновых задач
+"""
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from unittest.mock import MagicMock
+
+from insurance_app.application.services.job_service import JobServiceImpl
+from insurance_app.domain.models.job import Job, JobStatus
+
+
+class TestJobService:
+    """Тесты для сервиса очереди фоновых задач"""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.job_repository = MagicMock()
+        self.job_service = JobServiceImpl(
+            self.job_repository,
+            retry_base_delay=timedelta(seconds=10),
+            retry_max_delay=timedelta(seconds=60)
+        )
+    
+    def test_submit(self):
+        """Тестирование постановки задачи в очередь"""
+        # Arrange
+        self.job_repository.create.side_effect = lambda job: job
+        
+        # Act
+        result = self.job_service.submit("payouts.run", {"batch_size": 100}, max_attempts=5)
+        
+        # Assert
+        assert result.id is not None
+        assert result.status == JobStatus.PENDING
+        assert result.payload == {"batch_size": 100}
+        assert result.max_attempts == 5
+        assert result.run_after is not None
+        self.job_repository.create.assert_called_once()
+    
+    def test_submit_unknown_job_type(self):
+        """Тестирование постановки задачи неизвестного типа"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Неизвестный тип задачи"):
+            self.job_service.submit("unknown", {})
+        
+        self.job_repository.create.assert_not_called()
+    
+    def test_retry_delay(self):
+        """Тестирование экспоненциальной задержки повтора"""
+        assert self.job_service.retry_delay(1) == timedelta(seconds=10)
+        assert self.job_service.retry_delay(3) == timedelta(seconds=40)
+        assert self.job_service.retry_delay(10) == timedelta(seconds=60)
+    
+    def test_fail_schedules_retry(self):
+        """Тестирование повтора задачи после неудачной попытки"""
+        # Arrange
+        job = Job(
+            id=uuid4(), job_type="payouts.run", status=JobStatus.RUNNING, attempts=2, max_attempts=3, locked_by="worker"
+        )
+        
+        # Act
+        before = datetime.utcnow()
+        result = self.job_service.fail(job, "ошибка")
+        
+        # Assert
+        assert result.status == JobStatus.PENDING
+        assert result.run_after >= before + timedelta(seconds=20)
+        job_id, worker_id, error, _, retry_at = self.job_repository.mark_failed.call_args.args
+        assert (job_id, worker_id, error, retry_at) == (job.id, "worker", "ошибка", result.run_after)
+    
+    def test_fail_attempts_exhausted(self):
+        """Тестирование завершения задачи после исчерпания попыток"""
+        # Arrange
+        job = Job(id=uuid4(), job_type="payouts.run", status=JobStatus.RUNNING, attempts=3, max_attempts=3)
+        
+        # Act
+        result = self.job_service.fail(job, "ошибка")
+        
+        # Assert
+        assert result.status == JobStatus.FAILED
+        assert result.finished_at is not None
+        assert self.job_repository.mark_failed.call_args.args[4] is None
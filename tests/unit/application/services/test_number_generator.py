@@ -0,0 +1,60 @@
+"""
+Тесты для генератора номеров hi/lo
+"""
+import threading
+from itertools import count
+from unittest.mock import MagicMock
+
+from insurance_app.application.services.number_generator import NumberBlocks, NumberGeneratorImpl
+
+
+class TestNumberGenerator:
+    """Тесты для генератора номеров hi/lo"""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.sequence_repository = MagicMock()
+        blocks = count(1)
+        self.sequence_repository.next_block.side_effect = lambda sequence: next(blocks)
+        self.number_generator = NumberGeneratorImpl(self.sequence_repository, NumberBlocks(block_size=3))
+    
+    def test_numbers_of_block_are_issued_without_database(self):
+        """Тестирование выдачи номеров блока с одним обращением к базе на блок"""
+        # Act
+        numbers = [self.number_generator.next_value("policy") for _ in range(7)]
+        
+        # Assert
+        assert numbers == [1, 2, 3, 4, 5, 6, 7]
+        assert self.sequence_repository.next_block.call_count == 3
+    
+    def test_sequences_have_separate_blocks(self):
+        """Тестирование независимых блоков разных последовательностей"""
+        # Act
+        policy = self.number_generator.next_value("policy")
+        claim = self.number_generator.next_value("claim")
+        
+        # Assert
+        assert (policy, claim) == (1, 4)
+        assert [call.args[0] for call in self.sequence_repository.next_block.call_args_list] == ["policy", "claim"]
+    
+    def test_concurrent_numbers_are_unique(self):
+        """Тестирование уникальности номеров, выдаваемых параллельно из общих блоков процесса"""
+        # Arrange
+        numbers = []
+        lock = threading.Lock()
+        
+        def take():
+            values = [self.number_generator.next_value("payment") for _ in range(50)]
+            with lock:
+                numbers.extend(values)
+        
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # Assert
+        assert len(numbers) == len(set(numbers)) == 400
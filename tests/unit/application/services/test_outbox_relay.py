@@ -0,0 +1,60 @@
+"""
+Тесты для ретранслятора исходящих событий
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from insurance_app.application.services.outbox_relay import OutboxRelay
+from insurance_app.domain.models.outbox import OutboxEvent
+
+
+class TestOutboxRelay:
+    """Тесты для ретранслятора исходящих событий"""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.outbox_repository = MagicMock()
+        self.sinks = [MagicMock(), MagicMock()]
+        self.relay = OutboxRelay(self.outbox_repository, self.sinks)
+        self.events = [OutboxEvent(id=1, event_type="ClaimApproved"), OutboxEvent(id=2, event_type="PaymentCompleted")]
+    
+    def test_relay_batch(self):
+        """Тестирование публикации пачки событий всем получателям"""
+        # Arrange
+        self.outbox_repository.get_unpublished.return_value = self.events
+        
+        # Act
+        result = self.relay.relay_batch(batch_size=50)
+        
+        # Assert
+        assert result == 2
+        self.outbox_repository.get_unpublished.assert_called_once_with(50)
+        for sink in self.sinks:
+            sink.publish.assert_called_once_with(self.events)
+        assert self.outbox_repository.mark_published.call_args.args[0] == [1, 2]
+    
+    def test_relay_batch_empty(self):
+        """Тестирование прохода без новых событий"""
+        # Arrange
+        self.outbox_repository.get_unpublished.return_value = []
+        
+        # Act
+        result = self.relay.relay_batch()
+        
+        # Assert
+        assert result == 0
+        self.sinks[0].publish.assert_not_called()
+        self.outbox_repository.mark_published.assert_not_called()
+    
+    def test_relay_batch_sink_failure(self):
+        """Тестирование повторной доставки при недоступности получателя"""
+        # Arrange
+        self.outbox_repository.get_unpublished.return_value = self.events
+        self.sinks[1].publish.side_effect = ConnectionError("недоступен")
+        
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            self.relay.relay_batch()
+        
+        self.outbox_repository.mark_published.assert_not_called()
+        self.outbox_repository.mark_failed.assert_called_once_with([1, 2], "ConnectionError: недоступен")
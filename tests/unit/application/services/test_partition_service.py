@@ -0,0 +1,81 @@
+"""
+Тесты для сервиса обслуживания секций таблиц
+"""
+from datetime import date
+from unittest.mock import MagicMock
+
+from insurance_app.application.services.partition_service import PartitionServiceImpl
+from insurance_app.domain.models.partition import TablePartition
+
+
+class TestPartitionService:
+    """Тесты для сервиса обслуживания секций таблиц"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.partition_repository = MagicMock()
+        self.partition_repository.get_partitioned_tables.return_value = ["payments"]
+        self.partition_repository.create_partition.side_effect = (
+            lambda table, start, end: TablePartition(table, f"{table}_p{start:%Y_%m}", start, end)
+        )
+        self.partition_service = PartitionServiceImpl(self.partition_repository)
+
+    def test_maintain_creates_missing_months(self):
+        """Тестирование создания секций на текущий и следующие месяцы через границу года"""
+        # Arrange
+        self.partition_repository.get_partitions.return_value = [
+            TablePartition("payments", "payments_p2026_11", date(2026, 11, 1), date(2026, 12, 1)),
+        ]
+
+        # Act
+        result = self.partition_service.maintain(months_ahead=3, today=date(2026, 11, 19))
+
+        # Assert
+        assert [(partition.start, partition.end) for partition in result.created] == [
+            (date(2026, 12, 1), date(2027, 1, 1)),
+            (date(2027, 1, 1), date(2027, 2, 1)),
+            (date(2027, 2, 1), date(2027, 3, 1)),
+        ]
+        assert result.detached == []
+        self.partition_repository.detach_partition.assert_not_called()
+
+    def test_ensure_skips_months_covered_by_existing_partition(self):
+        """Тестирование пропуска месяцев, пересекающихся с секцией нестандартной длины"""
+        # Arrange
+        self.partition_repository.get_partitions.return_value = [
+            TablePartition("payments", "payments_legacy", date(2020, 1, 1), date(2026, 2, 1)),
+        ]
+
+        # Act
+        result = self.partition_service.ensure_partitions(date(2025, 12, 15), date(2026, 3, 31))
+
+        # Assert
+        assert [partition.name for partition in result.created] == ["payments_p2026_02", "payments_p2026_03"]
+
+    def test_maintain_detaches_partitions_older_than_retention(self):
+        """Тестирование отсоединения секций, закончившихся раньше срока хранения"""
+        # Arrange
+        old = TablePartition("payments", "payments_p2025_10", date(2025, 10, 1), date(2025, 11, 1))
+        retained = TablePartition("payments", "payments_p2025_11", date(2025, 11, 1), date(2025, 12, 1))
+        self.partition_repository.get_partitions.return_value = [old, retained]
+
+        # Act
+        result = self.partition_service.maintain(
+            months_ahead=0, retain_months=12, archive_schema="cold", today=date(2026, 11, 19)
+        )
+
+        # Assert
+        assert result.detached == [old]
+        self.partition_repository.detach_partition.assert_called_once_with(old, "cold")
+
+    def test_maintain_without_partitioned_tables(self):
+        """Тестирование обслуживания, когда СУБД не поддерживает секционирование"""
+        # Arrange
+        self.partition_repository.get_partitioned_tables.return_value = []
+
+        # Act
+        result = self.partition_service.maintain(retain_months=1)
+
+        # Assert
+        assert (result.created, result.detached) == ([], [])
+        self.partition_repository.create_partition.assert_not_called()
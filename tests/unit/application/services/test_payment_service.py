@@ -15,8 +15,9 @@ from insurance_app.application.interfaces.client_repository import ClientReposit
 from insurance_app.domain.models.payment import Payment, PaymentStatus, PaymentType
 from insurance_app.domain.models.claim import Claim, ClaimStatus
 from insurance_app.domain.models.policy import Policy, PolicyStatus
+from insurance_app.domain.models.reference import EntityRefs
 from insurance_app.domain.exceptions import EntityNotFoundException, BusinessRuleViolationException
-from tests.factories import PaymentFactory, PolicyFactory, ClaimFactory, ClientFactory
+from tests.factories import PaymentFactory, PolicyFactory, ClaimFactory, ClientFactory, claim_ref, policy_ref
 
 
 class TestPaymentService:
@@ -47,8 +48,6 @@ class TestPaymentService:
             status=PolicyStatus.ACTIVE
         )
         
-        client = ClientFactory(id=client_id)
-        
         payment_data = Payment(
             policy_id=policy_id,
             client_id=client_id,
@@ -75,8 +74,8 @@ class TestPaymentService:
             is_active=True
         )
         
-        self.policy_repository.get_by_id.return_value = policy
-        self.client_repository.get_by_id.return_value = client
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
+        self.client_repository.exists.return_value = True
         self.payment_repository.create.return_value = expected_payment
         
         # Act
@@ -84,9 +83,42 @@ class TestPaymentService:
         
         # Assert
         assert result == expected_payment
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
-        self.client_repository.get_by_id.assert_called_once_with(client_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
+        self.client_repository.exists.assert_called_once_with(client_id)
         self.payment_repository.create.assert_called_once()
+        self.policy_repository.get_by_id.assert_not_called()
+        self.client_repository.get_by_id.assert_not_called()
+    
+    def test_create_payment_with_reference_repository(self):
+        """Тестирование проверки клиента, полиса и страхового случая одним запросом к репозиторию ссылок"""
+        # Arrange
+        reference_repository = MagicMock()
+        payment_service = PaymentServiceImpl(
+            self.payment_repository,
+            self.policy_repository,
+            self.claim_repository,
+            self.client_repository,
+            reference_repository=reference_repository
+        )
+        claim = ClaimFactory()
+        payment_data = Payment(
+            claim_id=claim.id,
+            amount=Decimal("1000.00"),
+            payment_type=PaymentType.CLAIM_PAYOUT,
+            payment_method="bank_transfer",
+            description="Тестовый платеж по страховому случаю"
+        )
+        reference_repository.get_refs.return_value = EntityRefs(claim=claim_ref(claim))
+        self.payment_repository.create.side_effect = lambda payment: payment
+        
+        # Act
+        result = payment_service.create(payment_data)
+        
+        # Assert
+        assert (result.client_id, result.policy_id) == (claim.client_id, claim.policy_id)
+        reference_repository.get_refs.assert_called_once_with(None, None, claim.id)
+        self.claim_repository.get_ref.assert_not_called()
+        self.client_repository.exists.assert_not_called()
     
     def test_create_payment_client_not_found(self):
         """Тестирование создания платежа с несуществующим клиентом"""
@@ -101,13 +133,32 @@ class TestPaymentService:
             description="Тестовый платеж"
         )
         
-        self.client_repository.get_by_id.return_value = None
+        self.client_repository.exists.return_value = False
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Клиент с ID {client_id} не найден"):
             self.payment_service.create(payment_data)
         
-        self.client_repository.get_by_id.assert_called_once_with(client_id)
+        self.client_repository.exists.assert_called_once_with(client_id)
+        self.payment_repository.create.assert_not_called()
+    
+    def test_create_payment_number_taken(self):
+        """Тестирование создания платежа с занятым номером"""
+        # Arrange
+        payment_data = Payment(
+            payment_number="PAY-0000000001",
+            client_id=uuid4(),
+            amount=Decimal("1000.00"),
+            payment_type=PaymentType.PREMIUM
+        )
+        
+        self.payment_repository.get_by_payment_number.return_value = PaymentFactory(payment_number="PAY-0000000001")
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="Платеж с номером PAY-0000000001 уже существует"):
+            self.payment_service.create(payment_data)
+        
+        self.payment_repository.get_by_payment_number.assert_called_once_with("PAY-0000000001")
         self.payment_repository.create.assert_not_called()
     
     def test_create_payment_policy_not_found(self):
@@ -125,15 +176,15 @@ class TestPaymentService:
             description="Тестовый платеж"
         )
         
-        self.client_repository.get_by_id.return_value = ClientFactory(id=client_id)
-        self.policy_repository.get_by_id.return_value = None
+        self.client_repository.exists.return_value = True
+        self.policy_repository.get_ref.return_value = None
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Полис с ID {policy_id} не найден"):
             self.payment_service.create(payment_data)
         
-        self.client_repository.get_by_id.assert_called_once_with(client_id)
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.client_repository.exists.assert_called_once_with(client_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.payment_repository.create.assert_not_called()
     
     def test_create_payment_claim_not_found(self):
@@ -151,15 +202,15 @@ class TestPaymentService:
             description="Тестовый платеж по страховому случаю"
         )
         
-        self.client_repository.get_by_id.return_value = ClientFactory(id=client_id)
-        self.claim_repository.get_by_id.return_value = None
+        self.client_repository.exists.return_value = True
+        self.claim_repository.get_ref.return_value = None
         
         # Act & Assert
         with pytest.raises(ValueError, match=f"Страховой случай с ID {claim_id} не найден"):
             self.payment_service.create(payment_data)
         
-        self.client_repository.get_by_id.assert_called_once_with(client_id)
-        self.claim_repository.get_by_id.assert_called_once_with(claim_id)
+        self.client_repository.exists.assert_called_once_with(client_id)
+        self.claim_repository.get_ref.assert_called_once_with(claim_id)
         self.payment_repository.create.assert_not_called()
     
     def test_create_payment_client_from_policy(self):
@@ -199,7 +250,7 @@ class TestPaymentService:
             is_active=True
         )
         
-        self.policy_repository.get_by_id.return_value = policy
+        self.policy_repository.get_ref.return_value = policy_ref(policy)
         self.payment_repository.create.return_value = expected_payment
         
         # Act
@@ -208,7 +259,7 @@ class TestPaymentService:
         # Assert
         assert result == expected_payment
         assert result.client_id == client_id  # Должен быть клиент из полиса
-        self.policy_repository.get_by_id.assert_called_once_with(policy_id)
+        self.policy_repository.get_ref.assert_called_once_with(policy_id)
         self.payment_repository.create.assert_called_once()
     
     def test_get_payment_by_id(self):
@@ -609,3 +660,110 @@ class TestPaymentService:
         
         self.claim_repository.get_by_id.assert_called_once_with(claim_id)
         self.payment_repository.create.assert_not_called()
+    
+    def test_create_claim_payouts(self):
+        """Тестирование пакетного создания страховых выплат"""
+        # Arrange
+        claims = [
+            ClaimFactory(status=ClaimStatus.APPROVED, approved_amount=Decimal("1500.00")),
+            ClaimFactory(status=ClaimStatus.APPROVED, approved_amount=Decimal("2500.00"))
+        ]
+        self.payment_repository.create_payouts_bulk.side_effect = lambda payments: payments
+        
+        # Act
+        result = self.payment_service.create_claim_payouts(claims)
+        
+        # Assert
+        assert [payment.claim_id for payment in result] == [claim.id for claim in claims]
+        assert [payment.amount for payment in result] == [Decimal("1500.00"), Decimal("2500.00")]
+        assert all(payment.payment_type == PaymentType.CLAIM_PAYOUT for payment in result)
+        assert all(payment.payment_number.startswith("PAY-") for payment in result)
+        self.payment_repository.create_payouts_bulk.assert_called_once()
+        self.claim_repository.get_by_id.assert_not_called()
+    
+    def test_create_claim_payouts_claim_not_approved(self):
+        """Тестирование пакетного создания выплат по неутвержденному случаю"""
+        # Arrange
+        claims = [ClaimFactory(status=ClaimStatus.UNDER_REVIEW, approved_amount=Decimal("1500.00"))]
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="должен быть утвержден"):
+            self.payment_service.create_claim_payouts(claims)
+        
+        self.payment_repository.create_payouts_bulk.assert_not_called()
+    
+    def test_create_claim_payout_already_exists(self):
+        """Тестирование запрета повторной выплаты по страховому случаю"""
+        # Arrange
+        claim = ClaimFactory(status=ClaimStatus.APPROVED, approved_amount=Decimal("3000.00"))
+        self.claim_repository.get_by_id.return_value = claim
+        self.payment_repository.get_by_claim_id.return_value = [
+            PaymentFactory(claim_id=claim.id, payment_type=PaymentType.CLAIM_PAYOUT)
+        ]
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="уже создана"):
+            self.payment_service.create_claim_payout(claim.id)
+        
+        self.payment_repository.create.assert_not_called()
+    
+    def test_process_claim_payout_marks_claim_paid(self):
+        """Тестирование перевода страхового случая в статус PAID при проведении выплаты"""
+        # Arrange
+        payment = PaymentFactory(claim_id=uuid4(), payment_type=PaymentType.CLAIM_PAYOUT)
+        self.payment_repository.get_by_id.return_value = payment
+        self.payment_repository.update.side_effect = lambda entity: entity
+        
+        # Act
+        result = self.payment_service.process_payment(payment.id)
+        
+        # Assert
+        assert result.status == PaymentStatus.COMPLETED
+        self.claim_repository.update_status_bulk.assert_called_once_with(
+            [payment.claim_id], ClaimStatus.PAID, frozenset({ClaimStatus.APPROVED})
+        )
+    
+    def test_run_payout_pipeline(self):
+        """Тестирование прохода конвейера страховых выплат"""
+        # Arrange
+        claims = [ClaimFactory(status=ClaimStatus.APPROVED, approved_amount=Decimal("1000.00")) for _ in range(2)]
+        paid_claim_id = uuid4()
+        self.claim_repository.get_approved_without_payout.return_value = claims
+        self.claim_repository.mark_paid_by_completed_payouts.return_value = [paid_claim_id]
+        # Выплата по второму случаю уже создана параллельным обработчиком
+        self.payment_repository.create_payouts_bulk.side_effect = lambda payments: payments[:1]
+        
+        # Act
+        result = self.payment_service.run_payout_pipeline(batch_size=10)
+        
+        # Assert
+        assert result.claims_scanned == 2
+        assert [payment.claim_id for payment in result.payouts] == [claims[0].id]
+        assert result.paid_claim_ids == [paid_claim_id]
+        self.claim_repository.get_approved_without_payout.assert_called_once_with(10)
+        self.claim_repository.mark_paid_by_completed_payouts.assert_called_once_with(10)
+    
+    def test_process_payment_records_event(self):
+        """Тестирование записи события PaymentCompleted в таблицу исходящих событий"""
+        # Arrange
+        outbox_repository = MagicMock()
+        payment_service = PaymentServiceImpl(
+            self.payment_repository,
+            self.policy_repository,
+            self.claim_repository,
+            self.client_repository,
+            outbox_repository
+        )
+        payment = PaymentFactory(payment_type=PaymentType.PREMIUM)
+        self.payment_repository.get_by_id.return_value = payment
+        self.payment_repository.update.side_effect = lambda entity: entity
+        
+        # Act
+        payment_service.process_payment(payment.id, date(2025, 1, 15))
+        
+        # Assert
+        event = outbox_repository.add.call_args.args[0]
+        assert event.event_type == "PaymentCompleted"
+        assert event.aggregate_id == payment.id
+        assert event.payload["payment_date"] == "2025-01-15"
+        assert event.payload["payment_type"] == "premium"
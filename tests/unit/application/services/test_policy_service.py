@@ -339,3 +339,51 @@ class TestPolicyService:
         assert result.end_date == new_end_date
         self.policy_repository.get_by_id.assert_called_once_with(policy_id)
         self.policy_repository.update.assert_called_once()
+    
+    def test_process_expirations_renews_auto_renew_policies(self):
+        """Тестирование истечения срока полисов и создания продлений"""
+        # Arrange
+        outbox_repository = MagicMock()
+        policy_service = PolicyServiceImpl(self.policy_repository, self.client_repository, outbox_repository)
+        renewable = PolicyFactory(
+            status=PolicyStatus.ACTIVE,
+            type=PolicyType.VEHICLE,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            coverage_amount=Decimal("100000"),
+            auto_renew=True
+        )
+        lapsed = PolicyFactory(status=PolicyStatus.ACTIVE, end_date=date(2025, 12, 31), auto_renew=False)
+        self.policy_repository.get_expired_active.return_value = [renewable, lapsed]
+        self.policy_repository.expire_and_renew.return_value = [renewable.id, lapsed.id]
+        
+        # Act
+        result = policy_service.process_expirations(batch_size=100, as_of=date(2026, 1, 2))
+        
+        # Assert
+        self.policy_repository.get_expired_active.assert_called_once_with(date(2026, 1, 2), 100)
+        policy_ids, renewals = self.policy_repository.expire_and_renew.call_args[0]
+        assert policy_ids == [renewable.id, lapsed.id]
+        assert list(renewals) == [renewable.id]
+        renewal = renewals[renewable.id]
+        assert (renewal.start_date, renewal.end_date) == (date(2026, 1, 1), date(2026, 12, 31))
+        assert renewal.status == PolicyStatus.ACTIVE
+        assert renewal.premium_amount == Decimal("5000.00")
+        assert result.policies_scanned == 2
+        assert result.renewals == [renewal]
+        events = [call.args[0].event_type for call in outbox_repository.add.call_args_list]
+        assert events == ["PolicyStatusChanged", "PolicyRenewed", "PolicyStatusChanged"]
+    
+    def test_process_expirations_skips_policies_changed_concurrently(self):
+        """Тестирование пропуска продления полиса, статус которого изменился до истечения"""
+        # Arrange
+        policy = PolicyFactory(status=PolicyStatus.ACTIVE, end_date=date.today() - timedelta(days=1), auto_renew=True)
+        self.policy_repository.get_expired_active.return_value = [policy]
+        self.policy_repository.expire_and_renew.return_value = []
+        
+        # Act
+        result = self.policy_service.process_expirations()
+        
+        # Assert
+        assert result.expired_ids == []
+        assert result.renewals == []
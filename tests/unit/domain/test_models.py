@@ -0,0 +1,42 @@
+"""
+Тесты для доменных моделей
+"""
+import pytest
+from decimal import Decimal
+
+from insurance_app.application.dto.claim_dto import ClaimUpdateDTO
+from insurance_app.application.dto.mappers import ClaimMapper
+from insurance_app.domain.models import Client, Policy, Claim, Payment, User
+from tests.factories import ClaimFactory
+
+
+@pytest.mark.parametrize("model_cls", [Client, Policy, Claim, Payment, User])
+def test_domain_models_are_slotted(model_cls):
+    """Доменные модели не должны хранить атрибуты в __dict__"""
+    entity = model_cls()
+    
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.unknown_attribute = 1
+
+
+def test_user_default_roles():
+    """Роли пользователя по умолчанию создаются для каждого экземпляра"""
+    first = User()
+    second = User()
+    
+    first.roles.append("admin")
+    
+    assert second.roles == ["user"]
+
+
+def test_mapper_updates_slotted_entity():
+    """Маппер переносит поля DTO в доменный объект со __slots__"""
+    claim = ClaimFactory(claim_amount=Decimal("1000.00"))
+    dto = ClaimUpdateDTO(description="Новое описание", approved_amount=Decimal("500.00"))
+    
+    result = ClaimMapper.to_domain(dto, claim)
+    
+    assert result is claim
+    assert result.description == "Новое описание"
+    assert result.approved_amount == Decimal("500.00")
@@ -0,0 +1,91 @@
+"""
+Тесты для JWT middleware и скомпилированной политики доступа
+"""
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from insurance_app.infrastructure.auth.middleware import JWTAuthMiddleware
+from insurance_app.infrastructure.auth.policy import AUTHENTICATED, AuthorizationPolicy, RouteAccess, required_roles
+from insurance_app.presentation.api import jobs
+
+SECRET_KEY = "test-secret"
+
+
+def token(roles=(), is_superuser=False, expires_in=timedelta(hours=1)) -> str:
+    return jwt.encode(
+        {"sub": "user", "roles": list(roles), "is_superuser": is_superuser, "exp": datetime.utcnow() + expires_in},
+        SECRET_KEY,
+        algorithm="HS256"
+    )
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    
+    @app.post("/api/auth/login")
+    def login():
+        return {"ok": True}
+    
+    @app.get("/api/users", openapi_extra=required_roles("admin"))
+    def list_users():
+        return []
+    
+    @app.get("/api/users/me")
+    def me():
+        return {"id": "me"}
+    
+    @app.get("/api/users/{user_id}", openapi_extra=required_roles("admin"))
+    def get_user(user_id: str):
+        return {"id": user_id}
+    
+    app.add_middleware(JWTAuthMiddleware, secret_key=SECRET_KEY, excluded_paths=["/api/auth/login"], routes=app.routes)
+    return TestClient(app)
+
+
+def test_policy_prefers_static_segments_over_parameters():
+    policy = AuthorizationPolicy()
+    policy.add("/api/users/{user_id}", RouteAccess(roles=frozenset({"admin"})))
+    policy.add("/api/users/me", AUTHENTICATED)
+    
+    assert policy.lookup("GET", "/api/users/me").roles == frozenset()
+    assert policy.lookup("GET", "/api/users/42").roles == frozenset({"admin"})
+    assert policy.lookup("GET", "/api/unknown").public is False
+
+
+def test_public_path_skips_authentication(client):
+    assert client.post("/api/auth/login").status_code == 200
+
+
+def test_missing_or_invalid_token_returns_401(client):
+    assert client.get("/api/users/me").status_code == 401
+    assert client.get("/api/users/me", headers={"Authorization": "Basic abc"}).status_code == 401
+    response = client.get("/api/users/me", headers={"Authorization": "Bearer broken"})
+    assert response.status_code == 401
+    assert response.json()["message"] == "Недействительный токен"
+    expired = token(expires_in=timedelta(hours=-1))
+    response = client.get("/api/users/me", headers={"Authorization": f"Bearer {expired}"})
+    assert response.json()["message"] == "Срок действия токена истек"
+
+
+def test_roles_from_route_metadata(client):
+    user = {"Authorization": f"Bearer {token(roles=['user'])}"}
+    admin = {"Authorization": f"Bearer {token(roles=['admin'])}"}
+    superuser = {"Authorization": f"Bearer {token(is_superuser=True)}"}
+    
+    assert client.get("/api/users/me", headers=user).status_code == 200
+    assert client.get("/api/users", headers=user).status_code == 403
+    assert client.get("/api/users/42", headers=user).status_code == 403
+    assert client.get("/api/users", headers=admin).status_code == 200
+    assert client.get("/api/users/42", headers=superuser).status_code == 200
+
+
+def test_jobs_require_admin_role():
+    policy = AuthorizationPolicy.from_routes(jobs.router.routes)
+    
+    assert policy.lookup("POST", "/jobs").roles == frozenset({"admin"})
+    assert policy.lookup("GET", "/jobs/42").roles == frozenset({"admin"})
@@ -0,0 +1,50 @@
+"""
+Тесты для создания секций PostgreSQL при наличии секции по умолчанию
+"""
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from insurance_app.infrastructure.database.repositories import PartitionRepositoryImpl
+
+
+def postgresql_session(existing):
+    """Сессия PostgreSQL, в которой существуют таблицы existing; выполненные запросы сохраняются"""
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    executed = []
+    
+    def execute(stmt, params=None):
+        executed.append(str(stmt))
+        result = MagicMock()
+        result.scalar.return_value = params is not None and params.get("name") in existing
+        return result
+    
+    session.execute.side_effect = execute
+    return session, executed
+
+
+def test_partition_takes_rows_from_default_partition():
+    session, executed = postgresql_session({"claims_default"})
+    
+    partition = PartitionRepositoryImpl(session).create_partition("claims", date(2020, 1, 1), date(2020, 2, 1))
+    
+    assert partition.name == "claims_p2020_01"
+    ddl = executed[2:]
+    assert ddl[0].startswith("CREATE TABLE claims_p2020_01 (LIKE claims")
+    assert "DELETE FROM claims_default WHERE report_date >= :start AND report_date < :end" in ddl[1]
+    assert ddl[2] == "ALTER TABLE claims ATTACH PARTITION claims_p2020_01 FOR VALUES FROM ('2020-01-01') TO ('2020-02-01')"
+    session.commit.assert_called_once()
+
+
+def test_partition_without_default_partition_and_existing_partition():
+    session, executed = postgresql_session({"payments_p2026_11"})
+    repository = PartitionRepositoryImpl(session)
+    
+    repository.create_partition("payments", date(2026, 12, 1), date(2027, 1, 1))
+    repository.create_partition("payments", date(2026, 11, 1), date(2026, 12, 1))
+    
+    assert [stmt for stmt in executed if not stmt.startswith("SELECT")] == [
+        "CREATE TABLE payments_p2026_12 PARTITION OF payments FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+    ]
@@ -0,0 +1,143 @@
+"""
+Тесты для направления чтения на реплики
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from insurance_app.infrastructure.database.config import Base
+from insurance_app.infrastructure.database.repositories import ClientRepositoryImpl
+from insurance_app.infrastructure.database.routing import LEAST_CONNECTIONS, ReplicaSet, RoutingSession
+from tests.factories import ClientFactory
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """Ведущий сервер и две реплики — отдельные файлы SQLite, в каждом свой клиент"""
+    engines = {}
+    for name in ("primary", "replica1", "replica2"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        ClientRepositoryImpl(session).create(ClientFactory(last_name=name))
+        session.close()
+        engines[name] = engine
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+def session_factory(engines, **kwargs):
+    replicas = ReplicaSet([engines["replica1"], engines["replica2"]], **kwargs)
+    return sessionmaker(bind=engines["primary"], class_=RoutingSession, replicas=replicas)
+
+
+def read_source(session) -> str:
+    return ClientRepositoryImpl(session).get_all()[0].last_name
+
+
+def test_reads_go_to_replicas_round_robin(databases):
+    factory = session_factory(databases)
+    
+    sources = []
+    for _ in range(4):
+        session = factory(use_replicas=True)
+        # Реплика сохраняется до конца сессии
+        sources.append((read_source(session), read_source(session)))
+        session.close()
+    
+    assert sources == [("replica1",) * 2, ("replica2",) * 2, ("replica1",) * 2, ("replica2",) * 2]
+
+
+def test_read_after_write_goes_to_primary(databases):
+    session = session_factory(databases)(use_replicas=True)
+    repository = ClientRepositoryImpl(session)
+    
+    assert read_source(session) == "replica1"
+    created = repository.create(ClientFactory(last_name="new"))
+    
+    assert session.wrote
+    assert repository.get_by_id(created.id).last_name == "new"
+    assert {client.last_name for client in repository.get_all()} == {"primary", "new"}
+    session.close()
+
+
+def test_session_without_replicas_uses_primary(databases):
+    factory = session_factory(databases)
+    
+    write_session = factory()
+    plain_session = sessionmaker(bind=databases["primary"], class_=RoutingSession)(use_replicas=True)
+    
+    assert read_source(write_session) == "primary"
+    assert read_source(plain_session) == "primary"
+    write_session.close()
+    plain_session.close()
+
+
+def test_lagging_and_unavailable_replicas_are_skipped(databases):
+    lags = {databases["replica1"]: 30.0, databases["replica2"]: 0.5}
+    
+    def probe(engine):
+        lag = lags[engine]
+        if lag is None:
+            raise ConnectionError("replica is down")
+        return lag
+    
+    factory = session_factory(databases, max_lag=5.0, lag_check_interval=0.0, lag_probe=probe)
+    
+    assert [read_source(factory(use_replicas=True)) for _ in range(2)] == ["replica2", "replica2"]
+    
+    lags[databases["replica2"]] = None
+    assert read_source(factory(use_replicas=True)) == "primary"
+    
+    lags[databases["replica1"]] = 0.0
+    assert read_source(factory(use_replicas=True)) == "replica1"
+
+
+def test_least_connections_prefers_idle_replica(databases):
+    factory = session_factory(databases, balancing=LEAST_CONNECTIONS)
+    
+    busy = factory(use_replicas=True)
+    assert read_source(busy) == "replica1"
+    
+    # Первая сессия удерживает соединение с replica1 до закрытия
+    other = factory(use_replicas=True)
+    assert read_source(other) == "replica2"
+    other.close()
+    busy.close()
+    
+    assert read_source(factory(use_replicas=True)) == "replica1"
+
+
+def test_unknown_balancing_strategy():
+    with pytest.raises(ValueError):
+        ReplicaSet([], balancing="random")
+
+
+def test_change_feed_reads_from_primary():
+    from insurance_app.infrastructure.database.config import get_db, get_primary_db
+    from insurance_app.presentation.api.changes import router
+    
+    def calls(dependant):
+        for dependency in dependant.dependencies:
+            yield dependency.call
+            yield from calls(dependency)
+    
+    for route in router.routes:
+        dependencies = set(calls(route.dependant))
+        assert get_primary_db in dependencies
+        assert get_db not in dependencies
+
+
+def test_dispose_engines_resets_primary_and_replica_pools(monkeypatch):
+    from unittest.mock import MagicMock
+    from insurance_app.infrastructure.database import config
+    
+    primary, replica1, replica2 = MagicMock(), MagicMock(), MagicMock()
+    monkeypatch.setattr(config, "engine", primary)
+    monkeypatch.setattr(config, "replicas", MagicMock(replicas=[MagicMock(engine=replica1), MagicMock(engine=replica2)]))
+    
+    config.dispose_engines(close=False)
+    
+    for engine in (primary, replica1, replica2):
+        engine.dispose.assert_called_once_with(close=False)
@@ -0,0 +1,99 @@
+"""
+Тесты для кэша ответов
+"""
+import time
+
+from insurance_app.infrastructure.caching import MemoryResponseCacheBackend, ResponseCache
+from insurance_app.infrastructure.caching.config import parse_ttls
+
+
+def store(cache: ResponseCache, key: str, tags=("policies", "policies:1"), loaded_at=None, ttl=60.0) -> None:
+    cache.set(key, key.encode(), tags, loaded_at or time.time(), ttl)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    cache = ResponseCache(local=MemoryResponseCacheBackend(max_entries=2))
+    
+    store(cache, "a")
+    store(cache, "b")
+    cache.get("route", "a")
+    store(cache, "c")
+    
+    assert [cache.get("route", key) for key in ("a", "b", "c")] == [b"a", None, b"c"]
+    assert len(cache.local) == 2
+
+
+def test_expired_response_is_miss():
+    cache = ResponseCache()
+    
+    store(cache, "a", ttl=0.05)
+    time.sleep(0.06)
+    
+    assert cache.get("route", "a") is None
+
+
+def test_invalidation_by_record_and_entity_tags():
+    cache = ResponseCache()
+    loaded_at = time.time() - 1
+    store(cache, "one", ("policies", "policies:1"), loaded_at)
+    store(cache, "two", ("policies", "policies:2"), loaded_at)
+    store(cache, "client", ("clients", "clients:1"), loaded_at)
+    
+    cache.invalidate(["policies:1"])
+    assert [cache.get("route", key) for key in ("one", "two")] == [None, b"two"]
+    
+    cache.invalidate(["policies"])
+    assert cache.get("route", "two") is None
+    assert cache.get("route", "client") == b"client"
+
+
+def test_response_read_before_invalidation_is_not_reused():
+    """Ответ, чтение которого началось до сброса, недействителен, даже если сохранен после сброса"""
+    cache = ResponseCache()
+    loaded_at = time.time()
+    
+    cache.invalidate(["policies:1"])
+    store(cache, "a", loaded_at=loaded_at)
+    
+    assert cache.get("route", "a") is None
+
+
+def test_grace_covers_replica_lag():
+    cache = ResponseCache(grace=5.0)
+    
+    cache.invalidate(["policies:1"])
+    store(cache, "lagging", loaded_at=time.time() + 1)
+    store(cache, "caught_up", loaded_at=time.time() + 6)
+    
+    assert cache.get("route", "lagging") is None
+    assert cache.get("route", "caught_up") == b"caught_up"
+
+
+def test_shared_backend_propagates_responses_and_invalidations():
+    """Два процесса с локальными LRU и общим хранилищем"""
+    shared = MemoryResponseCacheBackend()
+    first = ResponseCache(shared=shared)
+    second = ResponseCache(shared=shared)
+    
+    store(first, "a", loaded_at=time.time() - 1)
+    assert second.get("route", "a") == b"a"
+    
+    # Ответ в памяти второго процесса сбрасывается изменением в первом
+    first.invalidate(["policies:1"])
+    assert second.get("route", "a") is None
+
+
+def test_hit_rate_and_route_ttl():
+    cache = ResponseCache(ttls=parse_ttls("policy_by_number=120, client_by_email=0"), max_ttl=90)
+    store(cache, "a")
+    
+    cache.get("policy_by_number", "a")
+    cache.get("policy_by_number", "a")
+    cache.get("policy_by_number", "missing")
+    
+    stats = cache.stats()["policy_by_number"]
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert round(stats.hit_rate, 2) == 0.67
+    assert cache.ttl("policy_by_number", 60) == 90
+    assert cache.ttl("client_by_email", 60) == 0
+    assert cache.ttl("claim_by_number", 60) == 60
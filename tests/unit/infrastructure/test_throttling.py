@@ -0,0 +1,121 @@
+"""
+Тесты для ограничения частоты запросов и сброса нагрузки
+"""
+import asyncio
+import time
+
+from insurance_app.infrastructure.database.pool import PoolWaitMonitor
+from insurance_app.infrastructure.throttling import MemoryRateLimitBackend, RouteGroup, ThrottlingMiddleware
+
+
+def http_scope(path="/api/policies", method="GET", user=None, client=("10.0.0.1", 5000)) -> dict:
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "client": client}
+    if user:
+        scope["user"] = {"sub": user}
+    return scope
+
+
+async def call(middleware, scope) -> dict:
+    """Выполняет запрос и возвращает начало ответа"""
+    messages = []
+    
+    async def receive():
+        return {"type": "http.request", "body": b""}
+    
+    async def send(message):
+        messages.append(message)
+    
+    await middleware(scope, receive, send)
+    return messages[0]
+
+
+async def ok(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def header(start: dict, name: bytes) -> str:
+    return dict(start["headers"])[name].decode()
+
+
+def test_memory_backend_refills_tokens():
+    backend = MemoryRateLimitBackend()
+    
+    async def scenario():
+        first = [await backend.take("key", rate=10, burst=2) for _ in range(3)]
+        await asyncio.sleep(0.15)
+        return first, await backend.take("key", rate=10, burst=2)
+    
+    first, after_refill = asyncio.run(scenario())
+    
+    assert first[:2] == [0.0, 0.0]
+    assert 0 < first[2] <= 0.1
+    assert after_refill == 0.0
+
+
+def test_rate_limit_per_user_and_ip():
+    middleware = ThrottlingMiddleware(ok, MemoryRateLimitBackend(), rate=1, burst=1)
+    
+    async def scenario():
+        return [
+            (await call(middleware, http_scope(user="alice")))["status"],
+            (await call(middleware, http_scope(user="alice"))),
+            (await call(middleware, http_scope(user="bob")))["status"],
+            (await call(middleware, http_scope()))["status"],
+        ]
+    
+    alice, limited, bob, anonymous = asyncio.run(scenario())
+    
+    assert alice == 200
+    assert limited["status"] == 429
+    assert header(limited, b"retry-after") == "1"
+    assert bob == 200
+    assert anonymous == 200
+
+
+def test_route_group_concurrency_limit():
+    release = asyncio.Event()
+    
+    async def slow(scope, receive, send):
+        await release.wait()
+        await ok(scope, receive, send)
+    
+    middleware = ThrottlingMiddleware(
+        slow, MemoryRateLimitBackend(), groups=[RouteGroup("exports", 1, r"/export$", frozenset({"GET"}))]
+    )
+    
+    async def scenario():
+        running = asyncio.ensure_future(call(middleware, http_scope("/api/claims/export")))
+        await asyncio.sleep(0)
+        rejected = await call(middleware, http_scope("/api/payments/export"))
+        release.set()
+        return rejected, await running, await call(middleware, http_scope("/api/claims/export"))
+    
+    rejected, first, after_release = asyncio.run(scenario())
+    
+    assert rejected["status"] == 503
+    assert first["status"] == 200
+    assert after_release["status"] == 200
+    assert middleware.in_flight["exports"] == 0
+
+
+def test_load_shedding_on_pool_wait():
+    monitor = PoolWaitMonitor()
+    middleware = ThrottlingMiddleware(
+        ok, MemoryRateLimitBackend(), pool_monitor=monitor, shed_threshold=0.05, exempt_paths=["/api/health-check"]
+    )
+    
+    started = monitor.started()
+    time.sleep(0.1)
+    
+    shed = asyncio.run(call(middleware, http_scope()))
+    health = asyncio.run(call(middleware, http_scope("/api/health-check")))
+    monitor.finished(started)
+    monitor.window = 0
+    time.sleep(0.01)
+    recovered = asyncio.run(call(middleware, http_scope()))
+    
+    assert shed["status"] == 503
+    assert header(shed, b"retry-after") == "1"
+    assert health["status"] == 200
+    assert recovered["status"] == 200
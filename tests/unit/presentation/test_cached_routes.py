@@ -0,0 +1,71 @@
+"""
+Тесты для кэширования ответов маршрутов
+"""
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from insurance_app.infrastructure.caching import ResponseCache
+from insurance_app.presentation.api.response_cache import cache_key, cached_json, record_tags
+
+
+def _request(path_params=None, query=b"", user=None) -> Request:
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": query,
+             "path_params": path_params or {"policy_number": "POL-1"}}
+    if user is not None:
+        scope["user"] = user
+    return Request(scope)
+
+
+def test_response_is_cached_until_record_changes():
+    cache = ResponseCache()
+    policy_id = uuid4()
+    loads = []
+    
+    def load():
+        loads.append(1)
+        return {"id": policy_id, "number": "POL-1"}, record_tags("policies", policy_id)
+    
+    first = cached_json(_request(), "policy_by_number", 60, load, cache)
+    second = cached_json(_request(), "policy_by_number", 60, load, cache)
+    cache.invalidate([f"policies:{policy_id}"])
+    third = cached_json(_request(), "policy_by_number", 60, load, cache)
+    
+    assert [response.headers["X-Cache"] for response in (first, second, third)] == ["MISS", "HIT", "MISS"]
+    assert first.body == second.body
+    assert len(loads) == 2
+
+
+def test_not_found_is_not_cached():
+    cache = ResponseCache()
+    
+    def load():
+        raise HTTPException(status_code=404)
+    
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            cached_json(_request(), "policy_by_number", 60, load, cache)
+    
+    assert len(cache.local) == 0
+
+
+def test_key_depends_on_params_and_access_scope():
+    admin = {"sub": "1", "roles": ["admin", "agent"]}
+    
+    assert cache_key(_request(), "r") != cache_key(_request({"policy_number": "POL-2"}), "r")
+    assert cache_key(_request(query=b"a=1"), "r") != cache_key(_request(query=b"a=2"), "r")
+    assert cache_key(_request(user=admin), "r") != cache_key(_request(user={"sub": "1", "roles": ["agent"]}), "r")
+    assert cache_key(_request(user=admin), "r") == cache_key(
+        _request(user={"sub": "2", "roles": ["agent", "admin"]}), "r"
+    )
+
+
+def test_route_cache_disabled_by_zero_ttl():
+    cache = ResponseCache(ttls={"policy_by_number": 0})
+    
+    response = cached_json(_request(), "policy_by_number", 60, lambda: ({"id": 1}, ["policies"]), cache)
+    
+    assert "X-Cache" not in response.headers
+    assert len(cache.local) == 0
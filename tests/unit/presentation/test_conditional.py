@@ -0,0 +1,90 @@
+"""
+Тесты для условных GET-запросов (ETag, Last-Modified)
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from insurance_app.domain.models.version import EntityVersion
+from insurance_app.presentation.api.conditional import (
+    check_entity,
+    check_list,
+    entity_etag,
+    if_match_version,
+    is_not_modified,
+    list_etag
+)
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_if_none_match_has_priority():
+    """If-None-Match сравнивается слабо и имеет приоритет над If-Modified-Since"""
+    modified = datetime(2024, 5, 1, 12, 30, 15, 500000)
+    
+    assert is_not_modified(_request(if_none_match='W/"3", "4"'), '"3"', modified)
+    assert is_not_modified(_request(if_none_match="*"), '"3"')
+    assert not is_not_modified(
+        _request(if_none_match='"2"', if_modified_since="Wed, 01 May 2024 12:30:15 GMT"), '"3"', modified
+    )
+
+
+def test_if_modified_since_uses_second_precision():
+    """Время изменения сравнивается с точностью до секунды, некорректная дата игнорируется"""
+    modified = datetime(2024, 5, 1, 12, 30, 15, 500000)
+    
+    assert is_not_modified(_request(if_modified_since="Wed, 01 May 2024 12:30:15 GMT"), '"3"', modified)
+    assert not is_not_modified(_request(if_modified_since="Wed, 01 May 2024 12:30:14 GMT"), '"3"', modified)
+    assert not is_not_modified(_request(if_modified_since="вчера"), '"3"', modified)
+
+
+def test_check_entity_skips_version_query_without_conditions():
+    """Без условных заголовков запрос версии не выполняется"""
+    calls = []
+    
+    assert check_entity(_request(), lambda: calls.append(1)) is None
+    assert calls == []
+
+
+def test_check_entity_returns_304():
+    """Для неизмененной записи возвращается 304 с валидаторами"""
+    version = EntityVersion(uuid4(), 7, datetime(2024, 5, 1, 12, 0, 0))
+    
+    response = check_entity(_request(if_none_match='"7"'), lambda: version)
+    
+    assert response.status_code == 304
+    assert response.headers["etag"] == entity_etag(version) == '"7"'
+    assert response.headers["last-modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+    assert check_entity(_request(if_none_match='"6"'), lambda: version) is None
+    assert check_entity(_request(if_none_match='"7"'), lambda: None) is None
+
+
+def test_list_etag_depends_on_versions_and_order():
+    """ETag страницы меняется при изменении версии, составе или порядке записей"""
+    first = EntityVersion(uuid4(), 1)
+    second = EntityVersion(uuid4(), 1)
+    etag = list_etag([first, second])
+    
+    assert check_list(_request(if_none_match=etag), lambda: [first, second]).status_code == 304
+    assert list_etag([first, EntityVersion(second.id, 2)]) != etag
+    assert list_etag([second, first]) != etag
+    assert list_etag([first]) != etag
+    assert check_list(_request(if_modified_since="Wed, 01 May 2024 12:00:00 GMT"), lambda: [first]) is None
+
+
+def test_if_match_version():
+    """If-Match сравнивается строго: принимается только ETag версии записи или *"""
+    assert if_match_version('"12"') == 12
+    assert if_match_version(' "3" ') == 3
+    assert if_match_version("*") is None
+    assert if_match_version(None) is None
+    for header in ('W/"3"', "3", '"abc"', '""'):
+        with pytest.raises(HTTPException) as error:
+            if_match_version(header)
+        assert error.value.status_code == 400
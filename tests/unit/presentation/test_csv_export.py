@@ -0,0 +1,25 @@
+"""
+Тесты для потоковой CSV выгрузки
+"""
+import csv
+import io
+from decimal import Decimal
+
+from insurance_app.domain.models.payment import Payment, PaymentStatus
+from insurance_app.presentation.api.csv_export import stream_csv
+from tests.factories import PaymentFactory
+
+
+def test_stream_csv_yields_chunks():
+    """CSV отдается частями, заголовок идет первым, перечисления выгружаются значениями"""
+    payments = PaymentFactory.build_batch(5, status=PaymentStatus.COMPLETED, claim_id=None)
+    
+    chunks = list(stream_csv(iter(payments), Payment, chunk_rows=2))
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    
+    assert len(chunks) == 3
+    assert len(rows) == 5
+    assert rows[0]["payment_number"] == payments[0].payment_number
+    assert rows[0]["status"] == "completed"
+    assert rows[0]["claim_id"] == ""
+    assert Decimal(rows[4]["amount"]) == payments[4].amount
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+# Модули, которые не должны загружаться при импорте приложения
+LAZY_MODULES = ("passlib", "bcrypt", "jose")
+STALE_MODULES = (
+    "insurance_app.presentation.api.docs",
+    "insurance_app.presentation.api.docs_fixed",
+    "insurance_app.presentation.api.docs_new",
+    "insurance_app.infrastructure.auth.middleware_fixed",
+    "insurance_app.infrastructure.auth.middleware_new",
+)
+
+
+def import_profile(module: str) -> dict:
+    """Профиль импорта модуля в отдельном процессе: совокупное время импорта каждого модуля, мкс"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_app_import_skips_heavy_and_stale_modules():
+    profile = import_profile("insurance_app.presentation.main")
+    
+    assert "insurance_app.presentation.main" in profile
+    assert not [name for name in profile if name.split(".")[0] in LAZY_MODULES]
+    assert not [name for name in profile if name in STALE_MODULES]